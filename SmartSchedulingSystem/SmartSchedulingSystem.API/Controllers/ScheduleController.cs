@@ -1,8 +1,13 @@
 using System;
 using System.Collections.Generic;
+using System.Diagnostics;
 using System.Linq;
+using System.Text.Json;
+using System.Text.Json.Serialization;
+using System.Threading.Channels;
 using Microsoft.AspNetCore.Mvc;
 using Microsoft.Extensions.Logging;
+using SmartSchedulingSystem.API.Services;
 using SmartSchedulingSystem.Core.DTOs;
 using SmartSchedulingSystem.Scheduling.Engine;
 using SmartSchedulingSystem.Scheduling.Models;
@@ -17,13 +22,27 @@ namespace SmartSchedulingSystem.API.Controllers
     {
         private readonly ILogger<ScheduleController> _logger;
         private readonly SchedulingEngine _schedulingEngine;
+        private readonly ScheduleRunRegistry _runRegistry;
+        private readonly ScheduleResultCache _resultCache;
+        private readonly ConstraintProfiler _profiler;
+
+        private static readonly JsonSerializerOptions EventJsonOptions = new JsonSerializerOptions(JsonSerializerDefaults.Web)
+        {
+            Converters = { new JsonStringEnumConverter() }
+        };
 
         public ScheduleController(
             ILogger<ScheduleController> logger,
-            SchedulingEngine schedulingEngine)
+            SchedulingEngine schedulingEngine,
+            ScheduleRunRegistry runRegistry,
+            ScheduleResultCache resultCache,
+            ConstraintProfiler profiler)
         {
             _logger = logger ?? throw new ArgumentNullException(nameof(logger));
             _schedulingEngine = schedulingEngine ?? throw new ArgumentNullException(nameof(schedulingEngine));
+            _runRegistry = runRegistry ?? throw new ArgumentNullException(nameof(runRegistry));
+            _resultCache = resultCache ?? throw new ArgumentNullException(nameof(resultCache));
+            _profiler = profiler ?? throw new ArgumentNullException(nameof(profiler));
         }
 
         [HttpGet("ping")]
@@ -40,29 +59,10 @@ namespace SmartSchedulingSystem.API.Controllers
                 _logger.LogInformation("Basic scheduling request received");
                 
                 // Validate request
-                if (request == null)
-                {
-                    return BadRequest(new { error = "Request cannot be empty" });
-                }
-
-                if (request.CourseSectionObjects == null || !request.CourseSectionObjects.Any())
-                {
-                    return BadRequest(new { error = "Course information missing in request data" });
-                }
-                
-                if (request.TeacherObjects == null || !request.TeacherObjects.Any())
-                {
-                    return BadRequest(new { error = "Teacher information missing in request data" });
-                }
-                
-                if (request.ClassroomObjects == null || !request.ClassroomObjects.Any())
+                string? validationError = GetRequestValidationError(request);
+                if (validationError != null)
                 {
-                    return BadRequest(new { error = "Classroom information missing in request data" });
-                }
-                
-                if (request.TimeSlotObjects == null || !request.TimeSlotObjects.Any())
-                {
-                    return BadRequest(new { error = "Time slot information missing in request data" });
+                    return BadRequest(new { error = validationError });
                 }
 
                 // Print time slot information for debugging
@@ -87,7 +87,7 @@ namespace SmartSchedulingSystem.API.Controllers
                 };
                 
                 // Use simplified mode, only including Level 1 constraints
-                var result = _schedulingEngine.GenerateSchedule(problem, parameters, useSimplifiedMode: true);
+                var result = GenerateWithCache(problem, parameters, "basic", useSimplifiedMode: true);
                 
                 if (result.Status == SchedulingStatus.Success || result.Status == SchedulingStatus.PartialSuccess)
                 {
@@ -130,37 +130,149 @@ namespace SmartSchedulingSystem.API.Controllers
             }
         }
 
-        [HttpPost("generate-advanced")]
-        public IActionResult GenerateAdvancedSchedule([FromBody] ScheduleRequestDto request)
+        /// <summary>
+        /// Basic scheduling with live progress as server-sent events. Events: "started" (run ID), "progress"
+        /// (phase, new solutions, local search iteration/temperature/best score), then "result" with the same
+        /// payload as /generate, or "error". The run stops early on /generate/{runId}/stop, after
+        /// timeLimitSeconds, or when the client disconnects, and returns the best solutions found so far
+        /// </summary>
+        [HttpPost("generate/stream")]
+        public async Task GenerateScheduleStream([FromBody] ScheduleRequestDto request, [FromQuery] int? timeLimitSeconds = null)
         {
+            string? validationError = GetRequestValidationError(request);
+            if (validationError != null)
+            {
+                Response.StatusCode = StatusCodes.Status400BadRequest;
+                await Response.WriteAsJsonAsync(new { error = validationError });
+                return;
+            }
+
+            _logger.LogInformation("Streamed basic scheduling request received");
+
+            Response.ContentType = "text/event-stream";
+            Response.Headers.CacheControl = "no-cache";
+            Response.Headers["X-Accel-Buffering"] = "no";
+
+            using var cancellationSource = CancellationTokenSource.CreateLinkedTokenSource(HttpContext.RequestAborted);
+            if (timeLimitSeconds > 0)
+            {
+                cancellationSource.CancelAfter(TimeSpan.FromSeconds(timeLimitSeconds.Value));
+            }
+
+            string runId = _runRegistry.Register(cancellationSource);
+            var events = Channel.CreateUnbounded<SchedulingProgress>(new UnboundedChannelOptions { SingleReader = true });
+            Task<SchedulingResult>? schedulingTask = null;
+            bool schedulingAwaited = false;
+
             try
             {
-                _logger.LogInformation("Advanced scheduling request received");
-                
-                // Validate request
-                if (request == null)
+                await WriteEventAsync("started", new { runId, timeLimitSeconds });
+
+                var problem = ConvertToBasicSchedulingProblem(request);
+                var parameters = new SchedulingParameters
+                {
+                    EnableLocalSearch = true,
+                    MaxLsIterations = 1000,
+                    InitialTemperature = 100,
+                    CoolingRate = 0.95,
+                    UseStandardConstraints = false,
+                    UseBasicConstraints = true,
+                    // Plan CP time and local search iterations to finish within the time limit instead of being cut off
+                    DeadlineSeconds = timeLimitSeconds > 0 ? timeLimitSeconds.Value : 0
+                };
+
+                var progress = new ChannelProgress(events.Writer);
+                schedulingTask = Task.Run(() =>
                 {
-                    return BadRequest(new { error = "Request cannot be empty" });
+                    try
+                    {
+                        return GenerateWithCache(
+                            problem, parameters, "basic", useSimplifiedMode: true, progress, cancellationSource.Token);
+                    }
+                    finally
+                    {
+                        events.Writer.TryComplete();
+                    }
+                });
+
+                await foreach (var progressEvent in events.Reader.ReadAllAsync(HttpContext.RequestAborted))
+                {
+                    await WriteEventAsync("progress", progressEvent);
                 }
 
-                if (request.CourseSectionObjects == null || !request.CourseSectionObjects.Any())
+                schedulingAwaited = true;
+                var result = await schedulingTask;
+                if (result.Status == SchedulingStatus.Success || result.Status == SchedulingStatus.PartialSuccess)
                 {
-                    return BadRequest(new { error = "Course information missing in request data" });
+                    await WriteEventAsync("result", ConvertToApiResult(result, request.SemesterId));
                 }
-                
-                if (request.TeacherObjects == null || !request.TeacherObjects.Any())
+                else
                 {
-                    return BadRequest(new { error = "Teacher information missing in request data" });
+                    await WriteEventAsync("error", new { error = "Scheduling failed", message = result.Message, status = result.Status });
                 }
-                
-                if (request.ClassroomObjects == null || !request.ClassroomObjects.Any())
+            }
+            catch (OperationCanceledException) when (HttpContext.RequestAborted.IsCancellationRequested)
+            {
+                _logger.LogInformation($"Client disconnected from scheduling run {runId}");
+            }
+            catch (Exception ex)
+            {
+                _logger.LogError(ex, "Exception occurred while processing streamed scheduling request");
+                if (!HttpContext.RequestAborted.IsCancellationRequested)
                 {
-                    return BadRequest(new { error = "Classroom information missing in request data" });
+                    await WriteEventAsync("error", new { error = "Scheduling execution failed", message = ex.Message });
                 }
+            }
+            finally
+            {
+                // The run uses request-scoped services: stop it and wait for it before the request scope ends
+                if (schedulingTask != null && !schedulingAwaited)
+                {
+                    cancellationSource.Cancel();
+                    try
+                    {
+                        await schedulingTask;
+                    }
+                    catch (OperationCanceledException)
+                    {
+                    }
+                    catch (Exception ex)
+                    {
+                        _logger.LogError(ex, $"Scheduling run {runId} failed after its stream ended");
+                    }
+                }
+
+                _runRegistry.Remove(runId);
+            }
+        }
+
+        /// <summary>
+        /// Stop a streamed scheduling run, its stream then ends with the best solutions found so far
+        /// </summary>
+        [HttpPost("generate/{runId}/stop")]
+        public IActionResult StopScheduleGeneration(string runId)
+        {
+            if (!_runRegistry.TryStop(runId))
+            {
+                return NotFound(new { error = "Scheduling run not found or already completed" });
+            }
+
+            _logger.LogInformation($"Stop requested for scheduling run {runId}");
+            return Ok(new { runId, message = "Stop requested, the best solutions found so far will be returned" });
+        }
+
+        [HttpPost("generate-advanced")]
+        public IActionResult GenerateAdvancedSchedule([FromBody] ScheduleRequestDto request)
+        {
+            try
+            {
+                _logger.LogInformation("Advanced scheduling request received");
                 
-                if (request.TimeSlotObjects == null || !request.TimeSlotObjects.Any())
+                // Validate request
+                string? validationError = GetRequestValidationError(request);
+                if (validationError != null)
                 {
-                    return BadRequest(new { error = "Time slot information missing in request data" });
+                    return BadRequest(new { error = validationError });
                 }
 
                 // Print time slot information for debugging
@@ -185,7 +297,7 @@ namespace SmartSchedulingSystem.API.Controllers
                 };
                 
                 // Use complete mode, including Level 2 constraints
-                var result = _schedulingEngine.GenerateSchedule(problem, parameters, useSimplifiedMode: false);
+                var result = GenerateWithCache(problem, parameters, "advanced", useSimplifiedMode: false);
                 
                 if (result.Status == SchedulingStatus.Success || result.Status == SchedulingStatus.PartialSuccess)
                 {
@@ -236,29 +348,10 @@ namespace SmartSchedulingSystem.API.Controllers
                 _logger.LogInformation("Enhanced level scheduling request received");
                 
                 // Validate request
-                if (request == null)
-                {
-                    return BadRequest(new { error = "Request cannot be empty" });
-                }
-
-                if (request.CourseSectionObjects == null || !request.CourseSectionObjects.Any())
-                {
-                    return BadRequest(new { error = "Course information missing in request data" });
-                }
-                
-                if (request.TeacherObjects == null || !request.TeacherObjects.Any())
-                {
-                    return BadRequest(new { error = "Teacher information missing in request data" });
-                }
-                
-                if (request.ClassroomObjects == null || !request.ClassroomObjects.Any())
+                string? validationError = GetRequestValidationError(request);
+                if (validationError != null)
                 {
-                    return BadRequest(new { error = "Classroom information missing in request data" });
-                }
-                
-                if (request.TimeSlotObjects == null || !request.TimeSlotObjects.Any())
-                {
-                    return BadRequest(new { error = "Time slot information missing in request data" });
+                    return BadRequest(new { error = validationError });
                 }
 
                 // Print time slot information for debugging
@@ -285,7 +378,7 @@ namespace SmartSchedulingSystem.API.Controllers
                 };
                 
                 // Use enhanced mode
-                var result = _schedulingEngine.GenerateSchedule(problem, parameters, useSimplifiedMode: false);
+                var result = GenerateWithCache(problem, parameters, "enhanced", useSimplifiedMode: false);
                 
                 if (result.Status == SchedulingStatus.Success || result.Status == SchedulingStatus.PartialSuccess)
                 {
@@ -328,6 +421,171 @@ namespace SmartSchedulingSystem.API.Controllers
             }
         }
 
+        /// <summary>
+        /// Schedule result cache statistics: lookups, hit rate, warm starts and saved solver seconds
+        /// </summary>
+        [HttpGet("cache/stats")]
+        public IActionResult GetCacheStatistics()
+        {
+            return Ok(_resultCache.GetStatistics());
+        }
+
+        [HttpGet("profile")]
+        public IActionResult GetConstraintProfile()
+        {
+            return Ok(_profiler.GetProfile());
+        }
+
+        [HttpPost("profile/enable")]
+        public IActionResult EnableConstraintProfiling([FromQuery] bool enabled = true)
+        {
+            _profiler.IsEnabled = enabled;
+            _logger.LogInformation("Constraint profiling {State}", enabled ? "enabled" : "disabled");
+            return Ok(new { enabled = _profiler.IsEnabled });
+        }
+
+        [HttpDelete("profile")]
+        public IActionResult ResetConstraintProfile()
+        {
+            _profiler.Reset();
+            return NoContent();
+        }
+
+        // Generate a schedule through the result cache: the stored result is returned for an unchanged input,
+        // the closest cached solution is repaired for a similar input, otherwise the engine solves from scratch
+        private SchedulingResult GenerateWithCache(
+            SchedulingProblem problem,
+            SchedulingParameters parameters,
+            string endpoint,
+            bool useSimplifiedMode,
+            IProgress<SchedulingProgress>? progress = null,
+            CancellationToken cancellationToken = default)
+        {
+            var fingerprint = ProblemFingerprint.Compute(problem, parameters, endpoint);
+            var lookup = _resultCache.Lookup(problem, fingerprint);
+
+            if (lookup.Result != null)
+            {
+                progress?.Report(new SchedulingProgress
+                {
+                    Kind = SchedulingProgressKind.Phase,
+                    Phase = "Cache",
+                    Message = "Returning the stored result of an identical request"
+                });
+                return lookup.Result;
+            }
+
+            if (lookup.WarmStartSolution != null && lookup.WarmStartFingerprint != null)
+            {
+                progress?.Report(new SchedulingProgress
+                {
+                    Kind = SchedulingProgressKind.Phase,
+                    Phase = "Cache",
+                    Message = $"Warm-starting from the stored result of a {lookup.Similarity:P0} similar request"
+                });
+
+                var warmStarted = TryWarmStart(problem, fingerprint, lookup);
+                if (warmStarted != null)
+                {
+                    _resultCache.RecordWarmStart(lookup.SolveTimeMs - warmStarted.ExecutionTimeMs);
+                    // A later hit saves a full solve, estimated by the solve time of the similar request
+                    _resultCache.Store(fingerprint, warmStarted, Math.Max(lookup.SolveTimeMs, warmStarted.ExecutionTimeMs));
+                    return warmStarted;
+                }
+            }
+
+            var sw = Stopwatch.StartNew();
+            var result = _schedulingEngine.GenerateSchedule(problem, parameters, useSimplifiedMode, progress, cancellationToken);
+
+            // Stopped runs return partial results that must not answer later requests
+            if (result.Status == SchedulingStatus.Success && !cancellationToken.IsCancellationRequested)
+            {
+                _resultCache.Store(fingerprint, result, sw.ElapsedMilliseconds);
+            }
+
+            return result;
+        }
+
+        // Repair the closest cached solution for the changed input, null if no repair was found
+        private SchedulingResult? TryWarmStart(SchedulingProblem problem, ProblemFingerprint fingerprint, ScheduleCacheLookup lookup)
+        {
+            try
+            {
+                var changes = fingerprint.GetChangesSince(lookup.WarmStartFingerprint!, lookup.WarmStartSolution!);
+
+                // Placements of removed sections and time slots cannot be kept
+                var sectionIds = problem.CourseSections.Select(s => s.Id).ToHashSet();
+                var timeSlotIds = problem.TimeSlots.Select(t => t.Id).ToHashSet();
+                var previousSolution = lookup.WarmStartSolution!.Clone();
+                previousSolution.Problem = problem;
+                previousSolution.Assignments.RemoveAll(a => !sectionIds.Contains(a.SectionId) || !timeSlotIds.Contains(a.TimeSlotId));
+
+                var rescheduled = _schedulingEngine.Reschedule(problem, previousSolution, changes);
+                if (!rescheduled.IsSuccessful)
+                {
+                    _logger.LogInformation($"Warm start from cached schedule failed: {rescheduled.Message}");
+                    return null;
+                }
+
+                var solution = rescheduled.Solution;
+                solution.Evaluation = _schedulingEngine.EvaluateSchedule(solution);
+
+                return new SchedulingResult
+                {
+                    Status = SchedulingStatus.Success,
+                    Message = $"Warm-started from a cached schedule: {rescheduled.Message}",
+                    Problem = problem,
+                    Solutions = new List<SchedulingSolution> { solution },
+                    ExecutionTimeMs = rescheduled.ExecutionTimeMs
+                };
+            }
+            catch (Exception ex)
+            {
+                _logger.LogWarning(ex, "Warm start from cached schedule failed, solving from scratch");
+                return null;
+            }
+        }
+
+        // Validate the parts of a scheduling request every generation endpoint needs
+        private static string? GetRequestValidationError(ScheduleRequestDto request)
+        {
+            if (request == null)
+                return "Request cannot be empty";
+            if (request.CourseSectionObjects == null || !request.CourseSectionObjects.Any())
+                return "Course information missing in request data";
+            if (request.TeacherObjects == null || !request.TeacherObjects.Any())
+                return "Teacher information missing in request data";
+            if (request.ClassroomObjects == null || !request.ClassroomObjects.Any())
+                return "Classroom information missing in request data";
+            if (request.TimeSlotObjects == null || !request.TimeSlotObjects.Any())
+                return "Time slot information missing in request data";
+            return null;
+        }
+
+        // Write one server-sent event and flush it to the client
+        private async Task WriteEventAsync(string eventName, object data)
+        {
+            string json = JsonSerializer.Serialize(data, EventJsonOptions);
+            await Response.WriteAsync($"event: {eventName}\ndata: {json}\n\n", HttpContext.RequestAborted);
+            await Response.Body.FlushAsync(HttpContext.RequestAborted);
+        }
+
+        // Forwards progress events to the stream of a scheduling run, callable from any solver thread
+        private sealed class ChannelProgress : IProgress<SchedulingProgress>
+        {
+            private readonly ChannelWriter<SchedulingProgress> _writer;
+
+            public ChannelProgress(ChannelWriter<SchedulingProgress> writer)
+            {
+                _writer = writer;
+            }
+
+            public void Report(SchedulingProgress value)
+            {
+                _writer.TryWrite(value);
+            }
+        }
+
         // Convert DTO to basic SchedulingProblem (without availability constraints)
         private SchedulingProblem ConvertToBasicSchedulingProblem(ScheduleRequestDto request)
         {
@@ -1,3 +1,4 @@
+using Microsoft.EntityFrameworkCore;
 using Microsoft.OpenApi.Models;
 using SmartSchedulingSystem.Core.Mapping;
 using System.Net;
@@ -40,10 +41,16 @@ string GetLocalIPAddress()
 }
 
 // Add SchedulingEngine related services.
+// The profiler is shared so the profile endpoints see the measurements of every request
+builder.Services.AddSingleton<SmartSchedulingSystem.Scheduling.Engine.ConstraintProfiler>();
 builder.Services.AddScoped<SmartSchedulingSystem.Scheduling.Engine.ConstraintManager>();
 
 // Add missing dependencies
 builder.Services.AddScoped<SmartSchedulingSystem.Scheduling.Algorithms.CP.CPModelBuilder>();
+// Components of decomposed problems are solved in parallel, each with a model builder of its own
+builder.Services.AddScoped<Func<SmartSchedulingSystem.Scheduling.Algorithms.CP.CPModelBuilder>>(provider =>
+    () => ActivatorUtilities.CreateInstance<SmartSchedulingSystem.Scheduling.Algorithms.CP.CPModelBuilder>(provider));
+builder.Services.AddScoped<SmartSchedulingSystem.Scheduling.Algorithms.CP.ProblemDecomposer>();
 builder.Services.AddScoped<SmartSchedulingSystem.Scheduling.Algorithms.CP.SolutionConverter>();
 builder.Services.AddScoped<SmartSchedulingSystem.Scheduling.Algorithms.LS.MoveGenerator>();
 builder.Services.AddScoped<SmartSchedulingSystem.Scheduling.Algorithms.LS.SimulatedAnnealingController>();
@@ -56,6 +63,10 @@ builder.Services.AddScoped<SmartSchedulingSystem.Scheduling.Algorithms.Hybrid.So
 builder.Services.AddScoped<SmartSchedulingSystem.Scheduling.Algorithms.CP.CPScheduler>();
 builder.Services.AddScoped<SmartSchedulingSystem.Scheduling.Algorithms.LS.LocalSearchOptimizer>();
 builder.Services.AddScoped<SmartSchedulingSystem.Scheduling.Algorithms.Hybrid.CPLSScheduler>();
+builder.Services.AddScoped<SmartSchedulingSystem.Scheduling.Algorithms.Hybrid.EngineSelector>();
+// Run history and predictor are shared so every request plans from the runtimes of all earlier runs
+builder.Services.AddSingleton<SmartSchedulingSystem.Scheduling.Algorithms.Hybrid.SchedulingRunHistory>();
+builder.Services.AddSingleton<SmartSchedulingSystem.Scheduling.Algorithms.Hybrid.RuntimePredictor>();
 builder.Services.AddScoped<SmartSchedulingSystem.Scheduling.Utils.ProblemAnalyzer>();
 builder.Services.AddScoped<SmartSchedulingSystem.Scheduling.Engine.SolutionEvaluator>();
 builder.Services.AddScoped<SmartSchedulingSystem.Scheduling.Engine.SchedulingEngine>();
@@ -63,6 +74,19 @@ builder.Services.AddScoped<SmartSchedulingSystem.Scheduling.Engine.SchedulingEng
 // Add scheduling parameters
 builder.Services.AddSingleton<SmartSchedulingSystem.Scheduling.Utils.SchedulingParameters>();
 
+// Add running streamed scheduling runs
+builder.Services.AddSingleton<SmartSchedulingSystem.API.Services.ScheduleRunRegistry>();
+
+// Add the schedule result cache, persisted in the database when a connection string is configured
+var connectionString = builder.Configuration.GetConnectionString("DefaultConnection");
+if (!string.IsNullOrEmpty(connectionString))
+{
+    builder.Services.AddDbContext<SmartSchedulingSystem.Data.Context.AppDbContext>(options => options.UseSqlServer(connectionString));
+    builder.Services.AddScoped<SmartSchedulingSystem.Data.Repositories.ScheduleResultRepository>();
+}
+builder.Services.Configure<SmartSchedulingSystem.API.Services.ScheduleCacheOptions>(builder.Configuration.GetSection("ScheduleCache"));
+builder.Services.AddSingleton<SmartSchedulingSystem.API.Services.ScheduleResultCache>();
+
 
 // Build the application
 var app = builder.Build();
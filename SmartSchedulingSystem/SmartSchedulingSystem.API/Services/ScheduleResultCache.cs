@@ -0,0 +1,450 @@
+using System.Text.Json;
+using Microsoft.EntityFrameworkCore;
+using Microsoft.Extensions.Options;
+using SmartSchedulingSystem.Data.Context;
+using SmartSchedulingSystem.Data.Entities;
+using SmartSchedulingSystem.Scheduling.Models;
+using SmartSchedulingSystem.Scheduling.Utils;
+
+namespace SmartSchedulingSystem.API.Services
+{
+    /// <summary>
+    /// Schedule result cache settings (section "ScheduleCache")
+    /// </summary>
+    public class ScheduleCacheOptions
+    {
+        /// <summary>
+        /// Results kept in memory
+        /// </summary>
+        public int Capacity { get; set; } = 32;
+
+        /// <summary>
+        /// Whether results are also stored in the database
+        /// </summary>
+        public bool UseDatabase { get; set; } = true;
+
+        /// <summary>
+        /// Results kept in the database, the least recently used are removed
+        /// </summary>
+        public int MaxPersistedEntries { get; set; } = 500;
+
+        /// <summary>
+        /// Minimum similarity of a cached input to warm-start from its solution
+        /// </summary>
+        public double NearMissSimilarity { get; set; } = 0.8;
+    }
+
+    /// <summary>
+    /// Cache hit rate and saved solver time
+    /// </summary>
+    public class ScheduleCacheStatistics
+    {
+        public long Lookups { get; set; }
+        public long Hits { get; set; }
+        public long NearMisses { get; set; }
+        public long WarmStarts { get; set; }
+        public long Misses { get; set; }
+        public double HitRate { get; set; }
+        public double SavedSolverSeconds { get; set; }
+        public int MemoryEntries { get; set; }
+        public bool DatabaseEnabled { get; set; }
+    }
+
+    /// <summary>
+    /// Result of a cache lookup: the stored result on a hit, the closest prior solution on a near miss
+    /// </summary>
+    public class ScheduleCacheLookup
+    {
+        public SchedulingResult? Result { get; set; }
+        public SchedulingSolution? WarmStartSolution { get; set; }
+        public ProblemFingerprint? WarmStartFingerprint { get; set; }
+        public double Similarity { get; set; }
+
+        /// <summary>
+        /// Solve time of the cached result
+        /// </summary>
+        public long SolveTimeMs { get; set; }
+    }
+
+    /// <summary>
+    /// Bounded cache of scheduling results keyed by ProblemFingerprint: an LRU list in memory backed by the
+    /// ScheduleResultCacheEntries table. Only the best solution of a result is stored in the database and rebuilt
+    /// for the requesting problem. Database errors disable the database part and leave the memory cache working
+    /// </summary>
+    public class ScheduleResultCache
+    {
+        /// <summary>
+        /// Database entries compared on a near miss lookup
+        /// </summary>
+        private const int NearMissCandidates = 20;
+
+        private readonly IServiceScopeFactory _scopeFactory;
+        private readonly ILogger<ScheduleResultCache> _logger;
+        private readonly ScheduleCacheOptions _options;
+
+        private readonly object _lock = new object();
+        private readonly LinkedList<CacheEntry> _lru = new LinkedList<CacheEntry>();
+        private readonly Dictionary<string, LinkedListNode<CacheEntry>> _entries = new Dictionary<string, LinkedListNode<CacheEntry>>();
+
+        private long _lookups;
+        private long _hits;
+        private long _nearMisses;
+        private long _warmStarts;
+        private long _savedSolverMs;
+        private volatile bool _databaseEnabled;
+
+        public ScheduleResultCache(IServiceScopeFactory scopeFactory, IOptions<ScheduleCacheOptions> options, ILogger<ScheduleResultCache> logger)
+        {
+            _scopeFactory = scopeFactory ?? throw new ArgumentNullException(nameof(scopeFactory));
+            _logger = logger ?? throw new ArgumentNullException(nameof(logger));
+            _options = options?.Value ?? new ScheduleCacheOptions();
+            _databaseEnabled = _options.UseDatabase;
+        }
+
+        /// <summary>
+        /// Look up a problem, in memory first and then in the database
+        /// </summary>
+        public ScheduleCacheLookup Lookup(SchedulingProblem problem, ProblemFingerprint fingerprint)
+        {
+            ArgumentNullException.ThrowIfNull(problem);
+            ArgumentNullException.ThrowIfNull(fingerprint);
+
+            Interlocked.Increment(ref _lookups);
+            var lookup = new ScheduleCacheLookup();
+
+            lock (_lock)
+            {
+                if (_entries.TryGetValue(fingerprint.Hash, out var node))
+                {
+                    _lru.Remove(node);
+                    _lru.AddFirst(node);
+                    lookup.Result = node.Value.Result;
+                    lookup.SolveTimeMs = node.Value.SolveTimeMs;
+                }
+                else
+                {
+                    // Closest entry computed with the same parameters
+                    foreach (var entry in _lru)
+                    {
+                        double similarity = fingerprint.Similarity(entry.Fingerprint);
+                        if (similarity >= _options.NearMissSimilarity && similarity > lookup.Similarity)
+                        {
+                            lookup.Similarity = similarity;
+                            lookup.WarmStartSolution = entry.BestSolution;
+                            lookup.WarmStartFingerprint = entry.Fingerprint;
+                            lookup.SolveTimeMs = entry.SolveTimeMs;
+                        }
+                    }
+                }
+            }
+
+            if (lookup.Result == null && _databaseEnabled)
+            {
+                LookupDatabase(problem, fingerprint, lookup);
+            }
+
+            if (lookup.Result != null)
+            {
+                Interlocked.Increment(ref _hits);
+                Interlocked.Add(ref _savedSolverMs, lookup.SolveTimeMs);
+                _logger.LogInformation($"Schedule cache hit for {fingerprint.Hash[..12]}, saved {lookup.SolveTimeMs}ms of solving");
+            }
+            else if (lookup.WarmStartSolution != null)
+            {
+                Interlocked.Increment(ref _nearMisses);
+                _logger.LogInformation($"Schedule cache near miss for {fingerprint.Hash[..12]}, closest cached input similarity {lookup.Similarity:P0}");
+            }
+
+            return lookup;
+        }
+
+        /// <summary>
+        /// Record a successful warm start and the solver time it saved compared with the cached solve
+        /// </summary>
+        public void RecordWarmStart(long savedSolverMs)
+        {
+            Interlocked.Increment(ref _warmStarts);
+            Interlocked.Add(ref _savedSolverMs, Math.Max(0, savedSolverMs));
+        }
+
+        /// <summary>
+        /// Store a successful result
+        /// </summary>
+        /// <param name="fingerprint">Fingerprint of the input</param>
+        /// <param name="result">Scheduling result</param>
+        /// <param name="solveTimeMs">Solver time a hit saves</param>
+        public void Store(ProblemFingerprint fingerprint, SchedulingResult result, long solveTimeMs)
+        {
+            ArgumentNullException.ThrowIfNull(fingerprint);
+            var bestSolution = GetBestSolution(result);
+            if (bestSolution == null)
+                return;
+
+            var entry = new CacheEntry(fingerprint, result, bestSolution, solveTimeMs);
+
+            lock (_lock)
+            {
+                AddEntry(entry);
+            }
+
+            if (_databaseEnabled)
+            {
+                StoreInDatabase(entry);
+            }
+        }
+
+        public ScheduleCacheStatistics GetStatistics()
+        {
+            long lookups = Interlocked.Read(ref _lookups);
+            long hits = Interlocked.Read(ref _hits);
+
+            lock (_lock)
+            {
+                return new ScheduleCacheStatistics
+                {
+                    Lookups = lookups,
+                    Hits = hits,
+                    NearMisses = Interlocked.Read(ref _nearMisses),
+                    WarmStarts = Interlocked.Read(ref _warmStarts),
+                    Misses = lookups - hits,
+                    HitRate = lookups > 0 ? (double)hits / lookups : 0,
+                    SavedSolverSeconds = Interlocked.Read(ref _savedSolverMs) / 1000.0,
+                    MemoryEntries = _lru.Count,
+                    DatabaseEnabled = _databaseEnabled
+                };
+            }
+        }
+
+        private void LookupDatabase(SchedulingProblem problem, ProblemFingerprint fingerprint, ScheduleCacheLookup lookup)
+        {
+            try
+            {
+                using var scope = _scopeFactory.CreateScope();
+                var dbContext = scope.ServiceProvider.GetService<AppDbContext>();
+                if (dbContext == null)
+                {
+                    _databaseEnabled = false;
+                    return;
+                }
+
+                var exact = dbContext.ScheduleResultCacheEntries
+                    .AsNoTracking()
+                    .FirstOrDefault(e => e.Fingerprint == fingerprint.Hash);
+
+                if (exact != null)
+                {
+                    var solution = RestoreSolution(exact, problem);
+                    lookup.Result = new SchedulingResult
+                    {
+                        Status = SchedulingStatus.Success,
+                        Message = "Loaded from schedule cache",
+                        Problem = problem,
+                        Solutions = new List<SchedulingSolution> { solution },
+                        ExecutionTimeMs = 0
+                    };
+                    lookup.SolveTimeMs = exact.SolveTimeMs;
+
+                    dbContext.ScheduleResultCacheEntries
+                        .Where(e => e.ScheduleResultCacheEntryId == exact.ScheduleResultCacheEntryId)
+                        .ExecuteUpdate(s => s
+                            .SetProperty(e => e.HitCount, e => e.HitCount + 1)
+                            .SetProperty(e => e.LastUsedAt, DateTime.Now));
+
+                    lock (_lock)
+                    {
+                        if (!_entries.ContainsKey(fingerprint.Hash))
+                        {
+                            AddEntry(new CacheEntry(fingerprint, lookup.Result, solution, exact.SolveTimeMs));
+                        }
+                    }
+                    return;
+                }
+
+                var candidates = dbContext.ScheduleResultCacheEntries
+                    .AsNoTracking()
+                    .Where(e => e.ParametersHash == fingerprint.ParametersHash && e.SemesterId == fingerprint.SemesterId)
+                    .OrderByDescending(e => e.LastUsedAt)
+                    .Take(NearMissCandidates)
+                    .ToList();
+
+                foreach (var candidate in candidates)
+                {
+                    var elements = JsonSerializer.Deserialize<Dictionary<string, long>>(candidate.ElementsJson) ?? new Dictionary<string, long>();
+                    var candidateFingerprint = new ProblemFingerprint(candidate.Fingerprint, candidate.ParametersHash, candidate.SemesterId, elements);
+                    double similarity = fingerprint.Similarity(candidateFingerprint);
+
+                    if (similarity >= _options.NearMissSimilarity && similarity > lookup.Similarity)
+                    {
+                        lookup.Similarity = similarity;
+                        lookup.WarmStartSolution = RestoreSolution(candidate, problem);
+                        lookup.WarmStartFingerprint = candidateFingerprint;
+                        lookup.SolveTimeMs = candidate.SolveTimeMs;
+                    }
+                }
+            }
+            catch (Exception ex)
+            {
+                DisableDatabase(ex);
+            }
+        }
+
+        private void StoreInDatabase(CacheEntry entry)
+        {
+            try
+            {
+                using var scope = _scopeFactory.CreateScope();
+                var dbContext = scope.ServiceProvider.GetService<AppDbContext>();
+                if (dbContext == null)
+                {
+                    _databaseEnabled = false;
+                    return;
+                }
+
+                var assignments = entry.BestSolution.Assignments
+                    .Select(a => new CachedAssignment(a.SectionId, a.TeacherId, a.ClassroomId, a.TimeSlotId))
+                    .ToList();
+
+                var stored = dbContext.ScheduleResultCacheEntries.FirstOrDefault(e => e.Fingerprint == entry.Fingerprint.Hash);
+                if (stored == null)
+                {
+                    stored = new ScheduleResultCacheEntry
+                    {
+                        Fingerprint = entry.Fingerprint.Hash,
+                        CreatedAt = DateTime.Now
+                    };
+                    dbContext.ScheduleResultCacheEntries.Add(stored);
+                }
+
+                stored.ParametersHash = entry.Fingerprint.ParametersHash;
+                stored.SemesterId = entry.Fingerprint.SemesterId;
+                stored.ElementsJson = JsonSerializer.Serialize(entry.Fingerprint.Elements);
+                stored.AssignmentsJson = JsonSerializer.Serialize(assignments);
+                stored.Algorithm = entry.BestSolution.Algorithm ?? string.Empty;
+                stored.Score = entry.BestSolution.Evaluation?.Score ?? 0;
+                stored.SolveTimeMs = entry.SolveTimeMs;
+                stored.LastUsedAt = DateTime.Now;
+                dbContext.SaveChanges();
+
+                // Keep the table bounded, least recently used entries go first
+                var expiredIds = dbContext.ScheduleResultCacheEntries
+                    .OrderByDescending(e => e.LastUsedAt)
+                    .Skip(Math.Max(1, _options.MaxPersistedEntries))
+                    .Select(e => e.ScheduleResultCacheEntryId)
+                    .ToList();
+
+                if (expiredIds.Count > 0)
+                {
+                    dbContext.ScheduleResultCacheEntries
+                        .Where(e => expiredIds.Contains(e.ScheduleResultCacheEntryId))
+                        .ExecuteDelete();
+                }
+            }
+            catch (Exception ex)
+            {
+                DisableDatabase(ex);
+            }
+        }
+
+        /// <summary>
+        /// Add an entry as the most recently used one and evict the least recently used beyond the capacity.
+        /// Callers hold the lock
+        /// </summary>
+        private void AddEntry(CacheEntry entry)
+        {
+            if (_entries.TryGetValue(entry.Fingerprint.Hash, out var existing))
+            {
+                _lru.Remove(existing);
+            }
+
+            _entries[entry.Fingerprint.Hash] = _lru.AddFirst(entry);
+
+            while (_lru.Count > Math.Max(1, _options.Capacity))
+            {
+                _entries.Remove(_lru.Last!.Value.Fingerprint.Hash);
+                _lru.RemoveLast();
+            }
+        }
+
+        private void DisableDatabase(Exception ex)
+        {
+            _databaseEnabled = false;
+            _logger.LogWarning(ex, "Schedule cache database is not available, continuing with the memory cache only");
+        }
+
+        /// <summary>
+        /// Rebuild a stored solution for the requesting problem, dropping placements of sections, resources or
+        /// time slots the problem does not contain
+        /// </summary>
+        private static SchedulingSolution RestoreSolution(ScheduleResultCacheEntry entry, SchedulingProblem problem)
+        {
+            var sections = problem.CourseSections.ToDictionary(s => s.Id);
+            var teachers = problem.Teachers.ToDictionary(t => t.Id);
+            var classrooms = problem.Classrooms.ToDictionary(c => c.Id);
+            var timeSlots = problem.TimeSlots.ToDictionary(t => t.Id);
+
+            var solution = new SchedulingSolution
+            {
+                ProblemId = problem.Id,
+                Problem = problem,
+                Name = "Cached Solution",
+                CreatedAt = entry.CreatedAt,
+                Algorithm = entry.Algorithm,
+                Assignments = new List<SchedulingAssignment>()
+            };
+
+            int assignmentId = 1;
+            foreach (var cached in JsonSerializer.Deserialize<List<CachedAssignment>>(entry.AssignmentsJson) ?? new List<CachedAssignment>())
+            {
+                if (!sections.TryGetValue(cached.SectionId, out var section) ||
+                    !teachers.TryGetValue(cached.TeacherId, out var teacher) ||
+                    !classrooms.TryGetValue(cached.ClassroomId, out var classroom) ||
+                    !timeSlots.TryGetValue(cached.TimeSlotId, out var timeSlot))
+                {
+                    continue;
+                }
+
+                solution.Assignments.Add(new SchedulingAssignment
+                {
+                    Id = assignmentId++,
+                    SectionId = section.Id,
+                    SectionCode = section.SectionCode,
+                    CourseSection = section,
+                    TeacherId = teacher.Id,
+                    TeacherName = teacher.Name,
+                    Teacher = teacher,
+                    ClassroomId = classroom.Id,
+                    ClassroomName = classroom.Name,
+                    Building = classroom.Building,
+                    Classroom = classroom,
+                    TimeSlotId = timeSlot.Id,
+                    DayOfWeek = timeSlot.DayOfWeek,
+                    StartTime = timeSlot.StartTime,
+                    EndTime = timeSlot.EndTime,
+                    TimeSlot = timeSlot
+                });
+            }
+
+            solution.Evaluation = new SchedulingEvaluation
+            {
+                SolutionId = solution.Id,
+                Score = entry.Score,
+                IsFeasible = true,
+                HardConstraintsSatisfied = true
+            };
+
+            return solution;
+        }
+
+        private static SchedulingSolution? GetBestSolution(SchedulingResult result)
+        {
+            return result?.Solutions?
+                .Where(s => s != null)
+                .OrderByDescending(s => s.Evaluation?.Score ?? 0)
+                .FirstOrDefault();
+        }
+
+        private sealed record CacheEntry(ProblemFingerprint Fingerprint, SchedulingResult Result, SchedulingSolution BestSolution, long SolveTimeMs);
+
+        private sealed record CachedAssignment(int SectionId, int TeacherId, int ClassroomId, int TimeSlotId);
+    }
+}
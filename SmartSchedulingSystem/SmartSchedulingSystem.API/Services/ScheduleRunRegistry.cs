@@ -0,0 +1,54 @@
+using System.Collections.Concurrent;
+
+namespace SmartSchedulingSystem.API.Services
+{
+    /// <summary>
+    /// Keeps the cancellation sources of the running streamed scheduling runs, so a client can stop a run
+    /// early from a separate request and receive the best solution found so far
+    /// </summary>
+    public class ScheduleRunRegistry
+    {
+        private readonly ConcurrentDictionary<string, CancellationTokenSource> _runs =
+            new ConcurrentDictionary<string, CancellationTokenSource>();
+
+        /// <summary>
+        /// Register a run and return its ID
+        /// </summary>
+        public string Register(CancellationTokenSource cancellationSource)
+        {
+            ArgumentNullException.ThrowIfNull(cancellationSource);
+
+            string runId = Guid.NewGuid().ToString("N");
+            _runs[runId] = cancellationSource;
+            return runId;
+        }
+
+        /// <summary>
+        /// Request a run to stop
+        /// </summary>
+        /// <returns>False if the run is unknown or already completed</returns>
+        public bool TryStop(string runId)
+        {
+            if (string.IsNullOrEmpty(runId) || !_runs.TryGetValue(runId, out var cancellationSource))
+                return false;
+
+            try
+            {
+                cancellationSource.Cancel();
+                return true;
+            }
+            catch (ObjectDisposedException)
+            {
+                return false;
+            }
+        }
+
+        /// <summary>
+        /// Remove a completed run
+        /// </summary>
+        public void Remove(string runId)
+        {
+            _runs.TryRemove(runId, out _);
+        }
+    }
+}
@@ -0,0 +1,128 @@
+namespace SmartSchedulingSystem.Benchmarks
+{
+    /// <summary>
+    /// Measurements of one scheduler on one scenario
+    /// </summary>
+    public class BenchmarkResult
+    {
+        public string Scenario { get; set; } = string.Empty;
+
+        /// <summary>
+        /// "CP", "LS" or "CPLS"
+        /// </summary>
+        public string Scheduler { get; set; } = string.Empty;
+
+        public int Sections { get; set; }
+
+        public int Teachers { get; set; }
+
+        public int Classrooms { get; set; }
+
+        public int TimeSlots { get; set; }
+
+        /// <summary>
+        /// Time to build the Basic level CP model of the whole problem (CP only)
+        /// </summary>
+        public long? ModelBuildMs { get; set; }
+
+        /// <summary>
+        /// Number of CP decision variables (CP only)
+        /// </summary>
+        public int? ModelVariables { get; set; }
+
+        /// <summary>
+        /// Time CP-SAT spends on the built model (CP only)
+        /// </summary>
+        public long? CpSolveMs { get; set; }
+
+        /// <summary>
+        /// CP-SAT status of the built model (CP only)
+        /// </summary>
+        public string? CpStatus { get; set; }
+
+        /// <summary>
+        /// Local search iterations (LS only)
+        /// </summary>
+        public int? LsIterations { get; set; }
+
+        /// <summary>
+        /// Local search iterations per second (LS only)
+        /// </summary>
+        public double? LsIterationsPerSecond { get; set; }
+
+        /// <summary>
+        /// Candidate moves evaluated per second of local search (LS only)
+        /// </summary>
+        public double? LsEvaluatedMovesPerSecond { get; set; }
+
+        /// <summary>
+        /// Share of generated candidate moves skipped as duplicates (LS only)
+        /// </summary>
+        public double? LsDuplicateRate { get; set; }
+
+        /// <summary>
+        /// Average time of a full SolutionEvaluator.Evaluate call on the final solution
+        /// </summary>
+        public double? EvaluationMicroseconds { get; set; }
+
+        /// <summary>
+        /// Wall time of the scheduler call (CPScheduler.GenerateInitialSolutions, LocalSearchOptimizer.OptimizeSolution
+        /// or CPLSScheduler.GenerateSchedule)
+        /// </summary>
+        public long SchedulerMs { get; set; }
+
+        /// <summary>
+        /// Managed bytes allocated during the run
+        /// </summary>
+        public long AllocatedBytes { get; set; }
+
+        /// <summary>
+        /// Peak working set growth during the run: highest sampled working set minus the working set before the run.
+        /// Includes native memory of the CP-SAT solver
+        /// </summary>
+        public long PeakWorkingSetBytes { get; set; }
+
+        /// <summary>
+        /// Peak managed heap growth during the run: highest sampled heap size minus the heap size before the run
+        /// </summary>
+        public long PeakHeapBytes { get; set; }
+
+        /// <summary>
+        /// SolutionEvaluator score of the final solution (0-1, higher is better)
+        /// </summary>
+        public double? FinalScore { get; set; }
+
+        public bool? Feasible { get; set; }
+
+        public string? Error { get; set; }
+    }
+
+    /// <summary>
+    /// Benchmark run written as JSON, compared against the report of another commit with --baseline
+    /// </summary>
+    public class BenchmarkReport
+    {
+        public string Commit { get; set; } = string.Empty;
+
+        public DateTime Timestamp { get; set; }
+
+        public string MachineName { get; set; } = string.Empty;
+
+        public int ProcessorCount { get; set; }
+
+        public string Runtime { get; set; } = string.Empty;
+
+        public int Seed { get; set; }
+
+        public int CpTimeLimit { get; set; }
+
+        public int LsIterations { get; set; }
+
+        public List<BenchmarkResult> Results { get; set; } = new List<BenchmarkResult>();
+
+        /// <summary>
+        /// Schedule result storage measurements, only when run with --storage-connection
+        /// </summary>
+        public StorageBenchmarkResult? Storage { get; set; }
+    }
+}
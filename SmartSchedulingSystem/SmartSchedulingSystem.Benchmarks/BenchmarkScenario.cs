@@ -0,0 +1,71 @@
+namespace SmartSchedulingSystem.Benchmarks
+{
+    /// <summary>
+    /// Resource tightness of a benchmark problem
+    /// </summary>
+    public enum ResourceTightness
+    {
+        /// <summary>
+        /// Classrooms about half occupied, teachers with light loads
+        /// </summary>
+        Loose,
+
+        /// <summary>
+        /// Classrooms almost fully occupied, teachers with heavy loads
+        /// </summary>
+        Tight
+    }
+
+    /// <summary>
+    /// Size and resource tightness of a generated benchmark problem
+    /// </summary>
+    public class BenchmarkScenario
+    {
+        /// <summary>
+        /// Section count tiers
+        /// </summary>
+        public static readonly int[] SectionTiers = { 100, 500, 2000, 5000 };
+
+        /// <summary>
+        /// TestDataGenerator produces at most 5 days x 5 slots, tightness is therefore controlled by the
+        /// number of classrooms and teachers
+        /// </summary>
+        public const int TimeSlotCount = 25;
+
+        public int SectionCount { get; init; }
+
+        public ResourceTightness Tightness { get; init; }
+
+        public string Name => $"{SectionCount}-{Tightness.ToString().ToLowerInvariant()}";
+
+        /// <summary>
+        /// Share of the classroom-slot capacity the sections occupy
+        /// </summary>
+        public double RoomOccupancy => Tightness == ResourceTightness.Tight ? 0.9 : 0.5;
+
+        /// <summary>
+        /// Average number of sections per teacher
+        /// </summary>
+        public double SectionsPerTeacher => Tightness == ResourceTightness.Tight ? 8 : 4;
+
+        public int ClassroomCount => Math.Max(1, (int)Math.Ceiling(SectionCount / (TimeSlotCount * RoomOccupancy)));
+
+        public int TeacherCount => Math.Max(1, (int)Math.Ceiling(SectionCount / SectionsPerTeacher));
+
+        /// <summary>
+        /// All combinations of the given tiers and tightness levels
+        /// </summary>
+        public static List<BenchmarkScenario> CreateAll(IEnumerable<int> sectionTiers, IEnumerable<ResourceTightness> tightnessLevels)
+        {
+            var levels = tightnessLevels.ToList();
+
+            return sectionTiers
+                .SelectMany(sections => levels.Select(tightness => new BenchmarkScenario
+                {
+                    SectionCount = sections,
+                    Tightness = tightness
+                }))
+                .ToList();
+        }
+    }
+}
@@ -0,0 +1,67 @@
+namespace SmartSchedulingSystem.Benchmarks
+{
+    /// <summary>
+    /// Samples the working set and the managed heap size on a background thread while a benchmark run executes.
+    /// Peaks are reported relative to the values when sampling started, so every run gets its own peak instead of
+    /// the process-wide peak of all runs so far. The working set includes native memory such as the CP-SAT solver's
+    /// </summary>
+    internal sealed class MemorySampler : IDisposable
+    {
+        private const int SampleIntervalMs = 10;
+
+        private readonly long _workingSetBefore;
+        private readonly long _heapBefore;
+        private readonly Thread _thread;
+        private volatile bool _stopped;
+
+        // Written by the sampling thread until Dispose has joined it
+        private long _peakWorkingSet;
+        private long _peakHeap;
+
+        public MemorySampler()
+        {
+            _workingSetBefore = Environment.WorkingSet;
+            _heapBefore = GC.GetTotalMemory(false);
+            _peakWorkingSet = _workingSetBefore;
+            _peakHeap = _heapBefore;
+
+            _thread = new Thread(SampleUntilStopped) { IsBackground = true, Name = "Benchmark memory sampler" };
+            _thread.Start();
+        }
+
+        /// <summary>
+        /// Highest sampled working set minus the working set when sampling started, valid after Dispose
+        /// </summary>
+        public long PeakWorkingSetBytes => Math.Max(0, _peakWorkingSet - _workingSetBefore);
+
+        /// <summary>
+        /// Highest sampled managed heap size minus the heap size when sampling started, valid after Dispose
+        /// </summary>
+        public long PeakHeapBytes => Math.Max(0, _peakHeap - _heapBefore);
+
+        public void Dispose()
+        {
+            if (_stopped)
+                return;
+
+            _stopped = true;
+            _thread.Join();
+            Sample();
+        }
+
+        private void SampleUntilStopped()
+        {
+            while (!_stopped)
+            {
+                Sample();
+                Thread.Sleep(SampleIntervalMs);
+            }
+        }
+
+        private void Sample()
+        {
+            _peakWorkingSet = Math.Max(_peakWorkingSet, Environment.WorkingSet);
+            _peakHeap = Math.Max(_peakHeap, GC.GetTotalMemory(false));
+        }
+    }
+}
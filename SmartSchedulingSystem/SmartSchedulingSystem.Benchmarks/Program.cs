@@ -0,0 +1,255 @@
+using System.Diagnostics;
+using System.Globalization;
+using System.Text.Json;
+
+namespace SmartSchedulingSystem.Benchmarks
+{
+    /// <summary>
+    /// Scheduler benchmark suite.
+    ///
+    /// Usage: dotnet run -c Release --project SmartSchedulingSystem.Benchmarks -- [options]
+    ///   --tiers 100,500,2000,5000     section count tiers
+    ///   --tightness loose,tight       resource tightness levels
+    ///   --schedulers CP,LS,CPLS       schedulers to run
+    ///   --seed 42                     problem and search seed
+    ///   --cp-time-limit 30            CP time limit in seconds
+    ///   --ls-iterations 2000          local search iterations
+    ///   --output path.json            report file (default: benchmark-results/{commit}.json)
+    ///   --baseline path.json          compare with the report of another commit
+    ///   --threshold 10                regression threshold in percent
+    ///   --storage-connection "..."    also time saving and reading a schedule result in this SQL Server database
+    ///   --storage-items 10000         item count of the saved schedule result
+    /// The exit code is 1 when a regression against the baseline exceeds the threshold
+    /// </summary>
+    public static class Program
+    {
+        private static readonly JsonSerializerOptions JsonOptions = new JsonSerializerOptions { WriteIndented = true };
+
+        public static int Main(string[] args)
+        {
+            var options = ParseArguments(args);
+
+            var tiers = GetOption(options, "tiers", string.Join(",", BenchmarkScenario.SectionTiers))
+                .Split(',', StringSplitOptions.RemoveEmptyEntries)
+                .Select(t => int.Parse(t, CultureInfo.InvariantCulture));
+            var tightness = GetOption(options, "tightness", "loose,tight")
+                .Split(',', StringSplitOptions.RemoveEmptyEntries)
+                .Select(t => Enum.Parse<ResourceTightness>(t, ignoreCase: true));
+            var schedulers = GetOption(options, "schedulers", $"{SchedulerBenchmark.Cp},{SchedulerBenchmark.LocalSearch},{SchedulerBenchmark.CpLs}")
+                .Split(',', StringSplitOptions.RemoveEmptyEntries)
+                .Select(s => s.ToUpperInvariant())
+                .ToList();
+            int seed = int.Parse(GetOption(options, "seed", "42"), CultureInfo.InvariantCulture);
+            int cpTimeLimit = int.Parse(GetOption(options, "cp-time-limit", "30"), CultureInfo.InvariantCulture);
+            int lsIterations = int.Parse(GetOption(options, "ls-iterations", "2000"), CultureInfo.InvariantCulture);
+            double threshold = double.Parse(GetOption(options, "threshold", "10"), CultureInfo.InvariantCulture);
+
+            string commit = GetCommit();
+            var report = new BenchmarkReport
+            {
+                Commit = commit,
+                Timestamp = DateTime.UtcNow,
+                MachineName = Environment.MachineName,
+                ProcessorCount = Environment.ProcessorCount,
+                Runtime = System.Runtime.InteropServices.RuntimeInformation.FrameworkDescription,
+                Seed = seed,
+                CpTimeLimit = cpTimeLimit,
+                LsIterations = lsIterations
+            };
+
+            var benchmark = new SchedulerBenchmark(seed, cpTimeLimit, lsIterations);
+            foreach (var scenario in BenchmarkScenario.CreateAll(tiers, tightness))
+            {
+                foreach (var scheduler in schedulers)
+                {
+                    Console.WriteLine($"Running {scheduler} on {scenario.Name} " +
+                                      $"({scenario.SectionCount} sections, {scenario.TeacherCount} teachers, {scenario.ClassroomCount} classrooms)...");
+
+                    var result = benchmark.Run(scenario, scheduler);
+                    report.Results.Add(result);
+                    Console.WriteLine(FormatResult(result));
+                }
+            }
+
+            if (options.TryGetValue("storage-connection", out var storageConnection))
+            {
+                int storageItems = int.Parse(GetOption(options, "storage-items", StorageBenchmark.DefaultItemCount.ToString(CultureInfo.InvariantCulture)),
+                    CultureInfo.InvariantCulture);
+                Console.WriteLine($"Running storage benchmark with {storageItems} items...");
+
+                report.Storage = StorageBenchmark.RunAsync(storageConnection, storageItems).GetAwaiter().GetResult();
+                Console.WriteLine($"  save {report.Storage.SaveMs}ms (header {report.Storage.HeaderMs}ms, items {report.Storage.ItemsMs}ms), " +
+                                  $"read {report.Storage.ReadMs}ms" +
+                                  (report.Storage.Error != null ? $", error: {report.Storage.Error}" : ""));
+            }
+
+            string outputPath = GetOption(options, "output", Path.Combine("benchmark-results", $"{commit}.json"));
+            var directory = Path.GetDirectoryName(Path.GetFullPath(outputPath));
+            if (!string.IsNullOrEmpty(directory))
+                Directory.CreateDirectory(directory);
+            File.WriteAllText(outputPath, JsonSerializer.Serialize(report, JsonOptions));
+            Console.WriteLine($"Report written to {outputPath}");
+
+            if (options.TryGetValue("baseline", out var baselinePath))
+            {
+                var baseline = JsonSerializer.Deserialize<BenchmarkReport>(File.ReadAllText(baselinePath));
+                if (baseline == null)
+                {
+                    Console.WriteLine($"Cannot read baseline {baselinePath}");
+                    return 2;
+                }
+
+                return CompareWithBaseline(report, baseline, threshold) ? 0 : 1;
+            }
+
+            return 0;
+        }
+
+        /// <summary>
+        /// Print the change of every metric against the baseline
+        /// </summary>
+        /// <returns>False if a metric regressed by more than the threshold</returns>
+        private static bool CompareWithBaseline(BenchmarkReport current, BenchmarkReport baseline, double thresholdPercent)
+        {
+            Console.WriteLine($"Comparison with baseline {baseline.Commit} (threshold {thresholdPercent}%):");
+
+            var baselineResults = baseline.Results.ToDictionary(r => (r.Scenario, r.Scheduler));
+            bool passed = true;
+
+            foreach (var result in current.Results)
+            {
+                if (!baselineResults.TryGetValue((result.Scenario, result.Scheduler), out var previous))
+                    continue;
+
+                // Metric name, previous value, current value, whether higher is better
+                var metrics = new (string Name, double? Previous, double? Current, bool HigherIsBetter)[]
+                {
+                    ("ModelBuildMs", previous.ModelBuildMs, result.ModelBuildMs, false),
+                    ("CpSolveMs", previous.CpSolveMs, result.CpSolveMs, false),
+                    ("SchedulerMs", previous.SchedulerMs, result.SchedulerMs, false),
+                    ("LsIterationsPerSecond", previous.LsIterationsPerSecond, result.LsIterationsPerSecond, true),
+                    ("LsEvaluatedMovesPerSecond", previous.LsEvaluatedMovesPerSecond, result.LsEvaluatedMovesPerSecond, true),
+                    ("EvaluationMicroseconds", previous.EvaluationMicroseconds, result.EvaluationMicroseconds, false),
+                    ("AllocatedBytes", previous.AllocatedBytes, result.AllocatedBytes, false),
+                    ("PeakWorkingSetBytes", previous.PeakWorkingSetBytes, result.PeakWorkingSetBytes, false),
+                    ("PeakHeapBytes", previous.PeakHeapBytes, result.PeakHeapBytes, false),
+                    ("FinalScore", previous.FinalScore, result.FinalScore, true)
+                };
+
+                foreach (var metric in metrics)
+                {
+                    if (!metric.Previous.HasValue || !metric.Current.HasValue || metric.Previous.Value == 0)
+                        continue;
+
+                    double changePercent = (metric.Current.Value - metric.Previous.Value) / Math.Abs(metric.Previous.Value) * 100;
+                    bool regressed = metric.HigherIsBetter ? changePercent < -thresholdPercent : changePercent > thresholdPercent;
+                    if (regressed)
+                        passed = false;
+
+                    Console.WriteLine($"  {result.Scheduler,-4} {result.Scenario,-12} {metric.Name,-26} " +
+                                      $"{metric.Previous.Value,14:F1} -> {metric.Current.Value,14:F1} ({changePercent,7:+0.0;-0.0}%)" +
+                                      (regressed ? "  REGRESSION" : ""));
+                }
+            }
+
+            if (current.Storage != null && baseline.Storage != null && current.Storage.Items == baseline.Storage.Items)
+            {
+                var storageMetrics = new (string Name, long? Previous, long? Current)[]
+                {
+                    ("StorageSaveMs", baseline.Storage.SaveMs, current.Storage.SaveMs),
+                    ("StorageReadMs", baseline.Storage.ReadMs, current.Storage.ReadMs)
+                };
+
+                foreach (var metric in storageMetrics)
+                {
+                    if (!metric.Previous.HasValue || !metric.Current.HasValue || metric.Previous.Value == 0)
+                        continue;
+
+                    double changePercent = (metric.Current.Value - metric.Previous.Value) * 100.0 / metric.Previous.Value;
+                    bool regressed = changePercent > thresholdPercent;
+                    if (regressed)
+                        passed = false;
+
+                    Console.WriteLine($"  {"DB",-4} {current.Storage.Items + " items",-12} {metric.Name,-26} " +
+                                      $"{metric.Previous.Value,14:F1} -> {metric.Current.Value,14:F1} ({changePercent,7:+0.0;-0.0}%)" +
+                                      (regressed ? "  REGRESSION" : ""));
+                }
+            }
+
+            return passed;
+        }
+
+        private static string FormatResult(BenchmarkResult result)
+        {
+            var parts = new List<string> { $"scheduler {result.SchedulerMs}ms" };
+            if (result.ModelBuildMs.HasValue)
+                parts.Add($"build {result.ModelBuildMs}ms ({result.ModelVariables} variables)");
+            if (result.CpSolveMs.HasValue)
+                parts.Add($"solve {result.CpSolveMs}ms ({result.CpStatus})");
+            if (result.LsIterationsPerSecond.HasValue)
+                parts.Add($"{result.LsIterations} iterations ({result.LsIterationsPerSecond:F1}/s)");
+            if (result.LsEvaluatedMovesPerSecond.HasValue)
+                parts.Add($"{result.LsEvaluatedMovesPerSecond:F0} moves/s, {result.LsDuplicateRate:P1} duplicates");
+            if (result.EvaluationMicroseconds.HasValue)
+                parts.Add($"evaluate {result.EvaluationMicroseconds:F1}us");
+            if (result.FinalScore.HasValue)
+                parts.Add($"score {result.FinalScore:F4}{(result.Feasible == true ? "" : " (infeasible)")}");
+            parts.Add($"allocated {result.AllocatedBytes / (1024 * 1024)}MB, " +
+                      $"peak +{result.PeakWorkingSetBytes / (1024 * 1024)}MB working set, +{result.PeakHeapBytes / (1024 * 1024)}MB heap");
+            if (result.Error != null)
+                parts.Add($"error: {result.Error}");
+
+            return "  " + string.Join(", ", parts);
+        }
+
+        private static Dictionary<string, string> ParseArguments(string[] args)
+        {
+            var options = new Dictionary<string, string>(StringComparer.OrdinalIgnoreCase);
+            for (int i = 0; i < args.Length - 1; i++)
+            {
+                if (args[i].StartsWith("--", StringComparison.Ordinal))
+                {
+                    options[args[i].Substring(2)] = args[i + 1];
+                    i++;
+                }
+            }
+            return options;
+        }
+
+        private static string GetOption(Dictionary<string, string> options, string name, string defaultValue) =>
+            options.TryGetValue(name, out var value) ? value : defaultValue;
+
+        /// <summary>
+        /// Current commit for the report, from BENCHMARK_COMMIT or git
+        /// </summary>
+        private static string GetCommit()
+        {
+            var commit = Environment.GetEnvironmentVariable("BENCHMARK_COMMIT");
+            if (!string.IsNullOrWhiteSpace(commit))
+                return commit.Trim();
+
+            try
+            {
+                using var git = Process.Start(new ProcessStartInfo("git", "rev-parse --short HEAD")
+                {
+                    RedirectStandardOutput = true,
+                    RedirectStandardError = true,
+                    UseShellExecute = false
+                });
+                if (git != null)
+                {
+                    string output = git.StandardOutput.ReadToEnd().Trim();
+                    git.WaitForExit();
+                    if (git.ExitCode == 0 && output.Length > 0)
+                        return output;
+                }
+            }
+            catch (Exception)
+            {
+                // git is not available
+            }
+
+            return "unknown";
+        }
+    }
+}
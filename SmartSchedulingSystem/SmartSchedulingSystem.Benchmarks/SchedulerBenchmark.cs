@@ -0,0 +1,224 @@
+using Google.OrTools.Sat;
+using Microsoft.Extensions.DependencyInjection;
+using Microsoft.Extensions.Logging;
+using SmartSchedulingSystem.Scheduling;
+using SmartSchedulingSystem.Scheduling.Algorithms.CP;
+using SmartSchedulingSystem.Scheduling.Algorithms.Hybrid;
+using SmartSchedulingSystem.Scheduling.Algorithms.LS;
+using SmartSchedulingSystem.Scheduling.Engine;
+using SmartSchedulingSystem.Scheduling.Models;
+using SmartSchedulingSystem.Scheduling.Utils;
+using System.Diagnostics;
+using System.Globalization;
+
+namespace SmartSchedulingSystem.Benchmarks
+{
+    /// <summary>
+    /// Runs CPScheduler, LocalSearchOptimizer and CPLSScheduler on seeded TestDataGenerator problems.
+    /// Every run gets a fresh service provider, so caches and singletons of one run do not affect the next
+    /// </summary>
+    public class SchedulerBenchmark
+    {
+        public const string Cp = "CP";
+        public const string LocalSearch = "LS";
+        public const string CpLs = "CPLS";
+
+        /// <summary>
+        /// Number of timed full evaluations per run
+        /// </summary>
+        private const int EvaluationSamples = 20;
+
+        private readonly int _seed;
+        private readonly int _cpTimeLimit;
+        private readonly int _lsIterations;
+
+        public SchedulerBenchmark(int seed, int cpTimeLimit, int lsIterations)
+        {
+            _seed = seed;
+            _cpTimeLimit = cpTimeLimit;
+            _lsIterations = lsIterations;
+        }
+
+        /// <summary>
+        /// Run one scheduler on one scenario
+        /// </summary>
+        public BenchmarkResult Run(BenchmarkScenario scenario, string scheduler)
+        {
+            var problem = GenerateProblem(scenario);
+            var result = new BenchmarkResult
+            {
+                Scenario = scenario.Name,
+                Scheduler = scheduler,
+                Sections = problem.CourseSections.Count,
+                Teachers = problem.Teachers.Count,
+                Classrooms = problem.Classrooms.Count,
+                TimeSlots = problem.TimeSlots.Count
+            };
+
+            using var services = CreateServices();
+            GlobalConstraintManager.Initialize(services.GetRequiredService<ConstraintManager>());
+            var evaluator = services.GetRequiredService<SolutionEvaluator>();
+
+            GC.Collect();
+            GC.WaitForPendingFinalizers();
+            long allocatedBefore = GC.GetTotalAllocatedBytes(true);
+            var memory = new MemorySampler();
+
+            try
+            {
+                var solution = scheduler switch
+                {
+                    Cp => RunCp(services, problem, result),
+                    LocalSearch => RunLocalSearch(services, problem, result),
+                    CpLs => RunCpLs(services, problem, result),
+                    _ => throw new ArgumentException($"Unknown scheduler: {scheduler}", nameof(scheduler))
+                };
+
+                if (solution != null)
+                {
+                    var evaluation = evaluator.Evaluate(solution);
+                    result.FinalScore = evaluation.Score;
+                    result.Feasible = evaluation.IsFeasible;
+                    result.EvaluationMicroseconds = MeasureEvaluation(evaluator, solution);
+                }
+            }
+            catch (Exception ex)
+            {
+                result.Error = ex.Message;
+            }
+            finally
+            {
+                memory.Dispose();
+            }
+
+            result.AllocatedBytes = GC.GetTotalAllocatedBytes(true) - allocatedBefore;
+            result.PeakWorkingSetBytes = memory.PeakWorkingSetBytes;
+            result.PeakHeapBytes = memory.PeakHeapBytes;
+
+            return result;
+        }
+
+        private SchedulingSolution? RunCp(ServiceProvider services, SchedulingProblem problem, BenchmarkResult result)
+        {
+            // Build and solve the Basic level model of the whole problem to time the two steps separately
+            var modelBuilder = services.GetRequiredService<CPModelBuilder>();
+            var eligibility = EligibilityIndex.Build(problem);
+
+            var sw = Stopwatch.StartNew();
+            var model = modelBuilder.BuildModel(problem, ConstraintApplicationLevel.Basic, eligibility);
+            result.ModelBuildMs = sw.ElapsedMilliseconds;
+            result.ModelVariables = modelBuilder.GetVariableTable().Count;
+
+            var solver = new CpSolver
+            {
+                StringParameters = string.Format(CultureInfo.InvariantCulture,
+                    "num_search_workers:{0};max_time_in_seconds:{1};random_seed:{2}",
+                    Environment.ProcessorCount, _cpTimeLimit, _seed)
+            };
+            sw.Restart();
+            var status = solver.Solve(model);
+            result.CpSolveMs = sw.ElapsedMilliseconds;
+            result.CpStatus = status.ToString();
+
+            // End-to-end CP phase, including decomposition and the constraint level cascade
+            var cpScheduler = services.GetRequiredService<CPScheduler>();
+            sw.Restart();
+            var solutions = cpScheduler.GenerateInitialSolutions(problem, 1);
+            result.SchedulerMs = sw.ElapsedMilliseconds;
+
+            return solutions.FirstOrDefault();
+        }
+
+        private SchedulingSolution? RunLocalSearch(ServiceProvider services, SchedulingProblem problem, BenchmarkResult result)
+        {
+            // Start from the same seeded random assignment in every run, independent of the CP phase
+            var initialSolution = new TestDataGenerator(_seed).CreateTestSolution(problem);
+            var optimizer = services.GetRequiredService<LocalSearchOptimizer>();
+            var saController = services.GetRequiredService<SimulatedAnnealingController>();
+
+            var sw = Stopwatch.StartNew();
+            var solution = optimizer.OptimizeSolution(initialSolution);
+            result.SchedulerMs = sw.ElapsedMilliseconds;
+
+            result.LsIterations = saController.CurrentIteration;
+            result.LsIterationsPerSecond = sw.Elapsed.TotalSeconds > 0
+                ? Math.Round(saController.CurrentIteration / sw.Elapsed.TotalSeconds, 1)
+                : null;
+            result.LsEvaluatedMovesPerSecond = Math.Round(optimizer.LastStatistics.EvaluatedMovesPerSecond, 1);
+            result.LsDuplicateRate = Math.Round(optimizer.LastStatistics.DuplicateRate, 4);
+
+            return solution;
+        }
+
+        private static SchedulingSolution? RunCpLs(ServiceProvider services, SchedulingProblem problem, BenchmarkResult result)
+        {
+            var scheduler = services.GetRequiredService<CPLSScheduler>();
+
+            var sw = Stopwatch.StartNew();
+            var schedulingResult = scheduler.GenerateSchedule(problem);
+            result.SchedulerMs = sw.ElapsedMilliseconds;
+
+            if (schedulingResult.Status != SchedulingStatus.Success)
+                result.Error = schedulingResult.Message;
+
+            return schedulingResult.Solutions?.FirstOrDefault();
+        }
+
+        /// <summary>
+        /// Average time of a full evaluation. The copy has no ID so the evaluator's per-solution score cache is bypassed
+        /// </summary>
+        private static double MeasureEvaluation(SolutionEvaluator evaluator, SchedulingSolution solution)
+        {
+            var probe = solution.Clone();
+            probe.Id = 0;
+
+            evaluator.Evaluate(probe);
+            var sw = Stopwatch.StartNew();
+            for (int i = 0; i < EvaluationSamples; i++)
+            {
+                evaluator.Evaluate(probe);
+            }
+
+            return Math.Round(sw.Elapsed.TotalMilliseconds * 1000 / EvaluationSamples, 1);
+        }
+
+        private SchedulingProblem GenerateProblem(BenchmarkScenario scenario)
+        {
+            var problem = new TestDataGenerator(_seed).GenerateTestProblem(
+                scenario.SectionCount,
+                scenario.TeacherCount,
+                scenario.ClassroomCount,
+                BenchmarkScenario.TimeSlotCount);
+            problem.Name = $"Benchmark {scenario.Name} (seed {_seed})";
+            return problem;
+        }
+
+        private ServiceProvider CreateServices()
+        {
+            var parameters = new SchedulingParameters
+            {
+                InitialSolutionCount = 1,
+                CpTimeLimit = _cpTimeLimit,
+                MaxLsIterations = _lsIterations,
+                EnableParallelOptimization = false
+            };
+
+            var services = new ServiceCollection();
+            services.AddLogging(configure => configure.AddConsole().SetMinimumLevel(LogLevel.Warning));
+            services.AddSchedulingServices(parameters);
+
+            // Seeded annealing that cools over the configured iteration count, so LS throughput is measured
+            // over the same number of iterations in every run
+            services.AddSingleton(provider => new SimulatedAnnealingController(
+                provider.GetRequiredService<ILogger<SimulatedAnnealingController>>(),
+                initialTemp: 100.0,
+                finalTemp: 0.1,
+                coolingRate: Math.Pow(0.1 / 100.0, 1.0 / Math.Max(1, _lsIterations)),
+                maxIterations: _lsIterations,
+                maxNoImprovementIterations: _lsIterations,
+                seed: _seed));
+
+            return services.BuildServiceProvider();
+        }
+    }
+}
@@ -0,0 +1,111 @@
+using System.Diagnostics;
+using Microsoft.EntityFrameworkCore;
+using Microsoft.Extensions.Logging.Abstractions;
+using SmartSchedulingSystem.Data.Context;
+using SmartSchedulingSystem.Data.Entities;
+using SmartSchedulingSystem.Data.Repositories;
+
+namespace SmartSchedulingSystem.Benchmarks
+{
+    /// <summary>
+    /// Measurements of the schedule result bulk write and streaming read path
+    /// </summary>
+    public class StorageBenchmarkResult
+    {
+        public int Items { get; set; }
+
+        /// <summary>
+        /// Wall time of ScheduleResultRepository.SaveAsync, header and items in one transaction
+        /// </summary>
+        public long? SaveMs { get; set; }
+
+        public long? HeaderMs { get; set; }
+
+        public long? ItemsMs { get; set; }
+
+        /// <summary>
+        /// Wall time of streaming all items back with ScheduleResultRepository.StreamItemsAsync
+        /// </summary>
+        public long? ReadMs { get; set; }
+
+        public string? Error { get; set; }
+    }
+
+    /// <summary>
+    /// Saves a schedule result with many items through ScheduleResultRepository and reads it back.
+    /// Needs a database with at least one course section, teacher, classroom and time slot; the items reuse them
+    /// and the saved result is deleted afterwards
+    /// </summary>
+    public static class StorageBenchmark
+    {
+        /// <summary>
+        /// Item count of a large semester schedule
+        /// </summary>
+        public const int DefaultItemCount = 10000;
+
+        public static async Task<StorageBenchmarkResult> RunAsync(string connectionString, int itemCount)
+        {
+            var result = new StorageBenchmarkResult { Items = itemCount };
+            var options = new DbContextOptionsBuilder<AppDbContext>().UseSqlServer(connectionString).Options;
+            await using var dbContext = new AppDbContext(options);
+            int? scheduleId = null;
+
+            try
+            {
+                var section = await dbContext.CourseSections.AsNoTracking().OrderBy(s => s.CourseSectionId).FirstAsync();
+                int teacherId = await dbContext.Teachers.OrderBy(t => t.TeacherId).Select(t => t.TeacherId).FirstAsync();
+                int classroomId = await dbContext.Classrooms.OrderBy(c => c.ClassroomId).Select(c => c.ClassroomId).FirstAsync();
+                int timeSlotId = await dbContext.TimeSlots.OrderBy(t => t.TimeSlotId).Select(t => t.TimeSlotId).FirstAsync();
+
+                var schedule = new ScheduleResult
+                {
+                    SemesterId = section.SemesterId,
+                    CreatedAt = DateTime.Now,
+                    Status = "Draft",
+                    Items = Enumerable.Range(0, itemCount)
+                        .Select(_ => new ScheduleItem
+                        {
+                            CourseSectionId = section.CourseSectionId,
+                            TeacherId = teacherId,
+                            ClassroomId = classroomId,
+                            TimeSlotId = timeSlotId
+                        })
+                        .ToList()
+                };
+
+                var repository = new ScheduleResultRepository(dbContext, NullLogger<ScheduleResultRepository>.Instance);
+                var saveResult = await repository.SaveAsync(schedule);
+                scheduleId = saveResult.ScheduleId;
+                result.SaveMs = saveResult.TotalMs;
+                result.HeaderMs = saveResult.HeaderMs;
+                result.ItemsMs = saveResult.ItemsMs;
+
+                var sw = Stopwatch.StartNew();
+                int read = 0;
+                await foreach (var _ in repository.StreamItemsAsync(saveResult.ScheduleId))
+                {
+                    read++;
+                }
+                result.ReadMs = sw.ElapsedMilliseconds;
+
+                if (read != itemCount)
+                    result.Error = $"read {read} of {itemCount} items";
+            }
+            catch (Exception ex)
+            {
+                result.Error = ex.Message;
+            }
+            finally
+            {
+                if (scheduleId.HasValue)
+                {
+                    int id = scheduleId.Value;
+                    await dbContext.Set<ScheduleItem>().Where(i => i.ScheduleResultId == id).ExecuteDeleteAsync();
+                    await dbContext.ScheduleResults.Where(r => r.ScheduleId == id).ExecuteDeleteAsync();
+                }
+            }
+
+            return result;
+        }
+    }
+}
@@ -3,6 +3,7 @@ using System;
 using System.Collections.Generic;
 using System.Linq;
 using System.Text;
+using System.Threading;
 using System.Threading.Tasks;
 
 namespace SmartSchedulingSystem.Core.Interfaces
@@ -14,6 +15,9 @@ namespace SmartSchedulingSystem.Core.Interfaces
         Task<ScheduleResultDto> GetScheduleByIdAsync(int scheduleId);
         Task<bool> PublishScheduleAsync(int scheduleId);
         Task<bool> CancelScheduleAsync(int scheduleId);
+        Task<int> SaveScheduleResultAsync(ScheduleResultDto result, CancellationToken cancellationToken = default);
+        Task<List<int>> SaveScheduleResultsAsync(IEnumerable<ScheduleResultDto> results, CancellationToken cancellationToken = default);
+        IAsyncEnumerable<ScheduleItemDto> StreamScheduleItemsAsync(int scheduleId, CancellationToken cancellationToken = default);
         // 添加新的重载，包含所有 8 个参数
         Task<List<ScheduleResultDto>> GetScheduleHistoryAsync(
             int semesterId,
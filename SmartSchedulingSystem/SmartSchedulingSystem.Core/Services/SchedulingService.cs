@@ -1,6 +1,8 @@
 ﻿using System;
 using System.Collections.Generic;
 using System.Linq;
+using System.Runtime.CompilerServices;
+using System.Threading;
 using System.Threading.Tasks;
 using Microsoft.EntityFrameworkCore;
 using Microsoft.Extensions.Logging;
@@ -10,21 +12,25 @@ using SmartSchedulingSystem.Core.Interfaces;
 using SmartSchedulingSystem.Data;
 using SmartSchedulingSystem.Data.Entities;
 using SmartSchedulingSystem.Data.Context;
+using SmartSchedulingSystem.Data.Repositories;
 
 namespace SmartSchedulingSystem.Core.Services
 {
     public class SchedulingService : ISchedulingService
     {
         private readonly AppDbContext _dbContext;
+        private readonly ScheduleResultRepository _scheduleResultRepository;
         private readonly IMapper _mapper;
         private readonly ILogger<SchedulingService> _logger;
 
         public SchedulingService(
             AppDbContext dbContext,
+            ScheduleResultRepository scheduleResultRepository,
             IMapper mapper,
             ILogger<SchedulingService> logger)
         {
             _dbContext = dbContext;
+            _scheduleResultRepository = scheduleResultRepository;
             _mapper = mapper;
             _logger = logger;
         }
@@ -193,7 +199,7 @@ namespace SmartSchedulingSystem.Core.Services
             try
             {
                 var scheduleResult = await _dbContext.ScheduleResults
-                    .Include(sr => sr.Items)
+                    .AsNoTracking()
                     .FirstOrDefaultAsync(sr => sr.ScheduleId == scheduleId);
 
                 if (scheduleResult == null)
@@ -201,15 +207,15 @@ namespace SmartSchedulingSystem.Core.Services
                     return null;
                 }
 
-                // Load related data
-                foreach (var item in scheduleResult.Items)
+                // Items are read in one untracked query with their related data
+                var result = _mapper.Map<ScheduleResultDto>(scheduleResult);
+                result.Items = new List<ScheduleItemDto>();
+                await foreach (var item in StreamScheduleItemsAsync(scheduleId))
                 {
-                    await _dbContext.Entry(item).Reference(i => i.Teacher).LoadAsync();
-                    await _dbContext.Entry(item).Reference(i => i.Classroom).LoadAsync();
-                    await _dbContext.Entry(item).Reference(i => i.TimeSlot).LoadAsync();
+                    result.Items.Add(item);
                 }
 
-                return _mapper.Map<ScheduleResultDto>(scheduleResult);
+                return result;
             }
             catch (Exception ex)
             {
@@ -218,6 +224,65 @@ namespace SmartSchedulingSystem.Core.Services
             }
         }
 
+        // Save generated schedules, every result with its items in its own transaction
+        public async Task<List<int>> SaveScheduleResultsAsync(
+            IEnumerable<ScheduleResultDto> results,
+            CancellationToken cancellationToken = default)
+        {
+            var scheduleIds = new List<int>();
+            foreach (var result in results)
+            {
+                scheduleIds.Add(await SaveScheduleResultAsync(result, cancellationToken));
+            }
+            return scheduleIds;
+        }
+
+        // Save a generated schedule through the bulk write path, returns the new schedule ID
+        public async Task<int> SaveScheduleResultAsync(ScheduleResultDto result, CancellationToken cancellationToken = default)
+        {
+            try
+            {
+                var scheduleResult = new ScheduleResult
+                {
+                    SemesterId = result.SemesterId,
+                    CreatedAt = result.CreatedAt == default ? DateTime.Now : result.CreatedAt,
+                    Status = string.IsNullOrEmpty(result.Status) ? "Draft" : result.Status,
+                    Score = result.Score,
+                    Items = (result.Items ?? new List<ScheduleItemDto>())
+                        .Select(item => new ScheduleItem
+                        {
+                            CourseSectionId = item.CourseSectionId,
+                            TeacherId = item.TeacherId,
+                            ClassroomId = item.ClassroomId,
+                            TimeSlotId = item.TimeSlotId
+                        })
+                        .ToList()
+                };
+
+                var saveResult = await _scheduleResultRepository.SaveAsync(scheduleResult, cancellationToken);
+                result.ScheduleId = saveResult.ScheduleId;
+                return saveResult.ScheduleId;
+            }
+            catch (Exception ex)
+            {
+                _logger.LogError(ex, "Error saving schedule for semester {SemesterId}", result.SemesterId);
+                throw;
+            }
+        }
+
+        // Stream the items of a schedule without tracking or buffering them
+        public async IAsyncEnumerable<ScheduleItemDto> StreamScheduleItemsAsync(
+            int scheduleId,
+            [EnumeratorCancellation] CancellationToken cancellationToken = default)
+        {
+            await foreach (var item in _scheduleResultRepository.StreamItemsAsync(scheduleId, cancellationToken))
+            {
+                var dto = _mapper.Map<ScheduleItemDto>(item);
+                dto.ScheduleId = scheduleId;
+                yield return dto;
+            }
+        }
+
         // Publish the schedule
         public async Task<bool> PublishScheduleAsync(int scheduleId)
         {
@@ -23,6 +23,7 @@ namespace SmartSchedulingSystem.Data.Context
         public DbSet<TeacherAvailability> TeacherAvailabilities { get; set; }
         public DbSet<ClassroomAvailability> ClassroomAvailabilities { get; set; }
         public DbSet<ScheduleResult> ScheduleResults { get; set; }
+        public DbSet<ScheduleResultCacheEntry> ScheduleResultCacheEntries { get; set; }
         public DbSet<SchedulingConstraint> SchedulingConstraints { get; set; }
         public DbSet<AISchedulingSuggestion> AISchedulingSuggestions { get; set; }
 
@@ -278,6 +279,20 @@ namespace SmartSchedulingSystem.Data.Context
             // You can keep the cascading delete for CourseSection and TimeSlot
             // Or also change them to NoAction based on your business needs
 
+            // Schedule result cache, looked up by fingerprint or by parameters for warm starts
+            modelBuilder.Entity<ScheduleResultCacheEntry>(entity =>
+            {
+                entity.HasKey(x => x.ScheduleResultCacheEntryId);
+
+                entity.Property(x => x.Fingerprint).HasMaxLength(64);
+                entity.Property(x => x.ParametersHash).HasMaxLength(64);
+                entity.HasIndex(x => x.Fingerprint).IsUnique();
+                entity.HasIndex(x => new { x.ParametersHash, x.SemesterId });
+
+                entity.Property(x => x.ElementsJson).HasColumnType("nvarchar(max)");
+                entity.Property(x => x.AssignmentsJson).HasColumnType("nvarchar(max)");
+            });
+
             // Add AISchedulingSuggestion configuration
             modelBuilder.Entity<AISchedulingSuggestion>(entity =>
             {
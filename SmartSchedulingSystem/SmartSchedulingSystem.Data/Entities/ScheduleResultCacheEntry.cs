@@ -0,0 +1,20 @@
+using System;
+
+namespace SmartSchedulingSystem.Data.Entities
+{
+    public class ScheduleResultCacheEntry
+    {
+        public int ScheduleResultCacheEntryId { get; set; }
+        public string Fingerprint { get; set; }       // 问题和参数的指纹
+        public string ParametersHash { get; set; }    // 参数指纹，相同参数的条目才能互相热启动
+        public int SemesterId { get; set; }
+        public string ElementsJson { get; set; }      // JSON格式存储各元素的哈希
+        public string AssignmentsJson { get; set; }   // JSON格式存储最优方案的分配
+        public string Algorithm { get; set; }
+        public double Score { get; set; }
+        public long SolveTimeMs { get; set; }
+        public int HitCount { get; set; }
+        public DateTime CreatedAt { get; set; }
+        public DateTime LastUsedAt { get; set; }
+    }
+}
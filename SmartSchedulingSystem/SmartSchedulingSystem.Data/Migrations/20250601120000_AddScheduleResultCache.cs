@@ -0,0 +1,60 @@
+using System;
+using Microsoft.EntityFrameworkCore.Infrastructure;
+using Microsoft.EntityFrameworkCore.Migrations;
+using SmartSchedulingSystem.Data.Context;
+
+#nullable disable
+
+namespace SmartSchedulingSystem.Data.Migrations
+{
+    /// <inheritdoc />
+    [DbContext(typeof(AppDbContext))]
+    [Migration("20250601120000_AddScheduleResultCache")]
+    public partial class AddScheduleResultCache : Migration
+    {
+        /// <inheritdoc />
+        protected override void Up(MigrationBuilder migrationBuilder)
+        {
+            migrationBuilder.CreateTable(
+                name: "ScheduleResultCacheEntries",
+                columns: table => new
+                {
+                    ScheduleResultCacheEntryId = table.Column<int>(type: "int", nullable: false)
+                        .Annotation("SqlServer:Identity", "1, 1"),
+                    Fingerprint = table.Column<string>(type: "nvarchar(64)", maxLength: 64, nullable: false),
+                    ParametersHash = table.Column<string>(type: "nvarchar(64)", maxLength: 64, nullable: false),
+                    SemesterId = table.Column<int>(type: "int", nullable: false),
+                    ElementsJson = table.Column<string>(type: "nvarchar(max)", nullable: false),
+                    AssignmentsJson = table.Column<string>(type: "nvarchar(max)", nullable: false),
+                    Algorithm = table.Column<string>(type: "nvarchar(max)", nullable: false),
+                    Score = table.Column<double>(type: "float", nullable: false),
+                    SolveTimeMs = table.Column<long>(type: "bigint", nullable: false),
+                    HitCount = table.Column<int>(type: "int", nullable: false),
+                    CreatedAt = table.Column<DateTime>(type: "datetime2", nullable: false),
+                    LastUsedAt = table.Column<DateTime>(type: "datetime2", nullable: false)
+                },
+                constraints: table =>
+                {
+                    table.PrimaryKey("PK_ScheduleResultCacheEntries", x => x.ScheduleResultCacheEntryId);
+                });
+
+            migrationBuilder.CreateIndex(
+                name: "IX_ScheduleResultCacheEntries_Fingerprint",
+                table: "ScheduleResultCacheEntries",
+                column: "Fingerprint",
+                unique: true);
+
+            migrationBuilder.CreateIndex(
+                name: "IX_ScheduleResultCacheEntries_ParametersHash_SemesterId",
+                table: "ScheduleResultCacheEntries",
+                columns: new[] { "ParametersHash", "SemesterId" });
+        }
+
+        /// <inheritdoc />
+        protected override void Down(MigrationBuilder migrationBuilder)
+        {
+            migrationBuilder.DropTable(
+                name: "ScheduleResultCacheEntries");
+        }
+    }
+}
@@ -405,6 +405,64 @@ namespace SmartSchedulingSystem.Data.Migrations
                     b.ToTable("ScheduleResults");
                 });
 
+            modelBuilder.Entity("SmartSchedulingSystem.Data.Entities.ScheduleResultCacheEntry", b =>
+                {
+                    b.Property<int>("ScheduleResultCacheEntryId")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("int");
+
+                    SqlServerPropertyBuilderExtensions.UseIdentityColumn(b.Property<int>("ScheduleResultCacheEntryId"));
+
+                    b.Property<string>("Algorithm")
+                        .IsRequired()
+                        .HasColumnType("nvarchar(max)");
+
+                    b.Property<string>("AssignmentsJson")
+                        .IsRequired()
+                        .HasColumnType("nvarchar(max)");
+
+                    b.Property<DateTime>("CreatedAt")
+                        .HasColumnType("datetime2");
+
+                    b.Property<string>("ElementsJson")
+                        .IsRequired()
+                        .HasColumnType("nvarchar(max)");
+
+                    b.Property<string>("Fingerprint")
+                        .IsRequired()
+                        .HasMaxLength(64)
+                        .HasColumnType("nvarchar(64)");
+
+                    b.Property<int>("HitCount")
+                        .HasColumnType("int");
+
+                    b.Property<DateTime>("LastUsedAt")
+                        .HasColumnType("datetime2");
+
+                    b.Property<string>("ParametersHash")
+                        .IsRequired()
+                        .HasMaxLength(64)
+                        .HasColumnType("nvarchar(64)");
+
+                    b.Property<double>("Score")
+                        .HasColumnType("float");
+
+                    b.Property<int>("SemesterId")
+                        .HasColumnType("int");
+
+                    b.Property<long>("SolveTimeMs")
+                        .HasColumnType("bigint");
+
+                    b.HasKey("ScheduleResultCacheEntryId");
+
+                    b.HasIndex("Fingerprint")
+                        .IsUnique();
+
+                    b.HasIndex("ParametersHash", "SemesterId");
+
+                    b.ToTable("ScheduleResultCacheEntries");
+                });
+
             modelBuilder.Entity("SmartSchedulingSystem.Data.Entities.SchedulingConstraint", b =>
                 {
                     b.Property<int>("ConstraintId")
@@ -0,0 +1,239 @@
+using System.Data;
+using System.Diagnostics;
+using System.Runtime.CompilerServices;
+using Microsoft.Data.SqlClient;
+using Microsoft.EntityFrameworkCore;
+using Microsoft.EntityFrameworkCore.Metadata;
+using Microsoft.EntityFrameworkCore.Storage;
+using Microsoft.Extensions.Logging;
+using SmartSchedulingSystem.Data.Context;
+using SmartSchedulingSystem.Data.Entities;
+
+namespace SmartSchedulingSystem.Data.Repositories
+{
+    /// <summary>
+    /// Timings of a saved schedule result
+    /// </summary>
+    public class ScheduleSaveResult
+    {
+        public int ScheduleId { get; set; }
+        public int ItemCount { get; set; }
+        public long HeaderMs { get; set; }
+        public long ItemsMs { get; set; }
+        public long TotalMs { get; set; }
+    }
+
+    /// <summary>
+    /// Bulk write and streaming read path for schedule results.
+    /// Items are written without change tracking in one transaction per result: SqlBulkCopy on SQL Server,
+    /// batched multi-row inserts on other providers. Items are read untracked and streamed one by one
+    /// </summary>
+    public class ScheduleResultRepository
+    {
+        /// <summary>
+        /// Rows per SqlBulkCopy batch or per SaveChanges call
+        /// </summary>
+        public const int BatchSize = 5000;
+
+        private readonly AppDbContext _dbContext;
+        private readonly ILogger<ScheduleResultRepository> _logger;
+
+        public ScheduleResultRepository(AppDbContext dbContext, ILogger<ScheduleResultRepository> logger)
+        {
+            _dbContext = dbContext ?? throw new ArgumentNullException(nameof(dbContext));
+            _logger = logger ?? throw new ArgumentNullException(nameof(logger));
+        }
+
+        /// <summary>
+        /// Save a schedule result with its items in one transaction.
+        /// Copies of the header and items are written, the caller's result only receives the generated IDs
+        /// after the commit and is left unchanged when the save fails
+        /// </summary>
+        /// <returns>ID of the saved result and the timings</returns>
+        public async Task<ScheduleSaveResult> SaveAsync(ScheduleResult result, CancellationToken cancellationToken = default)
+        {
+            ArgumentNullException.ThrowIfNull(result);
+
+            var sw = Stopwatch.StartNew();
+            var header = new ScheduleResult
+            {
+                SemesterId = result.SemesterId,
+                CreatedAt = result.CreatedAt,
+                Status = result.Status,
+                Score = result.Score
+            };
+            var items = (result.Items ?? Enumerable.Empty<ScheduleItem>())
+                .Select(item => new ScheduleItem
+                {
+                    CourseSectionId = item.CourseSectionId,
+                    TeacherId = item.TeacherId,
+                    ClassroomId = item.ClassroomId,
+                    TimeSlotId = item.TimeSlotId
+                })
+                .ToList();
+
+            await using var transaction = await _dbContext.Database.BeginTransactionAsync(cancellationToken);
+
+            // The header is inserted on its own to obtain the generated ID, the items are never tracked
+            _dbContext.ScheduleResults.Add(header);
+            try
+            {
+                await _dbContext.SaveChangesAsync(cancellationToken);
+            }
+            finally
+            {
+                _dbContext.Entry(header).State = EntityState.Detached;
+            }
+            long headerMs = sw.ElapsedMilliseconds;
+
+            foreach (var item in items)
+            {
+                item.ScheduleResultId = header.ScheduleId;
+            }
+
+            if (_dbContext.Database.IsSqlServer())
+            {
+                await BulkCopyItemsAsync(items, transaction, cancellationToken);
+            }
+            else
+            {
+                await InsertItemsInBatchesAsync(items, cancellationToken);
+            }
+
+            await transaction.CommitAsync(cancellationToken);
+
+            result.ScheduleId = header.ScheduleId;
+            foreach (var item in result.Items ?? Enumerable.Empty<ScheduleItem>())
+            {
+                item.ScheduleResultId = header.ScheduleId;
+            }
+
+            var saveResult = new ScheduleSaveResult
+            {
+                ScheduleId = header.ScheduleId,
+                ItemCount = items.Count,
+                HeaderMs = headerMs,
+                ItemsMs = sw.ElapsedMilliseconds - headerMs,
+                TotalMs = sw.ElapsedMilliseconds
+            };
+
+            _logger.LogInformation("Saved schedule {ScheduleId} with {ItemCount} items in {TotalMs}ms (header {HeaderMs}ms, items {ItemsMs}ms)",
+                saveResult.ScheduleId, saveResult.ItemCount, saveResult.TotalMs, saveResult.HeaderMs, saveResult.ItemsMs);
+
+            return saveResult;
+        }
+
+        /// <summary>
+        /// Stream the items of a schedule result with their course section, teacher, classroom and time slot,
+        /// without tracking and without buffering the whole result
+        /// </summary>
+        public async IAsyncEnumerable<ScheduleItem> StreamItemsAsync(
+            int scheduleId,
+            [EnumeratorCancellation] CancellationToken cancellationToken = default)
+        {
+            var sw = Stopwatch.StartNew();
+            int count = 0;
+
+            var query = _dbContext.Set<ScheduleItem>()
+                .AsNoTracking()
+                .Where(i => i.ScheduleResultId == scheduleId)
+                .Include(i => i.CourseSection).ThenInclude(s => s.Course)
+                .Include(i => i.Teacher)
+                .Include(i => i.Classroom)
+                .Include(i => i.TimeSlot)
+                .OrderBy(i => i.ScheduleItemId)
+                .AsAsyncEnumerable()
+                .WithCancellation(cancellationToken);
+
+            await foreach (var item in query)
+            {
+                count++;
+                yield return item;
+            }
+
+            _logger.LogInformation("Read {ItemCount} items of schedule {ScheduleId} in {ElapsedMs}ms",
+                count, scheduleId, sw.ElapsedMilliseconds);
+        }
+
+        private async Task BulkCopyItemsAsync(List<ScheduleItem> items, IDbContextTransaction transaction, CancellationToken cancellationToken)
+        {
+            if (items.Count == 0)
+                return;
+
+            var entityType = _dbContext.Model.FindEntityType(typeof(ScheduleItem))
+                ?? throw new InvalidOperationException("ScheduleItem is not part of the model");
+            string tableName = entityType.GetTableName()!;
+            string? schema = entityType.GetSchema();
+            var storeObject = StoreObjectIdentifier.Table(tableName, schema);
+
+            // Column names come from the EF model, the identity key is generated by the database
+            var properties = entityType.GetProperties()
+                .Where(p => !p.IsPrimaryKey() && p.PropertyInfo != null)
+                .ToList();
+
+            using var table = new DataTable();
+            foreach (var property in properties)
+            {
+                table.Columns.Add(property.GetColumnName(storeObject), Nullable.GetUnderlyingType(property.ClrType) ?? property.ClrType);
+            }
+            foreach (var item in items)
+            {
+                var row = table.NewRow();
+                foreach (var property in properties)
+                {
+                    row[property.GetColumnName(storeObject)!] = property.PropertyInfo!.GetValue(item) ?? DBNull.Value;
+                }
+                table.Rows.Add(row);
+            }
+
+            var connection = (SqlConnection)_dbContext.Database.GetDbConnection();
+            var sqlTransaction = (SqlTransaction)transaction.GetDbTransaction();
+
+            using var bulkCopy = new SqlBulkCopy(connection, SqlBulkCopyOptions.CheckConstraints, sqlTransaction)
+            {
+                DestinationTableName = schema == null ? $"[{tableName}]" : $"[{schema}].[{tableName}]",
+                BatchSize = BatchSize
+            };
+            foreach (DataColumn column in table.Columns)
+            {
+                bulkCopy.ColumnMappings.Add(column.ColumnName, column.ColumnName);
+            }
+
+            await bulkCopy.WriteToServerAsync(table, cancellationToken);
+        }
+
+        private async Task InsertItemsInBatchesAsync(List<ScheduleItem> items, CancellationToken cancellationToken)
+        {
+            bool autoDetectChanges = _dbContext.ChangeTracker.AutoDetectChangesEnabled;
+            _dbContext.ChangeTracker.AutoDetectChangesEnabled = false;
+
+            try
+            {
+                // Entries are added one by one so navigation properties are not attached with them,
+                // and detached again after each batch so the tracker never holds more than one batch
+                foreach (var batch in items.Chunk(BatchSize))
+                {
+                    foreach (var item in batch)
+                    {
+                        _dbContext.Entry(item).State = EntityState.Added;
+                    }
+                    try
+                    {
+                        await _dbContext.SaveChangesAsync(cancellationToken);
+                    }
+                    finally
+                    {
+                        foreach (var item in batch)
+                        {
+                            _dbContext.Entry(item).State = EntityState.Detached;
+                        }
+                    }
+                }
+            }
+            finally
+            {
+                _dbContext.ChangeTracker.AutoDetectChangesEnabled = autoDetectChanges;
+            }
+        }
+    }
+}
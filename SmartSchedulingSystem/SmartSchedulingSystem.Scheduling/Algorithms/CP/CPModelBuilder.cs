@@ -17,7 +17,8 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.CP
     {
         private readonly IEnumerable<ICPConstraintConverter> _constraintConverters;
         private readonly ConstraintManager _constraintManager;
-        private Dictionary<string, IntVar> _variables = new Dictionary<string, IntVar>();
+        private CPVariableTable _variableTable = new CPVariableTable();
+        private Dictionary<ConstraintApplicationLevel, BoolVar> _levelLayers = new Dictionary<ConstraintApplicationLevel, BoolVar>();
         private readonly ILogger<CPModelBuilder> _logger;
         public CPModelBuilder(IEnumerable<ICPConstraintConverter> constraintConverters, ConstraintManager constraintManager, ILogger<CPModelBuilder> logger)
         {
@@ -26,76 +27,160 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.CP
             _logger = logger ?? throw new ArgumentNullException(nameof(logger));
 
         }
+        /// <summary>
+        /// Name-keyed view of the variables of the last built model
+        /// </summary>
         public Dictionary<string, IntVar> GetVariables()
         {
-            return _variables;
+            return _variableTable.ToNamedDictionary();
         }
+
+        /// <summary>
+        /// Integer-indexed variables of the last built model
+        /// </summary>
+        public CPVariableTable GetVariableTable()
+        {
+            return _variableTable;
+        }
+
         /// <summary>
         /// Build CP model for scheduling problem
         /// </summary>
         public CpModel BuildModel(SchedulingProblem problem, ConstraintApplicationLevel level)
         {
-            _variables.Clear();
+            if (problem == null)
+                throw new ArgumentNullException(nameof(problem));
 
-            Console.WriteLine("============ CP Model Building Started ============");
-            Console.WriteLine($"Problem details: {problem.Name}, {problem.CourseSections.Count} courses");
-            Console.WriteLine($"Constraint application level: {level}");
+            return BuildModel(problem, level, EligibilityIndex.Build(problem));
+        }
 
+        /// <summary>
+        /// Build CP model for scheduling problem, reusing a precomputed eligibility index of the problem
+        /// </summary>
+        public CpModel BuildModel(SchedulingProblem problem, ConstraintApplicationLevel level, EligibilityIndex eligibility)
+        {
             if (problem == null)
                 throw new ArgumentNullException(nameof(problem));
+            if (eligibility == null)
+                throw new ArgumentNullException(nameof(eligibility));
+
+            Console.WriteLine("============ CP Model Building Started ============");
+            Console.WriteLine($"Problem details: {problem.Name}, {problem.CourseSections.Count} courses");
+            Console.WriteLine($"Constraint application level: {level}");
 
             var model = new CpModel();
-            _variables = CreateDecisionVariables(model, problem);
+            _variableTable = CreateDecisionVariables(model, problem, level, eligibility);
+            _levelLayers = new Dictionary<ConstraintApplicationLevel, BoolVar>();
 
             // Add core constraints (Level1_CoreHard)
             Console.WriteLine("Adding OneCourseOneAssignment constraint");
-            AddOneCourseOneAssignmentConstraints(model, _variables, problem);  // Each course must be assigned once
+            AddOneCourseOneAssignmentConstraints(model, _variableTable, problem);  // Each course must be assigned once
             
             Console.WriteLine("Adding teacher conflict constraint");
-            AddTeacherConflictConstraints(model, _variables, problem);   // Teacher cannot teach two courses at the same time
+            AddTeacherConflictConstraints(model, _variableTable);   // Teacher cannot teach two courses at the same time
             
             Console.WriteLine("Adding classroom conflict constraint");
-            AddClassroomConflictConstraints(model, _variables, problem); // Classroom cannot be used for two courses at the same time
+            AddClassroomConflictConstraints(model, _variableTable); // Classroom cannot be used for two courses at the same time
 
             // Selectively add constraints based on constraint level
             if (level >= ConstraintApplicationLevel.Basic)
             {
                 Console.WriteLine("Adding classroom capacity constraint");
-                AddClassroomCapacityConstraints(model, _variables, problem); // Classroom capacity constraint
+                AddClassroomCapacityConstraints(model, _variableTable, problem); // Classroom capacity constraint
                 
                 Console.WriteLine("Adding prerequisite constraint");
-                AddPrerequisiteConstraints(model, _variables, problem);      // Prerequisite constraint
+                AddPrerequisiteConstraints(model, _variableTable, problem);      // Prerequisite constraint
             }
 
-            // Add constraints at higher levels (Level2 and above)
-            if (level >= ConstraintApplicationLevel.Standard)
-            {
-                Console.WriteLine("Adding teacher availability constraint");
-                AddTeacherAvailabilityConstraints(model, _variables, problem); // Teacher availability constraint (Level2)
-                
-                Console.WriteLine("Adding classroom availability constraint");
-                AddClassroomAvailabilityConstraints(model, _variables, problem); // Classroom availability constraint (Level2)
-            }
+            // Teacher and classroom availability (Level2) need no constraints: at Standard and above,
+            // variables are only created for available teachers and classrooms (see CreateDecisionVariables)
 
-            // Apply custom constraint converters allowed by the current constraint level
+            // Apply custom constraint converters allowed by the current constraint level,
+            // all of them share one name-keyed view of the variables
+            Dictionary<string, IntVar> namedVariables = null;
             foreach (var converter in _constraintConverters)
             {
                 // Only apply constraint converters allowed at current level
                 if (IsConverterAllowedAtLevel(converter, level))
                 {
                     Console.WriteLine($"Applying constraint converter: {converter.GetType().Name}");
-                    converter.AddToModel(model, _variables, problem);
+                    namedVariables ??= _variableTable.ToNamedDictionary();
+                    converter.AddToModel(model, namedVariables, problem);
                 }
             }
 
             // Set objective function (maximize soft constraint satisfaction)
             Console.WriteLine("Setting objective function");
-            SetupObjectiveFunction(model, _variables, problem);
+            SetupObjectiveFunction(model, _variableTable, problem);
             Console.WriteLine("============ CP Model Building Completed ============");
 
             return model;
         }
 
+        /// <summary>
+        /// Build the core (Basic level) model once and add the constraints of the higher levels as layers guarded by
+        /// enforcement literals. The level is chosen per solve with SelectConstraintLevel, so a constraint level
+        /// cascade reuses the model instead of rebuilding it:
+        /// Standard forbids unavailable teachers and classrooms (Level2),
+        /// Enhanced also forbids classrooms not meeting the room type and equipment requirements (Level3)
+        /// </summary>
+        public CpModel BuildLayeredModel(SchedulingProblem problem, EligibilityIndex eligibility)
+        {
+            var model = BuildModel(problem, ConstraintApplicationLevel.Basic, eligibility);
+
+            var standardLayer = model.NewBoolVar("layer_standard");
+            var enhancedLayer = model.NewBoolVar("layer_enhanced");
+            int standardCount = 0;
+            int enhancedCount = 0;
+
+            for (int i = 0; i < _variableTable.Count; i++)
+            {
+                int timeSlotId = _variableTable.GetTimeSlotId(i);
+                int classroomId = _variableTable.GetClassroomId(i);
+
+                if (!eligibility.IsTeacherAvailable(_variableTable.GetTeacherId(i), timeSlotId) ||
+                    !eligibility.IsClassroomAvailable(classroomId, timeSlotId))
+                {
+                    model.Add(_variableTable[i] == 0).OnlyEnforceIf(standardLayer);
+                    standardCount++;
+                }
+
+                if (!eligibility.IsPreferredRoom(_variableTable.GetSectionId(i), classroomId))
+                {
+                    model.Add(_variableTable[i] == 0).OnlyEnforceIf(enhancedLayer);
+                    enhancedCount++;
+                }
+            }
+
+            // Each level includes the constraints of the levels below it
+            model.AddImplication(enhancedLayer, standardLayer);
+
+            _levelLayers = new Dictionary<ConstraintApplicationLevel, BoolVar>
+            {
+                [ConstraintApplicationLevel.Standard] = standardLayer,
+                [ConstraintApplicationLevel.Enhanced] = enhancedLayer
+            };
+
+            _logger.LogInformation($"Built layered model: {standardCount} variables guarded by the Standard layer, " +
+                                   $"{enhancedCount} by the Enhanced layer");
+
+            return model;
+        }
+
+        /// <summary>
+        /// Enable the constraint layers up to the given level for the next solve of a layered model
+        /// </summary>
+        public void SelectConstraintLevel(CpModel model, ConstraintApplicationLevel level)
+        {
+            model.ClearAssumptions();
+
+            foreach (var layer in _levelLayers)
+            {
+                if (layer.Key <= level)
+                    model.AddAssumption(layer.Value);
+            }
+        }
+
         /// <summary>
         /// Determine if the constraint converter is allowed to apply at the current constraint level
         /// </summary>
@@ -131,12 +216,12 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.CP
         }
 
         /// <summary>
-        /// Create decision variables - Optimized version, reduce variable count to improve solving speed
+        /// Create decision variables - Only eligible (section, time slot, classroom, teacher) combinations are materialized,
+        /// so the variable count scales with the feasible combinations instead of the full Cartesian product
         /// </summary>
-        private Dictionary<string, IntVar> CreateDecisionVariables(CpModel model, SchedulingProblem problem)
+        private CPVariableTable CreateDecisionVariables(CpModel model, SchedulingProblem problem, ConstraintApplicationLevel level, EligibilityIndex eligibility)
         {
-            var variables = new Dictionary<string, IntVar>();
-            int variableCount = 0;
+            var variables = new CPVariableTable();
 
             _logger.LogInformation($"Starting to create decision variables: Course count={problem.CourseSections.Count}, " +
                                  $"Teacher count={problem.Teachers.Count}, Classroom count={problem.Classrooms.Count}, " +
@@ -150,265 +235,279 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.CP
                 return variables;
             }
 
-            // Create variables for each course - Pre-filtering method to reduce variable count
+            // Availability is a Level2 constraint, below Standard unavailable combinations are kept
+            bool checkAvailability = level >= ConstraintApplicationLevel.Standard;
+
             foreach (var section in problem.CourseSections)
             {
-                bool sectionHasVariables = false;
-                _logger.LogDebug($"Creating variables for course {section.Id} ({section.CourseName})...");
+                var rooms = eligibility.GetEligibleRooms(section.Id, level);
+                var teachers = eligibility.GetEligibleTeachers(section.Id);
+                var timeSlots = checkAvailability ? eligibility.GetAvailableTimeSlots(section.Id, level) : problem.TimeSlots;
 
-                // Filter classrooms that meet capacity requirements to reduce variable count
-                var suitableRooms = problem.Classrooms
-                    .Where(room => room.Capacity >= section.Enrollment)
-                    .ToList();
+                _logger.LogDebug($"Creating variables for course {section.Id} ({section.CourseName}): " +
+                                 $"{rooms.Count} rooms, {teachers.Count} teachers, {timeSlots.Count} time slots");
 
-                if (suitableRooms.Count == 0)
+                foreach (var timeSlot in timeSlots)
                 {
-                    _logger.LogWarning($"Warning: Course {section.Id} ({section.CourseName}) enrollment is {section.Enrollment}, no suitable room found");
-                    
-                    // If no suitable room is found, select the largest few rooms
-                    suitableRooms = problem.Classrooms
-                        .OrderByDescending(room => room.Capacity)
-                        .Take(3)
-                        .ToList();
-                    
-                    _logger.LogWarning($"To avoid no solution, selected {suitableRooms.Count} rooms with the largest capacity");
-                }
+                    foreach (var classroom in rooms)
+                    {
+                        if (checkAvailability && !eligibility.IsClassroomAvailable(classroom.Id, timeSlot.Id))
+                            continue;
 
-                // Filter teachers qualified to teach this course to reduce variable count
-                var qualifiedTeachers = new List<TeacherInfo>();
-                
-                // Find teacher course preferences
-                var teacherPreferences = problem.TeacherCoursePreferences
-                    .Where(tcp => tcp.CourseId == section.CourseId && tcp.ProficiencyLevel >= 2)
-                    .ToList();
-                
-                if (teacherPreferences.Count > 0)
-                {
-                    // Select teachers based on preferences
-                    var preferredTeacherIds = teacherPreferences.Select(tp => tp.TeacherId).ToHashSet();
-                    qualifiedTeachers = problem.Teachers
-                        .Where(t => preferredTeacherIds.Contains(t.Id))
-                        .ToList();
-                }
-                
-                if (qualifiedTeachers.Count == 0)
-                {
-                    _logger.LogWarning($"Warning: Course {section.Id} ({section.CourseName}) no qualified teacher found");
-                    
-                    // If no qualified teacher is found, select all teachers to avoid no solution
-                    qualifiedTeachers = problem.Teachers.ToList();
-                    _logger.LogWarning($"To avoid no solution, selected all {qualifiedTeachers.Count} teachers");
-                }
+                        foreach (var teacher in teachers)
+                        {
+                            if (checkAvailability && !eligibility.IsTeacherAvailable(teacher.Id, timeSlot.Id))
+                                continue;
 
-                foreach (var timeSlot in problem.TimeSlots)
-                {
-                    // Initially ignore availability constraints to generate more possible variables
-                    var availableRooms = suitableRooms;
-                    var availableTeachers = qualifiedTeachers;
+                            string varName = CPVariableTable.GetVariableName(section.Id, timeSlot.Id, classroom.Id, teacher.Id);
+                            variables.Add(model.NewBoolVar(varName), section.Id, timeSlot.Id, classroom.Id, teacher.Id);
 
-                    foreach (var classroom in availableRooms)
-                    {
-                        foreach (var teacher in availableTeachers)
-                        {
-                            // Create variables
-                            string varName = $"c{section.Id}_t{timeSlot.Id}_r{classroom.Id}_f{teacher.Id}";
-                            var variable = model.NewBoolVar(varName);
-                            variables[varName] = variable;
-                            variableCount++;
-                            sectionHasVariables = true;
-
-                            if (variableCount % 1000 == 0)
+                            if (variables.Count % 1000 == 0)
                             {
-                                _logger.LogInformation($"Created {variableCount} variables...");
+                                _logger.LogInformation($"Created {variables.Count} variables...");
                             }
                         }
                     }
                 }
 
-                if (!sectionHasVariables)
+                if (variables.GetSectionVariables(section.Id).Count == 0)
                 {
                     _logger.LogWarning($"Course {section.Id} ({section.CourseName}) no variables created, may not generate valid solution");
                 }
             }
 
-            _logger.LogInformation($"Variable creation completed, total {variables.Count} variables created");
+            long fullProduct = (long)problem.CourseSections.Count * problem.TimeSlots.Count * problem.Classrooms.Count * problem.Teachers.Count;
+            _logger.LogInformation($"Variable creation completed, total {variables.Count} variables created " +
+                                 $"(full Cartesian product: {fullProduct})");
             return variables;
         }
 
         /// <summary>
         /// Set objective function, optimize soft constraint satisfaction
         /// </summary>
-        private void SetupObjectiveFunction(CpModel model, Dictionary<string, IntVar> _variables, SchedulingProblem problem)
+        private void SetupObjectiveFunction(CpModel model, CPVariableTable variables, SchedulingProblem problem)
         {
-            // Create list of objective function terms
-            var terms = new List<IntVar>();
-            var coefficients = new List<int>();
+            var (terms, coefficients) = CollectPreferenceTerms(variables, problem);
 
             int objectiveConstant = 0;
 
-            // 1. Preference matching items - Teacher and course matching score
-            foreach (var section in problem.CourseSections)
+            // 2. Add constraint preferences - Teacher workload balance, etc.
+            
+            // Add other objectives such as weekday balance
+
+            // Set objective function
+            if (terms.Count > 0)
             {
-                foreach (var timeSlot in problem.TimeSlots)
-                {
-                    foreach (var classroom in problem.Classrooms)
-                    {
-                        // Calculate the matching score between the classroom type and the course requirement
-                        int roomTypeScore = CalculateRoomTypeMatchScore(section, classroom, problem);
+                model.Maximize(LinearExpr.WeightedSum(terms.ToArray(), coefficients.ToArray()) + objectiveConstant);
+            }
+        }
 
-                        // Calculate the matching score between the classroom capacity and the course enrollment
-                        int capacityScore = CalculateCapacityScore(section.Enrollment, classroom.Capacity);
+        /// <summary>
+        /// Collect the preference terms of the objective function (teacher preference, room type, capacity and time slot scores)
+        /// </summary>
+        private (List<IntVar> Terms, List<int> Coefficients) CollectPreferenceTerms(CPVariableTable variables, SchedulingProblem problem)
+        {
+            // Create list of objective function terms
+            var terms = new List<IntVar>(variables.Count);
+            var coefficients = new List<int>(variables.Count);
 
-                        // Evaluate time slot preferences
-                        int timeSlotScore = 10; // Default score
-                        
-                        // Remove the special weight setting for evening time slots, so all time slots have the same weight
-                        // No longer distinguish between morning, afternoon, and evening time slots, treat each time slot equally
+            var sections = problem.CourseSections.ToDictionary(s => s.Id);
+            var classrooms = problem.Classrooms.ToDictionary(c => c.Id);
+            var preferences = problem.TeacherCoursePreferences
+                .GroupBy(tcp => (tcp.TeacherId, tcp.CourseId))
+                .ToDictionary(g => g.Key, g => g.First());
 
-                        foreach (var teacher in problem.Teachers)
-                        {
-                            string varName = $"c{section.Id}_t{timeSlot.Id}_r{classroom.Id}_f{teacher.Id}";
-                            if (_variables.TryGetValue(varName, out var variable))
-                            {
-                                // Calculate the teacher's preference score for this course
-                                int teacherPreferenceScore = 0;
-                                var preference = problem.TeacherCoursePreferences
-                                    .FirstOrDefault(tcp => tcp.TeacherId == teacher.Id && tcp.CourseId == section.CourseId);
+            // 1. Preference matching items - Teacher and course matching score
+            for (int i = 0; i < variables.Count; i++)
+            {
+                var section = sections[variables.GetSectionId(i)];
+                var classroom = classrooms[variables.GetClassroomId(i)];
 
-                                if (preference != null)
-                                {
-                                    // Calculate the score based on the teacher's professional level and preference
-                                    teacherPreferenceScore = preference.ProficiencyLevel * 5 + preference.PreferenceLevel * 2;
-                                }
+                // Calculate the matching score between the classroom type and the course requirement
+                int roomTypeScore = CalculateRoomTypeMatchScore(section, classroom, problem);
 
-                                // Add up all scores
-                                int totalScore = teacherPreferenceScore + roomTypeScore + capacityScore + timeSlotScore;
+                // Calculate the matching score between the classroom capacity and the course enrollment
+                int capacityScore = CalculateCapacityScore(section.Enrollment, classroom.Capacity);
 
-                                terms.Add(variable);
-                                coefficients.Add(totalScore);
-                            }
-                        }
-                    }
+                // Evaluate time slot preferences
+                int timeSlotScore = 10; // Default score
+
+                // Remove the special weight setting for evening time slots, so all time slots have the same weight
+                // No longer distinguish between morning, afternoon, and evening time slots, treat each time slot equally
+
+                // Calculate the teacher's preference score for this course
+                int teacherPreferenceScore = 0;
+                if (preferences.TryGetValue((variables.GetTeacherId(i), section.CourseId), out var preference))
+                {
+                    // Calculate the score based on the teacher's professional level and preference
+                    teacherPreferenceScore = preference.ProficiencyLevel * 5 + preference.PreferenceLevel * 2;
                 }
+
+                // Add up all scores
+                int totalScore = teacherPreferenceScore + roomTypeScore + capacityScore + timeSlotScore;
+
+                terms.Add(variables[i]);
+                coefficients.Add(totalScore);
             }
 
-            // 2. Add constraint preferences - Teacher workload balance, etc.
-            
-            // Add other objectives such as weekday balance
+            return (terms, coefficients);
+        }
 
-            // Set objective function
-            if (terms.Count > 0)
+        /// <summary>
+        /// Get the decision variable of an assignment in the last built model, null if the model has no variable for its placement
+        /// </summary>
+        public IntVar GetAssignmentVariable(SchedulingAssignment assignment)
+        {
+            if (assignment == null)
+                return null;
+
+            int index = _variableTable.IndexOf(assignment.SectionId, assignment.TimeSlotId, assignment.ClassroomId, assignment.TeacherId);
+            return index >= 0 ? _variableTable[index] : null;
+        }
+
+        /// <summary>
+        /// Add solver hints for the placements of a previous solution (warm start).
+        /// Every variable of a section of the previous solution is hinted, 1 for its previous placement and 0 otherwise.
+        /// Hints added before are replaced
+        /// </summary>
+        /// <returns>Number of hinted variables</returns>
+        public int AddSolutionHints(CpModel model, SchedulingSolution previousSolution)
+        {
+            if (previousSolution == null)
+                return 0;
+
+            model.ClearHints();
+
+            var previousPlacements = previousSolution.Assignments
+                .Select(a => _variableTable.IndexOf(a.SectionId, a.TimeSlotId, a.ClassroomId, a.TeacherId))
+                .Where(index => index >= 0)
+                .ToHashSet();
+
+            int hintCount = 0;
+            foreach (int sectionId in previousSolution.Assignments.Select(a => a.SectionId).Distinct())
             {
-                model.Maximize(LinearExpr.WeightedSum(terms.ToArray(), coefficients.ToArray()) + objectiveConstant);
+                foreach (int index in _variableTable.GetSectionVariables(sectionId))
+                {
+                    model.AddHint(_variableTable[index], previousPlacements.Contains(index) ? 1 : 0);
+                    hintCount++;
+                }
             }
+
+            _logger.LogDebug($"Added {hintCount} solution hints from previous solution");
+            return hintCount;
         }
 
         /// <summary>
-        /// Calculate the matching score between the course and the classroom type
+        /// Fix an assignment to its current placement
         /// </summary>
-        private int CalculateRoomTypeMatchScore(CourseSectionInfo course, ClassroomInfo classroom, SchedulingProblem problem)
+        /// <returns>False if the model has no variable for the placement</returns>
+        public bool TryFixAssignment(CpModel model, SchedulingAssignment assignment)
+        {
+            var variable = GetAssignmentVariable(assignment);
+            if (variable == null)
+                return false;
+
+            model.Add(variable == 1);
+            return true;
+        }
+
+        /// <summary>
+        /// Forbid placements in the last built model
+        /// </summary>
+        /// <param name="model">CP model</param>
+        /// <param name="isForbidden">Predicate on (sectionId, timeSlotId, classroomId, teacherId)</param>
+        /// <returns>Number of forbidden variables</returns>
+        public int ForbidPlacements(CpModel model, Func<int, int, int, int, bool> isForbidden)
         {
-            // If the course has a classroom type requirement, but the type does not match
-            if (!string.IsNullOrEmpty(course.RequiredRoomType) && 
-                !string.IsNullOrEmpty(classroom.RoomType) && 
-                !IsCompatibleRoomType(course.RequiredRoomType, classroom.RoomType))
+            int forbiddenCount = 0;
+            for (int i = 0; i < _variableTable.Count; i++)
             {
-                return 0; // Not compatible
+                if (isForbidden(_variableTable.GetSectionId(i), _variableTable.GetTimeSlotId(i),
+                                _variableTable.GetClassroomId(i), _variableTable.GetTeacherId(i)))
+                {
+                    model.Add(_variableTable[i] == 0);
+                    forbiddenCount++;
+                }
             }
 
-            // Default to a normal classroom, any classroom is acceptable
-            return 3;
+            return forbiddenCount;
         }
 
         /// <summary>
-        /// Check if two classroom types are compatible
+        /// Replace the objective function with one that keeps as many previous placements as possible,
+        /// using the preference score only to choose among equally stable placements
         /// </summary>
-        private bool IsCompatibleRoomType(string requiredType, string actualType)
+        public void SetupStabilityObjective(CpModel model, SchedulingProblem problem, SchedulingSolution previousSolution)
         {
-            // Check common compatible types
-            if (requiredType.Contains("lecture", StringComparison.OrdinalIgnoreCase))
+            var (terms, coefficients) = CollectPreferenceTerms(_variableTable, problem);
+
+            // Keeping a placement must outweigh any preference gain of moving a section
+            int stabilityWeight = (coefficients.Count > 0 ? coefficients.Max() : 0) + 1;
+
+            foreach (var assignment in previousSolution.Assignments)
             {
-                // Lecture rooms can be in large classrooms, multimedia rooms, etc.
-                return actualType.Contains("large", StringComparison.OrdinalIgnoreCase) ||
-                       actualType.Contains("multimedia", StringComparison.OrdinalIgnoreCase);
+                var variable = GetAssignmentVariable(assignment);
+                if (variable != null)
+                {
+                    terms.Add(variable);
+                    coefficients.Add(stabilityWeight);
+                }
             }
 
-            if (requiredType.Contains("lab", StringComparison.OrdinalIgnoreCase))
+            if (terms.Count > 0)
             {
-                // Lab courses must be in labs, cannot be substituted
-                return actualType.Contains("lab", StringComparison.OrdinalIgnoreCase);
+                model.Maximize(LinearExpr.WeightedSum(terms.ToArray(), coefficients.ToArray()));
             }
+        }
 
-            if (requiredType.Contains("computer", StringComparison.OrdinalIgnoreCase))
+        /// <summary>
+        /// Calculate the matching score between the course and the classroom type
+        /// </summary>
+        private int CalculateRoomTypeMatchScore(CourseSectionInfo course, ClassroomInfo classroom, SchedulingProblem problem)
+        {
+            // If the course has a classroom type requirement, but the type does not match;
+            // same rule as the room domains of the eligibility index
+            if (!EligibilityIndex.IsCompatibleRoomType(course.RequiredRoomType, classroom.Type))
             {
-                // Computer courses must be in computer rooms
-                return actualType.Contains("computer", StringComparison.OrdinalIgnoreCase);
+                return 0; // Not compatible
             }
 
-            // Other cases are considered incompatible
-            return false;
+            // Default to a normal classroom, any classroom is acceptable
+            return 3;
         }
-        private void AddOneCourseOneAssignmentConstraints(CpModel model, Dictionary<string, IntVar> _variables, SchedulingProblem problem)
+        private void AddOneCourseOneAssignmentConstraints(CpModel model, CPVariableTable variables, SchedulingProblem problem)
         {
             foreach (var course in problem.CourseSections)
             {
-                Console.WriteLine("Adding constraint for each course must be assigned once");
-
                 // Find all variables involving this course section
-                var courseVars = _variables
-                    .Where(kv => kv.Key.StartsWith($"c{course.Id}_"))
-                    .Select(kv => kv.Value)
-                    .ToList();
-                Console.WriteLine($"Course {course.Id} found {courseVars.Count} variables");
+                var courseVars = variables.GetVariables(variables.GetSectionVariables(course.Id));
+                _logger.LogDebug($"Course {course.Id} found {courseVars.Length} variables");
 
-                if (courseVars.Count > 0)
+                if (courseVars.Length > 0)
                 {
                     // Constraint: Each course must be assigned exactly once
                     model.Add(LinearExpr.Sum(courseVars) == 1);
-                    Console.WriteLine($"Added OneCourseOneAssignment constraint for course {course.Id}");
                 }
                 else
                 {
-                    Console.WriteLine($"Warning: Course {course.Id} no related variables found, cannot add constraint!");
+                    // No eligible placement left (e.g. all qualified teachers unavailable), the model is infeasible
+                    _logger.LogWarning($"Course {course.Id} has no eligible placement, model is infeasible");
+                    model.Add(model.NewConstant(0) == 1);
                 }
             }
         }
 
-        private void AddTeacherConflictConstraints(CpModel model, Dictionary<string, IntVar> variables, SchedulingProblem problem)
+        private void AddTeacherConflictConstraints(CpModel model, CPVariableTable variables)
         {
             _logger.LogDebug("Adding teacher conflict constraint...");
 
-            // Pre-processing: Group variables by teacher and time slot
-            var teacherTimeVarsMap = new Dictionary<(int teacherId, int timeSlotId), List<IntVar>>();
-
-            foreach (var entry in variables)
-            {
-                string key = entry.Key;
-
-                // Parse variable name "c{sectionId}_t{timeSlotId}_r{roomId}_f{teacherId}"
-                var parts = key.Split('_');
-                if (parts.Length < 4) continue;
-
-                int timeSlotId = int.Parse(parts[1].Substring(1));
-                int teacherId = int.Parse(parts[3].Substring(1));
-
-                var mapKey = (teacherId, timeSlotId);
-                if (!teacherTimeVarsMap.ContainsKey(mapKey))
-                {
-                    teacherTimeVarsMap[mapKey] = new List<IntVar>();
-                }
-
-                teacherTimeVarsMap[mapKey].Add(entry.Value);
-            }
-
             // Batch add constraints -Maximum of one course taught by the same teacher in the same time slot
             int constraintCount = 0;
-            foreach (var entry in teacherTimeVarsMap)
+            foreach (var group in variables.GetTeacherTimeGroups())
             {
-                var conflictingVars = entry.Value;
-                if (conflictingVars.Count > 1)
+                if (group.Count > 1)
                 {
-                    model.Add(LinearExpr.Sum(conflictingVars) <= 1);
+                    model.Add(LinearExpr.Sum(variables.GetVariables(group)) <= 1);
                     constraintCount++;
                 }
             }
@@ -416,41 +515,17 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.CP
             _logger.LogDebug($"Added {constraintCount} teacher conflict constraints");
         }
 
-        private void AddClassroomConflictConstraints(CpModel model, Dictionary<string, IntVar> variables, SchedulingProblem problem)
+        private void AddClassroomConflictConstraints(CpModel model, CPVariableTable variables)
         {
             _logger.LogDebug("Adding classroom conflict constraint...");
 
-            // Pre-processing: Group variables by classroom and time slot
-            var roomTimeVarsMap = new Dictionary<(int roomId, int timeSlotId), List<IntVar>>();
-
-            foreach (var entry in variables)
-            {
-                string key = entry.Key;
-
-                // Parse variable name "c{sectionId}_t{timeSlotId}_r{roomId}_f{teacherId}"
-                var parts = key.Split('_');
-                if (parts.Length < 4) continue;
-
-                int timeSlotId = int.Parse(parts[1].Substring(1));
-                int roomId = int.Parse(parts[2].Substring(1));
-
-                var mapKey = (roomId, timeSlotId);
-                if (!roomTimeVarsMap.ContainsKey(mapKey))
-                {
-                    roomTimeVarsMap[mapKey] = new List<IntVar>();
-                }
-
-                roomTimeVarsMap[mapKey].Add(entry.Value);
-            }
-
             // Batch add constraints - Maximum of one course in the same classroom in the same time slot
             int constraintCount = 0;
-            foreach (var entry in roomTimeVarsMap)
+            foreach (var group in variables.GetClassroomTimeGroups())
             {
-                var conflictingVars = entry.Value;
-                if (conflictingVars.Count > 1)
+                if (group.Count > 1)
                 {
-                    model.Add(LinearExpr.Sum(conflictingVars) <= 1);
+                    model.Add(LinearExpr.Sum(variables.GetVariables(group)) <= 1);
                     constraintCount++;
                 }
             }
@@ -458,75 +533,23 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.CP
             _logger.LogDebug($"Added {constraintCount} classroom conflict constraints");
         }
 
-        private void AddTeacherAvailabilityConstraints(CpModel model, Dictionary<string, IntVar> _variables, SchedulingProblem problem)
+        private void AddClassroomCapacityConstraints(CpModel model, CPVariableTable variables, SchedulingProblem problem)
         {
-            foreach (var availability in problem.TeacherAvailabilities)
-            {
-                if (!availability.IsAvailable)
-                {
-                    // Find all variables involving this teacher in the unavailable time slot
-                    var unavailableVars = _variables
-                        .Where(kv => kv.Key.Contains($"_t{availability.TimeSlotId}_") &&
-                                   kv.Key.EndsWith($"_f{availability.TeacherId}"))
-                        .Select(kv => kv.Value)
-                        .ToList();
-
-                    foreach (var variable in unavailableVars)
-                    {
-                        // Constraint: The variable for the unavailable time slot must be 0
-                        model.Add(variable == 0);
-                    }
-                }
-            }
-        }
-
-        private void AddClassroomAvailabilityConstraints(CpModel model, Dictionary<string, IntVar> _variables, SchedulingProblem problem)
-        {
-            foreach (var availability in problem.ClassroomAvailabilities)
-            {
-                if (!availability.IsAvailable)
-                {
-                    // Find all variables involving this classroom in the unavailable time slot
-                    var unavailableVars = _variables
-                        .Where(kv => kv.Key.Contains($"_t{availability.TimeSlotId}_r{availability.ClassroomId}_"))
-                        .Select(kv => kv.Value)
-                        .ToList();
-
-                    foreach (var variable in unavailableVars)
-                    {
-                        // Constraint: The variable for the unavailable time slot must be 0
-                        model.Add(variable == 0);
-                    }
-                }
-            }
-        }
+            var enrollments = problem.CourseSections.ToDictionary(s => s.Id, s => s.Enrollment);
+            var capacities = problem.Classrooms.ToDictionary(c => c.Id, c => c.Capacity);
 
-        private void AddClassroomCapacityConstraints(CpModel model, Dictionary<string, IntVar> _variables, SchedulingProblem problem)
-        {
-            foreach (var section in problem.CourseSections)
+            // Only the fallback rooms of sections without a large enough classroom can violate the capacity
+            for (int i = 0; i < variables.Count; i++)
             {
-                foreach (var classroom in problem.Classrooms)
+                if (capacities[variables.GetClassroomId(i)] < enrollments[variables.GetSectionId(i)])
                 {
-                    if (classroom.Capacity < section.Enrollment)
-                    {
-                        // Find all variables involving this classroom with insufficient capacity
-                        var invalidVars = _variables
-                            .Where(kv => kv.Key.StartsWith($"c{section.Id}_") &&
-                                       kv.Key.Contains($"_r{classroom.Id}_"))
-                            .Select(kv => kv.Value)
-                            .ToList();
-
-                        foreach (var variable in invalidVars)
-                        {
-                            // Constraint: The classroom with insufficient capacity cannot be assigned this course
-                            model.Add(variable == 0);
-                        }
-                    }
+                    // Constraint: The classroom with insufficient capacity cannot be assigned this course
+                    model.Add(variables[i] == 0);
                 }
             }
         }
 
-        private void AddPrerequisiteConstraints(CpModel model, Dictionary<string, IntVar> _variables, SchedulingProblem problem)
+        private void AddPrerequisiteConstraints(CpModel model, CPVariableTable variables, SchedulingProblem problem)
         {
             // Create a mapping from course ID to section ID
             var courseToSections = new Dictionary<int, List<int>>();
@@ -560,22 +583,15 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.CP
                             {
                                 foreach (var prereqSectionId in prereqSectionIds)
                                 {
-                                    var sectionTimeVars = _variables
-                                        .Where(kv => kv.Key.StartsWith($"c{sectionId}_t{timeSlot.Id}_"))
-                                        .Select(kv => kv.Value)
-                                        .ToList();
-
-                                    var prereqTimeVars = _variables
-                                        .Where(kv => kv.Key.StartsWith($"c{prereqSectionId}_t{timeSlot.Id}_"))
-                                        .Select(kv => kv.Value)
-                                        .ToList();
+                                    var sectionTimeVars = variables.GetSectionTimeVariables(sectionId, timeSlot.Id);
+                                    var prereqTimeVars = variables.GetSectionTimeVariables(prereqSectionId, timeSlot.Id);
 
-                                    foreach (var sectionVar in sectionTimeVars)
+                                    foreach (int sectionVar in sectionTimeVars)
                                     {
-                                        foreach (var prereqVar in prereqTimeVars)
+                                        foreach (int prereqVar in prereqTimeVars)
                                         {
                                             // Add: Prerequisite course and course cannot be scheduled at the same time
-                                            model.Add(sectionVar + prereqVar <= 1);
+                                            model.Add(variables[sectionVar] + variables[prereqVar] <= 1);
                                         }
                                     }
                                 }
@@ -9,6 +9,7 @@ using System;
 using System.Collections.Generic;
 using System.Linq;
 using System.Diagnostics;
+using System.Globalization;
 using System.Threading;
 using System.Threading.Tasks;
 using SmartSchedulingSystem.Scheduling.Algorithms.CP.Converters;
@@ -26,22 +27,49 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.CP
         private readonly SmartSchedulingSystem.Scheduling.Utils.SchedulingParameters _parameters;
         private readonly Random _random;
         private readonly Dictionary<string, ICPConstraintConverter> _constraintConverters;
+        private readonly ProblemDecomposer _problemDecomposer;
+        private readonly Func<CPModelBuilder> _modelBuilderFactory;
+        private readonly Dictionary<ConstraintApplicationLevel, long> _levelTimeMs = new Dictionary<ConstraintApplicationLevel, long>();
+        private EligibilityIndex _eligibility;
+        private int _timeLimitSeconds;
 
         public CPScheduler(
             CPModelBuilder modelBuilder,
             SolutionConverter solutionConverter,
             ILogger<CPScheduler> logger,
-            SchedulingParameters parameters = null)
+            SchedulingParameters parameters = null,
+            ProblemDecomposer problemDecomposer = null,
+            Func<CPModelBuilder> modelBuilderFactory = null)
         {
             _modelBuilder = modelBuilder ?? throw new ArgumentNullException(nameof(modelBuilder));
             _solutionConverter = solutionConverter ?? throw new ArgumentNullException(nameof(solutionConverter));
             _logger = logger ?? throw new ArgumentNullException(nameof(logger));
             _parameters = parameters ?? new SchedulingParameters();
+            _problemDecomposer = problemDecomposer;
+            _modelBuilderFactory = modelBuilderFactory;
             _random = new Random();
             _constraintConverters = new Dictionary<string, ICPConstraintConverter>();
             InitializeConstraintConverters();
         }
 
+        /// <summary>
+        /// Time spent per constraint level (ms) by the last call of GenerateInitialSolutions or GenerateRandomSolutions
+        /// </summary>
+        public IReadOnlyDictionary<ConstraintApplicationLevel, long> LevelTimeMs => _levelTimeMs;
+
+        /// <summary>
+        /// Time spent repairing the stitched solution of a decomposed problem (ms) by the last call of
+        /// GenerateInitialSolutions, 0 if the problem was not decomposed or needed no repair. Not part of LevelTimeMs
+        /// </summary>
+        public long DecompositionRepairTimeMs { get; private set; }
+
+        /// <summary>
+        /// Solver time limit in seconds: the limit passed to the running GenerateRandomSolutions call, else CpTimeLimit
+        /// </summary>
+        public int TimeLimitSeconds => _timeLimitSeconds > 0
+            ? _timeLimitSeconds
+            : (_parameters.CpTimeLimit > 0 ? _parameters.CpTimeLimit : 60);
+
         /// <summary>
         /// Initialize constraint converters
         /// </summary>
@@ -56,9 +84,15 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.CP
         }
 
         /// <summary>
-        /// Generate initial solution set using constraint programming
+        /// Generate initial solution set using constraint programming.
+        /// Problems at or above DecompositionThreshold are solved by components and return a single stitched
+        /// solution whatever the requested count; the local search phase diversifies from there
         /// </summary>
-        public List<SchedulingSolution> GenerateInitialSolutions(SchedulingProblem problem, int solutionCount = 5)
+        public List<SchedulingSolution> GenerateInitialSolutions(
+            SchedulingProblem problem,
+            int solutionCount = 5,
+            IProgress<SchedulingProgress> progress = null,
+            CancellationToken cancellationToken = default)
         {
             try
             {
@@ -71,20 +105,42 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.CP
                 ValidateProblemData(problem);
                 DebugProblemData(problem); // Add this line to debug problem data
 
+                _eligibility = EligibilityIndex.Build(problem);
+                _levelTimeMs.Clear();
+                DecompositionRepairTimeMs = 0;
+
+                // Large problems are split into weakly coupled components that are solved in parallel
+                if (_problemDecomposer != null &&
+                    _parameters.DecompositionThreshold > 0 &&
+                    problem.CourseSections.Count >= _parameters.DecompositionThreshold)
+                {
+                    var decomposed = GenerateDecomposedSolution(problem, _eligibility);
+                    if (decomposed != null)
+                    {
+                        if (solutionCount > 1)
+                            _logger.LogWarning($"Decomposed solving returns one stitched solution, {solutionCount} were requested");
+
+                        return new List<SchedulingSolution> { decomposed };
+                    }
+
+                    _logger.LogWarning("Decomposed solving failed, falling back to the full model");
+                }
+
                 var sw = Stopwatch.StartNew();
 
                 // Use progressive constraint application approach
                 List<SchedulingSolution> solutions = null;
                 
-                // First try to generate solutions with minimum level constraints
-                _logger.LogInformation("Attempting to generate initial solutions using Basic level constraints...");
-                solutions = TryGenerateWithConstraintLevel(problem, solutionCount, ConstraintApplicationLevel.Basic);
+                // Start from the configured constraint level and downgrade down to Basic level constraints
+                var startLevel = GetCascadeStartLevel();
+                _logger.LogInformation($"Attempting to generate initial solutions using {startLevel} to Basic level constraints...");
+                solutions = TryGenerateWithConstraintCascade(problem, solutionCount, startLevel, progress, cancellationToken);
                 
                 // If no solutions found, try to relax constraints further
                 if (solutions.Count == 0)
                 {
                     _logger.LogWarning("No solutions found with Basic level constraints, attempting to generate random solutions with relaxed constraints...");
-                    solutions = GenerateRandomSolutions(problem, solutionCount);
+                    solutions = GenerateConstraintAwareSolutions(problem, solutionCount, progress, cancellationToken);
                 }
                 
                 _logger.LogInformation($"CP phase completed, generated {solutions.Count} initial solutions");
@@ -99,170 +155,650 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.CP
         }
         
         /// <summary>
-        /// Try to generate solutions with specified constraint level
+        /// Generate solutions with a constraint level cascade. The layered model is built once and solved with the
+        /// layers of the start level enabled; while too few solutions are found it is solved again with the next lower
+        /// level enabled. Solutions found at a higher level are valid at the lower levels and are carried forward as hints
         /// </summary>
-        private List<SchedulingSolution> TryGenerateWithConstraintLevel(
-            SchedulingProblem problem, 
+        private List<SchedulingSolution> TryGenerateWithConstraintCascade(
+            SchedulingProblem problem,
             int solutionCount,
-            ConstraintApplicationLevel level)
+            ConstraintApplicationLevel startLevel,
+            IProgress<SchedulingProgress> progress,
+            CancellationToken cancellationToken)
         {
+            var solutions = new List<SchedulingSolution>();
+
             try
             {
                 var sw = Stopwatch.StartNew();
-            
-                // Create CP model with specified constraint level
-                var model = _modelBuilder.BuildModel(problem, level);
 
-                _logger.LogInformation($"Built CP model with {level} level constraints, time taken: {sw.ElapsedMilliseconds}ms");
+                var model = _modelBuilder.BuildLayeredModel(problem, GetEligibility(problem));
+                var variables = _modelBuilder.GetVariables();
 
-                // Create CP solver
-                var solver = new CpSolver();
-                
-                // Configure solver
+                // The model is built once, its time is charged to the first level
+                long buildTimeMs = sw.ElapsedMilliseconds;
+                _logger.LogInformation($"Built layered CP model, time taken: {buildTimeMs}ms");
+
+                var levels = Enum.GetValues<ConstraintApplicationLevel>()
+                    .Where(l => l <= startLevel && l <= ConstraintApplicationLevel.Enhanced)
+                    .OrderByDescending(l => l)
+                    .ToList();
+
+                long timeLimitMs = TimeLimitSeconds * 1000L;
                 int numThreads = Math.Max(1, Environment.ProcessorCount / 2);
-                int timeLimit = _parameters.CpTimeLimit > 0 ? _parameters.CpTimeLimit : 60;
-                
-                solver.StringParameters = $"num_search_workers:{numThreads};max_time_in_seconds:{timeLimit}";
-                solver.StringParameters += ";log_search_progress:true;collect_all_solutions_as_last_solution:true";
-                
-                _logger.LogInformation($"Set CP solver parameters: {solver.StringParameters}");
-                
-                // Create variable dictionary
-                var variableDict = ExtractVariablesDictionary(model);
-                
-                // Create solution callback
-                var callback = new CPSolutionCallback(variableDict, solutionCount);
+                var placementKeys = new HashSet<string>();
+                SchedulingSolution hint = null;
+                CpSolver solver = null;
+                var status = CpSolverStatus.Unknown;
 
-                // Start solving, but in a cancellable way
-                sw.Restart();
-                
-                // Set timeout monitoring
-                var tokenSource = new CancellationTokenSource();
-                Task timeoutTask = Task.Run(() => {
-                    try 
+                for (int i = 0; i < levels.Count && solutions.Count < solutionCount; i++)
+                {
+                    var level = levels[i];
+                    if (cancellationToken.IsCancellationRequested && solutions.Count > 0)
                     {
-                        // Use additional 1 minute as safety margin
-                        int timeoutMs = (timeLimit + 60) * 1000;
-                        Thread.Sleep(timeoutMs);
-                        
-                        // If execution reaches here, it means timeout
-                        _logger.LogWarning($"CP solving exceeded preset time {timeLimit} seconds, forcing termination");
-                        tokenSource.Cancel();
+                        _logger.LogInformation($"Generation stopped before trying {level} level constraints");
+                        break;
                     }
-                    catch (Exception ex)
+
+                    long remainingMs = timeLimitMs - sw.ElapsedMilliseconds;
+                    if (remainingMs <= 0)
                     {
-                        _logger.LogError(ex, "Timeout monitoring task exception");
+                        _logger.LogWarning($"CP time limit reached before trying {level} level constraints");
+                        break;
                     }
-                });
-                
-                Task<CpSolverStatus> solveTask = Task.Run(() => {
-                    try
+
+                    // Time a level does not use rolls over to the lower levels, the last level gets all that is left
+                    long levelTimeLimitMs = i == levels.Count - 1 ? remainingMs : remainingMs / (levels.Count - i);
+                    var levelSw = Stopwatch.StartNew();
+
+                    progress?.Report(new SchedulingProgress
                     {
-                        return solver.Solve(model, callback);
-                    }
-                    catch (Exception ex)
+                        Kind = SchedulingProgressKind.Phase,
+                        Phase = "CP",
+                        Message = $"Solving with {level} level constraints",
+                        SolutionCount = solutions.Count
+                    });
+
+                    _modelBuilder.SelectConstraintLevel(model, level);
+                    if (hint != null)
+                        _modelBuilder.AddSolutionHints(model, hint);
+
+                    solver = new CpSolver();
+                    solver.StringParameters = $"num_search_workers:{numThreads};max_time_in_seconds:{FormatSeconds(levelTimeLimitMs)}";
+
+                    // A hinted solution is usually found again first, leave room for it in the callback
+                    var callback = new CPSolutionCallback(
+                        variables, solutionCount - solutions.Count + (hint != null ? 1 : 0), progress, cancellationToken);
+
+                    // The callback only sees the token when a solution is found, stop the solver right away on cancellation
+                    using (cancellationToken.Register(solver.StopSearch))
                     {
-                        _logger.LogError(ex, "Exception occurred during CP solving");
-                        return CpSolverStatus.Unknown;
+                        status = solver.Solve(model, callback);
                     }
-                });
 
-                CpSolverStatus status;
-                try
-                {
-                    // Wait for solving to complete or be cancelled
-                    if (Task.WaitAny(new Task[] { solveTask }, timeLimit * 1000 + 10000) == 0)
+                    int found = 0;
+                    foreach (var cpSolution in callback.Solutions)
                     {
-                        // Normal completion
-                        status = solveTask.Result;
-                        _logger.LogInformation($"CP solving completed normally, status: {status}");
+                        if (solutions.Count >= solutionCount || !placementKeys.Add(GetPlacementKey(cpSolution)))
+                            continue;
+
+                        try
+                        {
+                            var solution = _solutionConverter.ConvertToDomainSolution(problem, cpSolution);
+                            solution.ConstraintLevel = level; // Mark which constraint level the solution was generated under
+
+                            var evaluation = EvaluateSolutionQuality(solution, problem);
+                            solution.Score = evaluation.Score;
+                            solution.Evaluation = evaluation;
+
+                            solutions.Add(solution);
+                            found++;
+
+                            _logger.LogInformation($"Successfully generated solution #{solution.Id}, using {level} level constraints, score: {solution.Score:F3}");
+                        }
+                        catch (Exception ex)
+                        {
+                            _logger.LogError(ex, "Error converting CP solution to scheduling system solution");
+                        }
                     }
-                    else
+
+                    levelSw.Stop();
+                    RecordLevelTime(level, levelSw.ElapsedMilliseconds + (i == 0 ? buildTimeMs : 0));
+                    _logger.LogInformation($"CP solving with {level} level constraints took: {levelSw.ElapsedMilliseconds}ms, " +
+                                           $"status: {status}, new solutions: {found}");
+
+                    if (solutions.Count > 0)
+                        hint = solutions.OrderByDescending(s => s.Score).First();
+                }
+
+                // If computation was interrupted without any solution, fall back to a partial solution
+                if (solutions.Count == 0 && status == CpSolverStatus.Unknown && solver != null)
+                {
+                    _logger.LogWarning("CP solving interrupted with no valid solutions returned, attempting to get intermediate solutions");
+
+                    var partialSolution = CollectPartialSolution(problem, model, solver);
+                    if (partialSolution != null)
                     {
-                        // Timeout
-                        tokenSource.Cancel();
-                        status = CpSolverStatus.Unknown;
-                        _logger.LogWarning("CP solving timeout, forcing interruption");
+                        _logger.LogInformation("Successfully built partial solution");
+                        solutions.Add(partialSolution);
                     }
                 }
-                catch (Exception ex)
+
+                return solutions;
+            }
+            catch (Exception ex)
+            {
+                _logger.LogError(ex, "Error in TryGenerateWithConstraintCascade");
+                return solutions;
+            }
+        }
+
+        /// <summary>
+        /// Constraint level the CP cascade starts from, chosen from the parameters as SchedulingEngine does
+        /// </summary>
+        private ConstraintApplicationLevel GetCascadeStartLevel()
+        {
+            if (_parameters.UseBasicConstraints)
+                return ConstraintApplicationLevel.Basic;
+            if (_parameters.UseEnhancedConstraints)
+                return ConstraintApplicationLevel.Enhanced;
+            return ConstraintApplicationLevel.Standard;
+        }
+
+        /// <summary>
+        /// Key identifying the placements selected by a CP solution
+        /// </summary>
+        private static string GetPlacementKey(Dictionary<string, long> cpSolution)
+        {
+            return string.Join(";", cpSolution.Where(kv => kv.Value == 1).Select(kv => kv.Key).OrderBy(k => k, StringComparer.Ordinal));
+        }
+
+        private void RecordLevelTime(ConstraintApplicationLevel level, long elapsedMs)
+        {
+            _levelTimeMs[level] = (_levelTimeMs.TryGetValue(level, out long total) ? total : 0) + elapsedMs;
+        }
+        
+        /// <summary>
+        /// Solve a large problem by decomposition: the weakly coupled components found by ProblemDecomposer are solved
+        /// concurrently, each with a share of the CP time limit proportional to its size, their solutions are stitched
+        /// together and the remaining shared-resource conflicts are repaired with a bounded incremental solve
+        /// </summary>
+        /// <returns>Stitched solution, null if some sections could not be placed</returns>
+        private SchedulingSolution GenerateDecomposedSolution(SchedulingProblem problem, EligibilityIndex eligibility)
+        {
+            var sw = Stopwatch.StartNew();
+            var components = _problemDecomposer.Decompose(problem, eligibility, _parameters.DecompositionMaxComponentSize);
+            if (components.Count <= 1)
+            {
+                _logger.LogInformation("Problem has no weakly coupled components, solving the full model");
+                return null;
+            }
+
+            int totalSections = Math.Max(1, problem.CourseSections.Count);
+            int parallelism = _parameters.MaxParallelism > 0 ? _parameters.MaxParallelism : Environment.ProcessorCount;
+            parallelism = Math.Max(1, Math.Min(parallelism, components.Count));
+            if (_modelBuilderFactory == null)
+                parallelism = 1;
+            int workersPerComponent = Math.Max(1, Environment.ProcessorCount / parallelism);
+
+            // Components get 80% of the time limit, the rest is left for repairing the stitched solution
+            long totalBudgetMs = TimeLimitSeconds * 1000L;
+            long solveBudgetMs = totalBudgetMs * 4 / 5;
+
+            _logger.LogInformation($"Solving {components.Count} components with parallelism {parallelism}, " +
+                                   $"{workersPerComponent} workers per component, solve budget {solveBudgetMs}ms");
+
+            var componentSolutions = new SchedulingSolution[components.Count];
+            Parallel.For(0, components.Count, new ParallelOptions { MaxDegreeOfParallelism = parallelism }, i =>
+            {
+                var component = components[i];
+                long componentBudgetMs = Math.Clamp(
+                    solveBudgetMs * component.SectionCount * parallelism / totalSections,
+                    1000L,
+                    solveBudgetMs);
+                var modelBuilder = _modelBuilderFactory != null ? _modelBuilderFactory() : _modelBuilder;
+
+                componentSolutions[i] = SolveComponent(component, modelBuilder, workersPerComponent, componentBudgetMs);
+            });
+
+            RecordLevelTime(ConstraintApplicationLevel.Basic, sw.ElapsedMilliseconds);
+            _logger.LogInformation($"Solved {componentSolutions.Count(s => s != null)} of {components.Count} components " +
+                                   $"in {sw.ElapsedMilliseconds}ms");
+
+            // Stitch the component solutions together
+            var stitched = new SchedulingSolution
+            {
+                ProblemId = problem.Id,
+                Problem = problem,
+                Name = $"Decomposed solution {DateTime.Now:yyyyMMdd_HHmmss}",
+                Algorithm = "CP_Decomposed",
+                ConstraintLevel = ConstraintApplicationLevel.Basic
+            };
+            int nextId = 1;
+            foreach (var assignment in componentSolutions.Where(s => s != null).SelectMany(s => s.Assignments))
+            {
+                assignment.Id = nextId++;
+                stitched.Assignments.Add(assignment);
+            }
+
+            // Shared-resource conflicts and sections of failed components are repaired in the remaining time
+            var changes = new ScheduleChangeSet();
+            if (FindAffectedSections(problem, stitched, changes).Count > 0)
+            {
+                long remainingMs = Math.Max(1000L, totalBudgetMs - sw.ElapsedMilliseconds);
+                var repair = RepairSolution(problem, stitched, changes, remainingMs);
+                DecompositionRepairTimeMs += repair.ExecutionTimeMs;
+
+                if (repair.IsSuccessful)
+                {
+                    _logger.LogInformation($"Repaired stitched solution, {repair.ChangedSectionCount} sections moved");
+                    stitched = repair.Solution;
+                    stitched.Algorithm = "CP_Decomposed";
+                }
+                else if (stitched.Assignments.Select(a => a.SectionId).Distinct().Count() < problem.CourseSections.Count)
                 {
-                    _logger.LogError(ex, "Exception occurred while waiting for CP solving results");
-                    status = CpSolverStatus.Unknown;
+                    _logger.LogWarning("Could not place the sections of the failed components");
+                    return null;
                 }
-                
-                // Cancel timeout monitoring task
-                tokenSource.Cancel();
-                
-                sw.Stop();
-                _logger.LogInformation($"CP solving with {level} level constraints took: {sw.ElapsedMilliseconds}ms, status: {status}, solutions found: {callback.SolutionCount}");
+                else
+                {
+                    // Remaining conflicts are left to the local search phase
+                    _logger.LogWarning("Could not repair all conflicts of the stitched solution within the time limit");
+                }
+            }
+
+            if (stitched.Evaluation == null)
+            {
+                var evaluation = EvaluateSolutionQuality(stitched, problem);
+                stitched.Score = evaluation.Score;
+                stitched.Evaluation = evaluation;
+            }
+
+            sw.Stop();
+            _logger.LogInformation($"Decomposed solving completed in {sw.ElapsedMilliseconds}ms, score: {stitched.Score:F3}");
+
+            return stitched;
+        }
 
-                // If not enough solutions found but computation was interrupted, try to use intermediate solutions collected by solver
-                if (callback.SolutionCount == 0 && status == CpSolverStatus.Unknown)
+        /// <summary>
+        /// Solve the Basic level model of a component
+        /// </summary>
+        private SchedulingSolution SolveComponent(ProblemComponent component, CPModelBuilder modelBuilder, int numThreads, long timeLimitMs)
+        {
+            try
+            {
+                var subproblem = component.Problem;
+                var model = modelBuilder.BuildModel(subproblem, ConstraintApplicationLevel.Basic, EligibilityIndex.Build(subproblem));
+                var variables = modelBuilder.GetVariables();
+
+                var solver = new CpSolver();
+                solver.StringParameters = $"num_search_workers:{numThreads};max_time_in_seconds:{FormatSeconds(timeLimitMs)}";
+
+                var status = solver.Solve(model);
+                if (status != CpSolverStatus.Optimal && status != CpSolverStatus.Feasible)
                 {
-                    _logger.LogWarning("CP solving interrupted with no valid solutions returned, attempting to get intermediate solutions");
-                    
-                    // Create a basic solution
-                    try
-                    {
-                        var partialSolution = CollectPartialSolution(problem, model, solver);
-                        if (partialSolution != null)
-                        {
-                            _logger.LogInformation("Successfully built partial solution");
-                            return new List<SchedulingSolution> { partialSolution };
-                        }
-                    }
-                    catch (Exception ex)
-                    {
-                        _logger.LogError(ex, "Error while attempting to build partial solution");
-                    }
+                    _logger.LogWarning($"Component {component.Index} ({component.SectionCount} sections) not solved, status: {status}");
+                    return null;
                 }
 
-                // Convert to scheduling system solutions
-                var solutions = new List<SchedulingSolution>();
+                var cpSolution = variables.ToDictionary(kv => kv.Key, kv => solver.Value(kv.Value));
+                return _solutionConverter.ConvertToDomainSolution(subproblem, cpSolution);
+            }
+            catch (Exception ex)
+            {
+                _logger.LogError(ex, $"Error solving component {component.Index}");
+                return null;
+            }
+        }
+
+        /// <summary>
+        /// Format a time limit in milliseconds as solver seconds
+        /// </summary>
+        private static string FormatSeconds(long milliseconds)
+        {
+            return (milliseconds / 1000.0).ToString("0.###", CultureInfo.InvariantCulture);
+        }
+
+        /// <summary>
+        /// Incrementally reschedule after a change to the semester. The previous placements are used as solver hints,
+        /// sections outside the neighbourhood affected by the change are fixed, and a bounded repair search is run.
+        /// The neighbourhood is widened step by step when the repair is infeasible
+        /// </summary>
+        /// <param name="problem">Scheduling problem, with the change already reflected in its data (see ScheduleChangeSet.ApplyTo)</param>
+        /// <param name="previousSolution">Previously generated solution</param>
+        /// <param name="changes">Changes since the previous solution</param>
+        public ReschedulingResult Reschedule(SchedulingProblem problem, SchedulingSolution previousSolution, ScheduleChangeSet changes)
+        {
+            if (problem == null)
+                throw new ArgumentNullException(nameof(problem));
+            if (previousSolution == null)
+                throw new ArgumentNullException(nameof(previousSolution));
+
+            // The problem may have changed since the last run, rebuild its eligibility domains
+            _eligibility = EligibilityIndex.Build(problem);
+
+            return RepairSolution(
+                problem,
+                previousSolution,
+                changes ?? new ScheduleChangeSet(),
+                Math.Max(1, _parameters.RescheduleTimeLimit) * 1000L);
+        }
+
+        /// <summary>
+        /// Repair a solution within the time limit, moving as few course sections as possible
+        /// </summary>
+        private ReschedulingResult RepairSolution(
+            SchedulingProblem problem,
+            SchedulingSolution previousSolution,
+            ScheduleChangeSet changes,
+            long timeLimitMs)
+        {
+            var sw = Stopwatch.StartNew();
+            var result = new ReschedulingResult();
+
+            var affectedSections = FindAffectedSections(problem, previousSolution, changes);
+            result.AffectedAssignmentCount = previousSolution.Assignments.Count(a => affectedSections.Contains(a.SectionId));
 
-                _logger.LogInformation($"Starting to convert CP solutions to scheduling system solutions...");
-                sw.Restart();
+            _logger.LogInformation($"Starting incremental rescheduling: {affectedSections.Count} affected sections, " +
+                                   $"{result.AffectedAssignmentCount} affected assignments");
 
-                foreach (var cpSolution in callback.Solutions)
+            // Radius 0 frees the affected sections only, radius 1 also frees the sections sharing a teacher or
+            // classroom with them, radius -1 frees the whole schedule and keeps only the hints
+            foreach (int radius in new[] { 0, 1, -1 })
+            {
+                long remainingMs = timeLimitMs - sw.ElapsedMilliseconds;
+                if (remainingMs <= 0)
+                    break;
+
+                var freeSections = radius < 0
+                    ? problem.CourseSections.Select(s => s.Id).ToHashSet()
+                    : ExpandNeighbourhood(previousSolution, affectedSections, radius);
+
+                result.Attempts++;
+                result.NeighbourhoodRadius = radius;
+
+                var solution = TryRepair(problem, previousSolution, changes, freeSections, remainingMs);
+                result.FreedSectionCount = freeSections.Count;
+
+                if (solution != null)
                 {
-                    try
+                    result.Solution = solution;
+                    result.ChangedSectionCount = CountChangedSections(previousSolution, solution);
+                    break;
+                }
+
+                _logger.LogInformation($"No repair found with neighbourhood radius {radius} ({freeSections.Count} free sections)");
+            }
+
+            sw.Stop();
+            result.ExecutionTimeMs = sw.ElapsedMilliseconds;
+            result.Message = result.IsSuccessful
+                ? $"Rescheduled {result.ChangedSectionCount} of {problem.CourseSections.Count} sections"
+                : "No feasible repair found within the time limit";
+
+            _logger.LogInformation($"Incremental rescheduling completed in {result.ExecutionTimeMs}ms after {result.Attempts} attempts: {result.Message}");
+
+            return result;
+        }
+
+        /// <summary>
+        /// Find the course sections whose previous placement is no longer valid or that have no placement yet
+        /// </summary>
+        private HashSet<int> FindAffectedSections(SchedulingProblem problem, SchedulingSolution previousSolution, ScheduleChangeSet changes)
+        {
+            var sections = problem.CourseSections.ToDictionary(s => s.Id);
+            var teacherIds = problem.Teachers.Select(t => t.Id).ToHashSet();
+            var classrooms = problem.Classrooms.ToDictionary(c => c.Id);
+            var timeSlotIds = problem.TimeSlots.Select(t => t.Id).ToHashSet();
+            var unavailableTeacherTimes = problem.TeacherAvailabilities
+                .Where(a => !a.IsAvailable)
+                .Select(a => (a.TeacherId, a.TimeSlotId))
+                .ToHashSet();
+            var unavailableClassroomTimes = problem.ClassroomAvailabilities
+                .Where(a => !a.IsAvailable)
+                .Select(a => (a.ClassroomId, a.TimeSlotId))
+                .ToHashSet();
+
+            var affected = new HashSet<int>(changes.SectionIds.Where(sections.ContainsKey));
+            var usedTeacherTimes = new HashSet<(int, int)>();
+            var usedClassroomTimes = new HashSet<(int, int)>();
+
+            foreach (var group in previousSolution.Assignments.GroupBy(a => a.SectionId))
+            {
+                if (!sections.TryGetValue(group.Key, out var section))
+                    continue;
+
+                // The CP model places each section exactly once
+                if (group.Count() != 1)
+                {
+                    affected.Add(group.Key);
+                    continue;
+                }
+
+                var assignment = group.First();
+                bool invalid =
+                    !teacherIds.Contains(assignment.TeacherId) ||
+                    !classrooms.TryGetValue(assignment.ClassroomId, out var classroom) ||
+                    !timeSlotIds.Contains(assignment.TimeSlotId) ||
+                    classroom.Capacity < section.Enrollment ||
+                    changes.IsTeacherBlocked(assignment.TeacherId, assignment.TimeSlotId) ||
+                    changes.IsClassroomBlocked(assignment.ClassroomId, assignment.TimeSlotId) ||
+                    unavailableTeacherTimes.Contains((assignment.TeacherId, assignment.TimeSlotId)) ||
+                    unavailableClassroomTimes.Contains((assignment.ClassroomId, assignment.TimeSlotId)) ||
+                    !usedTeacherTimes.Add((assignment.TeacherId, assignment.TimeSlotId)) ||
+                    !usedClassroomTimes.Add((assignment.ClassroomId, assignment.TimeSlotId));
+
+                if (invalid)
+                    affected.Add(group.Key);
+            }
+
+            // Sections placed in the same time slot as a section of one of their prerequisite courses
+            var courseTimeSlots = previousSolution.Assignments
+                .Where(a => sections.ContainsKey(a.SectionId))
+                .GroupBy(a => sections[a.SectionId].CourseId)
+                .ToDictionary(g => g.Key, g => g.Select(a => a.TimeSlotId).ToHashSet());
+
+            foreach (var assignment in previousSolution.Assignments)
+            {
+                if (!sections.TryGetValue(assignment.SectionId, out var section) || section.Course?.Prerequisites == null)
+                    continue;
+
+                if (section.Course.Prerequisites.Any(p =>
+                        courseTimeSlots.TryGetValue(p.PrerequisiteCourseId, out var timeSlots) &&
+                        timeSlots.Contains(assignment.TimeSlotId)))
+                {
+                    affected.Add(assignment.SectionId);
+                }
+            }
+
+            // Sections added since the previous solution
+            var previousSections = previousSolution.Assignments.Select(a => a.SectionId).ToHashSet();
+            affected.UnionWith(sections.Keys.Where(id => !previousSections.Contains(id)));
+
+            return affected;
+        }
+
+        /// <summary>
+        /// Add the sections sharing a teacher or classroom with the given sections, radius times
+        /// </summary>
+        private HashSet<int> ExpandNeighbourhood(SchedulingSolution previousSolution, HashSet<int> sections, int radius)
+        {
+            var neighbourhood = new HashSet<int>(sections);
+
+            for (int i = 0; i < radius; i++)
+            {
+                var frontier = previousSolution.Assignments.Where(a => neighbourhood.Contains(a.SectionId)).ToList();
+                var teacherIds = frontier.Select(a => a.TeacherId).ToHashSet();
+                var classroomIds = frontier.Select(a => a.ClassroomId).ToHashSet();
+
+                neighbourhood.UnionWith(previousSolution.Assignments
+                    .Where(a => teacherIds.Contains(a.TeacherId) || classroomIds.Contains(a.ClassroomId))
+                    .Select(a => a.SectionId));
+            }
+
+            return neighbourhood;
+        }
+
+        /// <summary>
+        /// Solve the repair model: sections outside freeSections keep their previous placement,
+        /// the previous solution is passed as hints and changes are kept to a minimum
+        /// </summary>
+        private SchedulingSolution TryRepair(
+            SchedulingProblem problem,
+            SchedulingSolution previousSolution,
+            ScheduleChangeSet changes,
+            HashSet<int> freeSections,
+            long timeLimitMs)
+        {
+            try
+            {
+                var model = _modelBuilder.BuildModel(problem, ConstraintApplicationLevel.Standard, GetEligibility(problem));
+                var variables = _modelBuilder.GetVariables();
+
+                _modelBuilder.ForbidPlacements(model, (sectionId, timeSlotId, classroomId, teacherId) =>
+                    changes.IsTeacherBlocked(teacherId, timeSlotId) || changes.IsClassroomBlocked(classroomId, timeSlotId));
+
+                int fixedCount = 0;
+                foreach (var assignment in previousSolution.Assignments)
+                {
+                    if (freeSections.Contains(assignment.SectionId))
+                        continue;
+
+                    if (_modelBuilder.TryFixAssignment(model, assignment))
                     {
-                        var solution = _solutionConverter.ConvertToDomainSolution(problem, cpSolution);
-                        solution.ConstraintLevel = level; // Mark which constraint level the solution was generated under
-                        
-                        // Calculate solution score
-                        var evaluation = EvaluateSolutionQuality(solution, problem);
-                        solution.Score = evaluation.Score;
-                        solution.Evaluation = evaluation;
-                        _logger.LogDebug($"Solution score: {evaluation.Score}");
-                        
-                        solutions.Add(solution);
-                        
-                        _logger.LogInformation($"Successfully generated solution #{solution.Id}, using {level} level constraints, score: {solution.Score:F3}");
+                        fixedCount++;
                     }
-                    catch (Exception ex)
+                    else
                     {
-                        _logger.LogError(ex, "Error converting CP solution to scheduling system solution");
+                        // Placement is outside the model's domain (e.g. teacher no longer qualified), let the solver move it
+                        freeSections.Add(assignment.SectionId);
                     }
                 }
 
-                sw.Stop();
-                _logger.LogInformation($"Conversion completed, took: {sw.ElapsedMilliseconds}ms, successfully converted {solutions.Count} solutions");
+                _modelBuilder.AddSolutionHints(model, previousSolution);
+                _modelBuilder.SetupStabilityObjective(model, problem, previousSolution);
 
-                return solutions;
+                var solver = new CpSolver();
+                int numThreads = Math.Max(1, Environment.ProcessorCount / 2);
+                string timeLimit = FormatSeconds(timeLimitMs);
+                solver.StringParameters = $"num_search_workers:{numThreads};max_time_in_seconds:{timeLimit}";
+
+                _logger.LogInformation($"Solving repair model: {fixedCount} fixed assignments, {freeSections.Count} free sections, time limit {timeLimit}s");
+
+                var status = solver.Solve(model);
+                if (status != CpSolverStatus.Optimal && status != CpSolverStatus.Feasible)
+                {
+                    _logger.LogDebug($"Repair model status: {status}");
+                    return null;
+                }
+
+                var cpSolution = variables.ToDictionary(kv => kv.Key, kv => solver.Value(kv.Value));
+                return BuildRescheduledSolution(problem, previousSolution, cpSolution);
             }
             catch (Exception ex)
             {
-                _logger.LogError(ex, "Error in TryGenerateWithConstraintLevel");
-                return new List<SchedulingSolution>();
+                _logger.LogError(ex, "Error solving repair model");
+                return null;
             }
         }
-        
+
+        /// <summary>
+        /// Convert the repair model solution, keeping the assignment IDs and week patterns of the previous solution
+        /// </summary>
+        private SchedulingSolution BuildRescheduledSolution(
+            SchedulingProblem problem,
+            SchedulingSolution previousSolution,
+            Dictionary<string, long> cpSolution)
+        {
+            var solution = _solutionConverter.ConvertToDomainSolution(problem, cpSolution);
+            solution.ProblemId = problem.Id;
+            solution.Name = previousSolution.Name;
+            solution.Algorithm = "CP_Reschedule";
+            solution.ConstraintLevel = ConstraintApplicationLevel.Standard;
+
+            var previousBySection = previousSolution.Assignments
+                .GroupBy(a => a.SectionId)
+                .ToDictionary(g => g.Key, g => g.First());
+            var sections = problem.CourseSections.ToDictionary(s => s.Id);
+            var teachers = problem.Teachers.ToDictionary(t => t.Id);
+            int nextId = previousSolution.Assignments.Count > 0 ? previousSolution.Assignments.Max(a => a.Id) + 1 : 1;
+
+            foreach (var assignment in solution.Assignments)
+            {
+                if (previousBySection.TryGetValue(assignment.SectionId, out var previous))
+                {
+                    assignment.Id = previous.Id;
+                    assignment.WeekPattern = new List<int>(previous.WeekPattern ?? new List<int>());
+                }
+                else
+                {
+                    assignment.Id = nextId++;
+                }
+
+                if (sections.TryGetValue(assignment.SectionId, out var section))
+                    assignment.SectionCode = section.SectionCode;
+                if (teachers.TryGetValue(assignment.TeacherId, out var teacher))
+                    assignment.TeacherName = teacher.Name;
+            }
+
+            var evaluation = EvaluateSolutionQuality(solution, problem);
+            solution.Score = evaluation.Score;
+            solution.Evaluation = evaluation;
+
+            return solution;
+        }
+
+        /// <summary>
+        /// Count the course sections whose placement differs from the previous solution
+        /// </summary>
+        private static int CountChangedSections(SchedulingSolution previousSolution, SchedulingSolution solution)
+        {
+            var previousPlacements = previousSolution.Assignments
+                .GroupBy(a => a.SectionId)
+                .ToDictionary(g => g.Key, g => (g.First().TimeSlotId, g.First().ClassroomId, g.First().TeacherId));
+
+            return solution.Assignments.Count(a =>
+                !previousPlacements.TryGetValue(a.SectionId, out var previous) ||
+                previous != (a.TimeSlotId, a.ClassroomId, a.TeacherId));
+        }
+
         /// <summary>
         /// Use appropriate constraints to generate random solutions
         /// </summary>
-        public List<SchedulingSolution> GenerateRandomSolutions(SchedulingProblem problem, int solutionCount)
+        /// <param name="timeLimitSeconds">Solver time limit of this call in seconds, 0 to use CpTimeLimit</param>
+        public List<SchedulingSolution> GenerateRandomSolutions(
+            SchedulingProblem problem,
+            int solutionCount,
+            IProgress<SchedulingProgress> progress = null,
+            CancellationToken cancellationToken = default,
+            int timeLimitSeconds = 0)
+        {
+            _levelTimeMs.Clear();
+            DecompositionRepairTimeMs = 0;
+
+            // Save original time limit
+            int originalTimeLimitSeconds = _timeLimitSeconds;
+            try
+            {
+                if (timeLimitSeconds > 0)
+                    _timeLimitSeconds = timeLimitSeconds;
+
+                return GenerateConstraintAwareSolutions(problem, solutionCount, progress, cancellationToken);
+            }
+            finally
+            {
+                _timeLimitSeconds = originalTimeLimitSeconds;
+            }
+        }
+
+        /// <summary>
+        /// Generate random solutions starting from the current constraint level and downgrading while too few are found
+        /// </summary>
+        private List<SchedulingSolution> GenerateConstraintAwareSolutions(
+            SchedulingProblem problem,
+            int solutionCount,
+            IProgress<SchedulingProgress> progress,
+            CancellationToken cancellationToken)
         {
             try
             {
@@ -281,33 +817,33 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.CP
                 switch (constraintLevel)
                 {
                     case ConstraintApplicationLevel.Basic:
-                        solutions = TryGenerateSolutionsWithConstraintLevel(problem, solutionCount, ConstraintApplicationLevel.Basic, random);
+                        solutions = TryGenerateSolutionsWithConstraintLevel(problem, solutionCount, ConstraintApplicationLevel.Basic, random, progress, cancellationToken);
                         break;
                         
                     case ConstraintApplicationLevel.Standard:
                         // First try to generate solutions with standard level constraints
-                        solutions = TryGenerateSolutionsWithConstraintLevel(problem, solutionCount, ConstraintApplicationLevel.Standard, random);
+                        solutions = TryGenerateSolutionsWithConstraintLevel(problem, solutionCount, ConstraintApplicationLevel.Standard, random, progress, cancellationToken);
                         
                         // If not enough, downgrade to basic constraints
                         if (solutions.Count < solutionCount)
                         {
                             _logger.LogWarning($"Using Standard level constraints only generated {solutions.Count}/{solutionCount} solutions, attempting to use Basic level constraints...");
                             var basicSolutions = TryGenerateSolutionsWithConstraintLevel(
-                                problem, solutionCount - solutions.Count, ConstraintApplicationLevel.Basic, random);
+                                problem, solutionCount - solutions.Count, ConstraintApplicationLevel.Basic, random, progress, cancellationToken);
                             solutions.AddRange(basicSolutions);
                         }
                         break;
                         
                     case ConstraintApplicationLevel.Enhanced:
                         // First try to generate solutions with enhanced level constraints
-                        solutions = TryGenerateSolutionsWithConstraintLevel(problem, solutionCount, ConstraintApplicationLevel.Enhanced, random);
+                        solutions = TryGenerateSolutionsWithConstraintLevel(problem, solutionCount, ConstraintApplicationLevel.Enhanced, random, progress, cancellationToken);
                         
                         // If not enough, downgrade to standard constraints
                         if (solutions.Count < solutionCount)
                         {
                             _logger.LogWarning($"Using Enhanced level constraints only generated {solutions.Count}/{solutionCount} solutions, attempting to use Standard level constraints...");
                             var standardSolutions = TryGenerateSolutionsWithConstraintLevel(
-                                problem, solutionCount - solutions.Count, ConstraintApplicationLevel.Standard, random);
+                                problem, solutionCount - solutions.Count, ConstraintApplicationLevel.Standard, random, progress, cancellationToken);
                             solutions.AddRange(standardSolutions);
                             
                             // If still not enough, further downgrade to basic constraints
@@ -315,7 +851,7 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.CP
                             {
                                 _logger.LogWarning($"Using Standard level constraints after generating {solutions.Count}/{solutionCount} solutions, attempting to use Basic level constraints...");
                                 var basicSolutions = TryGenerateSolutionsWithConstraintLevel(
-                                    problem, solutionCount - solutions.Count, ConstraintApplicationLevel.Basic, random);
+                                    problem, solutionCount - solutions.Count, ConstraintApplicationLevel.Basic, random, progress, cancellationToken);
                                 solutions.AddRange(basicSolutions);
                             }
                         }
@@ -324,27 +860,27 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.CP
                     case ConstraintApplicationLevel.Complete:
                         // For Complete level (including Level4), we use layered strategy
                         // Here we only consider Level3 for now
-                        solutions = TryGenerateSolutionsWithConstraintLevel(problem, solutionCount, ConstraintApplicationLevel.Enhanced, random);
+                        solutions = TryGenerateSolutionsWithConstraintLevel(problem, solutionCount, ConstraintApplicationLevel.Enhanced, random, progress, cancellationToken);
                         
                         if (solutions.Count < solutionCount)
                         {
                             _logger.LogWarning($"Using Complete level constraints only generated {solutions.Count}/{solutionCount} solutions, downgrading to Enhanced level...");
                             var enhancedSolutions = TryGenerateSolutionsWithConstraintLevel(
-                                problem, solutionCount - solutions.Count, ConstraintApplicationLevel.Enhanced, random);
+                                problem, solutionCount - solutions.Count, ConstraintApplicationLevel.Enhanced, random, progress, cancellationToken);
                             solutions.AddRange(enhancedSolutions);
                             
                             if (solutions.Count < solutionCount)
                             {
                                 _logger.LogWarning($"Using Enhanced level constraints after generating {solutions.Count}/{solutionCount} solutions, downgrading to Standard level...");
                                 var standardSolutions = TryGenerateSolutionsWithConstraintLevel(
-                                    problem, solutionCount - solutions.Count, ConstraintApplicationLevel.Standard, random);
+                                    problem, solutionCount - solutions.Count, ConstraintApplicationLevel.Standard, random, progress, cancellationToken);
                                 solutions.AddRange(standardSolutions);
                                 
                                 if (solutions.Count < solutionCount)
                                 {
                                     _logger.LogWarning($"Using Standard level constraints after generating {solutions.Count}/{solutionCount} solutions, downgrading to Basic level...");
                                     var basicSolutions = TryGenerateSolutionsWithConstraintLevel(
-                                        problem, solutionCount - solutions.Count, ConstraintApplicationLevel.Basic, random);
+                                        problem, solutionCount - solutions.Count, ConstraintApplicationLevel.Basic, random, progress, cancellationToken);
                                     solutions.AddRange(basicSolutions);
                                 }
                             }
@@ -414,13 +950,16 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.CP
             SchedulingProblem problem, 
             int targetCount,
             ConstraintApplicationLevel level,
-            Random random)
+            Random random,
+            IProgress<SchedulingProgress> progress,
+            CancellationToken cancellationToken)
         {
             _logger.LogInformation($"Attempting to generate {targetCount} solutions with {level} level constraints");
             
             var solutions = new List<SchedulingSolution>();
             int maxAttempts = targetCount * 3; // Each target solution allows up to 3 attempts
             int attempts = 0;
+            var levelSw = Stopwatch.StartNew();
             
             // Save the original constraint level
             var originalLevel = GlobalConstraintManager.Current?.GetCurrentApplicationLevel() ?? ConstraintApplicationLevel.Basic;
@@ -430,7 +969,7 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.CP
                 // Set the current constraint level
                 GlobalConstraintManager.Current?.SetConstraintApplicationLevel(level);
                 
-                while (solutions.Count < targetCount && attempts < maxAttempts)
+                while (solutions.Count < targetCount && attempts < maxAttempts && !cancellationToken.IsCancellationRequested)
                 {
                     attempts++;
                     
@@ -481,6 +1020,16 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.CP
                             solution.Evaluation = evaluation;
                             
                             solutions.Add(solution);
+
+                            progress?.Report(new SchedulingProgress
+                            {
+                                Kind = SchedulingProgressKind.Solution,
+                                Phase = "Construction",
+                                Message = $"Generated solution #{solution.Id} with {level} level constraints",
+                                SolutionCount = solutions.Count,
+                                Score = solution.Score,
+                                BestScore = solutions.Max(s => s.Score)
+                            });
                             
                             _logger.LogInformation($"Successfully generated solution #{solution.Id}, using {level} level constraints, score: {solution.Score:F3}");
                         }
@@ -497,6 +1046,8 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.CP
             }
             finally
             {
+                RecordLevelTime(level, levelSw.ElapsedMilliseconds);
+
                 // Restore the original constraint level
                 if (GlobalConstraintManager.Current != null)
                 {
@@ -859,18 +1410,10 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.CP
         /// </summary>
         private List<ClassroomInfo> FindSuitableRooms(SchedulingProblem problem, CourseSectionInfo section, int teacherId, int timeSlotId)
         {
-            // First find all unused classrooms (no longer use problem.Assignments, because SchedulingProblem does not have this property)
-            var availableRooms = problem.Classrooms.ToList();
-            
-            // Check classroom availability
-            availableRooms = availableRooms
-                .Where(room => !problem.ClassroomAvailabilities.Any(ca => 
-                    ca.ClassroomId == room.Id && ca.TimeSlotId == timeSlotId && !ca.IsAvailable))
-                .ToList();
-            
-            // Check capacity constraints
-            availableRooms = availableRooms
-                .Where(room => room.Capacity >= section.Enrollment)
+            // Classrooms with sufficient capacity that are available in the time slot
+            var eligibility = GetEligibility(problem);
+            var availableRooms = eligibility.GetRoomsWithCapacity(section.Id)
+                .Where(room => eligibility.IsClassroomAvailable(room.Id, timeSlotId))
                 .ToList();
             
             // Sort classrooms, first consider classrooms that meet the classroom type and equipment requirements
@@ -1238,9 +1781,7 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.CP
                 _logger.LogDebug($"Using basic constraints to assign resources for course {section.Id} ({section.CourseName})");
                 
                 // Filter classrooms with sufficient capacity
-                var suitableRooms = problem.Classrooms
-                    .Where(room => room.Capacity >= section.Enrollment)
-                    .ToList();
+                var suitableRooms = GetEligibility(problem).GetRoomsWithCapacity(section.Id).ToList();
                 
                 // If there are no classrooms with sufficient capacity, select the classroom with the largest capacity
                 if (suitableRooms.Count == 0)
@@ -1431,9 +1972,7 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.CP
             Random random)
         {
             // First filter classrooms with sufficient capacity (satisfy classroom capacity constraint)
-            var suitableRooms = problem.Classrooms
-                .Where(room => room.Capacity >= section.Enrollment)
-                .ToList();
+            var suitableRooms = GetEligibility(problem).GetRoomsWithCapacity(section.Id).ToList();
             
             if (suitableRooms.Count == 0)
             {
@@ -1535,9 +2074,7 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.CP
                 _logger.LogDebug($"Using standard constraints to assign resources for course {section.Id} ({section.CourseName})");
                 
                 // Filter classrooms with sufficient capacity
-            var suitableRooms = problem.Classrooms
-                .Where(room => room.Capacity >= section.Enrollment)
-                .ToList();
+            var suitableRooms = GetEligibility(problem).GetRoomsWithCapacity(section.Id).ToList();
                 
             if (suitableRooms.Count == 0)
             {
@@ -1701,9 +2238,7 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.CP
                 var selectedTimeSlot = timeSlotCandidates[random.Next(timeSlotCandidates.Count)];
                 
                 // Try to select a classroom with sufficient capacity
-                var suitableRooms = problem.Classrooms
-                    .Where(room => room.Capacity >= section.Enrollment)
-                    .ToList();
+                var suitableRooms = GetEligibility(problem).GetRoomsWithCapacity(section.Id).ToList();
                     
                 if (suitableRooms.Count == 0)
                 {
@@ -1872,14 +2407,20 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.CP
         }
         
         /// <summary>
-        /// Extract the variable dictionary from the CP model
+        /// Get the eligibility index of the problem, built once and reused while the same problem is scheduled
         /// </summary>
-        private Dictionary<string, IntVar> ExtractVariablesDictionary(CpModel model)
+        private EligibilityIndex GetEligibility(SchedulingProblem problem)
         {
-            // Simplified implementation, actually should extract variables from the model
-            return new Dictionary<string, IntVar>();
+            var eligibility = _eligibility;
+            if (eligibility == null || !ReferenceEquals(eligibility.Problem, problem))
+            {
+                eligibility = EligibilityIndex.Build(problem);
+                _eligibility = eligibility;
+            }
+
+            return eligibility;
         }
-        
+
         /// <summary>
         /// Collect partial solution
         /// </summary>
@@ -1,7 +1,9 @@
 ﻿using Google.OrTools.Sat;
+using SmartSchedulingSystem.Scheduling.Models;
 using System;
 using System.Collections.Generic;
 using System.Linq;
+using System.Threading;
 
 namespace SmartSchedulingSystem.Scheduling.Algorithms.CP
 {
@@ -12,6 +14,8 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.CP
     {
         private readonly Dictionary<string, IntVar> _variableDict;
         private readonly int _targetSolutionCount;
+        private readonly IProgress<SchedulingProgress> _progress;
+        private readonly CancellationToken _cancellationToken;
         
         public List<Dictionary<string, long>> Solutions { get; private set; }
         public int SolutionCount => Solutions.Count;
@@ -21,10 +25,18 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.CP
         /// </summary>
         /// <param name="variableDict">变量字典</param>
         /// <param name="targetSolutionCount">目标解数量</param>
-        public CPSolutionCallback(Dictionary<string, IntVar> variableDict, int targetSolutionCount)
+        /// <param name="progress">进度报告，每找到一个解报告一次</param>
+        /// <param name="cancellationToken">取消后在下一个解处停止搜索</param>
+        public CPSolutionCallback(
+            Dictionary<string, IntVar> variableDict,
+            int targetSolutionCount,
+            IProgress<SchedulingProgress> progress = null,
+            CancellationToken cancellationToken = default)
         {
             _variableDict = variableDict ?? throw new ArgumentNullException(nameof(variableDict));
             _targetSolutionCount = Math.Max(1, targetSolutionCount);
+            _progress = progress;
+            _cancellationToken = cancellationToken;
             Solutions = new List<Dictionary<string, long>>();
         }
         
@@ -50,9 +62,18 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.CP
             
             // 添加到解决方案列表
             Solutions.Add(solution);
+
+            _progress?.Report(new SchedulingProgress
+            {
+                Kind = SchedulingProgressKind.Solution,
+                Phase = "CP",
+                Message = $"CP found solution {Solutions.Count}",
+                SolutionCount = Solutions.Count,
+                Score = ObjectiveValue()
+            });
             
-            // 如果达到目标解数量，停止搜索
-            if (Solutions.Count >= _targetSolutionCount)
+            // 如果达到目标解数量或已取消，停止搜索
+            if (Solutions.Count >= _targetSolutionCount || _cancellationToken.IsCancellationRequested)
             {
                 StopSearch();
             }
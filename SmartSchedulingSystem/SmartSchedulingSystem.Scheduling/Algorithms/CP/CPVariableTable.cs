@@ -0,0 +1,145 @@
+using Google.OrTools.Sat;
+using System;
+using System.Collections.Generic;
+
+namespace SmartSchedulingSystem.Scheduling.Algorithms.CP
+{
+    /// <summary>
+    /// Dense integer-indexed store of the CP decision variables. Variable i places course section SectionIds[i]
+    /// in time slot TimeSlotIds[i] and classroom ClassroomIds[i] with teacher TeacherIds[i].
+    /// Variables are grouped by section, (teacher, time slot), (classroom, time slot) and (section, time slot)
+    /// while they are added, so constraints are built without scanning or parsing variable names
+    /// </summary>
+    public sealed class CPVariableTable
+    {
+        private readonly List<IntVar> _variables = new List<IntVar>();
+        private readonly List<int> _sectionIds = new List<int>();
+        private readonly List<int> _timeSlotIds = new List<int>();
+        private readonly List<int> _classroomIds = new List<int>();
+        private readonly List<int> _teacherIds = new List<int>();
+
+        private readonly Dictionary<(int, int, int, int), int> _indexByPlacement = new Dictionary<(int, int, int, int), int>();
+        private readonly Dictionary<int, List<int>> _bySection = new Dictionary<int, List<int>>();
+        private readonly Dictionary<(int, int), List<int>> _bySectionTime = new Dictionary<(int, int), List<int>>();
+        private readonly Dictionary<(int, int), List<int>> _byTeacherTime = new Dictionary<(int, int), List<int>>();
+        private readonly Dictionary<(int, int), List<int>> _byClassroomTime = new Dictionary<(int, int), List<int>>();
+
+        // Name-keyed view for the APIs that still address variables by name, built on first use
+        private Dictionary<string, IntVar> _namedVariables;
+
+        /// <summary>
+        /// Number of variables
+        /// </summary>
+        public int Count => _variables.Count;
+
+        public IntVar this[int index] => _variables[index];
+
+        public int GetSectionId(int index) => _sectionIds[index];
+
+        public int GetTimeSlotId(int index) => _timeSlotIds[index];
+
+        public int GetClassroomId(int index) => _classroomIds[index];
+
+        public int GetTeacherId(int index) => _teacherIds[index];
+
+        /// <summary>
+        /// Add a variable and return its index
+        /// </summary>
+        public int Add(IntVar variable, int sectionId, int timeSlotId, int classroomId, int teacherId)
+        {
+            if (variable == null)
+                throw new ArgumentNullException(nameof(variable));
+
+            int index = _variables.Count;
+            _variables.Add(variable);
+            _sectionIds.Add(sectionId);
+            _timeSlotIds.Add(timeSlotId);
+            _classroomIds.Add(classroomId);
+            _teacherIds.Add(teacherId);
+
+            _indexByPlacement[(sectionId, timeSlotId, classroomId, teacherId)] = index;
+            AddToGroup(_bySection, sectionId, index);
+            AddToGroup(_bySectionTime, (sectionId, timeSlotId), index);
+            AddToGroup(_byTeacherTime, (teacherId, timeSlotId), index);
+            AddToGroup(_byClassroomTime, (classroomId, timeSlotId), index);
+
+            _namedVariables = null;
+            return index;
+        }
+
+        /// <summary>
+        /// Index of the variable of a placement, -1 if the placement has no variable
+        /// </summary>
+        public int IndexOf(int sectionId, int timeSlotId, int classroomId, int teacherId) =>
+            _indexByPlacement.TryGetValue((sectionId, timeSlotId, classroomId, teacherId), out int index) ? index : -1;
+
+        /// <summary>
+        /// Indices of the variables of a course section
+        /// </summary>
+        public IReadOnlyList<int> GetSectionVariables(int sectionId) =>
+            _bySection.TryGetValue(sectionId, out var indices) ? indices : Array.Empty<int>();
+
+        /// <summary>
+        /// Indices of the variables of a course section in a time slot
+        /// </summary>
+        public IReadOnlyList<int> GetSectionTimeVariables(int sectionId, int timeSlotId) =>
+            _bySectionTime.TryGetValue((sectionId, timeSlotId), out var indices) ? indices : Array.Empty<int>();
+
+        /// <summary>
+        /// Variable indices grouped by (teacher, time slot)
+        /// </summary>
+        public IEnumerable<IReadOnlyList<int>> GetTeacherTimeGroups() => _byTeacherTime.Values;
+
+        /// <summary>
+        /// Variable indices grouped by (classroom, time slot)
+        /// </summary>
+        public IEnumerable<IReadOnlyList<int>> GetClassroomTimeGroups() => _byClassroomTime.Values;
+
+        /// <summary>
+        /// Variables of the given indices
+        /// </summary>
+        public IntVar[] GetVariables(IReadOnlyList<int> indices)
+        {
+            var variables = new IntVar[indices.Count];
+            for (int i = 0; i < indices.Count; i++)
+                variables[i] = _variables[indices[i]];
+            return variables;
+        }
+
+        /// <summary>
+        /// Name-keyed view of the variables ("c{sectionId}_t{timeSlotId}_r{classroomId}_f{teacherId}")
+        /// </summary>
+        public Dictionary<string, IntVar> ToNamedDictionary()
+        {
+            if (_namedVariables == null)
+            {
+                var namedVariables = new Dictionary<string, IntVar>(_variables.Count);
+                for (int i = 0; i < _variables.Count; i++)
+                {
+                    namedVariables[GetVariableName(_sectionIds[i], _timeSlotIds[i], _classroomIds[i], _teacherIds[i])] = _variables[i];
+                }
+                _namedVariables = namedVariables;
+            }
+
+            return _namedVariables;
+        }
+
+        /// <summary>
+        /// Name of the variable of a placement
+        /// </summary>
+        public static string GetVariableName(int sectionId, int timeSlotId, int classroomId, int teacherId)
+        {
+            return $"c{sectionId}_t{timeSlotId}_r{classroomId}_f{teacherId}";
+        }
+
+        private static void AddToGroup<TKey>(Dictionary<TKey, List<int>> groups, TKey key, int index) where TKey : notnull
+        {
+            if (!groups.TryGetValue(key, out var indices))
+            {
+                indices = new List<int>();
+                groups[key] = indices;
+            }
+            indices.Add(index);
+        }
+    }
+}
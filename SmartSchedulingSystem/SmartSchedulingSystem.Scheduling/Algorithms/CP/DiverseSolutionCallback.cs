@@ -1,8 +1,10 @@
 ﻿using Google.OrTools.Sat;
+using SmartSchedulingSystem.Scheduling.Models;
 using System;
 using System.Collections.Generic;
 using System.Linq;
 using System.Text;
+using System.Threading;
 
 namespace SmartSchedulingSystem.Scheduling.Algorithms.CP
 {
@@ -16,6 +18,8 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.CP
         private readonly CpModel _model;
         private int _solutionCount = 0;
         private readonly double _diversityThreshold;
+        private readonly IProgress<SchedulingProgress> _progress;
+        private readonly CancellationToken _cancellationToken;
 
         /// <summary>
         /// Collected solutions
@@ -29,12 +33,16 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.CP
             Dictionary<string, IntVar> variables,
             int maxSolutions,
             CpModel model,
-            double diversityThreshold = 0.2)
+            double diversityThreshold = 0.2,
+            IProgress<SchedulingProgress> progress = null,
+            CancellationToken cancellationToken = default)
         {
             _variables = variables ?? throw new ArgumentNullException(nameof(variables));
             _maxSolutions = maxSolutions;
             _model = model ?? throw new ArgumentNullException(nameof(model));
             _diversityThreshold = diversityThreshold;
+            _progress = progress;
+            _cancellationToken = cancellationToken;
         }
 
         public override void OnSolutionCallback()
@@ -60,13 +68,22 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.CP
                     Solutions.Add(solution);
                     _solutionCount++;
 
+                    _progress?.Report(new SchedulingProgress
+                    {
+                        Kind = SchedulingProgressKind.Solution,
+                        Phase = "CP",
+                        Message = $"Found diverse solution {_solutionCount}",
+                        SolutionCount = _solutionCount,
+                        Score = ObjectiveValue()
+                    });
+
                     // Add constraint to exclude current solution to promote diversity
                     AddDiversificationConstraint();
                 }
             }
 
-            // If enough solutions found, stop search
-            if (_solutionCount >= _maxSolutions)
+            // If enough solutions found or the run was cancelled, stop search
+            if (_solutionCount >= _maxSolutions || _cancellationToken.IsCancellationRequested)
             {
                 StopSearch();
             }
@@ -0,0 +1,243 @@
+using SmartSchedulingSystem.Scheduling.Engine;
+using SmartSchedulingSystem.Scheduling.Models;
+using System;
+using System.Collections.Generic;
+using System.Linq;
+
+namespace SmartSchedulingSystem.Scheduling.Algorithms.CP
+{
+    /// <summary>
+    /// Precomputed eligibility domains of a scheduling problem: the classrooms, teachers and time slots
+    /// each course section may use. Built once per problem, so model building and the construction heuristics
+    /// do not re-filter the resources of every section.
+    /// Room domains depend on the constraint level: capacity applies at all levels, room type and equipment
+    /// are physical constraints (Level3) and only restrict the rooms from Enhanced on
+    /// </summary>
+    public sealed class EligibilityIndex
+    {
+        // Number of largest classrooms used when no classroom is large enough for a section
+        private const int FallbackRoomCount = 3;
+
+        private readonly Dictionary<int, List<ClassroomInfo>> _roomsWithCapacity = new Dictionary<int, List<ClassroomInfo>>();
+        private readonly Dictionary<int, List<ClassroomInfo>> _basicRooms = new Dictionary<int, List<ClassroomInfo>>();
+        private readonly Dictionary<int, List<ClassroomInfo>> _enhancedRooms = new Dictionary<int, List<ClassroomInfo>>();
+        private readonly Dictionary<int, List<TeacherInfo>> _eligibleTeachers = new Dictionary<int, List<TeacherInfo>>();
+        private readonly Dictionary<int, List<TimeSlotInfo>> _basicTimeSlots = new Dictionary<int, List<TimeSlotInfo>>();
+        private readonly Dictionary<int, List<TimeSlotInfo>> _enhancedTimeSlots = new Dictionary<int, List<TimeSlotInfo>>();
+        private readonly HashSet<(int SectionId, int ClassroomId)> _preferredRooms = new HashSet<(int SectionId, int ClassroomId)>();
+        private readonly HashSet<(int TeacherId, int TimeSlotId)> _unavailableTeacherTimes;
+        private readonly HashSet<(int ClassroomId, int TimeSlotId)> _unavailableClassroomTimes;
+
+        private EligibilityIndex(SchedulingProblem problem)
+        {
+            Problem = problem;
+
+            _unavailableTeacherTimes = (problem.TeacherAvailabilities ?? new List<TeacherAvailability>())
+                .Where(a => !a.IsAvailable)
+                .Select(a => (a.TeacherId, a.TimeSlotId))
+                .ToHashSet();
+            _unavailableClassroomTimes = (problem.ClassroomAvailabilities ?? new List<ClassroomAvailability>())
+                .Where(a => !a.IsAvailable)
+                .Select(a => (a.ClassroomId, a.TimeSlotId))
+                .ToHashSet();
+
+            var qualifiedTeacherIds = (problem.TeacherCoursePreferences ?? new List<TeacherCoursePreference>())
+                .Where(tcp => tcp.ProficiencyLevel >= 2)
+                .GroupBy(tcp => tcp.CourseId)
+                .ToDictionary(g => g.Key, g => g.Select(tcp => tcp.TeacherId).ToHashSet());
+            var courseRequirements = (problem.CourseResourceRequirements ?? new List<CourseResourceRequirement>())
+                .GroupBy(r => r.CourseSectionId)
+                .ToDictionary(g => g.Key, g => g.First());
+            var classroomResources = (problem.ClassroomResources ?? new List<ClassroomResource>())
+                .GroupBy(r => r.ClassroomId)
+                .ToDictionary(g => g.Key, g => g.First());
+
+            foreach (var section in problem.CourseSections)
+            {
+                var roomsWithCapacity = problem.Classrooms
+                    .Where(room => room.Capacity >= section.Enrollment)
+                    .ToList();
+                _roomsWithCapacity[section.Id] = roomsWithCapacity;
+
+                // Basic and Standard: capacity only, the largest rooms if no room is large enough
+                var basicRooms = roomsWithCapacity.Count > 0
+                    ? roomsWithCapacity
+                    : problem.Classrooms
+                        .OrderByDescending(room => room.Capacity)
+                        .Take(FallbackRoomCount)
+                        .ToList();
+                _basicRooms[section.Id] = basicRooms;
+
+                // Enhanced and Complete: relax the room requirements step by step rather than leaving a section
+                // without rooms: type and equipment, then type only, then the rooms of the lower levels
+                courseRequirements.TryGetValue(section.Id, out var requirement);
+                var typedRooms = basicRooms
+                    .Where(room => IsCompatibleRoomType(section.RequiredRoomType, room.Type))
+                    .ToList();
+                var enhancedRooms = typedRooms
+                    .Where(room => HasRequiredEquipment(section, requirement, room, classroomResources))
+                    .ToList();
+
+                if (enhancedRooms.Count == 0)
+                    enhancedRooms = typedRooms;
+                if (enhancedRooms.Count == 0)
+                    enhancedRooms = basicRooms;
+                _enhancedRooms[section.Id] = enhancedRooms;
+                _preferredRooms.UnionWith(enhancedRooms.Select(room => (section.Id, room.Id)));
+
+                // Teachers with a proficiency of at least 2 for the course, all teachers if there are none
+                var eligibleTeachers = qualifiedTeacherIds.TryGetValue(section.CourseId, out var teacherIds)
+                    ? problem.Teachers.Where(t => teacherIds.Contains(t.Id)).ToList()
+                    : new List<TeacherInfo>();
+                if (eligibleTeachers.Count == 0)
+                    eligibleTeachers = problem.Teachers.ToList();
+                _eligibleTeachers[section.Id] = eligibleTeachers;
+
+                // Time slots where at least one eligible teacher and one eligible room are available
+                _basicTimeSlots[section.Id] = GetTimeSlotsWithResources(problem, eligibleTeachers, basicRooms);
+                _enhancedTimeSlots[section.Id] = ReferenceEquals(enhancedRooms, basicRooms)
+                    ? _basicTimeSlots[section.Id]
+                    : GetTimeSlotsWithResources(problem, eligibleTeachers, enhancedRooms);
+            }
+        }
+
+        /// <summary>
+        /// Problem the index was built for
+        /// </summary>
+        public SchedulingProblem Problem { get; }
+
+        /// <summary>
+        /// Build the eligibility index of a problem
+        /// </summary>
+        public static EligibilityIndex Build(SchedulingProblem problem)
+        {
+            if (problem == null)
+                throw new ArgumentNullException(nameof(problem));
+
+            return new EligibilityIndex(problem);
+        }
+
+        /// <summary>
+        /// Classrooms whose capacity is at least the enrollment of the section, without any other filtering
+        /// </summary>
+        public IReadOnlyList<ClassroomInfo> GetRoomsWithCapacity(int sectionId) =>
+            _roomsWithCapacity.TryGetValue(sectionId, out var rooms) ? rooms : Array.Empty<ClassroomInfo>();
+
+        /// <summary>
+        /// Classrooms the section may use at a constraint level: capacity below Enhanced,
+        /// capacity, room type and equipment from Enhanced on
+        /// </summary>
+        public IReadOnlyList<ClassroomInfo> GetEligibleRooms(int sectionId, ConstraintApplicationLevel level) =>
+            (level >= ConstraintApplicationLevel.Enhanced ? _enhancedRooms : _basicRooms)
+                .TryGetValue(sectionId, out var rooms) ? rooms : Array.Empty<ClassroomInfo>();
+
+        /// <summary>
+        /// Teachers qualified to teach the section
+        /// </summary>
+        public IReadOnlyList<TeacherInfo> GetEligibleTeachers(int sectionId) =>
+            _eligibleTeachers.TryGetValue(sectionId, out var teachers) ? teachers : Array.Empty<TeacherInfo>();
+
+        /// <summary>
+        /// Time slots in which at least one eligible teacher and one eligible classroom of the section at the
+        /// constraint level are available
+        /// </summary>
+        public IReadOnlyList<TimeSlotInfo> GetAvailableTimeSlots(int sectionId, ConstraintApplicationLevel level) =>
+            (level >= ConstraintApplicationLevel.Enhanced ? _enhancedTimeSlots : _basicTimeSlots)
+                .TryGetValue(sectionId, out var timeSlots) ? timeSlots : Array.Empty<TimeSlotInfo>();
+
+        /// <summary>
+        /// Whether the classroom is one of the rooms of the section at Enhanced, so a model built at Basic
+        /// can forbid the other rooms when the Enhanced constraints are switched on
+        /// </summary>
+        public bool IsPreferredRoom(int sectionId, int classroomId) =>
+            _preferredRooms.Contains((sectionId, classroomId));
+
+        public bool IsTeacherAvailable(int teacherId, int timeSlotId) =>
+            !_unavailableTeacherTimes.Contains((teacherId, timeSlotId));
+
+        public bool IsClassroomAvailable(int classroomId, int timeSlotId) =>
+            !_unavailableClassroomTimes.Contains((classroomId, timeSlotId));
+
+        /// <summary>
+        /// Number of (section, time slot, classroom, teacher) combinations allowed by the eligibility domains
+        /// at a constraint level; unavailable teachers and classrooms are excluded from Standard on
+        /// </summary>
+        public long CountCandidates(ConstraintApplicationLevel level)
+        {
+            long count = 0;
+            foreach (var section in Problem.CourseSections)
+            {
+                var rooms = GetEligibleRooms(section.Id, level);
+                var teachers = GetEligibleTeachers(section.Id);
+
+                if (level < ConstraintApplicationLevel.Standard)
+                {
+                    count += (long)Problem.TimeSlots.Count * rooms.Count * teachers.Count;
+                    continue;
+                }
+
+                foreach (var timeSlot in GetAvailableTimeSlots(section.Id, level))
+                {
+                    count += (long)rooms.Count(r => IsClassroomAvailable(r.Id, timeSlot.Id)) *
+                             teachers.Count(t => IsTeacherAvailable(t.Id, timeSlot.Id));
+                }
+            }
+            return count;
+        }
+
+        /// <summary>
+        /// Whether a classroom of the given type can host a section requiring the given room type.
+        /// Lab and computer courses need a room of their type, any room can host the other courses
+        /// </summary>
+        public static bool IsCompatibleRoomType(string requiredType, string actualType)
+        {
+            if (string.IsNullOrEmpty(requiredType))
+                return true;
+
+            if (requiredType.Contains("lab", StringComparison.OrdinalIgnoreCase))
+                return actualType?.Contains("lab", StringComparison.OrdinalIgnoreCase) == true;
+
+            if (requiredType.Contains("computer", StringComparison.OrdinalIgnoreCase))
+                return actualType?.Contains("computer", StringComparison.OrdinalIgnoreCase) == true;
+
+            return true;
+        }
+
+        private List<TimeSlotInfo> GetTimeSlotsWithResources(
+            SchedulingProblem problem,
+            List<TeacherInfo> teachers,
+            List<ClassroomInfo> rooms)
+        {
+            return problem.TimeSlots
+                .Where(slot => teachers.Any(t => IsTeacherAvailable(t.Id, slot.Id)) &&
+                               rooms.Any(r => IsClassroomAvailable(r.Id, slot.Id)))
+                .ToList();
+        }
+
+        private static bool HasRequiredEquipment(
+            CourseSectionInfo section,
+            CourseResourceRequirement requirement,
+            ClassroomInfo room,
+            Dictionary<int, ClassroomResource> classroomResources)
+        {
+            if (requirement != null && requirement.ResourceTypes.Count > 0 &&
+                classroomResources.TryGetValue(room.Id, out var resource))
+            {
+                return requirement.ResourceTypes.All(r => resource.ResourceTypes.Contains(r));
+            }
+
+            if (!string.IsNullOrEmpty(section.RequiredEquipment))
+            {
+                if (string.IsNullOrEmpty(room.Equipment))
+                    return false;
+
+                return section.RequiredEquipment.Split(',')
+                    .Select(e => e.Trim())
+                    .Where(e => !string.IsNullOrEmpty(e))
+                    .All(e => room.Equipment.Contains(e));
+            }
+
+            return true;
+        }
+    }
+}
@@ -0,0 +1,31 @@
+using SmartSchedulingSystem.Scheduling.Models;
+
+namespace SmartSchedulingSystem.Scheduling.Algorithms.CP
+{
+    /// <summary>
+    /// Subproblem produced by ProblemDecomposer
+    /// </summary>
+    public class ProblemComponent
+    {
+        /// <summary>
+        /// Index of the component in the decomposition
+        /// </summary>
+        public int Index { get; set; }
+
+        /// <summary>
+        /// Subproblem containing the sections of the component and the resources they may use
+        /// </summary>
+        public SchedulingProblem Problem { get; set; }
+
+        /// <summary>
+        /// Whether the component may use teachers or classrooms that other components use as well.
+        /// Solutions of such components can conflict and must be repaired after stitching
+        /// </summary>
+        public bool SharesResources { get; set; }
+
+        /// <summary>
+        /// Number of course sections
+        /// </summary>
+        public int SectionCount => Problem?.CourseSections?.Count ?? 0;
+    }
+}
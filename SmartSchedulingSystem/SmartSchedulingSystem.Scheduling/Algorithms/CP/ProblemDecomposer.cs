@@ -0,0 +1,212 @@
+using Microsoft.Extensions.Logging;
+using SmartSchedulingSystem.Scheduling.Engine;
+using SmartSchedulingSystem.Scheduling.Models;
+using System;
+using System.Collections.Generic;
+using System.Linq;
+
+namespace SmartSchedulingSystem.Scheduling.Algorithms.CP
+{
+    /// <summary>
+    /// Splits a scheduling problem into weakly coupled subproblems.
+    /// Sections are linked when they may use the same teacher or classroom (per EligibilityIndex) or are linked by a
+    /// prerequisite; the connected components of this section-resource interaction graph can be solved independently.
+    /// Classrooms come from the Enhanced room domains: capacity alone lets almost every section use the large rooms,
+    /// room types keep e.g. lab and computer sections apart. Subproblems only get those rooms, so stitched solutions
+    /// respect the room types.
+    /// Components larger than the size limit are split by department, those parts share resources and
+    /// their stitched solutions have to be repaired
+    /// </summary>
+    public class ProblemDecomposer
+    {
+        private readonly ILogger<ProblemDecomposer> _logger;
+
+        public ProblemDecomposer(ILogger<ProblemDecomposer> logger)
+        {
+            _logger = logger ?? throw new ArgumentNullException(nameof(logger));
+        }
+
+        /// <summary>
+        /// Decompose a problem into components of at most maxComponentSize sections
+        /// </summary>
+        public List<ProblemComponent> Decompose(SchedulingProblem problem, EligibilityIndex eligibility, int maxComponentSize)
+        {
+            if (problem == null)
+                throw new ArgumentNullException(nameof(problem));
+            if (eligibility == null)
+                throw new ArgumentNullException(nameof(eligibility));
+
+            maxComponentSize = Math.Max(1, maxComponentSize);
+            var sections = problem.CourseSections;
+
+            // Union-find over sections, every resource links the sections that may use it
+            var parent = Enumerable.Range(0, sections.Count).ToArray();
+            var teacherOwners = new Dictionary<int, int>();
+            var classroomOwners = new Dictionary<int, int>();
+
+            for (int i = 0; i < sections.Count; i++)
+            {
+                foreach (var teacher in eligibility.GetEligibleTeachers(sections[i].Id))
+                    Link(parent, teacherOwners, teacher.Id, i);
+                foreach (var classroom in eligibility.GetEligibleRooms(sections[i].Id, ConstraintApplicationLevel.Enhanced))
+                    Link(parent, classroomOwners, classroom.Id, i);
+            }
+
+            // Prerequisite constraints link the sections of a course with those of its prerequisites
+            var courseSections = Enumerable.Range(0, sections.Count)
+                .GroupBy(i => sections[i].CourseId)
+                .ToDictionary(g => g.Key, g => g.ToList());
+
+            for (int i = 0; i < sections.Count; i++)
+            {
+                var prerequisites = sections[i].Course?.Prerequisites;
+                if (prerequisites == null)
+                    continue;
+
+                foreach (var prerequisite in prerequisites)
+                {
+                    if (!courseSections.TryGetValue(prerequisite.PrerequisiteCourseId, out var prerequisiteSections))
+                        continue;
+
+                    foreach (int prerequisiteSection in prerequisiteSections)
+                        Union(parent, i, prerequisiteSection);
+                }
+            }
+
+            var groups = Enumerable.Range(0, sections.Count)
+                .GroupBy(i => Find(parent, i))
+                .Select(g => g.Select(i => sections[i]).ToList())
+                .OrderByDescending(g => g.Count)
+                .ToList();
+
+            // Independent groups are packed together up to the size limit, oversized groups are split
+            var parts = new List<(List<CourseSectionInfo> Sections, bool SharesResources)>();
+            var openBin = new List<CourseSectionInfo>();
+
+            foreach (var group in groups)
+            {
+                if (group.Count > maxComponentSize)
+                {
+                    parts.AddRange(SplitByDepartment(group, maxComponentSize).Select(p => (p, true)));
+                    continue;
+                }
+
+                if (openBin.Count + group.Count > maxComponentSize)
+                {
+                    parts.Add((openBin, false));
+                    openBin = new List<CourseSectionInfo>();
+                }
+                openBin.AddRange(group);
+            }
+
+            if (openBin.Count > 0)
+                parts.Add((openBin, false));
+
+            var components = parts
+                .Select((part, index) => new ProblemComponent
+                {
+                    Index = index,
+                    Problem = CreateSubproblem(problem, part.Sections, eligibility, index),
+                    SharesResources = part.SharesResources
+                })
+                .ToList();
+
+            _logger.LogInformation($"Decomposed {sections.Count} sections into {components.Count} components " +
+                                   $"({groups.Count} independent groups, {components.Count(c => c.SharesResources)} components share resources), " +
+                                   $"largest component: {(components.Count > 0 ? components.Max(c => c.SectionCount) : 0)} sections");
+
+            return components;
+        }
+
+        /// <summary>
+        /// Split a coupled group by department (the weakest coupling in practice), chunking departments larger than the limit
+        /// </summary>
+        private static IEnumerable<List<CourseSectionInfo>> SplitByDepartment(List<CourseSectionInfo> group, int maxComponentSize)
+        {
+            var current = new List<CourseSectionInfo>();
+
+            foreach (var department in group.GroupBy(s => s.DepartmentId).OrderByDescending(d => d.Count()))
+            {
+                foreach (var chunk in department.Chunk(maxComponentSize))
+                {
+                    if (current.Count + chunk.Length > maxComponentSize)
+                    {
+                        yield return current;
+                        current = new List<CourseSectionInfo>();
+                    }
+                    current.AddRange(chunk);
+                }
+            }
+
+            if (current.Count > 0)
+                yield return current;
+        }
+
+        /// <summary>
+        /// Create the subproblem of a set of sections, restricted to the resources those sections may use
+        /// </summary>
+        private static SchedulingProblem CreateSubproblem(
+            SchedulingProblem problem,
+            List<CourseSectionInfo> sections,
+            EligibilityIndex eligibility,
+            int index)
+        {
+            var sectionIds = sections.Select(s => s.Id).ToHashSet();
+            var teacherIds = sections
+                .SelectMany(s => eligibility.GetEligibleTeachers(s.Id))
+                .Select(t => t.Id)
+                .ToHashSet();
+            var classroomIds = sections
+                .SelectMany(s => eligibility.GetEligibleRooms(s.Id, ConstraintApplicationLevel.Enhanced))
+                .Select(c => c.Id)
+                .ToHashSet();
+
+            return new SchedulingProblem
+            {
+                Id = problem.Id,
+                Name = $"{problem.Name} [component {index}]",
+                SemesterId = problem.SemesterId,
+                CourseSections = sections,
+                Teachers = problem.Teachers.Where(t => teacherIds.Contains(t.Id)).ToList(),
+                Classrooms = problem.Classrooms.Where(c => classroomIds.Contains(c.Id)).ToList(),
+                TimeSlots = problem.TimeSlots,
+                TeacherCoursePreferences = problem.TeacherCoursePreferences.Where(p => teacherIds.Contains(p.TeacherId)).ToList(),
+                TeacherAvailabilities = problem.TeacherAvailabilities.Where(a => teacherIds.Contains(a.TeacherId)).ToList(),
+                ClassroomAvailabilities = problem.ClassroomAvailabilities.Where(a => classroomIds.Contains(a.ClassroomId)).ToList(),
+                CourseResourceRequirements = problem.CourseResourceRequirements.Where(r => sectionIds.Contains(r.CourseSectionId)).ToList(),
+                ClassroomResources = problem.ClassroomResources.Where(r => classroomIds.Contains(r.ClassroomId)).ToList(),
+                RoomTypeMatchingScores = problem.RoomTypeMatchingScores,
+                Constraints = problem.Constraints,
+                Prerequisites = problem.Prerequisites,
+                GenerateMultipleSolutions = false,
+                SolutionCount = 1
+            };
+        }
+
+        private static void Link(int[] parent, Dictionary<int, int> owners, int key, int section)
+        {
+            if (owners.TryGetValue(key, out int owner))
+                Union(parent, section, owner);
+            else
+                owners[key] = section;
+        }
+
+        private static int Find(int[] parent, int i)
+        {
+            while (parent[i] != i)
+            {
+                parent[i] = parent[parent[i]];
+                i = parent[i];
+            }
+            return i;
+        }
+
+        private static void Union(int[] parent, int a, int b)
+        {
+            int rootA = Find(parent, a);
+            int rootB = Find(parent, b);
+            if (rootA != rootB)
+                parent[rootA] = rootB;
+        }
+    }
+}
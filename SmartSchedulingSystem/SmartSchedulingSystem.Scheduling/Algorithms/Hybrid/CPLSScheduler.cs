@@ -85,6 +85,8 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.Hybrid
                     
                     List<SchedulingSolution> initialSolutions = _cpScheduler.GenerateInitialSolutions(
                         problem, _parameters.InitialSolutionCount);
+                    var levelTimeMs = _cpScheduler.LevelTimeMs.ToDictionary(kv => kv.Key.ToString(), kv => kv.Value);
+                    long decompositionRepairTimeMs = _cpScheduler.DecompositionRepairTimeMs;
 
                     if (initialSolutions.Count == 0)
                     {
@@ -98,16 +100,10 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.Hybrid
                         };
                     }
 
-                    _logger.LogInformation($"CP phase completed, generated {initialSolutions.Count} initial solutions using Basic level constraints");
+                    _logger.LogInformation($"CP phase completed, generated {initialSolutions.Count} initial solutions, time per constraint level: " +
+                                         string.Join(", ", levelTimeMs.Select(kv => $"{kv.Key}={kv.Value}ms")));
 
-                    // 4. Preliminary evaluation of initial solutions
-                    foreach (var solution in initialSolutions)
-                    {
-                        double score = _evaluator.Evaluate(solution).Score;
-                        _logger.LogDebug($"Initial solution score: {score:F4}");
-                    }
-
-                    // 5. Use local search to optimize each initial solution, gradually applying higher level constraints
+                    // 4. Use local search to optimize each initial solution, gradually applying higher level constraints
                     _logger.LogInformation("LS phase: Gradually applying higher level constraints to optimize solutions...");
                     
                     List<SchedulingSolution> optimizedSolutions = new List<SchedulingSolution>();
@@ -139,6 +135,13 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.Hybrid
                     
                     // Start from initial solutions
                     var currentSolutions = initialSolutions;
+                    List<double> currentScores = null;
+
+                    // One deadline for the whole LS phase, shared by all optimization phases
+                    var lsStopwatch = Stopwatch.StartNew();
+                    TimeSpan? lsTimeLimit = _parameters.LocalSearchTimeLimit > 0
+                        ? TimeSpan.FromSeconds(_parameters.LocalSearchTimeLimit)
+                        : null;
                     
                     // Optimize phase by phase, using best solutions from previous phase as input
                     for (int phase = 0; phase < optimizationPhases.Count; phase++)
@@ -149,14 +152,18 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.Hybrid
                         // Set current constraint level
                         GlobalConstraintManager.Current?.SetConstraintApplicationLevel(level);
                         
-                        // Optimize solutions for current phase
-                        var phaseSolutions = _localSearchOptimizer.OptimizeSolutions(currentSolutions);
+                        // Optimize solutions for current phase with the parallel portfolio
+                        var remaining = lsTimeLimit.HasValue ? lsTimeLimit.Value - lsStopwatch.Elapsed : (TimeSpan?)null;
+                        var portfolio = _localSearchOptimizer.OptimizePortfolio(currentSolutions, remaining);
+                        var phaseSolutions = portfolio.Solutions;
                         
                         // If solutions found, use them for next phase optimization
                         if (phaseSolutions.Any())
                         {
-                            _logger.LogInformation($"Phase {phase+1} completed, successfully optimized {phaseSolutions.Count} solutions");
+                            _logger.LogInformation($"Phase {phase+1} completed, successfully optimized {phaseSolutions.Count} solutions " +
+                                                 $"in {portfolio.ElapsedMs}ms ({portfolio.RunCount} runs)");
                             currentSolutions = phaseSolutions;
+                            currentScores = portfolio.Scores;
                         }
                         else
                         {
@@ -170,19 +177,22 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.Hybrid
 
                     _logger.LogInformation($"LS phase completed, optimized {optimizedSolutions.Count} solutions");
 
-                    // 6. Evaluate and sort optimized solutions
-                    optimizedSolutions = optimizedSolutions
-                        .OrderByDescending(s => _evaluator.Evaluate(s))
+                    // 5. Sort optimized solutions, scores were computed once during the search
+                    currentScores ??= optimizedSolutions.Select(s => _evaluator.Evaluate(s).Score).ToList();
+                    var rankedSolutions = optimizedSolutions
+                        .Select((solution, index) => (Solution: solution, Score: currentScores[index]))
+                        .OrderByDescending(x => x.Score)
                         .ToList();
+                    optimizedSolutions = rankedSolutions.Select(x => x.Solution).ToList();
 
                     // Record final solution scores
-                    if (optimizedSolutions.Any())
+                    if (rankedSolutions.Any())
                     {
-                        double bestScore = _evaluator.Evaluate(optimizedSolutions.First()).Score;
+                        double bestScore = rankedSolutions.First().Score;
                         _logger.LogInformation($"Best solution score: {bestScore:F4}");
                     }
 
-                    // 7. Prepare return result
+                    // 6. Prepare return result
                     sw.Stop();
                     var result = new SchedulingResult
                     {
@@ -194,6 +204,8 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.Hybrid
                         ExecutionTimeMs = sw.ElapsedMilliseconds,
                         Statistics = ComputeStatistics(optimizedSolutions, problem)
                     };
+                    result.Statistics.ConstraintLevelTimeMs = levelTimeMs;
+                    result.Statistics.DecompositionRepairTimeMs = decompositionRepairTimeMs;
 
                     _logger.LogInformation($"Scheduling completed, time taken: {sw.ElapsedMilliseconds}ms, " +
                                          $"status: {result.Status}, solution count: {result.Solutions.Count}");
@@ -47,7 +47,12 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.Hybrid
                 {
                     try
                     {
-                        var (score, conflicts) = constraint.Evaluate(solution);
+                        List<SchedulingConflict> conflicts;
+                        double score;
+                        using (_constraintManager.Profiler.Measure(constraint, ConstraintOperation.Evaluate))
+                        {
+                            (score, conflicts) = constraint.Evaluate(solution);
+                        }
 
                         // Record satisfaction and conflicts
                         result.ConstraintSatisfaction[constraint] = score;
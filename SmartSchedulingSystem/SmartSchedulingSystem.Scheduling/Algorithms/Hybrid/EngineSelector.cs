@@ -1,5 +1,6 @@
 ﻿using SmartSchedulingSystem.Scheduling.Models;
 using System;
+using System.Collections.Generic;
 using System.Linq;
 
 namespace SmartSchedulingSystem.Scheduling.Algorithms.Hybrid
@@ -9,6 +10,27 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.Hybrid
     /// </summary>
     public class EngineSelector
     {
+        /// <summary>
+        /// Share of a deadline kept free for analysis, evaluation and result conversion
+        /// </summary>
+        public const double DeadlineSafetyMargin = 0.1;
+
+        // Largest share of the budget construction may take, the rest is left for local search
+        private const double MaxCpShare = 0.8;
+        private const int MinCpTimeLimit = 1;
+        private const int MinLsIterations = 100;
+
+        // Fewer iterations are planned when their predicted score is this close to the score of all affordable iterations
+        private const double ScoreTolerance = 0.005;
+
+        private readonly RuntimePredictor _predictor;
+
+        /// <param name="predictor">Runtime predictor, null to plan with the heuristic weights only</param>
+        public EngineSelector(RuntimePredictor predictor = null)
+        {
+            _predictor = predictor;
+        }
+
         /// <summary>
         /// Determine weights for different engines based on problem characteristics
         /// </summary>
@@ -30,6 +52,108 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.Hybrid
             return weights;
         }
 
+        /// <summary>
+        /// Plan a run that finishes within a deadline. Construction gets its predicted time (capped at 80% of the
+        /// budget) instead of a fixed CP limit, local search gets the iterations that fit into the rest, reduced to the
+        /// point where more iterations are not predicted to improve the score. Without enough history the CP share
+        /// comes from the heuristic weights and the requested iterations are kept
+        /// </summary>
+        /// <param name="problem">Scheduling problem</param>
+        /// <param name="features">Features of the problem</param>
+        /// <param name="deadlineSeconds">Wall-clock deadline of the run in seconds</param>
+        /// <param name="solutionCount">Number of solutions to construct and optimize</param>
+        /// <param name="requestedLsIterations">Local search iterations per solution requested by the caller</param>
+        public EnginePlan PlanForDeadline(
+            SchedulingProblem problem,
+            Utils.ProblemFeatures features,
+            int deadlineSeconds,
+            int solutionCount,
+            int requestedLsIterations)
+        {
+            if (problem == null)
+                throw new ArgumentNullException(nameof(problem));
+            if (features == null)
+                throw new ArgumentNullException(nameof(features));
+            if (deadlineSeconds <= 0)
+                throw new ArgumentOutOfRangeException(nameof(deadlineSeconds), "Deadline must be positive");
+
+            solutionCount = Math.Max(1, solutionCount);
+            double budgetMs = GetBudgetMs(deadlineSeconds);
+            double? constructionMs = _predictor?.PredictConstructionMs(features, solutionCount);
+
+            // Predicted construction time, or the heuristic CP share of the budget
+            double cpBudgetMs = constructionMs.HasValue
+                ? Math.Min(constructionMs.Value, budgetMs * MaxCpShare)
+                : budgetMs * Math.Clamp(DetermineWeights(problem).CPWeight, 0, MaxCpShare);
+            int cpTimeLimit = Math.Max(MinCpTimeLimit, (int)Math.Ceiling(cpBudgetMs / 1000));
+
+            // Construction is expected to take its prediction, at most the time limit
+            double expectedConstructionMs = Math.Min(constructionMs ?? double.MaxValue, cpTimeLimit * 1000.0);
+            double lsBudgetMs = Math.Max(0, budgetMs - expectedConstructionMs);
+            int lsIterations = PlanLocalSearchIterations(features, lsBudgetMs, solutionCount, requestedLsIterations);
+
+            double cpWeight = Math.Min(1.0, cpTimeLimit * 1000.0 / budgetMs);
+            double? msPerIteration = _predictor?.PredictLocalSearchMsPerIteration(features);
+
+            return new EnginePlan
+            {
+                DeadlineSeconds = deadlineSeconds,
+                CpTimeLimit = cpTimeLimit,
+                MaxLsIterations = lsIterations,
+                CPWeight = cpWeight,
+                LSWeight = 1.0 - cpWeight,
+                PredictedConstructionMs = constructionMs,
+                PredictedLocalSearchMs = msPerIteration * lsIterations * solutionCount,
+                PredictedScore = _predictor?.PredictScore(features, lsIterations),
+                HistorySamples = _predictor?.SampleCount ?? 0
+            };
+        }
+
+        /// <summary>
+        /// Local search iterations per solution that fit into a time budget.
+        /// With a score model the smallest iteration count within 0.5% of the best predicted score is chosen,
+        /// without one the requested count is kept as long as it fits
+        /// </summary>
+        /// <param name="features">Features of the problem</param>
+        /// <param name="budgetMs">Time left for local search in milliseconds</param>
+        /// <param name="solutionCount">Number of solutions to optimize</param>
+        /// <param name="requestedLsIterations">Local search iterations per solution requested by the caller</param>
+        public int PlanLocalSearchIterations(
+            Utils.ProblemFeatures features,
+            double budgetMs,
+            int solutionCount,
+            int requestedLsIterations)
+        {
+            double? msPerIteration = _predictor?.PredictLocalSearchMsPerIteration(features);
+            if (!msPerIteration.HasValue)
+                return requestedLsIterations;
+
+            double affordable = Math.Max(0, budgetMs) / Math.Max(1, solutionCount) / Math.Max(msPerIteration.Value, 1e-6);
+            int maxIterations = (int)Math.Min(int.MaxValue, affordable);
+            if (maxIterations < MinLsIterations)
+                return maxIterations;
+
+            double? bestScore = _predictor.PredictScore(features, maxIterations);
+            if (!bestScore.HasValue)
+                return Math.Min(requestedLsIterations, maxIterations);
+
+            // Iteration counts doubling from the minimum, the smallest one close enough to the best score is used
+            var candidates = new List<int>();
+            for (long iterations = MinLsIterations; iterations < maxIterations; iterations *= 2)
+            {
+                candidates.Add((int)iterations);
+            }
+            candidates.Add(maxIterations);
+
+            double tolerance = ScoreTolerance * Math.Max(1.0, Math.Abs(bestScore.Value));
+            return candidates.First(iterations => _predictor.PredictScore(features, iterations) >= bestScore.Value - tolerance);
+        }
+
+        /// <summary>
+        /// Time of a deadline available to the engines in milliseconds
+        /// </summary>
+        public static double GetBudgetMs(int deadlineSeconds) => deadlineSeconds * 1000.0 * (1 - DeadlineSafetyMargin);
+
         /// <summary>
         /// Extract problem features
         /// </summary>
@@ -50,6 +50,19 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.Hybrid
             LogParameters();
         }
 
+        /// <summary>
+        /// Apply the CP time limit and local search iterations of a deadline plan
+        /// </summary>
+        public void ApplyPlan(EnginePlan plan)
+        {
+            if (plan == null)
+                throw new ArgumentNullException(nameof(plan));
+
+            _parameters.DeadlineSeconds = plan.DeadlineSeconds;
+            _parameters.CpTimeLimit = plan.CpTimeLimit;
+            _parameters.MaxLsIterations = plan.MaxLsIterations;
+        }
+
         /// <summary>
         /// Calculate problem size metric (0-1 range)
         /// </summary>
@@ -0,0 +1,253 @@
+using System;
+using System.Collections.Generic;
+using System.Linq;
+
+namespace SmartSchedulingSystem.Scheduling.Algorithms.Hybrid
+{
+    /// <summary>
+    /// Runtime and quality predictor fitted from the run history.
+    /// Three ridge-regularized least-squares models over log problem size, resource and time slot counts and the
+    /// hard constraint ratio: log construction time (also over the solution count), log local search time per
+    /// iteration, and best score over log local search iterations. Runtimes are predicted at the 90th percentile
+    /// of the residuals. Models are refitted lazily when the history changed; without enough runs a prediction is null
+    /// </summary>
+    public class RuntimePredictor
+    {
+        /// <summary>
+        /// Minimum number of usable runs before a model is fitted
+        /// </summary>
+        public const int MinimumSamples = 8;
+
+        // z-score of the 90th percentile of a normal distribution
+        private const double Percentile90 = 1.2816;
+        private const double RidgePenalty = 1e-3;
+
+        private readonly SchedulingRunHistory _history;
+        private readonly object _lock = new object();
+        private long _fittedVersion = -1;
+        private LinearModel _constructionModel;
+        private LinearModel _iterationModel;
+        private LinearModel _scoreModel;
+
+        public RuntimePredictor(SchedulingRunHistory history)
+        {
+            _history = history ?? throw new ArgumentNullException(nameof(history));
+        }
+
+        /// <summary>
+        /// Number of runs in the history
+        /// </summary>
+        public int SampleCount => _history.Count;
+
+        /// <summary>
+        /// Predicted construction time (90th percentile) in milliseconds
+        /// </summary>
+        public double? PredictConstructionMs(Utils.ProblemFeatures features, int solutionCount)
+        {
+            var model = GetModels().Construction;
+            if (model == null)
+                return null;
+
+            double logMs = model.Predict(ConstructionFeatures(features, solutionCount)) + Percentile90 * model.ResidualStdDev;
+            return Math.Max(0, Math.Exp(logMs) - 1);
+        }
+
+        /// <summary>
+        /// Predicted local search time per iteration (90th percentile) in milliseconds
+        /// </summary>
+        public double? PredictLocalSearchMsPerIteration(Utils.ProblemFeatures features)
+        {
+            var model = GetModels().Iteration;
+            if (model == null)
+                return null;
+
+            return Math.Exp(model.Predict(SizeFeatures(features)) + Percentile90 * model.ResidualStdDev);
+        }
+
+        /// <summary>
+        /// Predicted score of the best solution after the given local search iterations per solution
+        /// </summary>
+        public double? PredictScore(Utils.ProblemFeatures features, int lsIterationsPerSolution)
+        {
+            var model = GetModels().Score;
+            if (model == null)
+                return null;
+
+            return model.Predict(ScoreFeatures(features, lsIterationsPerSolution));
+        }
+
+        private (LinearModel Construction, LinearModel Iteration, LinearModel Score) GetModels()
+        {
+            lock (_lock)
+            {
+                long version = _history.Version;
+                if (version != _fittedVersion)
+                {
+                    Fit(_history.GetRecords());
+                    _fittedVersion = version;
+                }
+                return (_constructionModel, _iterationModel, _scoreModel);
+            }
+        }
+
+        private void Fit(IReadOnlyList<SchedulingRunRecord> records)
+        {
+            // Runs that hit the time limit or were stopped only give a lower bound of the construction time
+            var construction = records
+                .Where(r => !r.ConstructionTimedOut && !r.ConstructionCancelled && r.SolutionCount > 0)
+                .Select(r => (ConstructionFeatures(r), Math.Log(1 + r.ConstructionMs)))
+                .ToList();
+
+            var iteration = records
+                .Where(r => r.LocalSearchIterations >= 10)
+                .Select(r => (SizeFeatures(r), Math.Log((r.LocalSearchMs + 0.5) / r.LocalSearchIterations)))
+                .ToList();
+
+            var score = records
+                .Where(r => double.IsFinite(r.Score) && r.SolutionCount > 0)
+                .Select(r => (ScoreFeatures(r, (int)Math.Min(int.MaxValue, r.LocalSearchIterations / r.SolutionCount)), r.Score))
+                .ToList();
+
+            _constructionModel = LinearModel.Fit(construction);
+            _iterationModel = LinearModel.Fit(iteration);
+            _scoreModel = LinearModel.Fit(score);
+        }
+
+        private static double[] SizeFeatures(Utils.ProblemFeatures f) =>
+            SizeFeatures(f.CourseSectionCount, f.TeacherCount + f.ClassroomCount, f.TimeSlotCount, f.HardConstraintRatio);
+
+        private static double[] SizeFeatures(SchedulingRunRecord r) =>
+            SizeFeatures(r.CourseSectionCount, r.TeacherCount + r.ClassroomCount, r.TimeSlotCount, r.HardConstraintRatio);
+
+        private static double[] SizeFeatures(int sections, int resources, int timeSlots, double hardConstraintRatio) =>
+            new[] { 1.0, Math.Log(1 + sections), Math.Log(1 + resources), Math.Log(1 + timeSlots), hardConstraintRatio };
+
+        private static double[] ConstructionFeatures(Utils.ProblemFeatures f, int solutionCount) =>
+            Append(SizeFeatures(f), Math.Log(Math.Max(1, solutionCount)));
+
+        private static double[] ConstructionFeatures(SchedulingRunRecord r) =>
+            Append(SizeFeatures(r), Math.Log(Math.Max(1, r.SolutionCount)));
+
+        private static double[] ScoreFeatures(Utils.ProblemFeatures f, int lsIterationsPerSolution) =>
+            Append(SizeFeatures(f), Math.Log(1 + Math.Max(0, lsIterationsPerSolution)));
+
+        private static double[] ScoreFeatures(SchedulingRunRecord r, int lsIterationsPerSolution) =>
+            Append(SizeFeatures(r), Math.Log(1 + Math.Max(0, lsIterationsPerSolution)));
+
+        private static double[] Append(double[] values, double value)
+        {
+            var result = new double[values.Length + 1];
+            values.CopyTo(result, 0);
+            result[^1] = value;
+            return result;
+        }
+
+        /// <summary>
+        /// Linear model fitted by ridge-regularized least squares, the intercept is not penalized
+        /// </summary>
+        private sealed class LinearModel
+        {
+            private LinearModel(double[] coefficients, double residualStdDev)
+            {
+                Coefficients = coefficients;
+                ResidualStdDev = residualStdDev;
+            }
+
+            public double[] Coefficients { get; }
+
+            public double ResidualStdDev { get; }
+
+            public double Predict(double[] x)
+            {
+                double y = 0;
+                for (int i = 0; i < x.Length; i++)
+                {
+                    y += Coefficients[i] * x[i];
+                }
+                return y;
+            }
+
+            /// <returns>Fitted model, null if there are too few samples</returns>
+            public static LinearModel Fit(List<(double[] X, double Y)> samples)
+            {
+                if (samples.Count == 0)
+                    return null;
+
+                int p = samples[0].X.Length;
+                if (samples.Count < Math.Max(MinimumSamples, p + 2))
+                    return null;
+
+                // Normal equations (X'X + penalty) b = X'y
+                var a = new double[p, p + 1];
+                foreach (var (x, y) in samples)
+                {
+                    for (int i = 0; i < p; i++)
+                    {
+                        for (int j = 0; j < p; j++)
+                        {
+                            a[i, j] += x[i] * x[j];
+                        }
+                        a[i, p] += x[i] * y;
+                    }
+                }
+                for (int i = 1; i < p; i++)
+                {
+                    a[i, i] += RidgePenalty * samples.Count;
+                }
+
+                var coefficients = Solve(a, p);
+                if (coefficients == null)
+                    return null;
+
+                var model = new LinearModel(coefficients, 0);
+                double squaredError = samples.Sum(s => Math.Pow(s.Y - model.Predict(s.X), 2));
+                return new LinearModel(coefficients, Math.Sqrt(squaredError / (samples.Count - p)));
+            }
+
+            // Gaussian elimination with partial pivoting on the augmented matrix
+            private static double[] Solve(double[,] a, int n)
+            {
+                for (int column = 0; column < n; column++)
+                {
+                    int pivot = column;
+                    for (int row = column + 1; row < n; row++)
+                    {
+                        if (Math.Abs(a[row, column]) > Math.Abs(a[pivot, column]))
+                            pivot = row;
+                    }
+                    if (Math.Abs(a[pivot, column]) < 1e-12)
+                        return null;
+
+                    if (pivot != column)
+                    {
+                        for (int k = column; k <= n; k++)
+                        {
+                            (a[column, k], a[pivot, k]) = (a[pivot, k], a[column, k]);
+                        }
+                    }
+
+                    for (int row = column + 1; row < n; row++)
+                    {
+                        double factor = a[row, column] / a[column, column];
+                        for (int k = column; k <= n; k++)
+                        {
+                            a[row, k] -= factor * a[column, k];
+                        }
+                    }
+                }
+
+                var result = new double[n];
+                for (int row = n - 1; row >= 0; row--)
+                {
+                    double sum = a[row, n];
+                    for (int k = row + 1; k < n; k++)
+                    {
+                        sum -= a[row, k] * result[k];
+                    }
+                    result[row] = sum / a[row, row];
+                }
+                return result;
+            }
+        }
+    }
+}
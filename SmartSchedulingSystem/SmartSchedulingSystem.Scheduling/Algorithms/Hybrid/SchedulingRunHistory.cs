@@ -0,0 +1,166 @@
+using System;
+using System.Collections.Generic;
+using System.Threading;
+
+namespace SmartSchedulingSystem.Scheduling.Algorithms.Hybrid
+{
+    /// <summary>
+    /// Bounded, thread-safe record of finished scheduling runs, the training data of the runtime predictor
+    /// </summary>
+    public class SchedulingRunHistory
+    {
+        /// <summary>
+        /// Default number of runs kept, older runs are dropped first
+        /// </summary>
+        public const int DefaultCapacity = 500;
+
+        private readonly Queue<SchedulingRunRecord> _records = new Queue<SchedulingRunRecord>();
+        private readonly object _lock = new object();
+        private long _version;
+
+        public SchedulingRunHistory()
+            : this(DefaultCapacity)
+        {
+        }
+
+        /// <param name="capacity">Number of runs kept</param>
+        public SchedulingRunHistory(int capacity)
+        {
+            if (capacity <= 0)
+                throw new ArgumentOutOfRangeException(nameof(capacity), "History capacity must be positive");
+
+            Capacity = capacity;
+        }
+
+        /// <summary>
+        /// Number of runs kept
+        /// </summary>
+        public int Capacity { get; }
+
+        /// <summary>
+        /// Number of stored runs
+        /// </summary>
+        public int Count
+        {
+            get
+            {
+                lock (_lock)
+                {
+                    return _records.Count;
+                }
+            }
+        }
+
+        /// <summary>
+        /// Incremented on every change, lets readers detect new runs without copying the records
+        /// </summary>
+        public long Version => Interlocked.Read(ref _version);
+
+        /// <summary>
+        /// Add a finished run
+        /// </summary>
+        public void Record(SchedulingRunRecord record)
+        {
+            if (record == null)
+                throw new ArgumentNullException(nameof(record));
+
+            lock (_lock)
+            {
+                _records.Enqueue(record);
+                while (_records.Count > Capacity)
+                {
+                    _records.Dequeue();
+                }
+                Interlocked.Increment(ref _version);
+            }
+        }
+
+        /// <summary>
+        /// Copy of the stored runs, oldest first
+        /// </summary>
+        public IReadOnlyList<SchedulingRunRecord> GetRecords()
+        {
+            lock (_lock)
+            {
+                return _records.ToArray();
+            }
+        }
+
+        /// <summary>
+        /// Remove all runs
+        /// </summary>
+        public void Clear()
+        {
+            lock (_lock)
+            {
+                _records.Clear();
+                Interlocked.Increment(ref _version);
+            }
+        }
+    }
+
+    /// <summary>
+    /// Features, chosen parameters, runtimes and score of one scheduling run
+    /// </summary>
+    public class SchedulingRunRecord
+    {
+        public DateTime RecordedAt { get; set; } = DateTime.Now;
+
+        // Problem features
+        public int CourseSectionCount { get; set; }
+        public int TeacherCount { get; set; }
+        public int ClassroomCount { get; set; }
+        public int TimeSlotCount { get; set; }
+        public double HardConstraintRatio { get; set; }
+
+        /// <summary>
+        /// Requested number of solutions
+        /// </summary>
+        public int SolutionCount { get; set; }
+
+        /// <summary>
+        /// CP solver time limit in seconds
+        /// </summary>
+        public int CpTimeLimit { get; set; }
+
+        /// <summary>
+        /// Local search iteration limit per solution
+        /// </summary>
+        public int MaxLsIterations { get; set; }
+
+        /// <summary>
+        /// Wall time of solution construction (CP) in milliseconds
+        /// </summary>
+        public long ConstructionMs { get; set; }
+
+        /// <summary>
+        /// Local search time of all solutions in milliseconds
+        /// </summary>
+        public long LocalSearchMs { get; set; }
+
+        /// <summary>
+        /// Local search iterations run over all solutions
+        /// </summary>
+        public long LocalSearchIterations { get; set; }
+
+        /// <summary>
+        /// Wall time of the whole run in milliseconds
+        /// </summary>
+        public long TotalMs { get; set; }
+
+        /// <summary>
+        /// Score of the best solution, negative infinity if no feasible solution was found
+        /// </summary>
+        public double Score { get; set; } = double.NegativeInfinity;
+
+        /// <summary>
+        /// Whether construction was stopped before it finished, by the caller or by the deadline of the run
+        /// </summary>
+        public bool ConstructionCancelled { get; set; }
+
+        /// <summary>
+        /// Whether construction ran into the CP time limit, its time is then a lower bound and not a measurement
+        /// </summary>
+        public bool ConstructionTimedOut => CpTimeLimit > 0 && ConstructionMs >= CpTimeLimit * 900L;
+    }
+}
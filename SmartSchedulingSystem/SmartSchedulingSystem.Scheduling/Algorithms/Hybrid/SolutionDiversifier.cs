@@ -248,15 +248,15 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.Hybrid
 
             _logger.LogInformation($"Starting to diversify solution #{solution.Id}, Diversity level: {diversityLevel:F2}");
             
-            // Create a deep copy of the solution
-            var newSolution = solution.Clone();
+            // Work on the compact representation: no per-assignment copies and O(1) conflict checks
+            var newSolution = solution.ToCompact();
 
             // Determine the number of assignments to modify based on the diversity level
-            int assignmentsToModify = (int)Math.Ceiling(newSolution.Assignments.Count * diversityLevel);
-            _logger.LogDebug($"Plan to modify {assignmentsToModify}/{newSolution.Assignments.Count} assignments");
+            int assignmentsToModify = (int)Math.Ceiling(newSolution.Count * diversityLevel);
+            _logger.LogDebug($"Plan to modify {assignmentsToModify}/{newSolution.Count} assignments");
 
             // Randomly select the assignments to modify
-            var assignmentsToChange = newSolution.Assignments
+            var positionsToChange = Enumerable.Range(0, newSolution.Count)
                 .OrderBy(x => _random.Next())
                 .Take(assignmentsToModify)
                 .ToList();
@@ -264,12 +264,13 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.Hybrid
             int modifiedCount = 0;
             
             // Modify the selected assignments
-            foreach (var assignment in assignmentsToChange)
+            foreach (var position in positionsToChange)
             {
                 // Save the original value in case the constraint is violated
-                int originalTimeSlotId = assignment.TimeSlotId;
-                int originalClassroomId = assignment.ClassroomId;
-                int originalTeacherId = assignment.TeacherId;
+                var original = newSolution.GetPlacement(position);
+                int originalTimeSlotId = original.TimeSlotId;
+                int originalClassroomId = original.ClassroomId;
+                int originalTeacherId = original.TeacherId;
 
                 // Try up to 10 times to find a modification that satisfies the constraint
                 bool validModificationFound = false;
@@ -280,6 +281,7 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.Hybrid
                     
                     // Try to modify
                     bool modified = false;
+                    var assignment = newSolution.GetPlacement(position);
                     
                     if (modificationType == 0 && problem?.TimeSlots != null && problem.TimeSlots.Count > 1)
                     {
@@ -291,10 +293,7 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.Hybrid
                         if (availableTimeSlots.Count > 0)
                         {
                             var newTimeSlot = availableTimeSlots[_random.Next(availableTimeSlots.Count)];
-                            assignment.TimeSlotId = newTimeSlot.Id;
-                            assignment.DayOfWeek = newTimeSlot.DayOfWeek;
-                            assignment.StartTime = newTimeSlot.StartTime;
-                            assignment.EndTime = newTimeSlot.EndTime;
+                            newSolution.SetTimeSlot(position, newTimeSlot.Id);
                             modified = true;
                             _logger.LogDebug($"Modified time slot: {originalTimeSlotId} -> {newTimeSlot.Id}");
                         }
@@ -311,8 +310,7 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.Hybrid
                         if (availableClassrooms.Count > 0)
                         {
                             var newClassroom = availableClassrooms[_random.Next(availableClassrooms.Count)];
-                            assignment.ClassroomId = newClassroom.Id;
-                            assignment.ClassroomName = newClassroom.Name;
+                            newSolution.SetClassroom(position, newClassroom.Id);
                             modified = true;
                             _logger.LogDebug($"Modified classroom: {originalClassroomId} -> {newClassroom.Id}");
                         }
@@ -327,8 +325,7 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.Hybrid
                         if (availableTeachers.Count > 0)
                         {
                             var newTeacher = availableTeachers[_random.Next(availableTeachers.Count)];
-                            assignment.TeacherId = newTeacher.Id;
-                            assignment.TeacherName = newTeacher.Name;
+                            newSolution.SetTeacher(position, newTeacher.Id);
                             modified = true;
                             _logger.LogDebug($"Modified teacher: {originalTeacherId} -> {newTeacher.Id}");
                         }
@@ -337,7 +334,7 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.Hybrid
                     if (modified)
                     {
                         // Check if the constraint is satisfied
-                        bool constraintsSatisfied = CheckConstraints(newSolution, assignment, problem);
+                        bool constraintsSatisfied = CheckConstraints(newSolution, position, problem);
                         
                         if (constraintsSatisfied)
                         {
@@ -347,9 +344,9 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.Hybrid
                         else
                         {
                             // Restore original value
-                            assignment.TimeSlotId = originalTimeSlotId;
-                            assignment.ClassroomId = originalClassroomId;
-                            assignment.TeacherId = originalTeacherId;
+                            newSolution.SetTimeSlot(position, originalTimeSlotId);
+                            newSolution.SetClassroom(position, originalClassroomId);
+                            newSolution.SetTeacher(position, originalTeacherId);
                             _logger.LogDebug("Modified violated constraint, restored original value");
                         }
                     }
@@ -357,23 +354,23 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.Hybrid
             }
             
             _logger.LogInformation($"Diversification completed, actually modified {modifiedCount}/{assignmentsToModify} assignments");
-            return newSolution;
+            return newSolution.ToSolution(solution);
         }
         
         /// <summary>
         /// Check if the constraint is satisfied
         /// </summary>
-        private bool CheckConstraints(SchedulingSolution solution, SchedulingAssignment modifiedAssignment, SchedulingProblem problem)
+        private bool CheckConstraints(CompactSolution solution, int position, SchedulingProblem problem)
         {
             if (problem == null)
                 return true;
                 
             try
             {
-                // Check teacher time conflict
-                var teacherTimeConflict = solution.Assignments
-                    .Where(a => a != modifiedAssignment && a.TeacherId == modifiedAssignment.TeacherId && a.TimeSlotId == modifiedAssignment.TimeSlotId)
-                    .Any();
+                var modifiedAssignment = solution.GetPlacement(position);
+
+                // Check teacher time conflict (occupancy includes the modified assignment itself)
+                var teacherTimeConflict = solution.GetTeacherOccupancy(modifiedAssignment.TeacherId, modifiedAssignment.TimeSlotId) > 1;
                     
                 if (teacherTimeConflict)
                 {
@@ -382,9 +379,7 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.Hybrid
                 }
                 
                 // Check classroom time conflict
-                var roomTimeConflict = solution.Assignments
-                    .Where(a => a != modifiedAssignment && a.ClassroomId == modifiedAssignment.ClassroomId && a.TimeSlotId == modifiedAssignment.TimeSlotId)
-                    .Any();
+                var roomTimeConflict = solution.GetClassroomOccupancy(modifiedAssignment.ClassroomId, modifiedAssignment.TimeSlotId) > 1;
                     
                 if (roomTimeConflict)
                 {
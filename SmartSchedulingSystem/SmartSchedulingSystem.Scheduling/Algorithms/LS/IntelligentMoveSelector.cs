@@ -16,6 +16,10 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.LS
         private readonly MoveGenerator _moveGenerator;
         private readonly Random _random = new Random();
 
+        // Moves generated per assignment during one SelectMovesForConflict call; conflict pairs share assignments
+        private readonly Dictionary<(int AssignmentId, int MaxMoves), List<IMove>> _generatedMoves =
+            new Dictionary<(int AssignmentId, int MaxMoves), List<IMove>>();
+
         public IntelligentMoveSelector(
             ILogger<IntelligentMoveSelector> logger,
             MoveGenerator moveGenerator)
@@ -24,6 +28,11 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.LS
             _moveGenerator = moveGenerator ?? throw new ArgumentNullException(nameof(moveGenerator));
         }
 
+        /// <summary>
+        /// Generated and duplicate move counters of all calls
+        /// </summary>
+        public MoveStatistics Statistics { get; } = new MoveStatistics();
+
         /// <summary>
         /// Select appropriate move actions based on constraint conflict types
         /// </summary>
@@ -55,6 +64,7 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.LS
 
             // Generate specific moves based on conflict type
             var moves = new List<IMove>();
+            _generatedMoves.Clear();
 
             switch (conflict.Type)
             {
@@ -84,6 +94,9 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.LS
                     break;
             }
 
+            // The conflict-specific generators overlap, keep each resulting placement once
+            moves = _moveGenerator.RemoveDuplicateMoves(solution, moves, Statistics);
+
             // If the generated moves are too many, randomly select some moves
             if (moves.Count > maxMoves)
             {
@@ -94,6 +107,19 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.LS
             return moves;
         }
 
+        /// <summary>
+        /// Valid moves of an assignment, generated once per call of SelectMovesForConflict
+        /// </summary>
+        private List<IMove> GenerateValidMoves(SchedulingSolution solution, SchedulingAssignment assignment, int maxMoves)
+        {
+            if (!_generatedMoves.TryGetValue((assignment.Id, maxMoves), out var moves))
+            {
+                moves = _moveGenerator.GenerateValidMoves(solution, assignment, maxMoves);
+                _generatedMoves[(assignment.Id, maxMoves)] = moves;
+            }
+            return moves;
+        }
+
         private List<int> GetInvolvedIds(SchedulingConflict conflict, string entityType)
         {
             if (conflict.InvolvedEntities != null &&
@@ -141,9 +167,9 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.LS
                     if (a1.TeacherId == a2.TeacherId && a1.TimeSlotId == a2.TimeSlotId)
                     {
                         // Generate time moves for each assignment
-                        var timeMoves1 = _moveGenerator.GenerateValidMoves(solution, a1, 3)
+                        var timeMoves1 = GenerateValidMoves(solution, a1, 3)
                             .Where(m => m is TimeMove).ToList();
-                        var timeMoves2 = _moveGenerator.GenerateValidMoves(solution, a2, 3)
+                        var timeMoves2 = GenerateValidMoves(solution, a2, 3)
                             .Where(m => m is TimeMove).ToList();
 
                         moves.AddRange(timeMoves1);
@@ -188,9 +214,9 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.LS
                     if (a1.ClassroomId == a2.ClassroomId && a1.TimeSlotId == a2.TimeSlotId)
                     {
                         // Generate room moves for each assignment
-                        var roomMoves1 = _moveGenerator.GenerateValidMoves(solution, a1, 3)
+                        var roomMoves1 = GenerateValidMoves(solution, a1, 3)
                             .Where(m => m is RoomMove).ToList();
-                        var roomMoves2 = _moveGenerator.GenerateValidMoves(solution, a2, 3)
+                        var roomMoves2 = GenerateValidMoves(solution, a2, 3)
                             .Where(m => m is RoomMove).ToList();
 
                         moves.AddRange(roomMoves1);
@@ -199,9 +225,9 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.LS
                         // If not enough room moves found, add some time moves
                         if (roomMoves1.Count + roomMoves2.Count < 4)
                         {
-                            var timeMoves1 = _moveGenerator.GenerateValidMoves(solution, a1, 2)
+                            var timeMoves1 = GenerateValidMoves(solution, a1, 2)
                                 .Where(m => m is TimeMove).ToList();
-                            var timeMoves2 = _moveGenerator.GenerateValidMoves(solution, a2, 2)
+                            var timeMoves2 = GenerateValidMoves(solution, a2, 2)
                                 .Where(m => m is TimeMove).ToList();
 
                             moves.AddRange(timeMoves1);
@@ -223,7 +249,7 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.LS
             // For classroom capacity conflicts, mainly consider changing classroom
             foreach (var assignment in assignments)
             {
-                var roomMoves = _moveGenerator.GenerateValidMoves(solution, assignment, 5)
+                var roomMoves = GenerateValidMoves(solution, assignment, 5)
                     .Where(m => m is RoomMove).ToList();
                 moves.AddRange(roomMoves);
             }
@@ -241,14 +267,14 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.LS
             foreach (var assignment in assignments)
             {
                 // First try changing time
-                var timeMoves = _moveGenerator.GenerateValidMoves(solution, assignment, 3)
+                var timeMoves = GenerateValidMoves(solution, assignment, 3)
                     .Where(m => m is TimeMove).ToList();
                 moves.AddRange(timeMoves);
 
                 // If not enough time moves found, try changing teacher
                 if (timeMoves.Count < 2)
                 {
-                    var teacherMoves = _moveGenerator.GenerateValidMoves(solution, assignment, 3)
+                    var teacherMoves = GenerateValidMoves(solution, assignment, 3)
                         .Where(m => m is TeacherMove).ToList();
                     moves.AddRange(teacherMoves);
                 }
@@ -271,17 +297,17 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.LS
             foreach (var assignment in assignments)
             {
                 // Time moves
-                var timeMoves = _moveGenerator.GenerateValidMoves(solution, assignment, 3)
+                var timeMoves = GenerateValidMoves(solution, assignment, 3)
                     .Where(m => m is TimeMove).ToList();
                 moves.AddRange(timeMoves);
 
                 // Room moves
-                var roomMoves = _moveGenerator.GenerateValidMoves(solution, assignment, 3)
+                var roomMoves = GenerateValidMoves(solution, assignment, 3)
                     .Where(m => m is RoomMove).ToList();
                 moves.AddRange(roomMoves);
 
                 // Add some swap moves
-                var swapMoves = _moveGenerator.GenerateValidMoves(solution, assignment, 2)
+                var swapMoves = GenerateValidMoves(solution, assignment, 2)
                     .Where(m => m is SwapMove).ToList();
                 moves.AddRange(swapMoves);
             }
@@ -300,17 +326,17 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.LS
             foreach (var assignment in assignments)
             {
                 // 添加时间移动
-                var timeMoves = _moveGenerator.GenerateValidMoves(solution, assignment, 2)
+                var timeMoves = GenerateValidMoves(solution, assignment, 2)
                     .Where(m => m is TimeMove).ToList();
                 moves.AddRange(timeMoves);
 
                 // 添加教室移动
-                var roomMoves = _moveGenerator.GenerateValidMoves(solution, assignment, 2)
+                var roomMoves = GenerateValidMoves(solution, assignment, 2)
                     .Where(m => m is RoomMove).ToList();
                 moves.AddRange(roomMoves);
 
                 // 添加教师移动
-                var teacherMoves = _moveGenerator.GenerateValidMoves(solution, assignment, 1)
+                var teacherMoves = GenerateValidMoves(solution, assignment, 1)
                     .Where(m => m is TeacherMove).ToList();
                 moves.AddRange(teacherMoves);
             }
@@ -327,7 +353,7 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.LS
             // For generic conflicts, generate various types of moves
             foreach (var assignment in assignments)
             {
-                var genericMoves = _moveGenerator.GenerateValidMoves(solution, assignment, 5);
+                var genericMoves = GenerateValidMoves(solution, assignment, 5);
                 moves.AddRange(genericMoves);
             }
 
@@ -2,11 +2,14 @@
 using SmartSchedulingSystem.Scheduling.Models;
 using SmartSchedulingSystem.Scheduling.Algorithms.Hybrid;
 using SmartSchedulingSystem.Scheduling.Engine;
+using SmartSchedulingSystem.Scheduling.Constraints;
 using Microsoft.Extensions.Logging;
 using System;
 using System.Collections.Generic;
 using System.Linq;
 using System.Diagnostics;
+using System.Threading;
+using System.Threading.Tasks;
 using SmartSchedulingSystem.Scheduling.Utils;
 
 namespace SmartSchedulingSystem.Scheduling.Algorithms.LS
@@ -16,6 +19,13 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.LS
     /// </summary>
     public class LocalSearchOptimizer
     {
+        // Iterations between two periodic progress reports
+        private const int ProgressReportInterval = 100;
+
+        // Minimum iterations between two constraint analyses after accepted moves; the analysis only
+        // picks the assignments to move, so an analysis of a slightly older solution is still useful
+        private const int ConstraintAnalysisInterval = 10;
+
         private readonly MoveGenerator _moveGenerator;
         private readonly SimulatedAnnealingController _saController;
         private readonly ConstraintAnalyzer _constraintAnalyzer;
@@ -40,6 +50,12 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.LS
             _parameters = parameters ?? new Utils.SchedulingParameters();
             _random = new Random();
         }
+
+        /// <summary>
+        /// Move counters of the last OptimizeSolution call, summed over all runs for OptimizePortfolio
+        /// </summary>
+        public MoveStatistics LastStatistics { get; private set; } = new MoveStatistics();
+
         /// <summary>
         /// Optimize multiple initial solutions
         /// </summary>
@@ -60,25 +76,12 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.LS
 
             if (_parameters.EnableParallelOptimization)
             {
-                // Use parallel processing
-                optimizedSolutions = initialSolutions
-                    .AsParallel()
-                    .WithDegreeOfParallelism(_parameters.MaxParallelism > 0 ?
-                        _parameters.MaxParallelism :
-                        Environment.ProcessorCount)
-                    .Select(solution =>
-                    {
-                        try
-                        {
-                            return OptimizeSolution(solution);
-                        }
-                        catch (Exception ex)
-                        {
-                            _logger.LogError(ex, $"Error optimizing solution {solution.Id}");
-                            return solution; // If optimization fails, return original solution
-                        }
-                    })
-                    .ToList();
+                // Use parallel portfolio, each run has its own annealing controller and evaluation state
+                var timeLimit = _parameters.LocalSearchTimeLimit > 0
+                    ? TimeSpan.FromSeconds(_parameters.LocalSearchTimeLimit)
+                    : (TimeSpan?)null;
+
+                optimizedSolutions = OptimizePortfolio(initialSolutions, timeLimit).Solutions;
             }
             else
             {
@@ -105,14 +108,174 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.LS
         /// Optimize specified solution
         /// </summary>
         /// <param name="initialSolution">Initial solution</param>
+        /// <param name="progress">Receives improving solutions and periodic iteration state</param>
+        /// <param name="cancellationToken">Stops the search, the best solution found so far is returned</param>
         /// <returns>Optimized solution</returns>
-        public SchedulingSolution OptimizeSolution(SchedulingSolution initialSolution)
+        public SchedulingSolution OptimizeSolution(
+            SchedulingSolution initialSolution,
+            IProgress<SchedulingProgress> progress = null,
+            CancellationToken cancellationToken = default)
+        {
+            // The run gets its own controller so the iteration limit of the parameters applies
+            var annealing = _saController.CreateVariant(1.0, null, _parameters.MaxLsIterations);
+            var run = RunLocalSearch(initialSolution, annealing, null, null, null, progress, cancellationToken);
+            LastStatistics = run.Statistics;
+            return run.Solution;
+        }
+
+        /// <summary>
+        /// Optimize initial solutions as a parallel portfolio: every initial solution is optimized by
+        /// several independent runs with differently seeded and tempered simulated annealing controllers.
+        /// Runs of the same initial solution periodically share their best solution, runs of different initial
+        /// solutions never do, so every initial solution yields its own result. All runs stop at the time limit
+        /// </summary>
+        /// <param name="initialSolutions">List of initial solutions</param>
+        /// <param name="timeLimit">Wall time limit of the whole portfolio, null for no limit</param>
+        /// <param name="progress">Receives improving solutions and periodic iteration state of all runs</param>
+        /// <param name="cancellationToken">Stops all runs, their best solutions so far are returned</param>
+        /// <returns>Best solution and score per initial solution</returns>
+        public LocalSearchPortfolioResult OptimizePortfolio(
+            List<SchedulingSolution> initialSolutions,
+            TimeSpan? timeLimit = null,
+            IProgress<SchedulingProgress> progress = null,
+            CancellationToken cancellationToken = default)
+        {
+            var result = new LocalSearchPortfolioResult();
+            if (initialSolutions == null || initialSolutions.Count == 0)
+            {
+                _logger.LogWarning("Input initial solution list is empty");
+                return result;
+            }
+
+            var sw = Stopwatch.StartNew();
+
+            int parallelism = _parameters.EnableParallelOptimization
+                ? (_parameters.MaxParallelism > 0 ? _parameters.MaxParallelism : Environment.ProcessorCount)
+                : 1;
+            int variantsPerSolution = _parameters.PortfolioVariantsPerSolution > 0
+                ? _parameters.PortfolioVariantsPerSolution
+                : Math.Max(1, parallelism / initialSolutions.Count);
+
+            using var deadline = CancellationTokenSource.CreateLinkedTokenSource(cancellationToken);
+            if (timeLimit.HasValue)
+                deadline.CancelAfter(timeLimit.Value < TimeSpan.Zero ? TimeSpan.Zero : timeLimit.Value);
+            int baseSeed = Random.Shared.Next();
+
+            // Create runs sequentially: the initial evaluation also fills the lazy lookups of the
+            // shared constraint instances before any worker thread starts, and the shared move
+            // generator builds its caches here so the runs only read them
+            var problem = initialSolutions[0].Problem;
+            if (problem != null)
+                _moveGenerator.Prepare(problem);
+
+            var runs = new List<(int SolutionIndex, SchedulingSolution Start, SimulatedAnnealingController Annealing, IncrementalEvaluation Evaluation, CompactSolution Occupancy, PortfolioExchange Exchange)>();
+            var exchanges = new List<PortfolioExchange>();
+            for (int i = 0; i < initialSolutions.Count; i++)
+            {
+                // Runs of the same initial solution share one compact form until their first accepted move,
+                // and one exchange so they never continue from the solution of another initial solution
+                var occupancy = initialSolutions[i].ToCompact();
+                var exchange = new PortfolioExchange(_parameters.PortfolioSyncInterval);
+                exchanges.Add(exchange);
+
+                for (int variant = 0; variant < variantsPerSolution; variant++)
+                {
+                    // Each run applies its moves in place to its own working copy; the initial solution stays untouched
+                    var workingCopy = initialSolutions[i].Clone();
+                    var evaluation = _evaluator.CreateIncrementalEvaluation(workingCopy);
+                    var annealing = _saController.CreateVariant(GetTemperatureScale(variant), HashCode.Combine(baseSeed, i, variant), _parameters.MaxLsIterations);
+
+                    exchange.Publish(initialSolutions[i], evaluation.Score);
+                    runs.Add((i, initialSolutions[i], annealing, evaluation, occupancy.Clone(), exchange));
+                }
+            }
+
+            _logger.LogInformation($"Starting local search portfolio: {initialSolutions.Count} initial solutions x {variantsPerSolution} variants, " +
+                                 $"parallelism: {parallelism}, time limit: {(timeLimit.HasValue ? timeLimit.Value.TotalSeconds.ToString("F1") + "s" : "none")}");
+
+            var runResults = new (SchedulingSolution Solution, double Score, MoveStatistics Statistics)[runs.Count];
+
+            Parallel.For(0, runs.Count, new ParallelOptions { MaxDegreeOfParallelism = parallelism }, r =>
+            {
+                var run = runs[r];
+                double initialScore = run.Evaluation.Score;
+                try
+                {
+                    runResults[r] = RunLocalSearch(run.Start, run.Annealing, run.Evaluation, run.Occupancy, run.Exchange, progress, deadline.Token);
+                }
+                catch (Exception ex)
+                {
+                    _logger.LogError(ex, $"Error optimizing solution {run.Start.Id} in portfolio run {r}");
+                    runResults[r] = (run.Start.Clone(), initialScore, new MoveStatistics()); // If optimization fails, keep the initial solution
+                }
+            });
+
+            // Keep the best run per initial solution; scores come from the runs, no re-evaluation
+            for (int i = 0; i < initialSolutions.Count; i++)
+            {
+                var best = Enumerable.Range(0, runs.Count)
+                    .Where(r => runs[r].SolutionIndex == i)
+                    .Select(r => runResults[r])
+                    .OrderByDescending(x => x.Score)
+                    .First();
+
+                result.Solutions.Add(best.Solution);
+                result.Scores.Add(best.Score);
+            }
+
+            foreach (var runResult in runResults)
+            {
+                result.MoveStatistics.Add(runResult.Statistics);
+            }
+            LastStatistics = result.MoveStatistics;
+
+            sw.Stop();
+            result.RunCount = runs.Count;
+            result.DeadlineReached = deadline.IsCancellationRequested;
+            result.ElapsedMs = sw.ElapsedMilliseconds;
+
+            _logger.LogInformation($"Local search portfolio completed in {result.ElapsedMs}ms, runs: {result.RunCount}, " +
+                                 $"best score: {exchanges.Max(e => e.BestScore):F4}, deadline reached: {result.DeadlineReached}, moves: {result.MoveStatistics}");
+
+            return result;
+        }
+
+        /// <summary>
+        /// Initial temperature factor of an annealing variant: 1, 2, 0.5, 4, 0.25, ...
+        /// </summary>
+        private static double GetTemperatureScale(int variant)
+        {
+            if (variant == 0)
+                return 1.0;
+
+            int exponent = (variant + 1) / 2;
+            return variant % 2 == 1 ? Math.Pow(2, exponent) : Math.Pow(0.5, exponent);
+        }
+
+        /// <summary>
+        /// Local search run with its own annealing controller, incremental evaluation context and compact solution.
+        /// Accepted moves are applied in place to a working copy and its compact form; the best solution is kept as a
+        /// copy-on-write clone of the compact form and only turned into a SchedulingSolution when it is published or returned
+        /// </summary>
+        /// <param name="initialSolution">Start of the run, not modified</param>
+        /// <param name="incrementalEvaluation">Evaluation context of a working copy of the initial solution, created if null</param>
+        /// <param name="occupancy">Compact form of the initial solution, built if null</param>
+        private (SchedulingSolution Solution, double Score, MoveStatistics Statistics) RunLocalSearch(
+            SchedulingSolution initialSolution,
+            SimulatedAnnealingController saController,
+            IncrementalEvaluation incrementalEvaluation,
+            CompactSolution occupancy,
+            PortfolioExchange exchange,
+            IProgress<SchedulingProgress> progress,
+            CancellationToken cancellationToken)
         {
             _logger.LogInformation("Starting local search optimization...");
 
-            // Deep copy initial solution
-            var currentSolution = initialSolution.Clone();
-            var bestSolution = initialSolution.Clone();
+            // Deep copy initial solution (portfolio runs already own a copy); moves are applied to this copy in place
+            var currentSolution = incrementalEvaluation?.Solution ?? initialSolution.Clone();
+
+            // Solution the compact forms were built from, supplies names and metadata when the best solution is materialized
+            var baseline = initialSolution;
 
             // Save current constraint application level
             var currentConstraintLevel = SmartSchedulingSystem.Scheduling.Engine.GlobalConstraintManager.Current?.GetCurrentApplicationLevel() 
@@ -120,34 +283,110 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.LS
             
             _logger.LogDebug($"Using constraint level {currentConstraintLevel} for local search optimization");
 
-            // First evaluation of solution
-            var currentEvaluation = _evaluator.Evaluate(currentSolution);
-            double bestScore = currentEvaluation.Score;
+            // First evaluation of solution; the incremental context scores later moves
+            // from the assignments they change instead of re-evaluating the whole solution
+            incrementalEvaluation ??= _evaluator.CreateIncrementalEvaluation(currentSolution);
+            double bestScore = incrementalEvaluation.Score;
+
+            // Compact form of the current solution for move generation and for resolving the assignments
+            // a move changes in O(1), updated with every accepted move
+            occupancy ??= currentSolution.ToCompact();
+
+            // Best solution so far; materialized lazily and reused until a better solution is found
+            var bestCompact = occupancy.Clone();
+            SchedulingSolution bestSolution = null;
+            SchedulingSolution MaterializeBest()
+            {
+                if (bestSolution == null)
+                {
+                    bestSolution = bestCompact.ToSolution(baseline);
+                    bestSolution.ConstraintLevel = currentConstraintLevel;
+                }
+                return bestSolution;
+            }
 
             _logger.LogInformation("Initial solution score: {Score}", bestScore);
 
             // Reset simulated annealing controller
-            _saController.Reset();
+            saController.Reset();
+
+            var sw = Stopwatch.StartNew();
+            var statistics = new MoveStatistics();
+            var tabuList = new TabuList(Math.Max(0, _parameters.TabuTenure));
+
+            // Candidate buffers reused by every iteration; scores of evaluated moves stay valid until a move is accepted
+            var candidateSignatures = new HashSet<long>();
+            var moveScores = new Dictionary<long, double>();
 
             int iteration = 0;
             int noImprovementCount = 0;
+            bool improvedSinceSync = false;
             const int MAX_NO_IMPROVEMENT = 100;
 
+            // Constraint analysis of the current solution, refreshed when accepted moves made it stale
+            ConstraintAnalysisResult constraintAnalysis = null;
+            bool analysisStale = false;
+            int analysisIteration = 0;
+
             // Pre-calculate and cache initial satisfaction for each constraint
             var constraintScores = new Dictionary<int, double>();
             var allConstraints = _evaluator.GetAllActiveConstraints().ToList();
 
-            foreach (var constraint in allConstraints)
-            {
-                var (score, _) = constraint.Evaluate(currentSolution);
-                constraintScores[constraint.Id] = score;
-            }
+            UpdateConstraintScores(constraintScores, allConstraints, incrementalEvaluation);
 
             // Iterative optimization
-            while (!_saController.Cool())
+            while (!saController.Cool())
             {
+                if (cancellationToken.IsCancellationRequested)
+                {
+                    _logger.LogInformation("Iteration {Iteration}: Local search time limit reached", iteration);
+                    break;
+                }
+
                 iteration++;
 
+                if (progress != null && iteration % ProgressReportInterval == 0)
+                {
+                    progress.Report(new SchedulingProgress
+                    {
+                        Kind = SchedulingProgressKind.Iteration,
+                        Phase = "LocalSearch",
+                        Iteration = iteration,
+                        Temperature = saController.CurrentTemperature,
+                        Score = incrementalEvaluation.Score,
+                        BestScore = bestScore
+                    });
+                }
+
+                // Share best solutions with the other portfolio runs; a run that stopped improving
+                // continues from the portfolio best if another run found a better solution
+                if (exchange != null && iteration % exchange.SyncInterval == 0)
+                {
+                    if (improvedSinceSync)
+                        exchange.Publish(MaterializeBest(), bestScore);
+
+                    if (!improvedSinceSync && exchange.TryGetBetter(bestScore, out var sharedSolution, out double sharedScore))
+                    {
+                        // Published solutions are never modified, the shared solution becomes the new baseline
+                        baseline = sharedSolution;
+                        currentSolution = sharedSolution.Clone();
+                        incrementalEvaluation = _evaluator.CreateIncrementalEvaluation(currentSolution);
+                        occupancy = currentSolution.ToCompact();
+                        constraintAnalysis = null;
+                        moveScores.Clear();
+                        tabuList.Clear();
+                        UpdateConstraintScores(constraintScores, allConstraints, incrementalEvaluation);
+                        bestCompact = occupancy.Clone();
+                        bestSolution = sharedSolution;
+                        bestScore = sharedScore;
+                        noImprovementCount = 0;
+
+                        _logger.LogDebug("Iteration {Iteration}: Continuing from shared portfolio solution, score: {Score}", iteration, bestScore);
+                    }
+
+                    improvedSinceSync = false;
+                }
+
                 try
                 {
                     // Find constraint with lowest satisfaction
@@ -178,7 +417,12 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.LS
                     }
 
                     // Analyze constraint and generate moves
-                    var constraintAnalysis = _constraintAnalyzer.AnalyzeSolution(currentSolution);
+                    if (constraintAnalysis == null || (analysisStale && iteration - analysisIteration >= ConstraintAnalysisInterval))
+                    {
+                        constraintAnalysis = _constraintAnalyzer.AnalyzeSolution(currentSolution);
+                        analysisStale = false;
+                        analysisIteration = iteration;
+                    }
                     var assignments = constraintAnalysis.GetAssignmentsAffectedByConstraint(currentSolution, targetConstraint);
 
                     if (assignments.Count == 0)
@@ -191,56 +435,73 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.LS
 
                     // Select a random assignment to modify
                     var targetAssignment = assignments.OrderBy(a => Guid.NewGuid()).First();
-                    var moves = _moveGenerator.GenerateValidMoves(currentSolution, targetAssignment, 5);
+                    // Hard constraint violations are rejected by the incremental score, not by validating copies
+                    var moves = _moveGenerator.GenerateValidMoves(currentSolution, targetAssignment, 5, checkHardConstraints: false, occupancy: occupancy);
 
                     if (moves.Count == 0)
                     {
                         _logger.LogDebug("Iteration {Iteration}: No valid moves found", iteration);
                         continue;
                     }
-                    IMove bestMove = SelectBestMove(moves, currentSolution);
+                    IMove bestMove = SelectBestMove(moves, occupancy, incrementalEvaluation, tabuList, iteration, bestScore,
+                        candidateSignatures, moveScores, statistics, out var bestChanges, out double newScore);
+
+                    if (bestMove == null)
+                    {
+                        _logger.LogDebug("Iteration {Iteration}: All moves are tabu or duplicates", iteration);
+                        continue;
+                    }
 
-                    // Apply move and evaluate
-                    var newSolution = bestMove.Apply(currentSolution);
-                    
                     // Ensure solution after applying move still satisfies current constraint level requirements
-                    var hardConstraintsSatisfied = _evaluator.EvaluateHardConstraints(newSolution) >= 1.0;
-                    if (!hardConstraintsSatisfied)
+                    if (double.IsNegativeInfinity(newScore))
                     {
                         _logger.LogDebug("Iteration {Iteration}: Move {MoveDescription} violates hard constraints, rejected", 
                             iteration, bestMove.GetDescription());
                         continue;
                     }
-                    
-                    double newScore = _evaluator.Evaluate(newSolution).Score;
 
                     // Decide whether to accept new solution
-                    bool acceptMove = _saController.ShouldAccept(bestScore, newScore);
+                    bool acceptMove = saController.ShouldAccept(bestScore, newScore);
 
                     if (acceptMove)
                     {
                         _logger.LogDebug("Iteration {Iteration}: Accepting move {MoveDescription}, new score: {NewScore}",
                             iteration, bestMove.GetDescription(), newScore);
 
-                        currentSolution = newSolution;
-                        
-                        // Save constraint level used by current solution
-                        currentSolution.ConstraintLevel = currentConstraintLevel;
+                        // Apply in place: no copy of the solution per accepted move
+                        currentSolution.ApplyChanges(bestChanges, occupancy);
+                        occupancy.Apply(bestChanges);
+                        _evaluator.CommitChanges(incrementalEvaluation, bestChanges, currentSolution);
+
+                        statistics.AcceptedMoves++;
+                        tabuList.Add(bestChanges, iteration);
+                        moveScores.Clear();
+                        analysisStale = true;
 
                         // Update constraint score cache
-                        foreach (var constraint in allConstraints)
-                        {
-                            var (score, _) = constraint.Evaluate(currentSolution);
-                            constraintScores[constraint.Id] = score;
-                        }
+                        UpdateConstraintScores(constraintScores, allConstraints, incrementalEvaluation);
 
                         // If new solution is better, update best solution
                         if (newScore > bestScore)
                         {
-                            bestSolution = newSolution;
+                            // Shares the arrays of the current compact form until the next accepted move
+                            bestCompact = occupancy.Clone();
+                            bestSolution = null;
                             bestScore = newScore;
                             _logger.LogInformation("Iteration {Iteration}: Found better solution, score: {Score}", iteration, bestScore);
                             noImprovementCount = 0;
+                            improvedSinceSync = true;
+
+                            progress?.Report(new SchedulingProgress
+                            {
+                                Kind = SchedulingProgressKind.Solution,
+                                Phase = "LocalSearch",
+                                Message = $"Found better solution at iteration {iteration}",
+                                Iteration = iteration,
+                                Temperature = saController.CurrentTemperature,
+                                Score = bestScore,
+                                BestScore = bestScore
+                            });
                         }
                         else
                         {
@@ -259,26 +520,78 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.LS
                 }
             }
 
-            _logger.LogInformation("Local search optimization completed, best score: {Score}", bestScore);
-            return bestSolution;
+            statistics.Iterations = iteration;
+            statistics.ElapsedMs = sw.ElapsedMilliseconds;
+
+            _logger.LogInformation("Local search optimization completed, best score: {Score}, moves: {Moves}, full evaluation fallbacks: {Fallbacks}",
+                bestScore, statistics, incrementalEvaluation.FullEvaluationFallbacks);
+
+            var result = MaterializeBest();
+            exchange?.Publish(result, bestScore);
+            return (result, bestScore, statistics);
         }
 
         /// <summary>
-        /// Evaluate and select the best move
+        /// Evaluate and select the best move. Moves without changes, repeated candidates and moves already scored
+        /// against the current solution are not evaluated again; tabu moves are only selected if they beat the best score
         /// </summary>
-        private IMove SelectBestMove(List<IMove> moves, SchedulingSolution currentSolution)
+        /// <returns>Best allowed move with its changes, null if every candidate was skipped</returns>
+        private IMove SelectBestMove(
+            List<IMove> moves,
+            CompactSolution current,
+            IncrementalEvaluation evaluation,
+            TabuList tabuList,
+            int iteration,
+            double bestScore,
+            HashSet<long> candidateSignatures,
+            Dictionary<long, double> moveScores,
+            MoveStatistics statistics,
+            out IReadOnlyList<AssignmentChange> bestChanges,
+            out double bestMoveScore)
         {
-            IMove bestMove = moves.First();
-            double bestMoveScore = double.MinValue;
+            IMove bestMove = null;
+            bestChanges = AssignmentChange.None;
+            bestMoveScore = double.NegativeInfinity;
+            candidateSignatures.Clear();
 
             foreach (var move in moves)
             {
-                var newSolution = move.Apply(currentSolution);
-                double score = _evaluator.Evaluate(newSolution).Score;
+                statistics.GeneratedMoves++;
+
+                var changes = move.GetChanges(current);
+                long signature = MoveSignature.Of(changes);
+                if (signature == MoveSignature.None || !candidateSignatures.Add(signature))
+                {
+                    statistics.DuplicateMoves++;
+                    continue;
+                }
+
+                if (moveScores.TryGetValue(signature, out double score))
+                {
+                    statistics.DuplicateMoves++;
+                }
+                else
+                {
+                    score = _evaluator.EvaluateChanges(evaluation, changes);
+                    moveScores[signature] = score;
+                    statistics.EvaluatedMoves++;
+                }
+
+                if (tabuList.IsTabu(changes, iteration))
+                {
+                    // Aspiration: a tabu move that leads to a new best solution is allowed
+                    if (score <= bestScore)
+                    {
+                        statistics.TabuMoves++;
+                        continue;
+                    }
+                    statistics.AspirationMoves++;
+                }
 
-                if (score > bestMoveScore)
+                if (bestMove == null || score > bestMoveScore)
                 {
                     bestMove = move;
+                    bestChanges = changes;
                     bestMoveScore = score;
                 }
             }
@@ -286,6 +599,28 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.LS
             return bestMove;
         }
 
+        /// <summary>
+        /// Refresh cached constraint scores from the incremental evaluation context
+        /// </summary>
+        private void UpdateConstraintScores(
+            Dictionary<int, double> constraintScores,
+            List<IConstraint> constraints,
+            IncrementalEvaluation evaluation)
+        {
+            foreach (var constraint in constraints)
+            {
+                if (evaluation.TryGetConstraintScore(constraint.Id, out double score))
+                {
+                    constraintScores[constraint.Id] = score;
+                }
+                else
+                {
+                    var (fullScore, _) = _evaluator.EvaluateConstraint(constraint, evaluation.Solution);
+                    constraintScores[constraint.Id] = fullScore;
+                }
+            }
+        }
+
         /// <summary>
         /// Optimize solution with specified parameters
         /// </summary>
@@ -298,7 +633,9 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.LS
             SchedulingSolution initialSolution, 
             int maxIterations, 
             double initialTemperature, 
-            double coolingRate)
+            double coolingRate,
+            IProgress<SchedulingProgress> progress = null,
+            CancellationToken cancellationToken = default)
         {
             _logger.LogInformation("Using specified parameters to start local search optimization...");
             _logger.LogInformation($"Parameters: maxIterations={maxIterations}, initialTemperature={initialTemperature}, coolingRate={coolingRate}");
@@ -319,7 +656,7 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.LS
                 _saController.Reset(initialTemperature, coolingRate);
                 
                 // Call standard optimization method
-                return OptimizeSolution(initialSolution);
+                return OptimizeSolution(initialSolution, progress, cancellationToken);
             }
             finally
             {
@@ -0,0 +1,41 @@
+using SmartSchedulingSystem.Scheduling.Models;
+using System.Collections.Generic;
+
+namespace SmartSchedulingSystem.Scheduling.Algorithms.LS
+{
+    /// <summary>
+    /// Result of a parallel local search portfolio
+    /// </summary>
+    public class LocalSearchPortfolioResult
+    {
+        /// <summary>
+        /// Best optimized solution per initial solution, in the order of the input
+        /// </summary>
+        public List<SchedulingSolution> Solutions { get; set; } = new List<SchedulingSolution>();
+
+        /// <summary>
+        /// Score of each solution in Solutions, computed once during the search
+        /// </summary>
+        public List<double> Scores { get; set; } = new List<double>();
+
+        /// <summary>
+        /// Number of search runs (initial solutions x annealing variants)
+        /// </summary>
+        public int RunCount { get; set; }
+
+        /// <summary>
+        /// Whether the search was stopped by the time limit
+        /// </summary>
+        public bool DeadlineReached { get; set; }
+
+        /// <summary>
+        /// Wall time of the portfolio in milliseconds
+        /// </summary>
+        public long ElapsedMs { get; set; }
+
+        /// <summary>
+        /// Move counters summed over all runs
+        /// </summary>
+        public MoveStatistics MoveStatistics { get; set; } = new MoveStatistics();
+    }
+}
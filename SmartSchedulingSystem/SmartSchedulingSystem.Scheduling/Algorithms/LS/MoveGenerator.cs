@@ -14,7 +14,8 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.LS
     /// </summary>
     public class MoveGenerator
     {
-        private readonly Random _random = new Random();
+        // Shared instance is thread-safe, the generator is used by parallel local search runs
+        private readonly Random _random = Random.Shared;
         private readonly ILogger<MoveGenerator> _logger;
         private readonly ConstraintManager _constraintManager;
         private readonly Utils.SchedulingParameters _parameters;
@@ -29,17 +30,35 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.LS
             _parameters = parameters ?? new Utils.SchedulingParameters();
         }
 
+        /// <summary>
+        /// Build the room suitability and teacher qualification caches for a problem. Call before sharing the
+        /// generator between threads, the move generation of parallel runs then only reads the caches
+        /// </summary>
+        /// <param name="problem">Problem the following moves are generated for</param>
+        public void Prepare(SchedulingProblem problem)
+        {
+            if (problem == null) throw new ArgumentNullException(nameof(problem));
+
+            InitializeRoomSuitabilityCache(problem);
+            InitializeQualificationCache(problem);
+        }
+
         /// <summary>
         /// Generate valid moves
         /// </summary>
         /// <param name="solution">Current solution</param>
         /// <param name="assignment">Course assignment to optimize</param>
         /// <param name="maxMoves">Maximum number of moves to generate</param>
+        /// <param name="checkHardConstraints">Whether room, teacher and swap moves are checked against the hard constraints on a
+        /// copy of the solution. Callers that score moves incrementally pass false, the score already rejects hard violations</param>
+        /// <param name="occupancy">Compact form of the solution kept up to date by the caller, built from the solution if null</param>
         /// <returns>List of valid moves</returns>
         public List<IMove> GenerateValidMoves(
             SchedulingSolution solution,
             SchedulingAssignment assignment,
-            int maxMoves = 10)
+            int maxMoves = 10,
+            bool checkHardConstraints = true,
+            CompactSolution occupancy = null)
         {
             if (solution == null) throw new ArgumentNullException(nameof(solution));
             if (assignment == null) throw new ArgumentNullException(nameof(assignment));
@@ -49,18 +68,22 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.LS
                 _logger.LogDebug($"Generating moves for assignment #{assignment.Id}, maximum count: {maxMoves}");
 
                 var validMoves = new List<IMove>();
+                var signatures = new HashSet<long>();
+
+                // One occupancy index answers the conflict checks of all candidate filters
+                occupancy ??= solution.ToCompact();
 
                 // Add time moves
-                AddTimeSlotMoves(solution, assignment, validMoves);
+                AddTimeSlotMoves(solution, occupancy, assignment, validMoves, signatures);
 
                 // Add room moves
-                AddRoomMoves(solution, assignment, validMoves);
+                AddRoomMoves(solution, occupancy, assignment, validMoves, signatures, checkHardConstraints);
 
                 // Add teacher moves
-                AddTeacherMoves(solution, assignment, validMoves);
+                AddTeacherMoves(solution, occupancy, assignment, validMoves, signatures, checkHardConstraints);
 
                 // Add swap moves
-                AddSwapMoves(solution, assignment, validMoves);
+                AddSwapMoves(solution, occupancy, assignment, validMoves, signatures, checkHardConstraints);
 
                 _logger.LogDebug($"Generated {validMoves.Count} valid moves");
 
@@ -91,37 +114,70 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.LS
             SchedulingAssignment assignment)
         {
             var moves = new List<IMove>();
+            var occupancy = solution.ToCompact();
 
             switch (conflict.Type)
             {
                 case SchedulingConflictType.TeacherConflict:
-                    moves.AddRange(GenerateMovesForTeacherConflict(solution, assignment));
+                    moves.AddRange(GenerateMovesForTeacherConflict(solution, occupancy, assignment));
                     break;
                 case SchedulingConflictType.ClassroomConflict:
-                    moves.AddRange(GenerateMovesForClassroomConflict(solution, assignment));
+                    moves.AddRange(GenerateMovesForClassroomConflict(solution, occupancy, assignment));
                     break;
                 case SchedulingConflictType.ClassroomCapacityExceeded:
-                    moves.AddRange(GenerateMovesForCapacityConflict(solution, assignment));
+                    moves.AddRange(GenerateMovesForCapacityConflict(solution, occupancy, assignment));
                     break;
                 case SchedulingConflictType.TeacherAvailabilityConflict:
-                    moves.AddRange(GenerateMovesForTeacherAvailabilityConflict(solution, assignment));
+                    moves.AddRange(GenerateMovesForTeacherAvailabilityConflict(solution, occupancy, assignment));
                     break;
                 case SchedulingConflictType.CampusTravelTimeConflict:
-                    moves.AddRange(GenerateMovesForTravelTimeConflict(solution, assignment));
+                    moves.AddRange(GenerateMovesForTravelTimeConflict(solution, occupancy, assignment));
                     break;
                 case SchedulingConflictType.PrerequisiteConflict:
-                    moves.AddRange(GenerateMovesForPrerequisiteConflict(solution, assignment));
+                    moves.AddRange(GenerateMovesForPrerequisiteConflict(solution, occupancy, assignment));
                     break;
                 default:
                     // For other conflict types, generate generic moves
-                    moves.AddRange(GenerateGenericMoves(solution, assignment));
+                    moves.AddRange(GenerateGenericMoves(solution, occupancy, assignment));
                     break;
             }
 
-            return moves;
+            return RemoveDuplicateMoves(solution, moves);
         }
 
-        private List<IMove> GenerateMovesForTeacherConflict(SchedulingSolution solution, SchedulingAssignment assignment)
+        /// <summary>
+        /// Remove moves that change nothing or lead to the same placements as an earlier move in the list
+        /// </summary>
+        /// <param name="solution">Solution the moves apply to</param>
+        /// <param name="moves">Candidate moves</param>
+        /// <param name="statistics">Counts the generated and removed moves, optional</param>
+        /// <returns>Distinct moves in their original order</returns>
+        public List<IMove> RemoveDuplicateMoves(SchedulingSolution solution, IEnumerable<IMove> moves, MoveStatistics statistics = null)
+        {
+            var distinct = new List<IMove>();
+            var signatures = new HashSet<long>();
+            var compact = solution.ToCompact();
+
+            foreach (var move in moves)
+            {
+                long signature = MoveSignature.Of(move.GetChanges(compact));
+                if (signature != MoveSignature.None && signatures.Add(signature))
+                {
+                    distinct.Add(move);
+                }
+                else if (statistics != null)
+                {
+                    statistics.DuplicateMoves++;
+                }
+            }
+
+            if (statistics != null)
+                statistics.GeneratedMoves += distinct.Count;
+
+            return distinct;
+        }
+
+        private List<IMove> GenerateMovesForTeacherConflict(SchedulingSolution solution, CompactSolution occupancy, SchedulingAssignment assignment)
         {
             var moves = new List<IMove>();
 
@@ -133,7 +189,7 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.LS
             }
 
             // 2. Try changing teacher
-            var qualifiedTeachers = GetQualifiedTeachers(solution, assignment);
+            var qualifiedTeachers = GetQualifiedTeachers(solution, occupancy, assignment);
             foreach (var teacher in qualifiedTeachers)
             {
                 moves.Add(new TeacherMove(assignment.Id, teacher));
@@ -143,12 +199,12 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.LS
         }
 
         // Implement move generation methods for other conflict types...
-        private List<IMove> GenerateMovesForClassroomConflict(SchedulingSolution solution, SchedulingAssignment assignment)
+        private List<IMove> GenerateMovesForClassroomConflict(SchedulingSolution solution, CompactSolution occupancy, SchedulingAssignment assignment)
         {
             var moves = new List<IMove>();
 
             // 1. Try changing classroom
-            var suitableRooms = GetSuitableRooms(solution, assignment);
+            var suitableRooms = GetSuitableRooms(solution, occupancy, assignment);
             foreach (var roomId in suitableRooms)
             {
                 moves.Add(new RoomMove(assignment.Id, roomId));
@@ -164,12 +220,12 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.LS
             return moves;
         }
 
-        private List<IMove> GenerateMovesForCapacityConflict(SchedulingSolution solution, SchedulingAssignment assignment)
+        private List<IMove> GenerateMovesForCapacityConflict(SchedulingSolution solution, CompactSolution occupancy, SchedulingAssignment assignment)
         {
             var moves = new List<IMove>();
 
             // Find classrooms with larger capacity
-            var largerRooms = GetLargerRooms(solution, assignment);
+            var largerRooms = GetLargerRooms(solution, occupancy, assignment);
             foreach (var roomId in largerRooms)
             {
                 moves.Add(new RoomMove(assignment.Id, roomId));
@@ -178,19 +234,19 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.LS
             return moves;
         }
 
-        private List<IMove> GenerateMovesForTeacherAvailabilityConflict(SchedulingSolution solution, SchedulingAssignment assignment)
+        private List<IMove> GenerateMovesForTeacherAvailabilityConflict(SchedulingSolution solution, CompactSolution occupancy, SchedulingAssignment assignment)
         {
             var moves = new List<IMove>();
 
             // 1. Try moving to time slots where teacher is available
-            var teacherAvailableTimeSlots = GetTeacherAvailableTimeSlots(solution, assignment);
+            var teacherAvailableTimeSlots = GetTeacherAvailableTimeSlots(solution, occupancy, assignment);
             foreach (var timeSlotId in teacherAvailableTimeSlots)
             {
                 moves.Add(new TimeMove(assignment.Id, timeSlotId));
             }
 
             // 2. Try changing to available teacher
-            var availableTeachers = GetAvailableTeachers(solution, assignment);
+            var availableTeachers = GetAvailableTeachers(solution, occupancy, assignment);
             foreach (var teacherId in availableTeachers)
             {
                 moves.Add(new TeacherMove(assignment.Id, teacherId));
@@ -199,19 +255,19 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.LS
             return moves;
         }
 
-        private List<IMove> GenerateMovesForTravelTimeConflict(SchedulingSolution solution, SchedulingAssignment assignment)
+        private List<IMove> GenerateMovesForTravelTimeConflict(SchedulingSolution solution, CompactSolution occupancy, SchedulingAssignment assignment)
         {
             var moves = new List<IMove>();
 
             // 1. Try moving to more suitable time slots (increase travel time)
-            var betterTimeSlots = GetTimeSlotWithSufficientTravelTime(solution, assignment);
+            var betterTimeSlots = GetTimeSlotWithSufficientTravelTime(solution, occupancy, assignment);
             foreach (var timeSlotId in betterTimeSlots)
             {
                 moves.Add(new TimeMove(assignment.Id, timeSlotId));
             }
 
             // 2. Try changing to closer classroom
-            var nearbyRooms = GetNearbyRooms(solution, assignment);
+            var nearbyRooms = GetNearbyRooms(solution, occupancy, assignment);
             foreach (var roomId in nearbyRooms)
             {
                 moves.Add(new RoomMove(assignment.Id, roomId));
@@ -220,12 +276,12 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.LS
             return moves;
         }
 
-        private List<IMove> GenerateMovesForPrerequisiteConflict(SchedulingSolution solution, SchedulingAssignment assignment)
+        private List<IMove> GenerateMovesForPrerequisiteConflict(SchedulingSolution solution, CompactSolution occupancy, SchedulingAssignment assignment)
         {
             var moves = new List<IMove>();
 
             // For prerequisite conflicts, mainly adjust time slots
-            var nonConflictingTimeSlots = GetNonPrerequisiteConflictingTimeSlots(solution, assignment);
+            var nonConflictingTimeSlots = GetNonPrerequisiteConflictingTimeSlots(solution, occupancy, assignment);
             foreach (var timeSlotId in nonConflictingTimeSlots)
             {
                 moves.Add(new TimeMove(assignment.Id, timeSlotId));
@@ -234,7 +290,7 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.LS
             return moves;
         }
 
-        private List<IMove> GenerateGenericMoves(SchedulingSolution solution, SchedulingAssignment assignment)
+        private List<IMove> GenerateGenericMoves(SchedulingSolution solution, CompactSolution occupancy, SchedulingAssignment assignment)
         {
             var moves = new List<IMove>();
 
@@ -246,14 +302,14 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.LS
             }
 
             // 2. Room moves
-            var suitableRooms = GetSuitableRooms(solution, assignment);
+            var suitableRooms = GetSuitableRooms(solution, occupancy, assignment);
             foreach (var roomId in suitableRooms.Take(3))
             {
                 moves.Add(new RoomMove(assignment.Id, roomId));
             }
 
             // 3. Teacher moves
-            var qualifiedTeachers = GetQualifiedTeachers(solution, assignment);
+            var qualifiedTeachers = GetQualifiedTeachers(solution, occupancy, assignment);
             foreach (var teacherId in qualifiedTeachers.Take(2))
             {
                 moves.Add(new TeacherMove(assignment.Id, teacherId));
@@ -279,8 +335,10 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.LS
         /// </summary>
         private void AddTimeSlotMoves(
             SchedulingSolution solution,
+            CompactSolution occupancy,
             SchedulingAssignment assignment,
-            List<IMove> moves)
+            List<IMove> moves,
+            HashSet<long> signatures)
         {
             try
             {
@@ -305,8 +363,10 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.LS
                 {
                     // Create time slot move
                     var move = new TimeSlotMove(assignment.Id, timeSlotId);
-                    moves.Add(move);
-                    _logger.LogDebug($"Added time slot move: Assign {assignment.Id} to time slot {timeSlotId}");
+                    if (TryAddMove(solution, occupancy, move, moves, signatures, validate: false))
+                    {
+                        _logger.LogDebug($"Added time slot move: Assign {assignment.Id} to time slot {timeSlotId}");
+                    }
                 }
             }
             catch (Exception ex)
@@ -316,7 +376,7 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.LS
         }
 
         // Add necessary helper methods in MoveGenerator.cs
-        private List<int> GetLargerRooms(SchedulingSolution solution, SchedulingAssignment assignment)
+        private List<int> GetLargerRooms(SchedulingSolution solution, CompactSolution occupancy, SchedulingAssignment assignment)
         {
             var largerRooms = new List<int>();
 
@@ -346,7 +406,7 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.LS
                     continue;
 
                 // Check if classroom is already scheduled in this time slot
-                if (solution.HasClassroomConflict(room.Id, assignment.TimeSlotId, assignment.SectionId))
+                if (occupancy.HasClassroomConflict(room.Id, assignment.TimeSlotId, assignment.SectionId))
                     continue;
 
                 // Check if classroom is available in this time slot
@@ -363,7 +423,7 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.LS
             return largerRooms;
         }
 
-        private List<int> GetTeacherAvailableTimeSlots(SchedulingSolution solution, SchedulingAssignment assignment)
+        private List<int> GetTeacherAvailableTimeSlots(SchedulingSolution solution, CompactSolution occupancy, SchedulingAssignment assignment)
         {
             var availableSlots = new List<int>();
 
@@ -384,11 +444,11 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.LS
                     continue;
 
                 // Check if teacher is already scheduled in this time slot
-                if (solution.HasTeacherConflict(assignment.TeacherId, timeSlot.Id, assignment.SectionId))
+                if (occupancy.HasTeacherConflict(assignment.TeacherId, timeSlot.Id, assignment.SectionId))
                     continue;
 
                 // Check if classroom is already scheduled in this time slot
-                if (solution.HasClassroomConflict(assignment.ClassroomId, timeSlot.Id, assignment.SectionId))
+                if (occupancy.HasClassroomConflict(assignment.ClassroomId, timeSlot.Id, assignment.SectionId))
                     continue;
 
                 // Time slot available
@@ -398,7 +458,7 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.LS
             return availableSlots;
         }
 
-        private List<int> GetAvailableTeachers(SchedulingSolution solution, SchedulingAssignment assignment)
+        private List<int> GetAvailableTeachers(SchedulingSolution solution, CompactSolution occupancy, SchedulingAssignment assignment)
         {
             var availableTeachers = new List<int>();
 
@@ -426,7 +486,7 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.LS
                     continue;
 
                 // Check if teacher is already scheduled in this time slot
-                if (solution.HasTeacherConflict(teacher.Id, assignment.TimeSlotId, assignment.SectionId))
+                if (occupancy.HasTeacherConflict(teacher.Id, assignment.TimeSlotId, assignment.SectionId))
                     continue;
 
                 // Check if teacher is available in this time slot
@@ -443,7 +503,7 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.LS
             return availableTeachers;
         }
 
-        private List<int> GetTimeSlotWithSufficientTravelTime(SchedulingSolution solution, SchedulingAssignment assignment)
+        private List<int> GetTimeSlotWithSufficientTravelTime(SchedulingSolution solution, CompactSolution occupancy, SchedulingAssignment assignment)
         {
             var suitableTimeSlots = new List<int>();
 
@@ -492,11 +552,11 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.LS
                     continue;
 
                 // Check if teacher is already scheduled in this time slot
-                if (solution.HasTeacherConflict(assignment.TeacherId, timeSlot.Id, assignment.SectionId))
+                if (occupancy.HasTeacherConflict(assignment.TeacherId, timeSlot.Id, assignment.SectionId))
                     continue;
 
                 // Check if classroom is already scheduled in this time slot
-                if (solution.HasClassroomConflict(assignment.ClassroomId, timeSlot.Id, assignment.SectionId))
+                if (occupancy.HasClassroomConflict(assignment.ClassroomId, timeSlot.Id, assignment.SectionId))
                     continue;
 
                 // Check if travel time to other teacher's courses is sufficient
@@ -569,7 +629,7 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.LS
         }
 
         // Add necessary helper methods (continued) in MoveGenerator.cs
-        private List<int> GetNearbyRooms(SchedulingSolution solution, SchedulingAssignment assignment)
+        private List<int> GetNearbyRooms(SchedulingSolution solution, CompactSolution occupancy, SchedulingAssignment assignment)
         {
             var nearbyRooms = new List<int>();
 
@@ -606,7 +666,7 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.LS
                     continue;
 
                 // Check if classroom is already scheduled in this time slot
-                if (solution.HasClassroomConflict(room.Id, assignment.TimeSlotId, assignment.SectionId))
+                if (occupancy.HasClassroomConflict(room.Id, assignment.TimeSlotId, assignment.SectionId))
                     continue;
 
                 // Check if classroom is available in this time slot
@@ -690,7 +750,7 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.LS
             return nearbyRooms;
         }
 
-        private List<int> GetNonPrerequisiteConflictingTimeSlots(SchedulingSolution solution, SchedulingAssignment assignment)
+        private List<int> GetNonPrerequisiteConflictingTimeSlots(SchedulingSolution solution, CompactSolution occupancy, SchedulingAssignment assignment)
         {
             var suitableTimeSlots = new List<int>();
 
@@ -764,11 +824,11 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.LS
                     continue;
 
                 // Check if teacher is already scheduled in this time slot
-                if (solution.HasTeacherConflict(assignment.TeacherId, timeSlot.Id, assignment.SectionId))
+                if (occupancy.HasTeacherConflict(assignment.TeacherId, timeSlot.Id, assignment.SectionId))
                     continue;
 
                 // Check if classroom is already scheduled in this time slot
-                if (solution.HasClassroomConflict(assignment.ClassroomId, timeSlot.Id, assignment.SectionId))
+                if (occupancy.HasClassroomConflict(assignment.ClassroomId, timeSlot.Id, assignment.SectionId))
                     continue;
 
                 // Check if in the same time slot as courses with prerequisite relationships
@@ -796,23 +856,21 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.LS
         /// </summary>
         private void AddRoomMoves(
             SchedulingSolution solution,
+            CompactSolution occupancy,
             SchedulingAssignment assignment,
-            List<IMove> moves)
+            List<IMove> moves,
+            HashSet<long> signatures,
+            bool validate)
         {
             // Get all suitable classrooms
-            var suitableRooms = GetSuitableRooms(solution, assignment);
+            var suitableRooms = GetSuitableRooms(solution, occupancy, assignment);
 
             _logger.LogDebug($"Found {suitableRooms.Count} suitable classrooms for moves");
 
             foreach (var roomId in suitableRooms)
             {
-                var move = new RoomMove(assignment.Id, roomId);
-
                 // Verify if move satisfies all hard constraints
-                if (IsValidMove(solution, move))
-                {
-                    moves.Add(move);
-                }
+                TryAddMove(solution, occupancy, new RoomMove(assignment.Id, roomId), moves, signatures, validate);
             }
         }
 
@@ -821,23 +879,21 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.LS
         /// </summary>
         private void AddTeacherMoves(
             SchedulingSolution solution,
+            CompactSolution occupancy,
             SchedulingAssignment assignment,
-            List<IMove> moves)
+            List<IMove> moves,
+            HashSet<long> signatures,
+            bool validate)
         {
             // Get all qualified teachers
-            var qualifiedTeachers = GetQualifiedTeachers(solution, assignment);
+            var qualifiedTeachers = GetQualifiedTeachers(solution, occupancy, assignment);
 
             _logger.LogDebug($"Found {qualifiedTeachers.Count} qualified teachers for moves");
 
             foreach (var teacherId in qualifiedTeachers)
             {
-                var move = new TeacherMove(assignment.Id, teacherId);
-
                 // Verify if move satisfies all hard constraints
-                if (IsValidMove(solution, move))
-                {
-                    moves.Add(move);
-                }
+                TryAddMove(solution, occupancy, new TeacherMove(assignment.Id, teacherId), moves, signatures, validate);
             }
         }
 
@@ -846,8 +902,11 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.LS
         /// </summary>
         private void AddSwapMoves(
             SchedulingSolution solution,
+            CompactSolution occupancy,
             SchedulingAssignment assignment,
-            List<IMove> moves)
+            List<IMove> moves,
+            HashSet<long> signatures,
+            bool validate)
         {
             // Find possible swap partners
             var potentialSwapPartners = FindPotentialSwapPartners(solution, assignment);
@@ -856,57 +915,50 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.LS
 
             foreach (var partnerId in potentialSwapPartners)
             {
+                // Partners sharing a time, classroom or teacher make several swap variants identical,
+                // only the first of them is validated
+
                 // Time swap
-                var timeSwap = new SwapMove(assignment.Id, partnerId, true, false, false);
-                if (IsValidMove(solution, timeSwap))
-                {
-                    moves.Add(timeSwap);
-                }
+                TryAddMove(solution, occupancy, new SwapMove(assignment.Id, partnerId, true, false, false), moves, signatures, validate);
 
                 // Classroom swap
-                var roomSwap = new SwapMove(assignment.Id, partnerId, false, true, false);
-                if (IsValidMove(solution, roomSwap))
-                {
-                    moves.Add(roomSwap);
-                }
+                TryAddMove(solution, occupancy, new SwapMove(assignment.Id, partnerId, false, true, false), moves, signatures, validate);
 
                 // Swap teacher
-                var teacherSwap = new SwapMove(assignment.Id, partnerId, false, false, true);
-                if (IsValidMove(solution, teacherSwap))
-                {
-                    moves.Add(teacherSwap);
-                }
+                TryAddMove(solution, occupancy, new SwapMove(assignment.Id, partnerId, false, false, true), moves, signatures, validate);
+
                 // Time and classroom swap
-                var timeRoomSwap = new SwapMove(assignment.Id, partnerId, true, true, false);
-                if (IsValidMove(solution, timeRoomSwap))
-                {
-                    moves.Add(timeRoomSwap);
-                }
+                TryAddMove(solution, occupancy, new SwapMove(assignment.Id, partnerId, true, true, false), moves, signatures, validate);
+
                 // Time and teacher swap
-                var timeTeacherSwap = new SwapMove(assignment.Id, partnerId, true, false, true);
-                if (IsValidMove(solution, timeTeacherSwap))
-                {
-                    moves.Add(timeTeacherSwap);
-                }
+                TryAddMove(solution, occupancy, new SwapMove(assignment.Id, partnerId, true, false, true), moves, signatures, validate);
 
                 // Classroom and teacher swap
-                var roomTeacherSwap = new SwapMove(assignment.Id, partnerId, false, true, true);
-                if (IsValidMove(solution, roomTeacherSwap))
-                {
-                    moves.Add(roomTeacherSwap);
-                }
-
+                TryAddMove(solution, occupancy, new SwapMove(assignment.Id, partnerId, false, true, true), moves, signatures, validate);
 
                 // Complete swap (time, classroom, teacher)
-                var completeSwap = new SwapMove(assignment.Id, partnerId, true, true, true);
-                if (IsValidMove(solution, completeSwap))
-                {
-                    moves.Add(completeSwap);
-                }
-                
+                TryAddMove(solution, occupancy, new SwapMove(assignment.Id, partnerId, true, true, true), moves, signatures, validate);
             }
         }
 
+        /// <summary>
+        /// Add a move unless it changes nothing or leads to the same placements as a move already added.
+        /// Only new moves are checked against the hard constraints, which copies the whole solution
+        /// </summary>
+        /// <returns>Whether the move was added</returns>
+        private bool TryAddMove(SchedulingSolution solution, CompactSolution occupancy, IMove move, List<IMove> moves, HashSet<long> signatures, bool validate = true)
+        {
+            long signature = MoveSignature.Of(move.GetChanges(occupancy));
+            if (signature == MoveSignature.None || !signatures.Add(signature))
+                return false;
+
+            if (validate && !IsValidMove(solution, move))
+                return false;
+
+            moves.Add(move);
+            return true;
+        }
+
         private List<int> GetAvailableTimeSlots(SchedulingSolution solution, SchedulingAssignment assignment)
         {
             if (solution.Problem == null)
@@ -954,7 +1006,7 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.LS
         // Add class member variable for caching
         private Dictionary<(int sectionId, int classroomId), bool> _roomSuitabilityCache;
 
-        private List<int> GetSuitableRooms(SchedulingSolution solution, SchedulingAssignment assignment)
+        private List<int> GetSuitableRooms(SchedulingSolution solution, CompactSolution occupancy, SchedulingAssignment assignment)
         {
             if (solution.Problem == null)
                 return new List<int>();
@@ -978,7 +1030,7 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.LS
                     _roomSuitabilityCache.TryGetValue((courseSection.Id, classroom.Id), out bool isSuitable) &&
                     isSuitable &&
                     // 2. Check if classroom is already scheduled in this time slot
-                    !solution.HasClassroomConflict(classroom.Id, assignment.TimeSlotId, assignment.SectionId))
+                    !occupancy.HasClassroomConflict(classroom.Id, assignment.TimeSlotId, assignment.SectionId))
                 .Select(c => c.Id)
                 .ToList();
         }
@@ -986,7 +1038,7 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.LS
         // Initialize classroom suitability cache
         private void InitializeRoomSuitabilityCache(SchedulingProblem problem)
         {
-            _roomSuitabilityCache = new Dictionary<(int sectionId, int classroomId), bool>();
+            var roomSuitabilityCache = new Dictionary<(int sectionId, int classroomId), bool>();
 
             foreach (var section in problem.CourseSections)
             {
@@ -1001,9 +1053,12 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.LS
                         isSuitable = isSuitable && IsCompatibleRoomType(section.RequiredRoomType, classroom.Type);
                     }
 
-                    _roomSuitabilityCache[(section.Id, classroom.Id)] = isSuitable;
+                    roomSuitabilityCache[(section.Id, classroom.Id)] = isSuitable;
                 }
             }
+
+            // Publish only the fully built cache so concurrent readers never see a partial dictionary
+            _roomSuitabilityCache = roomSuitabilityCache;
         }
 
         // Check if two classroom types are compatible
@@ -1031,7 +1086,7 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.LS
 
         private Dictionary<(int teacherId, int courseId), bool> _teacherQualificationCache;
 
-        private List<int> GetQualifiedTeachers(SchedulingSolution solution, SchedulingAssignment assignment)
+        private List<int> GetQualifiedTeachers(SchedulingSolution solution, CompactSolution occupancy, SchedulingAssignment assignment)
         {
             if (solution.Problem == null)
                 return new List<int>();
@@ -1055,7 +1110,7 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.LS
                     _teacherQualificationCache.TryGetValue((teacher.Id, courseSection.CourseId), out bool isQualified) &&
                     isQualified &&
                     // 2. Check if teacher is already scheduled in this time slot
-                    !solution.HasTeacherConflict(teacher.Id, assignment.TimeSlotId, assignment.SectionId))
+                    !occupancy.HasTeacherConflict(teacher.Id, assignment.TimeSlotId, assignment.SectionId))
                 .Select(t => t.Id)
                 .ToList();
         }
@@ -1063,11 +1118,11 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.LS
         // Initialize teacher qualification cache
         private void InitializeQualificationCache(SchedulingProblem problem)
         {
-            _teacherQualificationCache = new Dictionary<(int teacherId, int courseId), bool>();
+            var teacherQualificationCache = new Dictionary<(int teacherId, int courseId), bool>();
 
             foreach (var pref in problem.TeacherCoursePreferences)
             {
-                _teacherQualificationCache[(pref.TeacherId, pref.CourseId)] = pref.ProficiencyLevel >= 3;
+                teacherQualificationCache[(pref.TeacherId, pref.CourseId)] = pref.ProficiencyLevel >= 3;
             }
 
             // Ensure all teacher-course combinations are in cache
@@ -1076,12 +1131,14 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.LS
                 foreach (var section in problem.CourseSections)
                 {
                     var key = (teacher.Id, section.CourseId);
-                    if (!_teacherQualificationCache.ContainsKey(key))
+                    if (!teacherQualificationCache.ContainsKey(key))
                     {
-                        _teacherQualificationCache[key] = false; // Default not qualified
+                        teacherQualificationCache[key] = false; // Default not qualified
                     }
                 }
             }
+
+            _teacherQualificationCache = teacherQualificationCache;
         }
 
         /// <summary>
@@ -1109,6 +1166,7 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.LS
             // Verify all hard constraints
             foreach (var constraint in _constraintManager.GetHardConstraints())
             {
+                using var scope = _constraintManager.Profiler.Measure(constraint, ConstraintOperation.IsSatisfied);
                 if (!constraint.IsSatisfied(tempSolution))
                 {
                     return false;
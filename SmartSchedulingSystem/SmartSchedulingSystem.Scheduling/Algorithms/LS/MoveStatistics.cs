@@ -0,0 +1,81 @@
+namespace SmartSchedulingSystem.Scheduling.Algorithms.LS
+{
+    /// <summary>
+    /// Move counters of local search runs
+    /// </summary>
+    public class MoveStatistics
+    {
+        /// <summary>
+        /// Candidate moves produced by the move generator
+        /// </summary>
+        public long GeneratedMoves { get; set; }
+
+        /// <summary>
+        /// Candidates skipped without evaluation: moves without changes, repeats of a candidate of the same
+        /// iteration and moves already evaluated against the current solution
+        /// </summary>
+        public long DuplicateMoves { get; set; }
+
+        /// <summary>
+        /// Candidates evaluated against the current solution
+        /// </summary>
+        public long EvaluatedMoves { get; set; }
+
+        /// <summary>
+        /// Candidates rejected because they undo a recent move
+        /// </summary>
+        public long TabuMoves { get; set; }
+
+        /// <summary>
+        /// Tabu candidates allowed because they improve on the best score
+        /// </summary>
+        public long AspirationMoves { get; set; }
+
+        /// <summary>
+        /// Accepted moves
+        /// </summary>
+        public long AcceptedMoves { get; set; }
+
+        /// <summary>
+        /// Search iterations, summed over runs
+        /// </summary>
+        public long Iterations { get; set; }
+
+        /// <summary>
+        /// Search time in milliseconds, summed over runs
+        /// </summary>
+        public long ElapsedMs { get; set; }
+
+        /// <summary>
+        /// Share of generated candidates skipped as duplicates
+        /// </summary>
+        public double DuplicateRate => GeneratedMoves > 0 ? (double)DuplicateMoves / GeneratedMoves : 0;
+
+        /// <summary>
+        /// Evaluated candidates per second of search time
+        /// </summary>
+        public double EvaluatedMovesPerSecond => ElapsedMs > 0 ? EvaluatedMoves * 1000.0 / ElapsedMs : 0;
+
+        /// <summary>
+        /// Add the counters of another run
+        /// </summary>
+        public void Add(MoveStatistics other)
+        {
+            if (other == null)
+                return;
+
+            GeneratedMoves += other.GeneratedMoves;
+            DuplicateMoves += other.DuplicateMoves;
+            EvaluatedMoves += other.EvaluatedMoves;
+            TabuMoves += other.TabuMoves;
+            AspirationMoves += other.AspirationMoves;
+            AcceptedMoves += other.AcceptedMoves;
+            Iterations += other.Iterations;
+            ElapsedMs += other.ElapsedMs;
+        }
+
+        public override string ToString() =>
+            $"generated {GeneratedMoves}, evaluated {EvaluatedMoves} ({EvaluatedMovesPerSecond:F0}/s), " +
+            $"duplicates {DuplicateMoves} ({DuplicateRate:P1}), tabu {TabuMoves}, aspiration {AspirationMoves}, accepted {AcceptedMoves}";
+    }
+}
@@ -1,4 +1,5 @@
 ﻿using SmartSchedulingSystem.Scheduling.Models;
+using System.Collections.Generic;
 
 namespace SmartSchedulingSystem.Scheduling.Algorithms.LS.Moves
 {
@@ -25,5 +26,13 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.LS.Moves
         /// </summary>
         /// <returns>Array of affected assignment IDs</returns>
         int[] GetAffectedAssignmentIds();
+
+        /// <summary>
+        /// Get the assignment changes this move would make, without copying the solution.
+        /// Assignments are resolved through the index of the compact solution, so the cost does not grow with the solution size
+        /// </summary>
+        /// <param name="solution">Compact form of the current solution</param>
+        /// <returns>Changed assignments with their placements before and after the move</returns>
+        IReadOnlyList<AssignmentChange> GetChanges(CompactSolution solution);
     }
 }
\ No newline at end of file
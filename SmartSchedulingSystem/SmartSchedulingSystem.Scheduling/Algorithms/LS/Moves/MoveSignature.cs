@@ -0,0 +1,64 @@
+using SmartSchedulingSystem.Scheduling.Models;
+using System.Collections.Generic;
+
+namespace SmartSchedulingSystem.Scheduling.Algorithms.LS.Moves
+{
+    /// <summary>
+    /// Hashed signatures of moves and placements.
+    /// A move signature depends only on the placements the move produces, so moves of different types or with
+    /// swapped operands that lead to the same assignments (e.g. TimeMove and TimeSlotMove to the same slot) are equal
+    /// </summary>
+    public static class MoveSignature
+    {
+        /// <summary>
+        /// Signature of a move that does not change the solution
+        /// </summary>
+        public const long None = 0;
+
+        /// <summary>
+        /// Signature of the placements a move produces, None if no assignment actually changes
+        /// </summary>
+        public static long Of(IReadOnlyList<AssignmentChange> changes)
+        {
+            long signature = None;
+            for (int i = 0; i < changes.Count; i++)
+            {
+                var change = changes[i];
+                if (IsSamePlacement(change.Before, change.After))
+                    continue;
+
+                // Addition keeps the signature independent of the order of the changes
+                signature += Of(change.After);
+            }
+            return signature;
+        }
+
+        /// <summary>
+        /// Hash of an assignment placement (assignment, teacher, classroom and time slot)
+        /// </summary>
+        public static long Of(AssignmentPlacement placement)
+        {
+            ulong key = (ulong)(uint)placement.AssignmentId;
+            key = Mix(key ^ ((ulong)(uint)placement.TeacherId << 32));
+            key = Mix(key ^ (uint)placement.ClassroomId);
+            key = Mix(key ^ ((ulong)(uint)placement.TimeSlotId << 32));
+
+            // None is reserved for moves without changes
+            return key == 0 ? 1 : (long)key;
+        }
+
+        private static bool IsSamePlacement(AssignmentPlacement a, AssignmentPlacement b) =>
+            a.AssignmentId == b.AssignmentId &&
+            a.TeacherId == b.TeacherId &&
+            a.ClassroomId == b.ClassroomId &&
+            a.TimeSlotId == b.TimeSlotId;
+
+        // SplitMix64 finalizer
+        private static ulong Mix(ulong value)
+        {
+            value = (value ^ (value >> 30)) * 0xBF58476D1CE4E5B9UL;
+            value = (value ^ (value >> 27)) * 0x94D049BB133111EBUL;
+            return value ^ (value >> 31);
+        }
+    }
+}
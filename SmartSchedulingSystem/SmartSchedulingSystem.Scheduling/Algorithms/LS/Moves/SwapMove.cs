@@ -113,5 +113,42 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.LS.Moves
         {
             return new[] { _assignment1Id, _assignment2Id };
         }
+
+        public IReadOnlyList<AssignmentChange> GetChanges(CompactSolution solution)
+        {
+            int position1 = solution.IndexOf(_assignment1Id);
+            int position2 = solution.IndexOf(_assignment2Id);
+            if (position1 < 0 || position2 < 0 || _assignment1Id == _assignment2Id)
+                return AssignmentChange.None;
+
+            var before1 = solution.GetPlacement(position1);
+            var before2 = solution.GetPlacement(position2);
+            var after1 = before1;
+            var after2 = before2;
+
+            if (_swapTime)
+            {
+                after1 = after1.WithTimeSlot(before2.TimeSlotId);
+                after2 = after2.WithTimeSlot(before1.TimeSlotId);
+            }
+
+            if (_swapRoom)
+            {
+                after1 = after1.WithClassroom(before2.ClassroomId);
+                after2 = after2.WithClassroom(before1.ClassroomId);
+            }
+
+            if (_swapTeacher)
+            {
+                after1 = after1.WithTeacher(before2.TeacherId);
+                after2 = after2.WithTeacher(before1.TeacherId);
+            }
+
+            return new[]
+            {
+                new AssignmentChange(before1, after1),
+                new AssignmentChange(before2, after2)
+            };
+        }
     }
 }
\ No newline at end of file
@@ -1,5 +1,6 @@
 ﻿using SmartSchedulingSystem.Scheduling.Algorithms.LS.Moves;
 using SmartSchedulingSystem.Scheduling.Models;
+using System.Collections.Generic;
 using System.Linq;
 
 namespace SmartSchedulingSystem.Scheduling.Algorithms.LS.Moves
@@ -51,5 +52,15 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.LS.Moves
         {
             return new[] { _assignmentId };
         }
+
+        public IReadOnlyList<AssignmentChange> GetChanges(CompactSolution solution)
+        {
+            int position = solution.IndexOf(_assignmentId);
+            if (position < 0)
+                return AssignmentChange.None;
+
+            var before = solution.GetPlacement(position);
+            return new[] { new AssignmentChange(before, before.WithTeacher(_newTeacherId)) };
+        }
     }
 }
\ No newline at end of file
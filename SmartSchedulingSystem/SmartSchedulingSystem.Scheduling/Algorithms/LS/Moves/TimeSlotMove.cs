@@ -1,4 +1,5 @@
 using SmartSchedulingSystem.Scheduling.Models;
+using System.Collections.Generic;
 using System.Linq;
 
 namespace SmartSchedulingSystem.Scheduling.Algorithms.LS.Moves
@@ -53,5 +54,15 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.LS.Moves
         {
             return new[] { _assignmentId };
         }
+
+        public IReadOnlyList<AssignmentChange> GetChanges(CompactSolution solution)
+        {
+            int position = solution.IndexOf(_assignmentId);
+            if (position < 0 || !solution.ContainsTimeSlot(_newTimeSlotId))
+                return AssignmentChange.None;
+
+            var before = solution.GetPlacement(position);
+            return new[] { new AssignmentChange(before, before.WithTimeSlot(_newTimeSlotId)) };
+        }
     }
 } 
\ No newline at end of file
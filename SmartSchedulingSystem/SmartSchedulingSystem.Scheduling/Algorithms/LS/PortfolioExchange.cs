@@ -0,0 +1,75 @@
+using SmartSchedulingSystem.Scheduling.Models;
+using System;
+
+namespace SmartSchedulingSystem.Scheduling.Algorithms.LS
+{
+    /// <summary>
+    /// Best solution shared between the parallel runs of one initial solution in a local search portfolio
+    /// </summary>
+    internal sealed class PortfolioExchange
+    {
+        private readonly object _lock = new object();
+        private SchedulingSolution _bestSolution;
+        private double _bestScore = double.NegativeInfinity;
+
+        public PortfolioExchange(int syncInterval)
+        {
+            SyncInterval = Math.Max(1, syncInterval);
+        }
+
+        /// <summary>
+        /// Number of iterations between two exchanges of a run
+        /// </summary>
+        public int SyncInterval { get; }
+
+        public double BestScore
+        {
+            get
+            {
+                lock (_lock)
+                {
+                    return _bestScore;
+                }
+            }
+        }
+
+        /// <summary>
+        /// Publish a run's best solution; kept only if it beats the shared best.
+        /// Published solutions must not be modified afterwards
+        /// </summary>
+        public void Publish(SchedulingSolution solution, double score)
+        {
+            if (solution == null || double.IsNaN(score))
+                return;
+
+            lock (_lock)
+            {
+                if (_bestSolution == null || score > _bestScore)
+                {
+                    _bestSolution = solution;
+                    _bestScore = score;
+                }
+            }
+        }
+
+        /// <summary>
+        /// Get the shared best solution if it is better than the given score
+        /// </summary>
+        public bool TryGetBetter(double score, out SchedulingSolution solution, out double bestScore)
+        {
+            lock (_lock)
+            {
+                if (_bestSolution != null && _bestScore > score)
+                {
+                    solution = _bestSolution;
+                    bestScore = _bestScore;
+                    return true;
+                }
+            }
+
+            solution = null;
+            bestScore = score;
+            return false;
+        }
+    }
+}
@@ -9,7 +9,7 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.LS
     public class SimulatedAnnealingController
     {
         private readonly ILogger<SimulatedAnnealingController> _logger;
-        private readonly Random _random = new Random();
+        private readonly Random _random;
 
         private double _initialTemperature;
         private readonly double _finalTemperature;
@@ -74,6 +74,7 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.LS
         public SimulatedAnnealingController(ILogger<SimulatedAnnealingController> logger)
         {
             _logger = logger;
+            _random = new Random();
             _initialTemperature = 100.0;
             _finalTemperature = 0.1;
             _coolingRate = 0.95;
@@ -92,15 +93,18 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.LS
         /// <param name="coolingRate">Cooling rate</param>
         /// <param name="maxIterations">Maximum iterations</param>
         /// <param name="maxNoImprovementIterations">Maximum iterations allowed without improvement</param>
+        /// <param name="seed">Random seed for acceptance decisions, null for a time-based seed</param>
         public SimulatedAnnealingController(
             ILogger<SimulatedAnnealingController> logger,
             double initialTemp,
             double finalTemp,
             double coolingRate,
             int maxIterations,
-            int maxNoImprovementIterations)
+            int maxNoImprovementIterations,
+            int? seed = null)
         {
             _logger = logger;
+            _random = seed.HasValue ? new Random(seed.Value) : new Random();
             _initialTemperature = initialTemp;
             _finalTemperature = finalTemp;
             _coolingRate = coolingRate;
@@ -110,6 +114,25 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.LS
             Reset();
         }
 
+        /// <summary>
+        /// Create an independent controller with the same settings and a scaled initial temperature.
+        /// Each parallel search run needs its own controller, since the controller state is not thread-safe
+        /// </summary>
+        /// <param name="temperatureScale">Factor applied to the initial temperature</param>
+        /// <param name="seed">Random seed for acceptance decisions, null for a time-based seed</param>
+        /// <param name="maxIterations">Iteration limit of the new controller, null to keep the current limit</param>
+        public SimulatedAnnealingController CreateVariant(double temperatureScale, int? seed, int? maxIterations = null)
+        {
+            return new SimulatedAnnealingController(
+                _logger,
+                Math.Max(_initialTemperature * temperatureScale, _finalTemperature),
+                _finalTemperature,
+                _coolingRate,
+                maxIterations ?? _maxIterations,
+                _maxNoImprovementIterations,
+                seed);
+        }
+
         /// <summary>
         /// Reset to initial state
         /// </summary>
@@ -168,7 +191,7 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.LS
         }
 
         /// <summary>
-        /// Cool down temperature (each call represents one iteration)
+        /// Cool down temperature (each call represents one iteration and is made before the iteration runs)
         /// </summary>
         /// <returns>Whether to stop search</returns>
         public bool Cool()
@@ -192,7 +215,7 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.LS
 
             // Check if should stop search
             bool shouldStop =
-                _currentIteration >= _maxIterations || // Reached maximum iterations
+                _currentIteration > _maxIterations || // Reached maximum iterations
                 _currentTemperature <= _finalTemperature || // Temperature reached minimum
                 _noImprovementCount >= _maxNoImprovementIterations; // No improvement for too long
 
@@ -201,7 +224,7 @@ namespace SmartSchedulingSystem.Scheduling.Algorithms.LS
                 _logger.LogInformation($"Search ended, iteration: {_currentIteration}, temperature: {_currentTemperature:F6}, best score: {_bestScore:F4}");
 
                 // Log stop reason
-                if (_currentIteration >= _maxIterations)
+                if (_currentIteration > _maxIterations)
                 {
                     _logger.LogInformation("Stop reason: Reached maximum iterations");
                 }
@@ -0,0 +1,87 @@
+using SmartSchedulingSystem.Scheduling.Algorithms.LS.Moves;
+using SmartSchedulingSystem.Scheduling.Models;
+using System;
+using System.Collections.Generic;
+using System.Linq;
+
+namespace SmartSchedulingSystem.Scheduling.Algorithms.LS
+{
+    /// <summary>
+    /// Short-term tabu memory of a local search run.
+    /// When a move is accepted, the placements its assignments left become tabu for the tenure, so the search
+    /// does not undo a recent move. A tabu move is still allowed when it improves on the best score (aspiration).
+    /// Not thread-safe, every run owns its own list
+    /// </summary>
+    public class TabuList
+    {
+        private readonly Dictionary<long, int> _expiry = new Dictionary<long, int>();
+
+        /// <param name="tenure">Number of iterations a placement stays tabu, 0 disables the list</param>
+        public TabuList(int tenure)
+        {
+            if (tenure < 0)
+                throw new ArgumentOutOfRangeException(nameof(tenure), "Tabu tenure cannot be negative");
+
+            Tenure = tenure;
+        }
+
+        /// <summary>
+        /// Number of iterations a placement stays tabu
+        /// </summary>
+        public int Tenure { get; }
+
+        /// <summary>
+        /// Number of stored placements, including expired ones not yet removed
+        /// </summary>
+        public int Count => _expiry.Count;
+
+        /// <summary>
+        /// Make the placements the changed assignments leave tabu
+        /// </summary>
+        /// <param name="changes">Changes of the accepted move</param>
+        /// <param name="iteration">Iteration the move was accepted in</param>
+        public void Add(IReadOnlyList<AssignmentChange> changes, int iteration)
+        {
+            if (Tenure == 0)
+                return;
+
+            foreach (var change in changes)
+            {
+                _expiry[MoveSignature.Of(change.Before)] = iteration + Tenure;
+            }
+
+            // Expired placements are removed in bulk once the list is much larger than the tenure requires
+            if (_expiry.Count > Tenure * 16)
+            {
+                foreach (var key in _expiry.Where(kv => kv.Value < iteration).Select(kv => kv.Key).ToList())
+                {
+                    _expiry.Remove(key);
+                }
+            }
+        }
+
+        /// <summary>
+        /// Whether the move would return an assignment to a placement it left within the tenure
+        /// </summary>
+        /// <param name="changes">Changes of the candidate move</param>
+        /// <param name="iteration">Current iteration</param>
+        public bool IsTabu(IReadOnlyList<AssignmentChange> changes, int iteration)
+        {
+            if (Tenure == 0 || _expiry.Count == 0)
+                return false;
+
+            foreach (var change in changes)
+            {
+                if (_expiry.TryGetValue(MoveSignature.Of(change.After), out int expiry) && expiry >= iteration)
+                    return true;
+            }
+
+            return false;
+        }
+
+        public void Clear()
+        {
+            _expiry.Clear();
+        }
+    }
+}
@@ -0,0 +1,17 @@
+using SmartSchedulingSystem.Scheduling.Models;
+
+namespace SmartSchedulingSystem.Scheduling.Constraints
+{
+    /// <summary>
+    /// 支持增量评估的约束接口，局部搜索中只根据移动改变的分配计算分数变化
+    /// </summary>
+    public interface IIncrementalConstraint : IConstraint
+    {
+        /// <summary>
+        /// 为解决方案创建增量评估状态（按教师/教室/时间槽维护的计数）
+        /// </summary>
+        /// <param name="solution">初始解决方案</param>
+        /// <returns>增量状态；如果该解决方案无法增量评估则返回null，调用方应回退到完整评估</returns>
+        IncrementalConstraintState CreateState(SchedulingSolution solution);
+    }
+}
@@ -0,0 +1,250 @@
+using System;
+using System.Collections.Generic;
+using SmartSchedulingSystem.Scheduling.Models;
+
+namespace SmartSchedulingSystem.Scheduling.Constraints
+{
+    /// <summary>
+    /// 增量约束状态基类。状态属于单个解决方案（单个搜索线程），约束实例本身保持无状态，
+    /// 因此并行局部搜索可以共享同一组约束单例
+    /// </summary>
+    public abstract class IncrementalConstraintState
+    {
+        /// <summary>
+        /// 当前维护的约束评分（0-1），与对同一解决方案调用Evaluate的结果一致
+        /// </summary>
+        public abstract double Score { get; }
+
+        /// <summary>
+        /// 将一个分配加入维护的状态
+        /// </summary>
+        protected abstract void Add(AssignmentPlacement placement);
+
+        /// <summary>
+        /// 从维护的状态中移除一个分配
+        /// </summary>
+        protected abstract void Remove(AssignmentPlacement placement);
+
+        /// <summary>
+        /// 用解决方案中的所有分配初始化状态
+        /// </summary>
+        protected void Initialize(SchedulingSolution solution)
+        {
+            foreach (var assignment in solution.Assignments)
+            {
+                Add(AssignmentPlacement.From(assignment));
+            }
+        }
+
+        /// <summary>
+        /// 提交变化（先移除所有旧位置再加入新位置，保证交换移动的正确性）
+        /// </summary>
+        public void Apply(IReadOnlyList<AssignmentChange> changes)
+        {
+            for (int i = 0; i < changes.Count; i++)
+                Remove(changes[i].Before);
+            for (int i = 0; i < changes.Count; i++)
+                Add(changes[i].After);
+        }
+
+        /// <summary>
+        /// 撤销之前提交的变化
+        /// </summary>
+        public void Revert(IReadOnlyList<AssignmentChange> changes)
+        {
+            for (int i = 0; i < changes.Count; i++)
+                Remove(changes[i].After);
+            for (int i = 0; i < changes.Count; i++)
+                Add(changes[i].Before);
+        }
+
+        /// <summary>
+        /// 计算应用变化后的评分变化量，不改变维护的状态
+        /// </summary>
+        public double EvaluateDelta(IReadOnlyList<AssignmentChange> changes)
+        {
+            if (changes == null || changes.Count == 0)
+                return 0.0;
+
+            double before = Score;
+            Apply(changes);
+            double after = Score;
+            Revert(changes);
+            return after - before;
+        }
+    }
+
+    /// <summary>
+    /// 按分配独立计分的约束状态：每个分配贡献整数的(满足数, 计数)，评分由累计值计算
+    /// </summary>
+    public sealed class AssignmentCountState : IncrementalConstraintState
+    {
+        private readonly Func<AssignmentPlacement, (int Value, int Count)> _contribution;
+        private readonly Func<int, int, double> _score;
+        private int _value;
+        private int _count;
+
+        public AssignmentCountState(
+            SchedulingSolution solution,
+            Func<AssignmentPlacement, (int Value, int Count)> contribution,
+            Func<int, int, double> score)
+        {
+            _contribution = contribution ?? throw new ArgumentNullException(nameof(contribution));
+            _score = score ?? throw new ArgumentNullException(nameof(score));
+            Initialize(solution);
+        }
+
+        public override double Score => _score(_value, _count);
+
+        protected override void Add(AssignmentPlacement placement)
+        {
+            var (value, count) = _contribution(placement);
+            _value += value;
+            _count += count;
+        }
+
+        protected override void Remove(AssignmentPlacement placement)
+        {
+            var (value, count) = _contribution(placement);
+            _value -= value;
+            _count -= count;
+        }
+    }
+
+    /// <summary>
+    /// 资源占用状态：按(资源, 时间槽)维护占用计数和冲突键数量，用于教师/教室冲突约束
+    /// </summary>
+    public sealed class ResourceOccupancyState : IncrementalConstraintState
+    {
+        private readonly Func<AssignmentPlacement, (int ResourceId, int TimeSlotId)> _keySelector;
+        private readonly Dictionary<(int ResourceId, int TimeSlotId), int> _occupancy = new Dictionary<(int ResourceId, int TimeSlotId), int>();
+        private int _conflictingKeys;
+
+        public ResourceOccupancyState(
+            SchedulingSolution solution,
+            Func<AssignmentPlacement, (int ResourceId, int TimeSlotId)> keySelector)
+        {
+            _keySelector = keySelector ?? throw new ArgumentNullException(nameof(keySelector));
+            Initialize(solution);
+        }
+
+        /// <summary>
+        /// 被多个分配占用的(资源, 时间槽)数量
+        /// </summary>
+        public int ConflictCount => _conflictingKeys;
+
+        public override double Score => _conflictingKeys == 0 ? 1.0 : 0.0;
+
+        protected override void Add(AssignmentPlacement placement)
+        {
+            var key = _keySelector(placement);
+            _occupancy.TryGetValue(key, out int count);
+            count++;
+            _occupancy[key] = count;
+
+            if (count == 2)
+                _conflictingKeys++;
+        }
+
+        protected override void Remove(AssignmentPlacement placement)
+        {
+            var key = _keySelector(placement);
+            if (!_occupancy.TryGetValue(key, out int count))
+                return;
+
+            if (count == 2)
+                _conflictingKeys--;
+
+            if (count <= 1)
+                _occupancy.Remove(key);
+            else
+                _occupancy[key] = count - 1;
+        }
+    }
+
+    /// <summary>
+    /// 按教师分组计分的约束状态：分配变化时只重新计算受影响教师的贡献
+    /// </summary>
+    public sealed class TeacherScheduleState : IncrementalConstraintState
+    {
+        private readonly Func<int, List<AssignmentPlacement>, (int Value, int Count)> _teacherContribution;
+        private readonly Func<int, int, double> _score;
+        private readonly Dictionary<int, List<AssignmentPlacement>> _placementsByTeacher = new Dictionary<int, List<AssignmentPlacement>>();
+        private readonly Dictionary<int, (int Value, int Count)> _contributions = new Dictionary<int, (int Value, int Count)>();
+        private int _value;
+        private int _count;
+
+        public TeacherScheduleState(
+            SchedulingSolution solution,
+            Func<int, List<AssignmentPlacement>, (int Value, int Count)> teacherContribution,
+            Func<int, int, double> score)
+        {
+            _teacherContribution = teacherContribution ?? throw new ArgumentNullException(nameof(teacherContribution));
+            _score = score ?? throw new ArgumentNullException(nameof(score));
+
+            foreach (var assignment in solution.Assignments)
+            {
+                var placement = AssignmentPlacement.From(assignment);
+                if (!_placementsByTeacher.TryGetValue(placement.TeacherId, out var placements))
+                {
+                    placements = new List<AssignmentPlacement>();
+                    _placementsByTeacher[placement.TeacherId] = placements;
+                }
+                placements.Add(placement);
+            }
+
+            foreach (var teacherId in _placementsByTeacher.Keys)
+            {
+                Recalculate(teacherId);
+            }
+        }
+
+        public override double Score => _score(_value, _count);
+
+        protected override void Add(AssignmentPlacement placement)
+        {
+            if (!_placementsByTeacher.TryGetValue(placement.TeacherId, out var placements))
+            {
+                placements = new List<AssignmentPlacement>();
+                _placementsByTeacher[placement.TeacherId] = placements;
+            }
+
+            placements.Add(placement);
+            Recalculate(placement.TeacherId);
+        }
+
+        protected override void Remove(AssignmentPlacement placement)
+        {
+            if (!_placementsByTeacher.TryGetValue(placement.TeacherId, out var placements))
+                return;
+
+            int index = placements.FindIndex(p => p.AssignmentId == placement.AssignmentId);
+            if (index < 0)
+                return;
+
+            placements.RemoveAt(index);
+            if (placements.Count == 0)
+                _placementsByTeacher.Remove(placement.TeacherId);
+
+            Recalculate(placement.TeacherId);
+        }
+
+        private void Recalculate(int teacherId)
+        {
+            if (_contributions.TryGetValue(teacherId, out var previous))
+            {
+                _value -= previous.Value;
+                _count -= previous.Count;
+                _contributions.Remove(teacherId);
+            }
+
+            if (_placementsByTeacher.TryGetValue(teacherId, out var placements))
+            {
+                var current = _teacherContribution(teacherId, placements);
+                _contributions[teacherId] = current;
+                _value += current.Value;
+                _count += current.Count;
+            }
+        }
+    }
+}
@@ -10,10 +10,11 @@ namespace SmartSchedulingSystem.Scheduling.Constraints.Level1_CoreHard
     /// Classroom capacity constraint: Ensures classroom capacity meets course enrollment requirements
     /// Core hard constraint - Level1_CoreHard
     /// </summary>
-    public class ClassroomCapacityConstraint : BaseConstraint
+    public class ClassroomCapacityConstraint : BaseConstraint, IIncrementalConstraint
     {
         private readonly Dictionary<int, int> _classroomCapacities;
         private readonly Dictionary<int, int> _expectedEnrollments;
+        private readonly object _lookupLock = new object();
 
         public override int Id => 3;
         public override string Name => "Classroom Capacity";
@@ -49,23 +50,7 @@ namespace SmartSchedulingSystem.Scheduling.Constraints.Level1_CoreHard
 
             var conflicts = new List<SchedulingConflict>();
             
-            // Fill capacity dictionary (if empty)
-            if (_classroomCapacities.Count == 0 && solution.Problem?.Classrooms != null)
-            {
-                foreach (var classroom in solution.Problem.Classrooms)
-                {
-                    _classroomCapacities[classroom.Id] = classroom.Capacity;
-                }
-            }
-            
-            // Fill enrollment dictionary (if empty)
-            if (_expectedEnrollments.Count == 0 && solution.Problem?.CourseSections != null)
-            {
-                foreach (var section in solution.Problem.CourseSections)
-                {
-                    _expectedEnrollments[section.Id] = section.Enrollment;
-                }
-            }
+            EnsureLookups(solution.Problem);
 
             // Check if each assigned classroom's capacity meets course requirements
             foreach (var assignment in solution.Assignments)
@@ -103,5 +88,52 @@ namespace SmartSchedulingSystem.Scheduling.Constraints.Level1_CoreHard
             var (score, _) = Evaluate(solution);
             return score >= 1.0;
         }
+
+        public IncrementalConstraintState CreateState(SchedulingSolution solution)
+        {
+            if (solution == null)
+                throw new ArgumentNullException(nameof(solution));
+
+            EnsureLookups(solution.Problem);
+
+            // Count capacity violations; score is 1 only when there are none
+            return new AssignmentCountState(
+                solution,
+                p => (IsOverCapacity(p.ClassroomId, p.SectionId) ? 1 : 0, 0),
+                (violations, _) => violations == 0 ? 1.0 : 0.0);
+        }
+
+        private bool IsOverCapacity(int classroomId, int sectionId)
+        {
+            return _classroomCapacities.TryGetValue(classroomId, out int capacity) &&
+                   _expectedEnrollments.TryGetValue(sectionId, out int enrollment) &&
+                   capacity < enrollment;
+        }
+
+        private void EnsureLookups(SchedulingProblem problem)
+        {
+            // The constraint is a shared singleton evaluated by parallel local search runs,
+            // fill the lookups under a lock so no thread reads a dictionary being written
+            lock (_lookupLock)
+            {
+                // Fill capacity dictionary (if empty)
+                if (_classroomCapacities.Count == 0 && problem?.Classrooms != null)
+                {
+                    foreach (var classroom in problem.Classrooms)
+                    {
+                        _classroomCapacities[classroom.Id] = classroom.Capacity;
+                    }
+                }
+
+                // Fill enrollment dictionary (if empty)
+                if (_expectedEnrollments.Count == 0 && problem?.CourseSections != null)
+                {
+                    foreach (var section in problem.CourseSections)
+                    {
+                        _expectedEnrollments[section.Id] = section.Enrollment;
+                    }
+                }
+            }
+        }
     }
 } 
\ No newline at end of file
@@ -10,7 +10,7 @@ namespace SmartSchedulingSystem.Scheduling.Constraints.Level1_CoreHard
     /// Classroom conflict constraint: Ensures a classroom can only host one course at a time
     /// Core hard constraint - Level1_CoreHard
     /// </summary>
-    public class ClassroomConflictConstraint : BaseConstraint
+    public class ClassroomConflictConstraint : BaseConstraint, IIncrementalConstraint
     {
         public override int Id => 2;
         public override string Name => "Classroom Conflict Avoidance";
@@ -84,5 +84,14 @@ namespace SmartSchedulingSystem.Scheduling.Constraints.Level1_CoreHard
             var (score, _) = Evaluate(solution);
             return score >= 1.0;
         }
+
+        public IncrementalConstraintState CreateState(SchedulingSolution solution)
+        {
+            if (solution == null)
+                throw new ArgumentNullException(nameof(solution));
+
+            // Maintain occupancy counts per (classroom, time slot)
+            return new ResourceOccupancyState(solution, p => (p.ClassroomId, p.TimeSlotId));
+        }
     }
 } 
\ No newline at end of file
@@ -10,7 +10,7 @@ namespace SmartSchedulingSystem.Scheduling.Constraints.Level1_CoreHard
     /// Teacher conflict constraint: Ensures a teacher can only teach one course at a time
     /// Core hard constraint - Level1_CoreHard
     /// </summary>
-    public class TeacherConflictConstraint : BaseConstraint
+    public class TeacherConflictConstraint : BaseConstraint, IIncrementalConstraint
     {
         public override int Id => 1;
         public override string Name => "Teacher Conflict Avoidance";
@@ -84,5 +84,14 @@ namespace SmartSchedulingSystem.Scheduling.Constraints.Level1_CoreHard
             var (score, _) = Evaluate(solution);
             return score >= 1.0;
         }
+
+        public IncrementalConstraintState CreateState(SchedulingSolution solution)
+        {
+            if (solution == null)
+                throw new ArgumentNullException(nameof(solution));
+
+            // Maintain occupancy counts per (teacher, time slot)
+            return new ResourceOccupancyState(solution, p => (p.TeacherId, p.TimeSlotId));
+        }
     }
 } 
\ No newline at end of file
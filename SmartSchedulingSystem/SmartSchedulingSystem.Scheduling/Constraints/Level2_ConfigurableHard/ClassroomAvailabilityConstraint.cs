@@ -10,7 +10,7 @@ namespace SmartSchedulingSystem.Scheduling.Constraints.Level2_ConfigurableHard
     /// <summary>
     /// Classroom availability constraint - Classrooms can only be used during their available time slots
     /// </summary>
-    public class ClassroomAvailabilityConstraint : BaseConstraint, IConstraint
+    public class ClassroomAvailabilityConstraint : BaseConstraint, IIncrementalConstraint
     {
         /// <summary>
         /// Dictionary of classroom unavailable times (classroom ID -> list of unavailable times)
@@ -177,6 +177,28 @@ namespace SmartSchedulingSystem.Scheduling.Constraints.Level2_ConfigurableHard
             return Evaluate(solution).Score >= 1.0;
         }
 
+        /// <summary>
+        /// Create incremental state counting assignments placed in unavailable classroom time slots
+        /// </summary>
+        public IncrementalConstraintState CreateState(SchedulingSolution solution)
+        {
+            // Evaluate returns 0 for solutions without availability data; leave those to full evaluation
+            if (!IsValidSolution(solution))
+                return null;
+
+            // First record per (classroom, time slot) wins, matching the lookup in Evaluate
+            var availability = new Dictionary<(int ClassroomId, int TimeSlotId), bool>();
+            foreach (var record in solution.Problem.ClassroomAvailabilities)
+            {
+                availability.TryAdd((record.ClassroomId, record.TimeSlotId), record.IsAvailable);
+            }
+
+            return new AssignmentCountState(
+                solution,
+                p => (availability.TryGetValue((p.ClassroomId, p.TimeSlotId), out bool isAvailable) && !isAvailable ? 1 : 0, 0),
+                (violations, _) => violations == 0 ? 1.0 : 0.0);
+        }
+
         /// <summary>
         /// Check if two time periods overlap
         /// </summary>
@@ -12,7 +12,7 @@ namespace SmartSchedulingSystem.Scheduling.Constraints.Level2_ConfigurableHard
     /// <summary>
     /// Teacher availability constraint - Teachers can only teach during their available time slots
     /// </summary>
-    public class TeacherAvailabilityConstraint : BaseConstraint, IConstraint
+    public class TeacherAvailabilityConstraint : BaseConstraint, IIncrementalConstraint
     {
         /// <summary>
         /// Dictionary of teacher unavailable times (teacher ID -> list of unavailable times)
@@ -174,6 +174,28 @@ namespace SmartSchedulingSystem.Scheduling.Constraints.Level2_ConfigurableHard
             return Evaluate(solution).Score >= 1.0;
         }
 
+        /// <summary>
+        /// Create incremental state counting assignments placed in unavailable teacher time slots
+        /// </summary>
+        public IncrementalConstraintState CreateState(SchedulingSolution solution)
+        {
+            // Evaluate returns 0 for solutions without availability data; leave those to full evaluation
+            if (!IsValidSolution(solution))
+                return null;
+
+            // First record per (teacher, time slot) wins, matching the lookup in Evaluate
+            var availability = new Dictionary<(int TeacherId, int TimeSlotId), bool>();
+            foreach (var record in solution.Problem.TeacherAvailabilities)
+            {
+                availability.TryAdd((record.TeacherId, record.TimeSlotId), record.IsAvailable);
+            }
+
+            return new AssignmentCountState(
+                solution,
+                p => (availability.TryGetValue((p.TeacherId, p.TimeSlotId), out bool isAvailable) && !isAvailable ? 1 : 0, 0),
+                (violations, _) => violations == 0 ? 1.0 : 0.0);
+        }
+
         /// <summary>
         /// Check if two time periods overlap
         /// </summary>
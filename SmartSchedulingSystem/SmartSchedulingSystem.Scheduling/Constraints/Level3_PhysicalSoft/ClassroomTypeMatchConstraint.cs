@@ -7,7 +7,7 @@ using SmartSchedulingSystem.Scheduling.Models;
 
 namespace SmartSchedulingSystem.Scheduling.Constraints.Level3_PhysicalSoft
 {
-    public class ClassroomTypeMatchConstraint : IConstraint
+    public class ClassroomTypeMatchConstraint : IIncrementalConstraint
     {
         private readonly Dictionary<int, string> _courseSectionTypes; // Section ID -> Course type
         private readonly Dictionary<int, string> _classroomTypes; // Classroom ID -> Classroom type
@@ -126,5 +126,28 @@ namespace SmartSchedulingSystem.Scheduling.Constraints.Level3_PhysicalSoft
         {
             throw new NotImplementedException();
         }
+
+        public IncrementalConstraintState CreateState(SchedulingSolution solution)
+        {
+            if (solution == null)
+                throw new ArgumentNullException(nameof(solution));
+
+            // Each assignment counts once; it scores when the types match or are unknown
+            return new AssignmentCountState(
+                solution,
+                p => (IsMatchingAssignment(p.SectionId, p.ClassroomId) ? 1 : 0, 1),
+                (matching, total) => total > 0 ? (double)matching / total : 1.0);
+        }
+
+        private bool IsMatchingAssignment(int sectionId, int classroomId)
+        {
+            if (_courseSectionTypes.TryGetValue(sectionId, out string courseType) &&
+                _classroomTypes.TryGetValue(classroomId, out string classroomType))
+            {
+                return IsTypeMatching(courseType, classroomType);
+            }
+
+            return true;
+        }
     }
 } 
\ No newline at end of file
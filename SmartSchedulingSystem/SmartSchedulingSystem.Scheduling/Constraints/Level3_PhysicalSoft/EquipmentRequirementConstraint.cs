@@ -7,7 +7,7 @@ using SmartSchedulingSystem.Scheduling.Models;
 
 namespace SmartSchedulingSystem.Scheduling.Constraints.Level3_PhysicalSoft
 {
-    public class EquipmentRequirementConstraint : IConstraint
+    public class EquipmentRequirementConstraint : IIncrementalConstraint
     {
         private readonly Dictionary<int, List<string>> _sectionRequiredEquipment; // Section ID -> List of required equipment
         private readonly Dictionary<int, List<string>> _classroomEquipment; // Classroom ID -> List of available equipment
@@ -118,5 +118,31 @@ namespace SmartSchedulingSystem.Scheduling.Constraints.Level3_PhysicalSoft
         {
             throw new NotImplementedException();
         }
+
+        public IncrementalConstraintState CreateState(SchedulingSolution solution)
+        {
+            if (solution == null)
+                throw new ArgumentNullException(nameof(solution));
+
+            // Only assignments whose section has equipment requirements are counted
+            return new AssignmentCountState(
+                solution,
+                p => GetRequirementContribution(p.SectionId, p.ClassroomId),
+                (satisfied, total) => total > 0 ? (double)satisfied / total : 1.0);
+        }
+
+        private (int Satisfied, int Total) GetRequirementContribution(int sectionId, int classroomId)
+        {
+            if (!_sectionRequiredEquipment.TryGetValue(sectionId, out List<string> requiredEquipment) ||
+                requiredEquipment.Count == 0)
+            {
+                return (0, 0);
+            }
+
+            bool satisfied = _classroomEquipment.TryGetValue(classroomId, out List<string> availableEquipment) &&
+                             requiredEquipment.All(req => availableEquipment.Contains(req));
+
+            return (satisfied ? 1 : 0, 1);
+        }
     }
 } 
\ No newline at end of file
@@ -10,7 +10,7 @@ namespace SmartSchedulingSystem.Scheduling.Constraints.Level3_PhysicalSoft
     /// <summary>
     /// Resource compliance constraint - Combines physical resource matching constraints
     /// </summary>
-    public class ResourceComplianceConstraint : BaseConstraint, IConstraint
+    public class ResourceComplianceConstraint : BaseConstraint, IIncrementalConstraint
     {
         /// <summary>
         /// Feature switches
@@ -116,6 +116,17 @@ namespace SmartSchedulingSystem.Scheduling.Constraints.Level3_PhysicalSoft
             return (finalScore, allConflicts);
         }
 
+        /// <summary>
+        /// Create incremental state; (section, classroom) checks are cached so each move only re-checks changed pairs
+        /// </summary>
+        public IncrementalConstraintState CreateState(SchedulingSolution solution)
+        {
+            if (solution?.Problem == null || solution.Assignments == null)
+                return null;
+
+            return new ResourceComplianceState(this, solution);
+        }
+
         private bool IsValidSolution(SchedulingSolution solution)
         {
             return solution != null && 
@@ -326,6 +337,137 @@ namespace SmartSchedulingSystem.Scheduling.Constraints.Level3_PhysicalSoft
             };
         }
 
+        /// <summary>
+        /// Maintained mismatch counts for the classroom type and equipment sub-scores
+        /// </summary>
+        private sealed class ResourceComplianceState : IncrementalConstraintState
+        {
+            private readonly ResourceComplianceConstraint _owner;
+            private readonly bool _useEnhancedData;
+            private readonly Dictionary<int, CourseResourceRequirement> _requirements = new Dictionary<int, CourseResourceRequirement>();
+            private readonly Dictionary<int, ClassroomResource> _resources = new Dictionary<int, ClassroomResource>();
+            private readonly Dictionary<int, CourseSectionInfo> _sections = new Dictionary<int, CourseSectionInfo>();
+            private readonly Dictionary<int, ClassroomInfo> _classrooms = new Dictionary<int, ClassroomInfo>();
+            private readonly Dictionary<(int SectionId, int ClassroomId), (bool TypeMismatch, bool HasEquipmentRequirement, bool EquipmentMismatch)> _pairCache =
+                new Dictionary<(int SectionId, int ClassroomId), (bool TypeMismatch, bool HasEquipmentRequirement, bool EquipmentMismatch)>();
+
+            private int _typeValid;
+            private int _typeMismatch;
+            private int _equipmentTotal;
+            private int _equipmentMismatch;
+
+            public ResourceComplianceState(ResourceComplianceConstraint owner, SchedulingSolution solution)
+            {
+                _owner = owner;
+                var problem = solution.Problem;
+
+                _useEnhancedData = problem.CourseResourceRequirements != null &&
+                                   problem.CourseResourceRequirements.Any() &&
+                                   problem.ClassroomResources != null &&
+                                   problem.ClassroomResources.Any();
+
+                // First match wins, as with FirstOrDefault in the full evaluation
+                if (_useEnhancedData)
+                {
+                    foreach (var requirement in problem.CourseResourceRequirements)
+                        _requirements.TryAdd(requirement.CourseSectionId, requirement);
+                    foreach (var resource in problem.ClassroomResources)
+                        _resources.TryAdd(resource.ClassroomId, resource);
+                }
+                else
+                {
+                    foreach (var section in problem.CourseSections ?? new List<CourseSectionInfo>())
+                        _sections.TryAdd(section.Id, section);
+                    foreach (var classroom in problem.Classrooms ?? new List<ClassroomInfo>())
+                        _classrooms.TryAdd(classroom.Id, classroom);
+                }
+
+                Initialize(solution);
+            }
+
+            public override double Score
+            {
+                get
+                {
+                    double typeScore = _typeValid > 0 ? Math.Max(0, 1.0 - ((double)_typeMismatch / _typeValid)) : 1.0;
+                    double equipmentScore = _equipmentTotal > 0 ? Math.Max(0, 1.0 - ((double)_equipmentMismatch / _equipmentTotal)) : 1.0;
+
+                    // Equal 0.5 weights, so the weighted average is the mean of the enabled sub-scores
+                    if (_owner._enableClassroomTypeMatch && _owner._enableEquipmentRequirement)
+                        return typeScore * 0.5 + equipmentScore * 0.5;
+                    if (_owner._enableClassroomTypeMatch)
+                        return typeScore;
+                    if (_owner._enableEquipmentRequirement)
+                        return equipmentScore;
+                    return 1.0;
+                }
+            }
+
+            protected override void Add(AssignmentPlacement placement) => Update(placement, 1);
+
+            protected override void Remove(AssignmentPlacement placement) => Update(placement, -1);
+
+            private void Update(AssignmentPlacement placement, int sign)
+            {
+                if (placement.ClassroomId <= 0)
+                    return;
+
+                var key = (placement.SectionId, placement.ClassroomId);
+                if (!_pairCache.TryGetValue(key, out var check))
+                {
+                    check = CheckPair(placement.SectionId, placement.ClassroomId);
+                    _pairCache[key] = check;
+                }
+
+                _typeValid += sign;
+                if (check.TypeMismatch)
+                    _typeMismatch += sign;
+                if (check.HasEquipmentRequirement)
+                {
+                    _equipmentTotal += sign;
+                    if (check.EquipmentMismatch)
+                        _equipmentMismatch += sign;
+                }
+            }
+
+            private (bool TypeMismatch, bool HasEquipmentRequirement, bool EquipmentMismatch) CheckPair(int sectionId, int classroomId)
+            {
+                if (_useEnhancedData)
+                {
+                    _requirements.TryGetValue(sectionId, out var requirement);
+                    _resources.TryGetValue(classroomId, out var resource);
+                    if (requirement == null || resource == null)
+                        return (false, false, false);
+
+                    bool typeMismatch = requirement.PreferredRoomTypes.Any() &&
+                                        !requirement.PreferredRoomTypes.Contains(resource.RoomType);
+                    bool hasRequirement = requirement.ResourceTypes.Any();
+                    bool equipmentMismatch = hasRequirement &&
+                                             requirement.ResourceTypes.Any(e => !resource.ResourceTypes.Contains(e));
+                    return (typeMismatch, hasRequirement, equipmentMismatch);
+                }
+
+                _sections.TryGetValue(sectionId, out var course);
+                _classrooms.TryGetValue(classroomId, out var classroom);
+                if (course == null || classroom == null)
+                    return (false, false, false);
+
+                bool traditionalTypeMismatch = !string.IsNullOrEmpty(course.RequiredClassroomType) &&
+                                               classroom.ClassroomType != course.RequiredClassroomType;
+                bool hasEquipmentRequirement = !string.IsNullOrEmpty(course.RequiredEquipment);
+                bool traditionalEquipmentMismatch = false;
+                if (hasEquipmentRequirement)
+                {
+                    var classroomEquipmentList = (classroom.Equipment ?? string.Empty).Split(',').Select(e => e.Trim()).ToList();
+                    traditionalEquipmentMismatch = course.RequiredEquipment.Split(',')
+                        .Select(e => e.Trim())
+                        .Any(e => !classroomEquipmentList.Contains(e));
+                }
+
+                return (traditionalTypeMismatch, hasEquipmentRequirement, traditionalEquipmentMismatch);
+            }
+        }
+
         private SchedulingConflict CreateEquipmentMismatchConflict(
             SchedulingSolution solution, CourseSectionInfo course, ClassroomInfo classroom, List<string> missingEquipment)
         {
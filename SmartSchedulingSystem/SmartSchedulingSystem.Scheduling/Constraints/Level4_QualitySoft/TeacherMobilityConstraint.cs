@@ -10,7 +10,7 @@ namespace SmartSchedulingSystem.Scheduling.Constraints.Level4_QualitySoft
     /// <summary>
     /// Teacher mobility constraint - Evaluates the reasonableness of teacher movement between different buildings
     /// </summary>
-    public class TeacherMobilityConstraint : BaseConstraint, IConstraint
+    public class TeacherMobilityConstraint : BaseConstraint, IIncrementalConstraint
     {
         /// <summary>
         /// Constraint definition ID
@@ -71,6 +71,74 @@ namespace SmartSchedulingSystem.Scheduling.Constraints.Level4_QualitySoft
             return EvaluateTeacherMobility(solution);
         }
 
+        /// <summary>
+        /// Create incremental state; only the teachers touched by a move have their days re-checked
+        /// </summary>
+        public IncrementalConstraintState CreateState(SchedulingSolution solution)
+        {
+            if (solution?.Problem == null || solution.Assignments == null)
+                return null;
+
+            var timeSlots = new Dictionary<int, TimeSlotInfo>();
+            foreach (var timeSlot in solution.Problem.TimeSlots)
+                timeSlots.TryAdd(timeSlot.Id, timeSlot);
+
+            var classrooms = new Dictionary<int, ClassroomInfo>();
+            foreach (var classroom in solution.Problem.Classrooms)
+                classrooms.TryAdd(classroom.Id, classroom);
+
+            // Value = consecutive pairs in different buildings, count = consecutive pairs
+            return new TeacherScheduleState(
+                solution,
+                (teacherId, placements) => CountTeacherMoves(teacherId, placements, timeSlots, classrooms),
+                (distantCount, totalConsecutive) => totalConsecutive > 0
+                    ? Math.Max(0, 1.0 - ((double)distantCount / totalConsecutive))
+                    : 1.0);
+        }
+
+        private (int DistantCount, int TotalConsecutive) CountTeacherMoves(
+            int teacherId,
+            List<AssignmentPlacement> placements,
+            Dictionary<int, TimeSlotInfo> timeSlots,
+            Dictionary<int, ClassroomInfo> classrooms)
+        {
+            if (teacherId <= 0)
+                return (0, 0);
+
+            int totalConsecutive = 0;
+            int distantCount = 0;
+
+            var placementsByDay = placements
+                .Where(p => p.ClassroomId > 0 && timeSlots.ContainsKey(p.TimeSlotId))
+                .GroupBy(p => timeSlots[p.TimeSlotId].DayOfWeek)
+                .Where(g => g.Key > 0);
+
+            foreach (var dayGroup in placementsByDay)
+            {
+                var dayPlacements = dayGroup.OrderBy(p => timeSlots[p.TimeSlotId].StartTime).ToList();
+
+                for (int i = 0; i < dayPlacements.Count - 1; i++)
+                {
+                    var currentTimeSlot = timeSlots[dayPlacements[i].TimeSlotId];
+                    var nextTimeSlot = timeSlots[dayPlacements[i + 1].TimeSlotId];
+
+                    if (!IsConsecutive(currentTimeSlot, nextTimeSlot))
+                        continue;
+
+                    totalConsecutive++;
+
+                    if (classrooms.TryGetValue(dayPlacements[i].ClassroomId, out var currentRoom) &&
+                        classrooms.TryGetValue(dayPlacements[i + 1].ClassroomId, out var nextRoom) &&
+                        currentRoom.Building != nextRoom.Building)
+                    {
+                        distantCount++;
+                    }
+                }
+            }
+
+            return (distantCount, totalConsecutive);
+        }
+
         private bool IsValidSolution(SchedulingSolution solution)
         {
             return solution != null && 
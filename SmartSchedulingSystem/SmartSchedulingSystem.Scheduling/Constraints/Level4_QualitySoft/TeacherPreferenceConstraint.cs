@@ -5,7 +5,7 @@ using SmartSchedulingSystem.Scheduling.Models;
 
 namespace SmartSchedulingSystem.Scheduling.Constraints.Level4_QualitySoft
 {
-    public class TeacherPreferenceConstraint : IConstraint
+    public class TeacherPreferenceConstraint : IIncrementalConstraint
     {
         private readonly Dictionary<(int TeacherId, int TimeSlotId), int> _preferences;
 
@@ -91,5 +91,17 @@ namespace SmartSchedulingSystem.Scheduling.Constraints.Level4_QualitySoft
         {
             throw new NotImplementedException();
         }
+
+        public IncrementalConstraintState CreateState(SchedulingSolution solution)
+        {
+            if (solution == null)
+                throw new ArgumentNullException(nameof(solution));
+
+            // Sum preference levels (neutral = 3, i.e. 0.6 points) and average them as level / 5
+            return new AssignmentCountState(
+                solution,
+                p => (_preferences.TryGetValue((p.TeacherId, p.TimeSlotId), out int preference) ? preference : 3, 1),
+                (levelSum, evaluated) => evaluated > 0 ? levelSum / (5.0 * evaluated) : 1.0);
+        }
     }
 }
\ No newline at end of file
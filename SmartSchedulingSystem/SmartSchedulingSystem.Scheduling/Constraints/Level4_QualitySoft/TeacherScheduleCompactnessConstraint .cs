@@ -7,7 +7,7 @@ using System.Threading.Tasks;
 
 namespace SmartSchedulingSystem.Scheduling.Constraints.Level4_QualitySoft
 {
-    public class TeacherScheduleCompactnessConstraint : IConstraint
+    public class TeacherScheduleCompactnessConstraint : IIncrementalConstraint
     {
         public int Id { get; } = 6;
         public string Name { get; } = "Teacher Schedule Compactness";
@@ -100,5 +100,58 @@ namespace SmartSchedulingSystem.Scheduling.Constraints.Level4_QualitySoft
         {
             throw new NotImplementedException();
         }
+
+        public IncrementalConstraintState CreateState(SchedulingSolution solution)
+        {
+            if (solution?.Problem?.TimeSlots == null)
+                return null;
+
+            var timeSlots = new Dictionary<int, TimeSlotInfo>();
+            foreach (var timeSlot in solution.Problem.TimeSlots)
+            {
+                timeSlots.TryAdd(timeSlot.Id, timeSlot);
+            }
+
+            // Value = compact days, count = teaching days, summed over teachers
+            return new TeacherScheduleState(
+                solution,
+                (_, placements) => CountCompactDays(placements, timeSlots),
+                (optimalDays, totalDays) => totalDays > 0 ? (double)optimalDays / totalDays : 1.0);
+        }
+
+        private (int OptimalDays, int TotalDays) CountCompactDays(List<AssignmentPlacement> placements, Dictionary<int, TimeSlotInfo> timeSlots)
+        {
+            int totalDays = 0;
+            int optimalDays = 0;
+
+            var dailyGroups = placements
+                .Select(p => timeSlots.TryGetValue(p.TimeSlotId, out var slot) ? slot : null)
+                .Where(slot => slot != null)
+                .GroupBy(slot => slot.DayOfWeek);
+
+            foreach (var dayGroup in dailyGroups)
+            {
+                totalDays++;
+
+                var daySlots = dayGroup.OrderBy(slot => slot.StartTime).ToList();
+                int maxConsecutive = 1;
+                int currentConsecutive = 1;
+
+                for (int i = 1; i < daySlots.Count; i++)
+                {
+                    if ((daySlots[i].StartTime - daySlots[i - 1].EndTime).TotalMinutes <= 15)
+                        currentConsecutive++;
+                    else
+                        currentConsecutive = 1;
+
+                    maxConsecutive = Math.Max(maxConsecutive, currentConsecutive);
+                }
+
+                if (maxConsecutive >= _maxConsecutiveHours)
+                    optimalDays++;
+            }
+
+            return (optimalDays, totalDays);
+        }
     }
 }
@@ -7,7 +7,7 @@ using System.Threading.Tasks;
 
 namespace SmartSchedulingSystem.Scheduling.Constraints.Level4_QualitySoft
 {
-    public class TeacherWorkloadConstraint : IConstraint
+    public class TeacherWorkloadConstraint : IIncrementalConstraint
     {
         public int Id { get; } = 5;
         public string Name { get; } = "Teacher Workload";
@@ -93,5 +93,40 @@ namespace SmartSchedulingSystem.Scheduling.Constraints.Level4_QualitySoft
         {
             throw new NotImplementedException();
         }
+
+        public IncrementalConstraintState CreateState(SchedulingSolution solution)
+        {
+            if (solution?.Problem?.TimeSlots == null)
+                return null;
+
+            var slotDays = new Dictionary<int, int>();
+            foreach (var timeSlot in solution.Problem.TimeSlots)
+            {
+                slotDays.TryAdd(timeSlot.Id, timeSlot.DayOfWeek);
+            }
+
+            // Each teacher counts once; only the teacher touched by a move is re-checked
+            return new TeacherScheduleState(
+                solution,
+                (teacherId, placements) => (IsCompliant(teacherId, placements, slotDays) ? 1 : 0, 1),
+                (compliant, teachers) => teachers > 0 ? (double)compliant / teachers : 1.0);
+        }
+
+        private bool IsCompliant(int teacherId, List<AssignmentPlacement> placements, Dictionary<int, int> slotDays)
+        {
+            int totalHours = placements.Count * 2; // Assume 2 hours per course
+
+            int maxPerDay = placements
+                .GroupBy(p => slotDays.TryGetValue(p.TimeSlotId, out int day) ? day : 0)
+                .Select(g => g.Count() * 2)
+                .DefaultIfEmpty(0)
+                .Max();
+
+            _maxWeeklyHours.TryGetValue(teacherId, out var weeklyLimit);
+            _maxDailyHours.TryGetValue(teacherId, out var dailyLimit);
+
+            return (weeklyLimit == 0 || totalHours <= weeklyLimit) &&
+                   (dailyLimit == 0 || maxPerDay <= dailyLimit);
+        }
     }
 } 
\ No newline at end of file
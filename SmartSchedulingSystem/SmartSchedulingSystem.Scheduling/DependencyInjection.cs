@@ -35,6 +35,7 @@ namespace SmartSchedulingSystem.Scheduling
             services.AddSingleton(parameters);
 
             // Register core components
+            services.AddSingleton<ConstraintProfiler>();
             services.AddSingleton<ConstraintManager>();
             services.AddSingleton<SolutionEvaluator>();
             services.AddSingleton<Algorithms.CP.SolutionConverter>();
@@ -77,6 +78,8 @@ namespace SmartSchedulingSystem.Scheduling
             });
             // Register CP model builder
             services.AddTransient<CPModelBuilder>();
+            services.AddTransient<Func<CPModelBuilder>>(provider => () => provider.GetRequiredService<CPModelBuilder>());
+            services.AddSingleton<ProblemDecomposer>();
 
             // Register CP engine
             services.AddTransient<CPScheduler>();
@@ -92,6 +95,8 @@ namespace SmartSchedulingSystem.Scheduling
             // Register hybrid engine
             services.AddTransient<CPLSScheduler>();
             services.AddTransient<EngineSelector>();
+            services.AddSingleton<SchedulingRunHistory>();
+            services.AddSingleton<RuntimePredictor>();
 
             // Register main engine
             services.AddTransient<SchedulingEngine>();
@@ -52,10 +52,11 @@ namespace SmartSchedulingSystem.Scheduling.Engine
         /// <summary>
         /// Constructor
         /// </summary>
-        public ConstraintManager(IEnumerable<IConstraint> constraints, ILogger<ConstraintManager> logger)
+        public ConstraintManager(IEnumerable<IConstraint> constraints, ILogger<ConstraintManager> logger, ConstraintProfiler profiler = null)
         {
             _constraints = constraints?.ToList() ?? new List<IConstraint>();
             _logger = logger;
+            Profiler = profiler ?? new ConstraintProfiler();
             
             // Initialize dictionaries
             foreach (var constraint in _constraints)
@@ -85,6 +86,11 @@ namespace SmartSchedulingSystem.Scheduling.Engine
             UseSimplifiedConstraints(true);
         }
 
+        /// <summary>
+        /// Profiler of the constraint evaluations made through this manager and its evaluators
+        /// </summary>
+        public ConstraintProfiler Profiler { get; }
+
         /// <summary>
         /// Set the constraint application level
         /// </summary>
@@ -335,7 +341,12 @@ namespace SmartSchedulingSystem.Scheduling.Engine
             {
                 try
                 {
-                    var (score, conflicts) = constraint.Evaluate(solution);
+                    List<SchedulingConflict> conflicts;
+                    double score;
+                    using (Profiler.Measure(constraint, ConstraintOperation.Evaluate))
+                    {
+                        (score, conflicts) = constraint.Evaluate(solution);
+                    }
                     var evaluation = new ConstraintEvaluation
                     {
                         Constraint = constraint,
@@ -382,7 +393,12 @@ namespace SmartSchedulingSystem.Scheduling.Engine
             {
                 try
                 {
-                    var (score, conflicts) = constraint.Evaluate(solution);
+                    List<SchedulingConflict> conflicts;
+                    double score;
+                    using (Profiler.Measure(constraint, ConstraintOperation.Evaluate))
+                    {
+                        (score, conflicts) = constraint.Evaluate(solution);
+                    }
                     var evaluation = new ConstraintEvaluation
                     {
                         Constraint = constraint,
@@ -429,7 +445,11 @@ namespace SmartSchedulingSystem.Scheduling.Engine
             {
                 try
                 {
-                    var (_, constraintConflicts) = constraint.Evaluate(solution);
+                    List<SchedulingConflict> constraintConflicts;
+                    using (Profiler.Measure(constraint, ConstraintOperation.Evaluate))
+                    {
+                        (_, constraintConflicts) = constraint.Evaluate(solution);
+                    }
                     if (constraintConflicts != null && constraintConflicts.Any())
                     {
                         conflicts.AddRange(constraintConflicts);
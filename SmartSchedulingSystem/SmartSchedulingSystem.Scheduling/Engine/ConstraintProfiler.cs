@@ -0,0 +1,299 @@
+using SmartSchedulingSystem.Scheduling.Constraints;
+using SmartSchedulingSystem.Scheduling.Models;
+using System;
+using System.Collections.Concurrent;
+using System.Collections.Generic;
+using System.Diagnostics;
+using System.Linq;
+using System.Threading;
+
+namespace SmartSchedulingSystem.Scheduling.Engine
+{
+    /// <summary>
+    /// Opt-in instrumentation of constraint operations and engine phases.
+    /// Records call counts, cumulative and percentile times and allocated bytes per constraint operation, and wall time
+    /// and allocated bytes per engine phase. While disabled, Measure and MeasurePhase return an empty scope and nothing
+    /// is read or recorded. Measurements go to the process-wide profile and to the profile of the current run, if any
+    /// </summary>
+    public sealed class ConstraintProfiler
+    {
+        // Durations kept per constraint operation for the percentile estimates
+        private const int SampleSize = 1024;
+
+        private readonly AsyncLocal<ProfileData> _currentRun = new AsyncLocal<ProfileData>();
+        private volatile ProfileData _global = new ProfileData();
+        private volatile bool _isEnabled;
+
+        public ConstraintProfiler(Utils.SchedulingParameters parameters = null)
+        {
+            _isEnabled = parameters?.EnableConstraintProfiling ?? false;
+        }
+
+        /// <summary>
+        /// Whether constraint operations and phases are recorded
+        /// </summary>
+        public bool IsEnabled
+        {
+            get => _isEnabled;
+            set => _isEnabled = value;
+        }
+
+        /// <summary>
+        /// Start measuring a constraint operation, dispose the scope when the operation returns
+        /// </summary>
+        public MeasurementScope Measure(IConstraint constraint, ConstraintOperation operation)
+        {
+            if (!_isEnabled || constraint == null)
+                return default;
+
+            return new MeasurementScope(this, constraint, operation, null,
+                Stopwatch.GetTimestamp(), GC.GetAllocatedBytesForCurrentThread());
+        }
+
+        /// <summary>
+        /// Start measuring an engine phase, dispose the scope when the phase ends.
+        /// Unlike Measure, allocated bytes are read process-wide with GC.GetTotalAllocatedBytes, because phases such as
+        /// the local search portfolio run on worker threads that a per-thread counter would miss. The figure therefore
+        /// also includes allocations of anything else running in the process at the same time, e.g. concurrent
+        /// scheduling requests in the API, and is only exact when the phase runs alone
+        /// </summary>
+        public MeasurementScope MeasurePhase(string phase)
+        {
+            if (!_isEnabled || string.IsNullOrEmpty(phase))
+                return default;
+
+            return new MeasurementScope(this, null, default, phase,
+                Stopwatch.GetTimestamp(), GC.GetTotalAllocatedBytes(false));
+        }
+
+        /// <summary>
+        /// Start a separate profile for the current scheduling run, including work it starts on other threads
+        /// </summary>
+        /// <returns>False if the profiler is disabled</returns>
+        public bool BeginRun()
+        {
+            if (!_isEnabled)
+                return false;
+
+            _currentRun.Value = new ProfileData();
+            return true;
+        }
+
+        /// <summary>
+        /// End the profile of the current run
+        /// </summary>
+        /// <returns>Measurements of the run, null if no run profile was started</returns>
+        public ConstraintProfile EndRun()
+        {
+            var run = _currentRun.Value;
+            _currentRun.Value = null;
+            return run?.ToProfile(_isEnabled);
+        }
+
+        /// <summary>
+        /// Process-wide measurements since the last reset
+        /// </summary>
+        public ConstraintProfile GetProfile()
+        {
+            return _global.ToProfile(_isEnabled);
+        }
+
+        /// <summary>
+        /// Discard the process-wide measurements
+        /// </summary>
+        public void Reset()
+        {
+            _global = new ProfileData();
+        }
+
+        private void Record(IConstraint constraint, ConstraintOperation operation, long elapsedTicks, long allocatedBytes)
+        {
+            _global.RecordConstraint(constraint, operation, elapsedTicks, allocatedBytes);
+            _currentRun.Value?.RecordConstraint(constraint, operation, elapsedTicks, allocatedBytes);
+        }
+
+        private void RecordPhase(string phase, long elapsedTicks, long allocatedBytes)
+        {
+            _global.RecordPhase(phase, elapsedTicks, allocatedBytes);
+            _currentRun.Value?.RecordPhase(phase, elapsedTicks, allocatedBytes);
+        }
+
+        private static double TicksToMicroseconds(double ticks) => ticks * 1_000_000.0 / Stopwatch.Frequency;
+
+        /// <summary>
+        /// Running measurement of a constraint operation or engine phase; default when the profiler is disabled
+        /// </summary>
+        public readonly struct MeasurementScope : IDisposable
+        {
+            private readonly ConstraintProfiler _profiler;
+            private readonly IConstraint _constraint;
+            private readonly ConstraintOperation _operation;
+            private readonly string _phase;
+            private readonly long _startTimestamp;
+            private readonly long _startAllocatedBytes;
+
+            internal MeasurementScope(
+                ConstraintProfiler profiler,
+                IConstraint constraint,
+                ConstraintOperation operation,
+                string phase,
+                long startTimestamp,
+                long startAllocatedBytes)
+            {
+                _profiler = profiler;
+                _constraint = constraint;
+                _operation = operation;
+                _phase = phase;
+                _startTimestamp = startTimestamp;
+                _startAllocatedBytes = startAllocatedBytes;
+            }
+
+            public void Dispose()
+            {
+                if (_profiler == null)
+                    return;
+
+                long elapsedTicks = Stopwatch.GetTimestamp() - _startTimestamp;
+                if (_phase != null)
+                {
+                    // Process-wide, see MeasurePhase
+                    _profiler.RecordPhase(_phase, elapsedTicks, GC.GetTotalAllocatedBytes(false) - _startAllocatedBytes);
+                }
+                else
+                {
+                    _profiler.Record(_constraint, _operation, elapsedTicks, GC.GetAllocatedBytesForCurrentThread() - _startAllocatedBytes);
+                }
+            }
+        }
+
+        private sealed class ProfileData
+        {
+            private readonly ConcurrentDictionary<(IConstraint Constraint, ConstraintOperation Operation), ConstraintStats> _constraints =
+                new ConcurrentDictionary<(IConstraint Constraint, ConstraintOperation Operation), ConstraintStats>();
+            private readonly ConcurrentDictionary<string, PhaseStats> _phases = new ConcurrentDictionary<string, PhaseStats>();
+            private readonly DateTime _since = DateTime.Now;
+            private int _phaseOrder;
+
+            public void RecordConstraint(IConstraint constraint, ConstraintOperation operation, long elapsedTicks, long allocatedBytes)
+            {
+                var stats = _constraints.GetOrAdd((constraint, operation), _ => new ConstraintStats());
+                stats.Add(elapsedTicks, allocatedBytes);
+            }
+
+            public void RecordPhase(string phase, long elapsedTicks, long allocatedBytes)
+            {
+                var stats = _phases.GetOrAdd(phase, _ => new PhaseStats(Interlocked.Increment(ref _phaseOrder)));
+                Interlocked.Increment(ref stats.Calls);
+                Interlocked.Add(ref stats.ElapsedTicks, elapsedTicks);
+                Interlocked.Add(ref stats.AllocatedBytes, allocatedBytes);
+            }
+
+            public ConstraintProfile ToProfile(bool enabled)
+            {
+                return new ConstraintProfile
+                {
+                    Enabled = enabled,
+                    Since = _since,
+                    Constraints = _constraints
+                        .Select(kv => kv.Value.ToEntry(kv.Key.Constraint, kv.Key.Operation))
+                        .OrderByDescending(e => e.TotalMs)
+                        .ToList(),
+                    Phases = _phases
+                        .OrderBy(kv => kv.Value.Order)
+                        .Select(kv => new PhaseProfileEntry
+                        {
+                            Phase = kv.Key,
+                            Calls = Interlocked.Read(ref kv.Value.Calls),
+                            TotalMs = TicksToMicroseconds(Interlocked.Read(ref kv.Value.ElapsedTicks)) / 1000.0,
+                            AllocatedBytes = Interlocked.Read(ref kv.Value.AllocatedBytes)
+                        })
+                        .ToList()
+                };
+            }
+        }
+
+        private sealed class ConstraintStats
+        {
+            // Reservoir sample of call durations (ticks), uniform over all calls
+            private readonly long[] _samples = new long[SampleSize];
+            private readonly Random _random = new Random(0);
+            private long _calls;
+            private long _elapsedTicks;
+            private long _maxTicks;
+            private long _allocatedBytes;
+
+            public void Add(long elapsedTicks, long allocatedBytes)
+            {
+                lock (_samples)
+                {
+                    if (_calls < SampleSize)
+                    {
+                        _samples[_calls] = elapsedTicks;
+                    }
+                    else
+                    {
+                        long index = _random.NextInt64(_calls + 1);
+                        if (index < SampleSize)
+                            _samples[index] = elapsedTicks;
+                    }
+
+                    _calls++;
+                    _elapsedTicks += elapsedTicks;
+                    _allocatedBytes += allocatedBytes;
+                    if (elapsedTicks > _maxTicks)
+                        _maxTicks = elapsedTicks;
+                }
+            }
+
+            public ConstraintProfileEntry ToEntry(IConstraint constraint, ConstraintOperation operation)
+            {
+                long[] sorted;
+                var entry = new ConstraintProfileEntry
+                {
+                    Constraint = constraint.Name ?? constraint.GetType().Name,
+                    Hierarchy = constraint.Hierarchy.ToString(),
+                    Operation = operation
+                };
+
+                lock (_samples)
+                {
+                    sorted = _samples.Take((int)Math.Min(_calls, SampleSize)).ToArray();
+                    entry.Calls = _calls;
+                    entry.TotalMs = TicksToMicroseconds(_elapsedTicks) / 1000.0;
+                    entry.MeanMicroseconds = _calls > 0 ? TicksToMicroseconds((double)_elapsedTicks / _calls) : 0;
+                    entry.MaxMicroseconds = TicksToMicroseconds(_maxTicks);
+                    entry.AllocatedBytes = _allocatedBytes;
+                }
+
+                Array.Sort(sorted);
+                entry.P50Microseconds = Percentile(sorted, 0.50);
+                entry.P95Microseconds = Percentile(sorted, 0.95);
+                entry.P99Microseconds = Percentile(sorted, 0.99);
+                return entry;
+            }
+
+            private static double Percentile(long[] sorted, double percentile)
+            {
+                if (sorted.Length == 0)
+                    return 0;
+
+                int index = (int)Math.Ceiling(percentile * sorted.Length) - 1;
+                return TicksToMicroseconds(sorted[Math.Clamp(index, 0, sorted.Length - 1)]);
+            }
+        }
+
+        private sealed class PhaseStats
+        {
+            public long Calls;
+            public long ElapsedTicks;
+            public long AllocatedBytes;
+
+            public PhaseStats(int order)
+            {
+                Order = order;
+            }
+
+            public int Order { get; }
+        }
+    }
+}
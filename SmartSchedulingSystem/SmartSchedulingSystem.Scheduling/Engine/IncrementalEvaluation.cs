@@ -0,0 +1,112 @@
+using System;
+using System.Collections.Generic;
+using SmartSchedulingSystem.Scheduling.Constraints;
+using SmartSchedulingSystem.Scheduling.Models;
+
+namespace SmartSchedulingSystem.Scheduling.Engine
+{
+    /// <summary>
+    /// Incremental evaluation context of a single solution during local search.
+    /// Holds per-constraint scores and incremental states so that a move can be scored
+    /// from the assignments it changes instead of re-evaluating the whole solution.
+    /// Instances are not thread-safe; each search thread should create its own.
+    /// </summary>
+    public sealed class IncrementalEvaluation
+    {
+        internal IncrementalEvaluation(
+            SchedulingSolution solution,
+            List<ConstraintEntry> hardConstraints,
+            List<ConstraintEntry> physicalSoftConstraints,
+            List<ConstraintEntry> qualitySoftConstraints)
+        {
+            Solution = solution ?? throw new ArgumentNullException(nameof(solution));
+            HardConstraints = hardConstraints;
+            PhysicalSoftConstraints = physicalSoftConstraints;
+            QualitySoftConstraints = qualitySoftConstraints;
+        }
+
+        /// <summary>
+        /// Solution the maintained state corresponds to
+        /// </summary>
+        public SchedulingSolution Solution { get; internal set; }
+
+        /// <summary>
+        /// Score of the current solution, same as SolutionEvaluator.Evaluate would return
+        /// </summary>
+        public double Score { get; internal set; }
+
+        /// <summary>
+        /// Whether the current solution satisfies all hard constraints
+        /// </summary>
+        public bool IsFeasible => !double.IsNegativeInfinity(Score);
+
+        /// <summary>
+        /// Number of moves scored through this context
+        /// </summary>
+        public long EvaluatedMoves { get; internal set; }
+
+        /// <summary>
+        /// Number of constraint evaluations that had to fall back to a full evaluation
+        /// </summary>
+        public long FullEvaluationFallbacks { get; internal set; }
+
+        internal List<ConstraintEntry> HardConstraints { get; }
+
+        internal List<ConstraintEntry> PhysicalSoftConstraints { get; }
+
+        internal List<ConstraintEntry> QualitySoftConstraints { get; }
+
+        /// <summary>
+        /// Get current score of a constraint
+        /// </summary>
+        /// <param name="constraintId">Constraint ID</param>
+        /// <param name="score">Constraint score (0-1)</param>
+        /// <returns>Whether the constraint is tracked by this context</returns>
+        public bool TryGetConstraintScore(int constraintId, out double score)
+        {
+            foreach (var entry in AllEntries())
+            {
+                if (entry.Constraint.Id == constraintId)
+                {
+                    score = entry.Score;
+                    return true;
+                }
+            }
+
+            score = 0;
+            return false;
+        }
+
+        internal IEnumerable<ConstraintEntry> AllEntries()
+        {
+            foreach (var entry in HardConstraints)
+                yield return entry;
+            foreach (var entry in PhysicalSoftConstraints)
+                yield return entry;
+            foreach (var entry in QualitySoftConstraints)
+                yield return entry;
+        }
+
+        /// <summary>
+        /// Constraint tracked by the context together with its incremental state
+        /// </summary>
+        internal sealed class ConstraintEntry
+        {
+            public ConstraintEntry(IConstraint constraint, IncrementalConstraintState state, double score)
+            {
+                Constraint = constraint;
+                State = state;
+                Score = score;
+            }
+
+            public IConstraint Constraint { get; }
+
+            /// <summary>
+            /// Incremental state, null if the constraint requires full evaluation
+            /// </summary>
+            public IncrementalConstraintState State { get; }
+
+            public double Score { get; set; }
+        }
+    }
+}
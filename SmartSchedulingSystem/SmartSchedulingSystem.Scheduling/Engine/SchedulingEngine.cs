@@ -5,7 +5,9 @@ using SmartSchedulingSystem.Scheduling.Models;
 using SmartSchedulingSystem.Scheduling.Utils;
 using System;
 using System.Collections.Generic;
+using System.Diagnostics;
 using System.Linq;
+using System.Threading;
 using Microsoft.Extensions.Logging;
 using SmartSchedulingSystem.Scheduling.Constraints;
 
@@ -24,6 +26,8 @@ namespace SmartSchedulingSystem.Scheduling.Engine
         private readonly ProblemAnalyzer _problemAnalyzer;
         private readonly SolutionEvaluator _solutionEvaluator;
         private readonly SolutionDiversifier _solutionDiversifier;
+        private readonly EngineSelector _engineSelector;
+        private readonly SchedulingRunHistory _runHistory;
 
         public SchedulingEngine(
             ILogger<SchedulingEngine> logger,
@@ -33,7 +37,9 @@ namespace SmartSchedulingSystem.Scheduling.Engine
             CPLSScheduler cplsScheduler,
             ProblemAnalyzer problemAnalyzer,
             SolutionEvaluator solutionEvaluator,
-            SolutionDiversifier solutionDiversifier)
+            SolutionDiversifier solutionDiversifier,
+            EngineSelector engineSelector,
+            SchedulingRunHistory runHistory)
         {
             _logger = logger ?? throw new ArgumentNullException(nameof(logger));
             _constraintManager = constraintManager ?? throw new ArgumentNullException(nameof(constraintManager));
@@ -43,6 +49,8 @@ namespace SmartSchedulingSystem.Scheduling.Engine
             _problemAnalyzer = problemAnalyzer ?? throw new ArgumentNullException(nameof(problemAnalyzer));
             _solutionEvaluator = solutionEvaluator ?? throw new ArgumentNullException(nameof(solutionEvaluator));
             _solutionDiversifier = solutionDiversifier ?? throw new ArgumentNullException(nameof(solutionDiversifier));
+            _engineSelector = engineSelector ?? throw new ArgumentNullException(nameof(engineSelector));
+            _runHistory = runHistory ?? throw new ArgumentNullException(nameof(runHistory));
             
             // Register global constraint manager, so it can be accessed in CPScheduler
             GlobalConstraintManager.Initialize(_constraintManager);
@@ -55,9 +63,21 @@ namespace SmartSchedulingSystem.Scheduling.Engine
         /// <param name="problem">Scheduling problem definition</param>
         /// <param name="parameters">Scheduling parameters</param>
         /// <param name="useSimplifiedMode">Whether to use simplified mode</param>
+        /// <param name="progress">Receives the current phase, new solutions and local search state</param>
+        /// <param name="cancellationToken">Stops the run early, the solutions found so far are returned</param>
         /// <returns>Scheduling result</returns>
-        public SchedulingResult GenerateSchedule(SchedulingProblem problem, Utils.SchedulingParameters parameters = null, bool useSimplifiedMode = false)
+        public SchedulingResult GenerateSchedule(
+            SchedulingProblem problem,
+            Utils.SchedulingParameters parameters = null,
+            bool useSimplifiedMode = false,
+            IProgress<SchedulingProgress> progress = null,
+            CancellationToken cancellationToken = default)
         {
+            var profiler = _constraintManager.Profiler;
+            bool profiling = profiler.BeginRun();
+            var runStopwatch = Stopwatch.StartNew();
+            CancellationTokenSource deadlineSource = null;
+
             try
             {
                 _logger.LogInformation("Starting to generate scheduling solution, using progressive constraint strategy...");
@@ -74,7 +94,12 @@ namespace SmartSchedulingSystem.Scheduling.Engine
                 }
 
                 // Analyze problem
-                var features = _problemAnalyzer.AnalyzeProblem(problem);
+                ReportPhase(progress, "Analysis", $"Analyzing problem with {problem.CourseSections.Count} course sections");
+                Utils.ProblemFeatures features;
+                using (profiler.MeasurePhase("Analysis"))
+                {
+                    features = _problemAnalyzer.AnalyzeProblem(problem);
+                }
                 _logger.LogInformation("Problem features: CourseCount={CourseCount}, TeacherCount={TeacherCount}, ClassroomCount={ClassroomCount}, Complexity={Complexity}",
                     features.CourseSectionCount, features.TeacherCount, features.ClassroomCount, features.OverallComplexity);
 
@@ -118,9 +143,40 @@ namespace SmartSchedulingSystem.Scheduling.Engine
                 // Generate specified number of solutions, using updated progressive constraint strategy
                 int targetSolutionCount = problem.GenerateMultipleSolutions ? 
                     Math.Max(3, problem.SolutionCount) : 1; // Ensure at least 3 solutions are generated
+
+                // With a deadline, the CP time limit and local search iterations are planned from the runtimes of earlier runs
+                EnginePlan plan = null;
+                int requestedLsIterations = parameters.MaxLsIterations;
+                if (parameters.DeadlineSeconds > 0)
+                {
+                    plan = _engineSelector.PlanForDeadline(problem, features, parameters.DeadlineSeconds, targetSolutionCount, requestedLsIterations);
+                    parameters = parameters.Clone();
+                    new ParameterAdjuster(parameters).ApplyPlan(plan);
+                    result.Statistics.EnginePlan = plan;
+
+                    // The deadline also stops the run, the best solutions found so far are returned
+                    deadlineSource = CancellationTokenSource.CreateLinkedTokenSource(cancellationToken);
+                    deadlineSource.CancelAfter(TimeSpan.FromMilliseconds(
+                        Math.Max(0, plan.DeadlineSeconds * 1000.0 - runStopwatch.ElapsedMilliseconds)));
+                    cancellationToken = deadlineSource.Token;
+
+                    _logger.LogInformation("Deadline plan for {DeadlineSeconds}s: CP time limit {CpTimeLimit}s, {LsIterations} LS iterations, " +
+                                           "CP weight {CPWeight:F2}, predicted construction {ConstructionMs}ms, {HistorySamples} earlier runs",
+                        plan.DeadlineSeconds, plan.CpTimeLimit, plan.MaxLsIterations, plan.CPWeight, plan.PredictedConstructionMs, plan.HistorySamples);
+                }
                 
                 // Generate solutions
-                var solutions = _cpScheduler.GenerateRandomSolutions(problem, targetSolutionCount);
+                ReportPhase(progress, "Construction", $"Generating {targetSolutionCount} solutions with {constraintLevel} level constraints");
+                int cpTimeLimit = plan?.CpTimeLimit ?? _cpScheduler.TimeLimitSeconds;
+                var constructionStopwatch = Stopwatch.StartNew();
+                List<SchedulingSolution> solutions;
+                using (profiler.MeasurePhase("Construction"))
+                {
+                    solutions = _cpScheduler.GenerateRandomSolutions(problem, targetSolutionCount, progress, cancellationToken, plan?.CpTimeLimit ?? 0);
+                }
+                long constructionMs = constructionStopwatch.ElapsedMilliseconds;
+                bool constructionCancelled = cancellationToken.IsCancellationRequested;
+                var localSearchStatistics = new MoveStatistics();
                 
                 if (solutions.Count > 0)
                 {
@@ -131,7 +187,10 @@ namespace SmartSchedulingSystem.Scheduling.Engine
                     if (solutions.Count > 1)
                     {
                         // Ensure solutions are sufficiently diverse, limit to 5 solutions
-                        solutions = _solutionDiversifier.DiversifySolutions(problem, solutions, 5).ToList();
+                        using (profiler.MeasurePhase("Diversification"))
+                        {
+                            solutions = _solutionDiversifier.DiversifySolutions(problem, solutions, 5).ToList();
+                        }
                         _logger.LogInformation("Optimized solution diversity, final {SolutionsCount} solutions", solutions.Count);
                     }
                     
@@ -167,7 +226,7 @@ namespace SmartSchedulingSystem.Scheduling.Engine
                     }
                     
                     // If solution count is insufficient, try to create variants
-                    if (solutions.Count < targetSolutionCount)
+                    if (solutions.Count < targetSolutionCount && !cancellationToken.IsCancellationRequested)
                     {
                         _logger.LogInformation($"Generated solutions count is insufficient ({solutions.Count}/{targetSolutionCount}), creating variants...");
                         var existingSolutions = new List<SchedulingSolution>(solutions);
@@ -194,23 +253,42 @@ namespace SmartSchedulingSystem.Scheduling.Engine
                         }
                     }
                     
+                    // Local search gets the time construction left over
+                    if (plan != null && parameters.EnableLocalSearch)
+                    {
+                        double remainingMs = EngineSelector.GetBudgetMs(plan.DeadlineSeconds) - runStopwatch.ElapsedMilliseconds;
+                        parameters.MaxLsIterations = _engineSelector.PlanLocalSearchIterations(
+                            features, remainingMs, solutions.Count, requestedLsIterations);
+                        plan.ReplannedLsIterations = parameters.MaxLsIterations;
+                        _logger.LogInformation("Re-planned local search with {RemainingMs:F0}ms left: {LsIterations} iterations per solution",
+                            remainingMs, parameters.MaxLsIterations);
+                    }
+
                     // Ensure each solution has a unique ID
                     for (int i = 0; i < solutions.Count; i++)
                     {
                         solutions[i].Id = i + 1;
                         
                         // Optimize solution (optional)
-                        if (parameters.EnableLocalSearch && parameters.MaxLsIterations > 0)
+                        if (parameters.EnableLocalSearch && parameters.MaxLsIterations > 0 && !cancellationToken.IsCancellationRequested)
                         {
                             try
                             {
                                 _logger.LogInformation($"Starting local search optimization for solution #{solutions[i].Id}...");
+                                ReportPhase(progress, "LocalSearch", $"Optimizing solution {i + 1} of {solutions.Count}", solutions.Count);
                                 
-                                var optimizedSolution = _localSearchOptimizer.OptimizeSolution(
-                                    solutions[i], 
-                                    parameters.MaxLsIterations,
-                                    parameters.InitialTemperature,
-                                    parameters.CoolingRate);
+                                SchedulingSolution optimizedSolution;
+                                using (profiler.MeasurePhase("LocalSearch"))
+                                {
+                                    optimizedSolution = _localSearchOptimizer.OptimizeSolution(
+                                        solutions[i], 
+                                        parameters.MaxLsIterations,
+                                        parameters.InitialTemperature,
+                                        parameters.CoolingRate,
+                                        progress,
+                                        cancellationToken);
+                                }
+                                localSearchStatistics.Add(_localSearchOptimizer.LastStatistics);
                                 
                                 // If the optimized solution is better, replace it
                                 if (optimizedSolution.Score > solutions[i].Score)
@@ -230,7 +308,15 @@ namespace SmartSchedulingSystem.Scheduling.Engine
                     
                     result.Solutions = solutions;
                     result.Status = SchedulingStatus.Success;
-                    result.Message = "Successfully generated scheduling solution using progressive constraint strategy";
+                    result.Message = cancellationToken.IsCancellationRequested
+                        ? "Stopped early, returning the best solutions found so far"
+                        : "Successfully generated scheduling solution using progressive constraint strategy";
+                }
+                else if (cancellationToken.IsCancellationRequested)
+                {
+                    _logger.LogWarning("Scheduling was stopped before any solution was found");
+                    result.Status = SchedulingStatus.Cancelled;
+                    result.Message = "Scheduling was stopped before any solution was found";
                 }
                 else
                 {
@@ -249,18 +335,46 @@ namespace SmartSchedulingSystem.Scheduling.Engine
                 result.Statistics.UnscheduledSections = result.Statistics.TotalSections - result.Statistics.ScheduledSections;
                 result.Statistics.TotalTeachers = problem.Teachers.Count;
                 result.Statistics.TotalClassrooms = problem.Classrooms.Count;
+                result.Statistics.ConstraintLevelTimeMs = _cpScheduler.LevelTimeMs.ToDictionary(kv => kv.Key.ToString(), kv => kv.Value);
+                result.Statistics.DecompositionRepairTimeMs = _cpScheduler.DecompositionRepairTimeMs;
+                if (profiling)
+                {
+                    result.Statistics.ConstraintProfile = profiler.EndRun();
+                }
+
+                // Record the run for the runtime predictor
+                _runHistory.Record(new SchedulingRunRecord
+                {
+                    CourseSectionCount = features.CourseSectionCount,
+                    TeacherCount = features.TeacherCount,
+                    ClassroomCount = features.ClassroomCount,
+                    TimeSlotCount = features.TimeSlotCount,
+                    HardConstraintRatio = features.HardConstraintRatio,
+                    SolutionCount = targetSolutionCount,
+                    CpTimeLimit = cpTimeLimit,
+                    MaxLsIterations = parameters.EnableLocalSearch ? parameters.MaxLsIterations : 0,
+                    ConstructionMs = constructionMs,
+                    LocalSearchMs = localSearchStatistics.ElapsedMs,
+                    LocalSearchIterations = localSearchStatistics.Iterations,
+                    TotalMs = runStopwatch.ElapsedMilliseconds,
+                    Score = result.Solutions.Count > 0 ? result.Solutions.Max(s => s.Score) : double.NegativeInfinity,
+                    ConstructionCancelled = constructionCancelled
+                });
                 
                 // Restore constraint manager state
                 if (_constraintManager is ConstraintManager constraintManager2)
                 {
                     constraintManager2.UseSimplifiedConstraints(false);
                 }
+
+                ReportPhase(progress, "Completed", result.Message, result.Solutions.Count);
                 
                 return result;
             }
             catch (Exception ex)
             {
                 _logger.LogError(ex, "Error generating scheduling solution");
+                profiler.EndRun();
                 
                 // Restore constraint manager state
                 if (_constraintManager is ConstraintManager constraintManager)
@@ -314,6 +428,24 @@ namespace SmartSchedulingSystem.Scheduling.Engine
                     };
                 }
             }
+            finally
+            {
+                deadlineSource?.Dispose();
+            }
+        }
+
+        /// <summary>
+        /// Report the start of a phase
+        /// </summary>
+        private static void ReportPhase(IProgress<SchedulingProgress> progress, string phase, string message, int solutionCount = 0)
+        {
+            progress?.Report(new SchedulingProgress
+            {
+                Kind = SchedulingProgressKind.Phase,
+                Phase = phase,
+                Message = message,
+                SolutionCount = solutionCount
+            });
         }
 
         /// <summary>
@@ -422,6 +554,48 @@ namespace SmartSchedulingSystem.Scheduling.Engine
             }
         }
 
+        /// <summary>
+        /// Incrementally reschedule an existing solution after a change to the semester,
+        /// moving as few assignments as possible instead of solving from scratch
+        /// </summary>
+        /// <param name="problem">Scheduling problem, updated with the change set</param>
+        /// <param name="previousSolution">Previously generated solution</param>
+        /// <param name="changes">Changes since the previous solution</param>
+        /// <returns>Rescheduling result</returns>
+        public ReschedulingResult Reschedule(SchedulingProblem problem, SchedulingSolution previousSolution, ScheduleChangeSet changes)
+        {
+            if (problem == null)
+            {
+                throw new ArgumentNullException(nameof(problem));
+            }
+
+            if (previousSolution == null)
+            {
+                throw new ArgumentNullException(nameof(previousSolution));
+            }
+
+            try
+            {
+                _logger.LogInformation("Starting incremental rescheduling...");
+
+                changes?.ApplyTo(problem);
+                ReschedulingResult result;
+                using (_constraintManager.Profiler.MeasurePhase("Reschedule"))
+                {
+                    result = _cpScheduler.Reschedule(problem, previousSolution, changes);
+                }
+
+                _logger.LogInformation($"Incremental rescheduling completed: {result.Message}");
+
+                return result;
+            }
+            catch (Exception ex)
+            {
+                _logger.LogError(ex, "Error rescheduling solution");
+                throw;
+            }
+        }
+
         /// <summary>
         /// Optimize existing scheduling solution
         /// </summary>
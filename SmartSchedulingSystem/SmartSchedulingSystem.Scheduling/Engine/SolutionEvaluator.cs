@@ -1,4 +1,5 @@
 ﻿using System;
+using System.Collections.Concurrent;
 using System.Collections.Generic;
 using System.Linq;
 using Microsoft.Extensions.Logging;
@@ -25,8 +26,10 @@ namespace SmartSchedulingSystem.Scheduling.Engine
         private readonly ConstraintManager _constraintManager;
         private readonly Utils.SchedulingParameters _parameters;
 
-        // Cache evaluation results to reduce duplicate calculations
-        private readonly Dictionary<int, Dictionary<int, double>> _constraintScoreCache = new Dictionary<int, Dictionary<int, double>>();
+        // Cache evaluation results to reduce duplicate calculations; the evaluator is a singleton shared by
+        // parallel local search runs, so the cache is concurrent
+        private readonly ConcurrentDictionary<int, ConcurrentDictionary<int, double>> _constraintScoreCache =
+            new ConcurrentDictionary<int, ConcurrentDictionary<int, double>>();
 
         public SolutionEvaluator(
             ILogger<SolutionEvaluator> logger,
@@ -133,7 +136,7 @@ namespace SmartSchedulingSystem.Scheduling.Engine
             {
                 try
                 {
-                    var (score, conflicts) = constraint.Evaluate(solution);
+                    var (score, conflicts) = EvaluateConstraint(constraint, solution);
 
                     // Cache result
                     if (solution.Id > 0)
@@ -197,7 +200,7 @@ namespace SmartSchedulingSystem.Scheduling.Engine
             {
                 try
                 {
-                    var (score, conflicts) = constraint.Evaluate(solution);
+                    var (score, conflicts) = EvaluateConstraint(constraint, solution);
 
                     // Cache result
                     if (solution.Id > 0)
@@ -244,7 +247,7 @@ namespace SmartSchedulingSystem.Scheduling.Engine
             {
                 try
                 {
-                    var (score, conflicts) = constraint.Evaluate(solution);
+                    var (score, conflicts) = EvaluateConstraint(constraint, solution);
 
                     // Cache result
                     if (solution.Id > 0)
@@ -269,10 +272,190 @@ namespace SmartSchedulingSystem.Scheduling.Engine
             return weightedScore;
         }
 
+        /// <summary>
+        /// Create incremental evaluation context for a solution. Constraints implementing
+        /// IIncrementalConstraint keep per-solution state, the rest are re-evaluated in full
+        /// </summary>
+        /// <param name="solution">Current solution</param>
+        /// <returns>Evaluation context whose Score equals Evaluate(solution).Score</returns>
+        public IncrementalEvaluation CreateIncrementalEvaluation(SchedulingSolution solution)
+        {
+            if (solution == null)
+                throw new ArgumentNullException(nameof(solution));
+
+            var softConstraints = _constraintManager.GetSoftConstraints();
+
+            var evaluation = new IncrementalEvaluation(
+                solution,
+                CreateConstraintEntries(_constraintManager.GetHardConstraints(), solution),
+                CreateConstraintEntries(softConstraints.Where(c => c.Hierarchy == ConstraintHierarchy.Level3_PhysicalSoft), solution),
+                CreateConstraintEntries(softConstraints.Where(c => c.Hierarchy == ConstraintHierarchy.Level4_QualitySoft), solution));
+
+            evaluation.Score = CombineScores(evaluation, entry => entry.Score);
+            return evaluation;
+        }
+
+        /// <summary>
+        /// Score the solution that would result from applying assignment changes, without modifying
+        /// the evaluation context. Returns negative infinity if a hard constraint would be violated
+        /// </summary>
+        /// <param name="evaluation">Incremental evaluation context of the current solution</param>
+        /// <param name="changes">Assignment changes produced by a move</param>
+        public double EvaluateChanges(IncrementalEvaluation evaluation, IReadOnlyList<AssignmentChange> changes)
+        {
+            if (evaluation == null)
+                throw new ArgumentNullException(nameof(evaluation));
+
+            evaluation.EvaluatedMoves++;
+
+            if (changes == null || changes.Count == 0)
+                return evaluation.Score;
+
+            // Materialized lazily, only needed for constraints without incremental state
+            SchedulingSolution changedSolution = null;
+            var profiler = _constraintManager.Profiler;
+
+            return CombineScores(evaluation, entry =>
+            {
+                if (entry.State != null)
+                {
+                    using var scope = profiler.Measure(entry.Constraint, ConstraintOperation.EvaluateDelta);
+                    return entry.State.Score + entry.State.EvaluateDelta(changes);
+                }
+
+                changedSolution ??= evaluation.Solution.WithChanges(changes);
+                evaluation.FullEvaluationFallbacks++;
+                return EvaluateConstraintSafely(entry.Constraint, changedSolution);
+            });
+        }
+
+        /// <summary>
+        /// Commit accepted changes to the evaluation context
+        /// </summary>
+        /// <param name="evaluation">Incremental evaluation context of the current solution</param>
+        /// <param name="changes">Assignment changes produced by the accepted move</param>
+        /// <param name="newSolution">Solution after the move was applied</param>
+        public void CommitChanges(IncrementalEvaluation evaluation, IReadOnlyList<AssignmentChange> changes, SchedulingSolution newSolution)
+        {
+            if (evaluation == null)
+                throw new ArgumentNullException(nameof(evaluation));
+            if (newSolution == null)
+                throw new ArgumentNullException(nameof(newSolution));
+
+            changes ??= AssignmentChange.None;
+
+            foreach (var entry in evaluation.AllEntries())
+            {
+                if (entry.State != null)
+                {
+                    using (_constraintManager.Profiler.Measure(entry.Constraint, ConstraintOperation.ApplyChanges))
+                    {
+                        entry.State.Apply(changes);
+                    }
+                    entry.Score = entry.State.Score;
+                }
+                else
+                {
+                    entry.Score = EvaluateConstraintSafely(entry.Constraint, newSolution);
+                }
+            }
+
+            evaluation.Solution = newSolution;
+            evaluation.Score = CombineScores(evaluation, entry => entry.Score);
+        }
+
+        private List<IncrementalEvaluation.ConstraintEntry> CreateConstraintEntries(IEnumerable<IConstraint> constraints, SchedulingSolution solution)
+        {
+            var entries = new List<IncrementalEvaluation.ConstraintEntry>();
+
+            foreach (var constraint in constraints)
+            {
+                IncrementalConstraintState state = null;
+
+                if (constraint is IIncrementalConstraint incrementalConstraint)
+                {
+                    try
+                    {
+                        using var scope = _constraintManager.Profiler.Measure(constraint, ConstraintOperation.CreateState);
+                        state = incrementalConstraint.CreateState(solution);
+                    }
+                    catch (Exception ex)
+                    {
+                        _logger.LogWarning(ex, $"Failed to create incremental state for constraint '{constraint.Name}', using full evaluation");
+                    }
+                }
+
+                double score = state?.Score ?? EvaluateConstraintSafely(constraint, solution);
+                entries.Add(new IncrementalEvaluation.ConstraintEntry(constraint, state, score));
+            }
+
+            return entries;
+        }
+
+        private double EvaluateConstraintSafely(IConstraint constraint, SchedulingSolution solution)
+        {
+            try
+            {
+                return EvaluateConstraint(constraint, solution).Score;
+            }
+            catch (Exception ex)
+            {
+                _logger.LogError(ex, $"Error evaluating constraint '{constraint.Name}'");
+                return 0.0; // Error is regarded as the constraint not being satisfied
+            }
+        }
+
+        /// <summary>
+        /// Evaluate a single constraint, measured by the constraint profiler
+        /// </summary>
+        public (double Score, List<SchedulingConflict> Conflicts) EvaluateConstraint(IConstraint constraint, SchedulingSolution solution)
+        {
+            using var scope = _constraintManager.Profiler.Measure(constraint, ConstraintOperation.Evaluate);
+            return constraint.Evaluate(solution);
+        }
+
+        /// <summary>
+        /// Combine constraint scores with the same weighting as Evaluate
+        /// </summary>
+        private double CombineScores(IncrementalEvaluation evaluation, Func<IncrementalEvaluation.ConstraintEntry, double> scoreOf)
+        {
+            foreach (var entry in evaluation.HardConstraints)
+            {
+                if (scoreOf(entry) < 1.0)
+                    return double.NegativeInfinity;
+            }
+
+            double physicalSoftScore = CombineWeightedScores(evaluation.PhysicalSoftConstraints, scoreOf);
+            double qualitySoftScore = CombineWeightedScores(evaluation.QualitySoftConstraints, scoreOf);
+
+            return (_parameters.PhysicalSoftConstraintWeight * physicalSoftScore) +
+                   (_parameters.QualitySoftConstraintWeight * qualitySoftScore);
+        }
+
+        private static double CombineWeightedScores(
+            List<IncrementalEvaluation.ConstraintEntry> entries,
+            Func<IncrementalEvaluation.ConstraintEntry, double> scoreOf)
+        {
+            if (entries.Count == 0)
+                return 1.0;
+
+            double totalWeight = entries.Sum(e => e.Constraint.Weight);
+            if (totalWeight == 0)
+                return 1.0;
+
+            double totalScore = 0;
+            foreach (var entry in entries)
+            {
+                totalScore += scoreOf(entry) * entry.Constraint.Weight;
+            }
+
+            return totalScore / totalWeight;
+        }
+
         /// <summary>
         /// Evaluate hard constraints from cache
         /// </summary>
-        private double EvaluateHardConstraintsFromCache(Dictionary<int, double> cachedScores)
+        private double EvaluateHardConstraintsFromCache(IReadOnlyDictionary<int, double> cachedScores)
         {
             var hardConstraints = _constraintManager.GetHardConstraints();
 
@@ -301,7 +484,7 @@ namespace SmartSchedulingSystem.Scheduling.Engine
         /// <summary>
         /// Evaluate soft constraints from cache
         /// </summary>
-        private double EvaluateSoftConstraintsFromCache(Dictionary<int, double> cachedScores)
+        private double EvaluateSoftConstraintsFromCache(IReadOnlyDictionary<int, double> cachedScores)
         {
             var physicalSoftConstraints = _constraintManager.GetSoftConstraints()
                 .Where(c => c.Hierarchy == ConstraintHierarchy.Level3_PhysicalSoft)
@@ -370,14 +553,9 @@ namespace SmartSchedulingSystem.Scheduling.Engine
             if (solutionId <= 0)
                 return;
 
-            // Ensure the dictionary contains the solution cache
-            if (!_constraintScoreCache.ContainsKey(solutionId))
-            {
-                _constraintScoreCache[solutionId] = new Dictionary<int, double>();
-            }
-
-            // Cache constraint score
-            _constraintScoreCache[solutionId][constraintId] = score;
+            // Ensure the dictionary contains the solution cache, then cache constraint score
+            var scores = _constraintScoreCache.GetOrAdd(solutionId, _ => new ConcurrentDictionary<int, double>());
+            scores[constraintId] = score;
 
             // Optional: Limit cache size to prevent memory leaks
             // Here we simply limit the maximum cache size to 100 solutions
@@ -385,7 +563,7 @@ namespace SmartSchedulingSystem.Scheduling.Engine
             {
                 // Remove the oldest cache
                 var oldestSolutionId = _constraintScoreCache.Keys.Min();
-                _constraintScoreCache.Remove(oldestSolutionId);
+                _constraintScoreCache.TryRemove(oldestSolutionId, out _);
             }
         }
         // Add this method to the SolutionEvaluator class
@@ -454,7 +632,7 @@ namespace SmartSchedulingSystem.Scheduling.Engine
             {
                 try
                 {
-                    var (score, conflicts) = constraint.Evaluate(solution);
+                    var (score, conflicts) = EvaluateConstraint(constraint, solution);
                     var weight = constraint.Weight * _parameters.PhysicalSoftConstraintWeight;
                     var evaluation = new ConstraintEvaluation
                     {
@@ -476,7 +654,7 @@ namespace SmartSchedulingSystem.Scheduling.Engine
             {
                 try
                 {
-                    var (score, conflicts) = constraint.Evaluate(solution);
+                    var (score, conflicts) = EvaluateConstraint(constraint, solution);
                     var weight = constraint.Weight * _parameters.QualitySoftConstraintWeight;
                     var evaluation = new ConstraintEvaluation
                     {
@@ -0,0 +1,97 @@
+using System;
+using System.Collections.Generic;
+
+namespace SmartSchedulingSystem.Scheduling.Models
+{
+    /// <summary>
+    /// Resource placement of a single course assignment (who teaches it, where and when)
+    /// </summary>
+    public readonly struct AssignmentPlacement
+    {
+        public AssignmentPlacement(int assignmentId, int sectionId, int teacherId, int classroomId, int timeSlotId)
+        {
+            AssignmentId = assignmentId;
+            SectionId = sectionId;
+            TeacherId = teacherId;
+            ClassroomId = classroomId;
+            TimeSlotId = timeSlotId;
+        }
+
+        /// <summary>
+        /// Assignment ID
+        /// </summary>
+        public int AssignmentId { get; }
+
+        /// <summary>
+        /// Course section ID
+        /// </summary>
+        public int SectionId { get; }
+
+        /// <summary>
+        /// Teacher ID
+        /// </summary>
+        public int TeacherId { get; }
+
+        /// <summary>
+        /// Classroom ID
+        /// </summary>
+        public int ClassroomId { get; }
+
+        /// <summary>
+        /// Time slot ID
+        /// </summary>
+        public int TimeSlotId { get; }
+
+        /// <summary>
+        /// Create placement from an existing assignment
+        /// </summary>
+        public static AssignmentPlacement From(SchedulingAssignment assignment)
+        {
+            if (assignment == null)
+                throw new ArgumentNullException(nameof(assignment));
+
+            return new AssignmentPlacement(
+                assignment.Id,
+                assignment.SectionId,
+                assignment.TeacherId,
+                assignment.ClassroomId,
+                assignment.TimeSlotId);
+        }
+
+        public AssignmentPlacement WithTeacher(int teacherId) =>
+            new AssignmentPlacement(AssignmentId, SectionId, teacherId, ClassroomId, TimeSlotId);
+
+        public AssignmentPlacement WithClassroom(int classroomId) =>
+            new AssignmentPlacement(AssignmentId, SectionId, TeacherId, classroomId, TimeSlotId);
+
+        public AssignmentPlacement WithTimeSlot(int timeSlotId) =>
+            new AssignmentPlacement(AssignmentId, SectionId, TeacherId, ClassroomId, timeSlotId);
+    }
+
+    /// <summary>
+    /// Change of a single assignment caused by a local search move
+    /// </summary>
+    public readonly struct AssignmentChange
+    {
+        /// <summary>
+        /// Shared empty change list for moves that do not modify the solution
+        /// </summary>
+        public static readonly IReadOnlyList<AssignmentChange> None = Array.Empty<AssignmentChange>();
+
+        public AssignmentChange(AssignmentPlacement before, AssignmentPlacement after)
+        {
+            Before = before;
+            After = after;
+        }
+
+        /// <summary>
+        /// Placement before the move
+        /// </summary>
+        public AssignmentPlacement Before { get; }
+
+        /// <summary>
+        /// Placement after the move
+        /// </summary>
+        public AssignmentPlacement After { get; }
+    }
+}
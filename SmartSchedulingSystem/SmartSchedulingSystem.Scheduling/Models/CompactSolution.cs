@@ -0,0 +1,322 @@
+using System;
+using System.Collections.Generic;
+
+namespace SmartSchedulingSystem.Scheduling.Models
+{
+    /// <summary>
+    /// Compact struct-of-arrays representation of a scheduling solution.
+    /// Placements are stored as int arrays indexed by assignment position and resource occupancy
+    /// as counters indexed by (teacher, time slot) and (classroom, time slot), so conflict lookups are O(1).
+    /// Clones share the arrays until one of them is modified (copy-on-write).
+    /// SchedulingSolution remains the view handed to API consumers, see ToSolution.
+    /// Instances are not thread-safe for writes; clones may be written on different threads, since shared arrays are
+    /// copied and never written in place.
+    /// </summary>
+    public sealed class CompactSolution
+    {
+        private readonly SolutionIndex _index;
+        private readonly int[] _assignmentIds;
+        private readonly int[] _sectionIds;
+
+        private int[] _teacherIds;
+        private int[] _classroomIds;
+        private int[] _timeSlotIds;
+        private ushort[] _teacherOccupancy;
+        private ushort[] _classroomOccupancy;
+
+        // Set when the arrays above are shared with a clone and must be copied before writing
+        private bool _shared;
+
+        private CompactSolution(SchedulingSolution solution)
+        {
+            Problem = solution.Problem;
+            _index = new SolutionIndex(solution);
+
+            int count = solution.Assignments.Count;
+            _assignmentIds = new int[count];
+            _sectionIds = new int[count];
+            _teacherIds = new int[count];
+            _classroomIds = new int[count];
+            _timeSlotIds = new int[count];
+            _teacherOccupancy = new ushort[_index.TeacherCount * _index.TimeSlotCount];
+            _classroomOccupancy = new ushort[_index.ClassroomCount * _index.TimeSlotCount];
+
+            for (int position = 0; position < count; position++)
+            {
+                var assignment = solution.Assignments[position];
+                _assignmentIds[position] = assignment.Id;
+                _sectionIds[position] = assignment.SectionId;
+                _teacherIds[position] = assignment.TeacherId;
+                _classroomIds[position] = assignment.ClassroomId;
+                _timeSlotIds[position] = assignment.TimeSlotId;
+                Occupy(position, 1);
+            }
+        }
+
+        private CompactSolution(CompactSolution source)
+        {
+            Problem = source.Problem;
+            _index = source._index;
+            _assignmentIds = source._assignmentIds;
+            _sectionIds = source._sectionIds;
+            _teacherIds = source._teacherIds;
+            _classroomIds = source._classroomIds;
+            _timeSlotIds = source._timeSlotIds;
+            _teacherOccupancy = source._teacherOccupancy;
+            _classroomOccupancy = source._classroomOccupancy;
+            _shared = true;
+        }
+
+        /// <summary>
+        /// Scheduling problem the solution belongs to
+        /// </summary>
+        public SchedulingProblem Problem { get; }
+
+        /// <summary>
+        /// Number of assignments
+        /// </summary>
+        public int Count => _assignmentIds.Length;
+
+        /// <summary>
+        /// Create compact representation of a solution
+        /// </summary>
+        public static CompactSolution From(SchedulingSolution solution)
+        {
+            if (solution == null)
+                throw new ArgumentNullException(nameof(solution));
+
+            return new CompactSolution(solution);
+        }
+
+        /// <summary>
+        /// Create a copy that shares storage with this solution until either is modified
+        /// </summary>
+        public CompactSolution Clone()
+        {
+            _shared = true;
+            return new CompactSolution(this);
+        }
+
+        /// <summary>
+        /// Position of an assignment, -1 if the assignment is not part of the solution
+        /// </summary>
+        public int IndexOf(int assignmentId) => _index.GetAssignmentPosition(assignmentId);
+
+        /// <summary>
+        /// Whether the classroom is part of the problem
+        /// </summary>
+        public bool ContainsClassroom(int classroomId) => _index.IsProblemClassroom(classroomId);
+
+        /// <summary>
+        /// Whether the time slot is part of the problem
+        /// </summary>
+        public bool ContainsTimeSlot(int timeSlotId) => _index.IsProblemTimeSlot(timeSlotId);
+
+        /// <summary>
+        /// Placement of the assignment at the specified position
+        /// </summary>
+        public AssignmentPlacement GetPlacement(int position) =>
+            new AssignmentPlacement(
+                _assignmentIds[position],
+                _sectionIds[position],
+                _teacherIds[position],
+                _classroomIds[position],
+                _timeSlotIds[position]);
+
+        public void SetTeacher(int position, int teacherId)
+        {
+            if (_teacherIds[position] == teacherId)
+                return;
+
+            EnsureWritable();
+            Occupy(position, -1);
+            _teacherIds[position] = teacherId;
+            Occupy(position, 1);
+        }
+
+        public void SetClassroom(int position, int classroomId)
+        {
+            if (_classroomIds[position] == classroomId)
+                return;
+
+            EnsureWritable();
+            Occupy(position, -1);
+            _classroomIds[position] = classroomId;
+            Occupy(position, 1);
+        }
+
+        public void SetTimeSlot(int position, int timeSlotId)
+        {
+            if (_timeSlotIds[position] == timeSlotId)
+                return;
+
+            EnsureWritable();
+            Occupy(position, -1);
+            _timeSlotIds[position] = timeSlotId;
+            Occupy(position, 1);
+        }
+
+        /// <summary>
+        /// Apply assignment changes produced by a move
+        /// </summary>
+        public void Apply(IReadOnlyList<AssignmentChange> changes)
+        {
+            if (changes == null)
+                return;
+
+            foreach (var change in changes)
+            {
+                int position = IndexOf(change.After.AssignmentId);
+                if (position < 0)
+                    continue;
+
+                SetTeacher(position, change.After.TeacherId);
+                SetClassroom(position, change.After.ClassroomId);
+                SetTimeSlot(position, change.After.TimeSlotId);
+            }
+        }
+
+        /// <summary>
+        /// Number of assignments of a teacher in a time slot
+        /// </summary>
+        public int GetTeacherOccupancy(int teacherId, int timeSlotId)
+        {
+            int key = GetOccupancyKey(_index.GetTeacherIndex(teacherId), _index.GetTimeSlotIndex(timeSlotId));
+            if (key >= 0)
+                return _teacherOccupancy[key];
+
+            return CountPositions(position => _teacherIds[position] == teacherId && _timeSlotIds[position] == timeSlotId);
+        }
+
+        /// <summary>
+        /// Number of assignments of a classroom in a time slot
+        /// </summary>
+        public int GetClassroomOccupancy(int classroomId, int timeSlotId)
+        {
+            int key = GetOccupancyKey(_index.GetClassroomIndex(classroomId), _index.GetTimeSlotIndex(timeSlotId));
+            if (key >= 0)
+                return _classroomOccupancy[key];
+
+            return CountPositions(position => _classroomIds[position] == classroomId && _timeSlotIds[position] == timeSlotId);
+        }
+
+        /// <summary>
+        /// Check if there is a teacher conflict for the specified time slot, same semantics as SchedulingSolution.HasTeacherConflict
+        /// </summary>
+        public bool HasTeacherConflict(int teacherId, int timeSlotId, int? ignoreSectionId = null)
+        {
+            int occupancy = GetTeacherOccupancy(teacherId, timeSlotId);
+            if (occupancy == 0 || !ignoreSectionId.HasValue)
+                return occupancy > 0;
+
+            foreach (int position in _index.GetSectionPositions(ignoreSectionId.Value))
+            {
+                if (_teacherIds[position] == teacherId && _timeSlotIds[position] == timeSlotId)
+                    occupancy--;
+            }
+
+            return occupancy > 0;
+        }
+
+        /// <summary>
+        /// Check if there is a classroom conflict for the specified time slot, same semantics as SchedulingSolution.HasClassroomConflict
+        /// </summary>
+        public bool HasClassroomConflict(int classroomId, int timeSlotId, int? ignoreSectionId = null)
+        {
+            int occupancy = GetClassroomOccupancy(classroomId, timeSlotId);
+            if (occupancy == 0 || !ignoreSectionId.HasValue)
+                return occupancy > 0;
+
+            foreach (int position in _index.GetSectionPositions(ignoreSectionId.Value))
+            {
+                if (_classroomIds[position] == classroomId && _timeSlotIds[position] == timeSlotId)
+                    occupancy--;
+            }
+
+            return occupancy > 0;
+        }
+
+        /// <summary>
+        /// Changes needed to turn the baseline solution into this one
+        /// </summary>
+        /// <param name="baseline">Solution this compact solution was created from</param>
+        public IReadOnlyList<AssignmentChange> GetChanges(SchedulingSolution baseline)
+        {
+            if (baseline == null)
+                throw new ArgumentNullException(nameof(baseline));
+
+            var changes = new List<AssignmentChange>();
+
+            foreach (var assignment in baseline.Assignments)
+            {
+                int position = IndexOf(assignment.Id);
+                if (position < 0)
+                    continue;
+
+                var before = AssignmentPlacement.From(assignment);
+                if (before.TeacherId != _teacherIds[position] ||
+                    before.ClassroomId != _classroomIds[position] ||
+                    before.TimeSlotId != _timeSlotIds[position])
+                {
+                    changes.Add(new AssignmentChange(before, GetPlacement(position)));
+                }
+            }
+
+            return changes;
+        }
+
+        /// <summary>
+        /// Materialize the SchedulingSolution view of this compact solution
+        /// </summary>
+        /// <param name="baseline">Solution this compact solution was created from, supplies names and metadata</param>
+        public SchedulingSolution ToSolution(SchedulingSolution baseline)
+        {
+            return baseline.WithChanges(GetChanges(baseline));
+        }
+
+        private void EnsureWritable()
+        {
+            if (!_shared)
+                return;
+
+            _teacherIds = (int[])_teacherIds.Clone();
+            _classroomIds = (int[])_classroomIds.Clone();
+            _timeSlotIds = (int[])_timeSlotIds.Clone();
+            _teacherOccupancy = (ushort[])_teacherOccupancy.Clone();
+            _classroomOccupancy = (ushort[])_classroomOccupancy.Clone();
+            _shared = false;
+        }
+
+        private void Occupy(int position, int delta)
+        {
+            int timeSlotIndex = _index.GetTimeSlotIndex(_timeSlotIds[position]);
+
+            int teacherKey = GetOccupancyKey(_index.GetTeacherIndex(_teacherIds[position]), timeSlotIndex);
+            if (teacherKey >= 0)
+                _teacherOccupancy[teacherKey] = (ushort)(_teacherOccupancy[teacherKey] + delta);
+
+            int classroomKey = GetOccupancyKey(_index.GetClassroomIndex(_classroomIds[position]), timeSlotIndex);
+            if (classroomKey >= 0)
+                _classroomOccupancy[classroomKey] = (ushort)(_classroomOccupancy[classroomKey] + delta);
+        }
+
+        private int GetOccupancyKey(int resourceIndex, int timeSlotIndex)
+        {
+            if (resourceIndex < 0 || timeSlotIndex < 0)
+                return -1;
+
+            return resourceIndex * _index.TimeSlotCount + timeSlotIndex;
+        }
+
+        private int CountPositions(Func<int, bool> predicate)
+        {
+            int count = 0;
+            for (int position = 0; position < Count; position++)
+            {
+                if (predicate(position))
+                    count++;
+            }
+            return count;
+        }
+    }
+}
@@ -0,0 +1,128 @@
+using System;
+using System.Collections.Generic;
+using System.Text.Json.Serialization;
+
+namespace SmartSchedulingSystem.Scheduling.Models
+{
+    /// <summary>
+    /// Constraint operation measured by the constraint profiler
+    /// </summary>
+    [JsonConverter(typeof(JsonStringEnumConverter))]
+    public enum ConstraintOperation
+    {
+        /// <summary>
+        /// Full evaluation of a solution (IConstraint.Evaluate)
+        /// </summary>
+        Evaluate,
+
+        /// <summary>
+        /// Feasibility check of a solution (IConstraint.IsSatisfied)
+        /// </summary>
+        IsSatisfied,
+
+        /// <summary>
+        /// Creation of the incremental evaluation state of a solution
+        /// </summary>
+        CreateState,
+
+        /// <summary>
+        /// Incremental score of a move
+        /// </summary>
+        EvaluateDelta,
+
+        /// <summary>
+        /// Update of the incremental state with an accepted move
+        /// </summary>
+        ApplyChanges
+    }
+
+    /// <summary>
+    /// Measurements of one operation of one constraint
+    /// </summary>
+    public class ConstraintProfileEntry
+    {
+        public string Constraint { get; set; }
+
+        public string Hierarchy { get; set; }
+
+        public ConstraintOperation Operation { get; set; }
+
+        public long Calls { get; set; }
+
+        /// <summary>
+        /// Cumulative time (milliseconds)
+        /// </summary>
+        public double TotalMs { get; set; }
+
+        public double MeanMicroseconds { get; set; }
+
+        /// <summary>
+        /// Median call time (microseconds), estimated from a sample of the calls
+        /// </summary>
+        public double P50Microseconds { get; set; }
+
+        /// <summary>
+        /// 95th percentile call time (microseconds), estimated from a sample of the calls
+        /// </summary>
+        public double P95Microseconds { get; set; }
+
+        /// <summary>
+        /// 99th percentile call time (microseconds), estimated from a sample of the calls
+        /// </summary>
+        public double P99Microseconds { get; set; }
+
+        public double MaxMicroseconds { get; set; }
+
+        /// <summary>
+        /// Bytes allocated by the calls on the calling thread
+        /// </summary>
+        public long AllocatedBytes { get; set; }
+    }
+
+    /// <summary>
+    /// Measurements of one engine phase
+    /// </summary>
+    public class PhaseProfileEntry
+    {
+        public string Phase { get; set; }
+
+        public long Calls { get; set; }
+
+        /// <summary>
+        /// Cumulative wall time (milliseconds)
+        /// </summary>
+        public double TotalMs { get; set; }
+
+        /// <summary>
+        /// Bytes allocated by all threads of the process while the phase ran, including work outside the phase
+        /// that ran concurrently
+        /// </summary>
+        public long AllocatedBytes { get; set; }
+    }
+
+    /// <summary>
+    /// Per-constraint and per-phase measurements of the constraint profiler
+    /// </summary>
+    public class ConstraintProfile
+    {
+        /// <summary>
+        /// Whether the profiler is currently recording
+        /// </summary>
+        public bool Enabled { get; set; }
+
+        /// <summary>
+        /// Start of the measurements (profiler reset or scheduling run start)
+        /// </summary>
+        public DateTime Since { get; set; }
+
+        /// <summary>
+        /// Constraint operations, most expensive first
+        /// </summary>
+        public List<ConstraintProfileEntry> Constraints { get; set; } = new List<ConstraintProfileEntry>();
+
+        /// <summary>
+        /// Engine phases in the order they first ran
+        /// </summary>
+        public List<PhaseProfileEntry> Phases { get; set; } = new List<PhaseProfileEntry>();
+    }
+}
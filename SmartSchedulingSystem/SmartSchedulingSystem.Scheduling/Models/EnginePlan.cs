@@ -0,0 +1,59 @@
+namespace SmartSchedulingSystem.Scheduling.Models
+{
+    /// <summary>
+    /// Time budget of a scheduling run with a deadline: CP time limit, local search iterations and engine weights,
+    /// with the runtimes and score predicted from earlier runs
+    /// </summary>
+    public class EnginePlan
+    {
+        /// <summary>
+        /// Requested wall-clock deadline in seconds
+        /// </summary>
+        public int DeadlineSeconds { get; set; }
+
+        /// <summary>
+        /// CP solver time limit in seconds
+        /// </summary>
+        public int CpTimeLimit { get; set; }
+
+        /// <summary>
+        /// Local search iterations per solution
+        /// </summary>
+        public int MaxLsIterations { get; set; }
+
+        /// <summary>
+        /// Share of the budget given to the CP engine
+        /// </summary>
+        public double CPWeight { get; set; }
+
+        /// <summary>
+        /// Share of the budget given to the LS engine
+        /// </summary>
+        public double LSWeight { get; set; }
+
+        /// <summary>
+        /// Predicted construction time (90th percentile) in milliseconds, null without enough history
+        /// </summary>
+        public double? PredictedConstructionMs { get; set; }
+
+        /// <summary>
+        /// Predicted local search time of all solutions in milliseconds, null without enough history
+        /// </summary>
+        public double? PredictedLocalSearchMs { get; set; }
+
+        /// <summary>
+        /// Predicted score of the best solution, null without enough history
+        /// </summary>
+        public double? PredictedScore { get; set; }
+
+        /// <summary>
+        /// Earlier runs the predictions are based on
+        /// </summary>
+        public int HistorySamples { get; set; }
+
+        /// <summary>
+        /// Local search iterations per solution after re-planning with the time left after construction
+        /// </summary>
+        public int? ReplannedLsIterations { get; set; }
+    }
+}
@@ -0,0 +1,50 @@
+namespace SmartSchedulingSystem.Scheduling.Models
+{
+    /// <summary>
+    /// Result of an incremental rescheduling run
+    /// </summary>
+    public class ReschedulingResult
+    {
+        /// <summary>
+        /// Repaired solution, null if no feasible repair was found
+        /// </summary>
+        public SchedulingSolution Solution { get; set; }
+
+        /// <summary>
+        /// Whether a feasible repair was found
+        /// </summary>
+        public bool IsSuccessful => Solution != null;
+
+        /// <summary>
+        /// Number of previous assignments invalidated by the change set
+        /// </summary>
+        public int AffectedAssignmentCount { get; set; }
+
+        /// <summary>
+        /// Number of course sections the solver was allowed to move in the final attempt
+        /// </summary>
+        public int FreedSectionCount { get; set; }
+
+        /// <summary>
+        /// Number of course sections whose placement differs from the previous solution
+        /// </summary>
+        public int ChangedSectionCount { get; set; }
+
+        /// <summary>
+        /// Neighbourhood radius of the final attempt (0 = affected sections only, -1 = whole schedule)
+        /// </summary>
+        public int NeighbourhoodRadius { get; set; }
+
+        /// <summary>
+        /// Number of repair attempts
+        /// </summary>
+        public int Attempts { get; set; }
+
+        /// <summary>
+        /// Execution time (milliseconds)
+        /// </summary>
+        public long ExecutionTimeMs { get; set; }
+
+        public string Message { get; set; }
+    }
+}
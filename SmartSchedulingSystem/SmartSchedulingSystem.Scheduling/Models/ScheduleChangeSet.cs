@@ -0,0 +1,90 @@
+using System;
+using System.Collections.Generic;
+using System.Linq;
+
+namespace SmartSchedulingSystem.Scheduling.Models
+{
+    /// <summary>
+    /// Changes made to a semester after a schedule was generated, used for incremental rescheduling
+    /// </summary>
+    public class ScheduleChangeSet
+    {
+        /// <summary>
+        /// Teachers that can no longer teach in the given time slots
+        /// </summary>
+        public List<TeacherAvailability> TeacherUnavailabilities { get; set; } = new List<TeacherAvailability>();
+
+        /// <summary>
+        /// Classrooms that can no longer be used in the given time slots
+        /// </summary>
+        public List<ClassroomAvailability> ClassroomUnavailabilities { get; set; } = new List<ClassroomAvailability>();
+
+        /// <summary>
+        /// Teachers that are unavailable for the whole semester
+        /// </summary>
+        public List<int> RemovedTeacherIds { get; set; } = new List<int>();
+
+        /// <summary>
+        /// Classrooms that are closed for the whole semester
+        /// </summary>
+        public List<int> ClosedClassroomIds { get; set; } = new List<int>();
+
+        /// <summary>
+        /// Course sections that must be placed again (e.g. enrollment changed or newly added)
+        /// </summary>
+        public List<int> SectionIds { get; set; } = new List<int>();
+
+        /// <summary>
+        /// Whether the change set contains no changes
+        /// </summary>
+        public bool IsEmpty =>
+            TeacherUnavailabilities.Count == 0 &&
+            ClassroomUnavailabilities.Count == 0 &&
+            RemovedTeacherIds.Count == 0 &&
+            ClosedClassroomIds.Count == 0 &&
+            SectionIds.Count == 0;
+
+        /// <summary>
+        /// Check if the change set forbids a teacher in a time slot
+        /// </summary>
+        public bool IsTeacherBlocked(int teacherId, int timeSlotId)
+        {
+            return RemovedTeacherIds.Contains(teacherId) ||
+                   TeacherUnavailabilities.Any(a => a.TeacherId == teacherId && a.TimeSlotId == timeSlotId);
+        }
+
+        /// <summary>
+        /// Check if the change set forbids a classroom in a time slot
+        /// </summary>
+        public bool IsClassroomBlocked(int classroomId, int timeSlotId)
+        {
+            return ClosedClassroomIds.Contains(classroomId) ||
+                   ClassroomUnavailabilities.Any(a => a.ClassroomId == classroomId && a.TimeSlotId == timeSlotId);
+        }
+
+        /// <summary>
+        /// Apply the change set to a problem, so the availability data of the problem reflects the changes
+        /// </summary>
+        public void ApplyTo(SchedulingProblem problem)
+        {
+            if (problem == null)
+                throw new ArgumentNullException(nameof(problem));
+
+            foreach (var unavailability in TeacherUnavailabilities)
+            {
+                problem.TeacherAvailabilities.RemoveAll(a =>
+                    a.TeacherId == unavailability.TeacherId && a.TimeSlotId == unavailability.TimeSlotId);
+                unavailability.IsAvailable = false;
+                problem.TeacherAvailabilities.Add(unavailability);
+            }
+
+            foreach (var unavailability in ClassroomUnavailabilities)
+            {
+                problem.ClassroomAvailabilities.RemoveAll(a =>
+                    a.ClassroomId == unavailability.ClassroomId && a.TimeSlotId == unavailability.TimeSlotId);
+                unavailability.IsAvailable = false;
+                problem.ClassroomAvailabilities.Add(unavailability);
+            }
+        }
+    }
+}
@@ -0,0 +1,76 @@
+using System;
+
+namespace SmartSchedulingSystem.Scheduling.Models
+{
+    /// <summary>
+    /// Kind of scheduling progress event
+    /// </summary>
+    public enum SchedulingProgressKind
+    {
+        /// <summary>
+        /// A new phase of the scheduling process started
+        /// </summary>
+        Phase,
+
+        /// <summary>
+        /// A new or improving solution was found
+        /// </summary>
+        Solution,
+
+        /// <summary>
+        /// Periodic local search state
+        /// </summary>
+        Iteration
+    }
+
+    /// <summary>
+    /// Progress event reported while a schedule is generated
+    /// </summary>
+    public class SchedulingProgress
+    {
+        /// <summary>
+        /// Event kind
+        /// </summary>
+        public SchedulingProgressKind Kind { get; set; }
+
+        /// <summary>
+        /// Current phase (e.g. "CP", "LocalSearch")
+        /// </summary>
+        public string Phase { get; set; }
+
+        /// <summary>
+        /// Human readable description
+        /// </summary>
+        public string Message { get; set; }
+
+        /// <summary>
+        /// Number of solutions found so far in the current phase
+        /// </summary>
+        public int SolutionCount { get; set; }
+
+        /// <summary>
+        /// Score of the reported solution (CP objective value during CP solving)
+        /// </summary>
+        public double? Score { get; set; }
+
+        /// <summary>
+        /// Best score so far in the current phase
+        /// </summary>
+        public double? BestScore { get; set; }
+
+        /// <summary>
+        /// Local search iteration
+        /// </summary>
+        public int? Iteration { get; set; }
+
+        /// <summary>
+        /// Simulated annealing temperature
+        /// </summary>
+        public double? Temperature { get; set; }
+
+        /// <summary>
+        /// Time of the event
+        /// </summary>
+        public DateTime Timestamp { get; set; } = DateTime.Now;
+    }
+}
@@ -198,6 +198,26 @@ namespace SmartSchedulingSystem.Scheduling.Models
         /// Lowest time slot utilization rate
         /// </summary>
         public double LowestTimeSlotUtilization { get; set; }
+
+        /// <summary>
+        /// Time spent generating initial solutions per constraint level (ms), keyed by level name
+        /// </summary>
+        public Dictionary<string, long> ConstraintLevelTimeMs { get; set; } = new Dictionary<string, long>();
+
+        /// <summary>
+        /// Time spent repairing the stitched solution of a decomposed problem (ms), not included in ConstraintLevelTimeMs
+        /// </summary>
+        public long DecompositionRepairTimeMs { get; set; }
+
+        /// <summary>
+        /// Per-constraint and per-phase measurements of the run, null unless constraint profiling is enabled
+        /// </summary>
+        public ConstraintProfile ConstraintProfile { get; set; }
+
+        /// <summary>
+        /// CP time limit, local search iterations and engine weights chosen for the deadline, null without a deadline
+        /// </summary>
+        public EnginePlan EnginePlan { get; set; }
     }
 
     /// <summary>
@@ -276,6 +276,99 @@ namespace SmartSchedulingSystem.Scheduling.Models
             return clone;
         }
 
+        /// <summary>
+        /// Create compact struct-of-arrays representation with O(1) occupancy lookups and
+        /// copy-on-write cloning, for algorithms that clone or query the solution repeatedly
+        /// </summary>
+        public CompactSolution ToCompact()
+        {
+            return CompactSolution.From(this);
+        }
+
+        /// <summary>
+        /// Create a copy of the solution with assignment changes applied
+        /// </summary>
+        /// <param name="changes">Assignment changes produced by a move</param>
+        /// <returns>New solution; the current solution is left untouched</returns>
+        public SchedulingSolution WithChanges(IReadOnlyList<AssignmentChange> changes)
+        {
+            var clone = Clone();
+            if (changes == null || changes.Count == 0)
+                return clone;
+
+            var assignmentsById = clone.Assignments
+                .GroupBy(a => a.Id)
+                .ToDictionary(g => g.Key, g => g.First());
+
+            foreach (var change in changes)
+            {
+                if (assignmentsById.TryGetValue(change.After.AssignmentId, out var assignment))
+                    clone.ApplyPlacement(assignment, change.After);
+            }
+
+            return clone;
+        }
+
+        /// <summary>
+        /// Apply assignment changes to this solution in place, without copying it
+        /// </summary>
+        /// <param name="changes">Assignment changes produced by a move</param>
+        /// <param name="compact">Compact form of this solution or of a copy with the same assignment order,
+        /// resolves the changed assignments by position instead of scanning the assignment list</param>
+        public void ApplyChanges(IReadOnlyList<AssignmentChange> changes, CompactSolution compact)
+        {
+            if (compact == null)
+                throw new ArgumentNullException(nameof(compact));
+            if (changes == null)
+                return;
+
+            foreach (var change in changes)
+            {
+                int position = compact.IndexOf(change.After.AssignmentId);
+                if (position >= 0 && position < Assignments.Count)
+                    ApplyPlacement(Assignments[position], change.After);
+            }
+        }
+
+        private void ApplyPlacement(SchedulingAssignment assignment, AssignmentPlacement after)
+        {
+            if (assignment.TeacherId != after.TeacherId)
+            {
+                assignment.TeacherId = after.TeacherId;
+                var teacher = Problem?.Teachers?.FirstOrDefault(t => t.Id == after.TeacherId);
+                if (teacher != null)
+                {
+                    assignment.TeacherName = teacher.Name;
+                    assignment.Teacher = teacher;
+                }
+            }
+
+            if (assignment.ClassroomId != after.ClassroomId)
+            {
+                assignment.ClassroomId = after.ClassroomId;
+                var classroom = Problem?.Classrooms?.FirstOrDefault(r => r.Id == after.ClassroomId);
+                if (classroom != null)
+                {
+                    assignment.ClassroomName = classroom.Name;
+                    assignment.Building = classroom.Building;
+                    assignment.Classroom = classroom;
+                }
+            }
+
+            if (assignment.TimeSlotId != after.TimeSlotId)
+            {
+                assignment.TimeSlotId = after.TimeSlotId;
+                var timeSlot = Problem?.TimeSlots?.FirstOrDefault(t => t.Id == after.TimeSlotId);
+                if (timeSlot != null)
+                {
+                    assignment.TimeSlot = timeSlot;
+                    assignment.DayOfWeek = timeSlot.DayOfWeek;
+                    assignment.StartTime = timeSlot.StartTime;
+                    assignment.EndTime = timeSlot.EndTime;
+                }
+            }
+        }
+
         /// <summary>
         /// Get next conflict ID
         /// </summary>
@@ -0,0 +1,114 @@
+using System;
+using System.Collections.Generic;
+
+namespace SmartSchedulingSystem.Scheduling.Models
+{
+    /// <summary>
+    /// Dense integer indices for the teachers, classrooms, time slots and assignments of a solution.
+    /// Built once and shared (read-only) by every CompactSolution cloned from the same source
+    /// </summary>
+    internal sealed class SolutionIndex
+    {
+        private readonly Dictionary<int, int> _teacherIndex = new Dictionary<int, int>();
+        private readonly Dictionary<int, int> _classroomIndex = new Dictionary<int, int>();
+        private readonly Dictionary<int, int> _timeSlotIndex = new Dictionary<int, int>();
+        private readonly Dictionary<int, int> _assignmentPositions = new Dictionary<int, int>();
+        private readonly Dictionary<int, List<int>> _sectionPositions = new Dictionary<int, List<int>>();
+
+        // Resources of the problem are indexed first, indices at or above these counts were only found in the solution
+        private readonly int _problemClassroomCount;
+        private readonly int _problemTimeSlotCount;
+
+        public SolutionIndex(SchedulingSolution solution)
+        {
+            if (solution == null)
+                throw new ArgumentNullException(nameof(solution));
+
+            var problem = solution.Problem;
+            if (problem != null)
+            {
+                foreach (var teacher in problem.Teachers ?? new List<TeacherInfo>())
+                    AddId(_teacherIndex, teacher.Id);
+                foreach (var classroom in problem.Classrooms ?? new List<ClassroomInfo>())
+                    AddId(_classroomIndex, classroom.Id);
+                foreach (var timeSlot in problem.TimeSlots ?? new List<TimeSlotInfo>())
+                    AddId(_timeSlotIndex, timeSlot.Id);
+            }
+
+            _problemClassroomCount = _classroomIndex.Count;
+            _problemTimeSlotCount = _timeSlotIndex.Count;
+
+            // Resources referenced by the solution but missing from the problem are indexed as well
+            for (int position = 0; position < solution.Assignments.Count; position++)
+            {
+                var assignment = solution.Assignments[position];
+                AddId(_teacherIndex, assignment.TeacherId);
+                AddId(_classroomIndex, assignment.ClassroomId);
+                AddId(_timeSlotIndex, assignment.TimeSlotId);
+
+                _assignmentPositions.TryAdd(assignment.Id, position);
+
+                if (!_sectionPositions.TryGetValue(assignment.SectionId, out var positions))
+                {
+                    positions = new List<int>();
+                    _sectionPositions[assignment.SectionId] = positions;
+                }
+                positions.Add(position);
+            }
+        }
+
+        public int TeacherCount => _teacherIndex.Count;
+
+        public int ClassroomCount => _classroomIndex.Count;
+
+        public int TimeSlotCount => _timeSlotIndex.Count;
+
+        /// <summary>
+        /// Index of teacher, -1 if the teacher is not indexed
+        /// </summary>
+        public int GetTeacherIndex(int teacherId) =>
+            _teacherIndex.TryGetValue(teacherId, out int index) ? index : -1;
+
+        /// <summary>
+        /// Index of classroom, -1 if the classroom is not indexed
+        /// </summary>
+        public int GetClassroomIndex(int classroomId) =>
+            _classroomIndex.TryGetValue(classroomId, out int index) ? index : -1;
+
+        /// <summary>
+        /// Index of time slot, -1 if the time slot is not indexed
+        /// </summary>
+        public int GetTimeSlotIndex(int timeSlotId) =>
+            _timeSlotIndex.TryGetValue(timeSlotId, out int index) ? index : -1;
+
+        /// <summary>
+        /// Whether the classroom is part of the problem
+        /// </summary>
+        public bool IsProblemClassroom(int classroomId) =>
+            _classroomIndex.TryGetValue(classroomId, out int index) && index < _problemClassroomCount;
+
+        /// <summary>
+        /// Whether the time slot is part of the problem
+        /// </summary>
+        public bool IsProblemTimeSlot(int timeSlotId) =>
+            _timeSlotIndex.TryGetValue(timeSlotId, out int index) && index < _problemTimeSlotCount;
+
+        /// <summary>
+        /// Position of assignment in the solution, -1 if not found
+        /// </summary>
+        public int GetAssignmentPosition(int assignmentId) =>
+            _assignmentPositions.TryGetValue(assignmentId, out int position) ? position : -1;
+
+        /// <summary>
+        /// Positions of all assignments belonging to a course section
+        /// </summary>
+        public IReadOnlyList<int> GetSectionPositions(int sectionId) =>
+            _sectionPositions.TryGetValue(sectionId, out var positions) ? positions : Array.Empty<int>();
+
+        private static void AddId(Dictionary<int, int> index, int id)
+        {
+            if (!index.ContainsKey(id))
+                index[id] = index.Count;
+        }
+    }
+}
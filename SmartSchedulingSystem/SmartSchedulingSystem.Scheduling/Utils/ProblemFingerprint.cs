@@ -0,0 +1,264 @@
+using SmartSchedulingSystem.Scheduling.Models;
+using System;
+using System.Collections.Generic;
+using System.Globalization;
+using System.Linq;
+using System.Security.Cryptography;
+using System.Text;
+using System.Text.Json;
+
+namespace SmartSchedulingSystem.Scheduling.Utils
+{
+    /// <summary>
+    /// Canonical fingerprint of a scheduling problem and its parameters.
+    /// Every section, teacher, classroom, time slot, availability, preference, resource and prerequisite entry is
+    /// hashed on its own, independent of list order and of display-only fields. Equal hashes mean the same input,
+    /// the element hashes give the similarity of two inputs and the sections a cached solution has to re-place
+    /// </summary>
+    public sealed class ProblemFingerprint
+    {
+        private const string SectionPrefix = "section:";
+        private const string TeacherPrefix = "teacher:";
+        private const string ClassroomPrefix = "classroom:";
+        private const string TimeSlotPrefix = "timeslot:";
+        private const string TeacherAvailabilityPrefix = "teacher-availability:";
+        private const string ClassroomAvailabilityPrefix = "classroom-availability:";
+        private const string PreferencePrefix = "preference:";
+        private const string RequirementPrefix = "requirement:";
+        private const string ResourcePrefix = "resource:";
+        private const string PrerequisitePrefix = "prerequisite:";
+        private const string RoomTypeScoresKey = "room-type-scores";
+
+        /// <summary>
+        /// Hash of the whole input (problem elements, parameters, requested solutions and variant)
+        /// </summary>
+        public string Hash { get; }
+
+        /// <summary>
+        /// Hash of the parameters, requested solutions and variant, only inputs with the same parameters hash are comparable
+        /// </summary>
+        public string ParametersHash { get; }
+
+        public int SemesterId { get; }
+
+        /// <summary>
+        /// Hash per problem element, keyed by element kind and ID (e.g. "section:12")
+        /// </summary>
+        public IReadOnlyDictionary<string, long> Elements { get; }
+
+        public ProblemFingerprint(string hash, string parametersHash, int semesterId, IReadOnlyDictionary<string, long> elements)
+        {
+            Hash = hash ?? throw new ArgumentNullException(nameof(hash));
+            ParametersHash = parametersHash ?? throw new ArgumentNullException(nameof(parametersHash));
+            SemesterId = semesterId;
+            Elements = elements ?? throw new ArgumentNullException(nameof(elements));
+        }
+
+        /// <summary>
+        /// Compute the fingerprint of a problem
+        /// </summary>
+        /// <param name="problem">Scheduling problem</param>
+        /// <param name="parameters">Scheduling parameters</param>
+        /// <param name="variant">Further input that changes the result (e.g. the engine mode)</param>
+        public static ProblemFingerprint Compute(SchedulingProblem problem, SchedulingParameters parameters, string variant = null)
+        {
+            if (problem == null)
+                throw new ArgumentNullException(nameof(problem));
+
+            var contents = new Dictionary<string, List<string>>();
+
+            foreach (var s in problem.CourseSections ?? new List<CourseSectionInfo>())
+            {
+                Add(contents, SectionPrefix + s.Id, Join(s.CourseId, s.SectionCode, s.Enrollment, s.SessionsPerWeek, s.HoursPerSession,
+                    s.DepartmentId, s.CourseType, s.RequiredRoomType, s.RequiredEquipment, s.RequiresSameTeacher, s.RequiresSameRoom,
+                    s.CrossListedWithId));
+            }
+            foreach (var t in problem.Teachers ?? new List<TeacherInfo>())
+            {
+                Add(contents, TeacherPrefix + t.Id, Join(t.DepartmentId, t.MaxWeeklyHours, t.MaxDailyHours, t.MaxConsecutiveHours, t.PreferredBuilding));
+            }
+            foreach (var c in problem.Classrooms ?? new List<ClassroomInfo>())
+            {
+                Add(contents, ClassroomPrefix + c.Id, Join(c.Building, c.CampusId, c.Capacity, c.Type, c.Equipment, c.HasComputers, c.HasProjector));
+            }
+            foreach (var ts in problem.TimeSlots ?? new List<TimeSlotInfo>())
+            {
+                Add(contents, TimeSlotPrefix + ts.Id, Join(ts.DayOfWeek, ts.StartTime, ts.EndTime, ts.IsAvailable, ts.Type));
+            }
+            foreach (var a in problem.TeacherAvailabilities ?? new List<TeacherAvailability>())
+            {
+                Add(contents, $"{TeacherAvailabilityPrefix}{a.TeacherId}:{a.TimeSlotId}",
+                    Join(a.IsAvailable, a.PreferenceLevel, JoinList(a.ApplicableWeeks)));
+            }
+            foreach (var a in problem.ClassroomAvailabilities ?? new List<ClassroomAvailability>())
+            {
+                Add(contents, $"{ClassroomAvailabilityPrefix}{a.ClassroomId}:{a.TimeSlotId}",
+                    Join(a.IsAvailable, JoinList(a.ApplicableWeeks)));
+            }
+            foreach (var p in problem.TeacherCoursePreferences ?? new List<TeacherCoursePreference>())
+            {
+                Add(contents, $"{PreferencePrefix}{p.TeacherId}:{p.CourseId}", Join(p.ProficiencyLevel, p.PreferenceLevel));
+            }
+            foreach (var r in problem.CourseResourceRequirements ?? new List<CourseResourceRequirement>())
+            {
+                Add(contents, RequirementPrefix + r.CourseSectionId, Join(JoinList(r.ResourceTypes), JoinList(r.PreferredRoomTypes)));
+            }
+            foreach (var r in problem.ClassroomResources ?? new List<ClassroomResource>())
+            {
+                Add(contents, ResourcePrefix + r.ClassroomId, Join(r.RoomType, JoinList(r.ResourceTypes)));
+            }
+            foreach (var p in problem.Prerequisites ?? new List<CoursePrerequisite>())
+            {
+                Add(contents, $"{PrerequisitePrefix}{p.CourseId}:{p.PrerequisiteCourseId}", string.Empty);
+            }
+            if (problem.RoomTypeMatchingScores?.Count > 0)
+            {
+                Add(contents, RoomTypeScoresKey, string.Join(";", problem.RoomTypeMatchingScores
+                    .OrderBy(kv => kv.Key, StringComparer.Ordinal)
+                    .SelectMany(kv => kv.Value
+                        .OrderBy(inner => inner.Key, StringComparer.Ordinal)
+                        .Select(inner => Join(kv.Key, inner.Key, inner.Value)))));
+            }
+
+            // Duplicate entries of an element are combined in a fixed order
+            var elements = contents.ToDictionary(
+                kv => kv.Key,
+                kv => HashToInt64(string.Join("\n", kv.Value.OrderBy(v => v, StringComparer.Ordinal))));
+
+            // The number of requested solutions changes the result as much as the parameters do
+            string parametersHash = HashToHex(Join(
+                parameters != null ? JsonSerializer.Serialize(parameters) : string.Empty,
+                problem.GenerateMultipleSolutions,
+                problem.SolutionCount,
+                variant ?? string.Empty));
+
+            var canonical = new StringBuilder();
+            canonical.Append(parametersHash).Append('\n').Append(problem.SemesterId).Append('\n');
+            foreach (var element in elements.OrderBy(kv => kv.Key, StringComparer.Ordinal))
+            {
+                canonical.Append(element.Key).Append('=').Append(element.Value.ToString(CultureInfo.InvariantCulture)).Append('\n');
+            }
+
+            return new ProblemFingerprint(HashToHex(canonical.ToString()), parametersHash, problem.SemesterId, elements);
+        }
+
+        /// <summary>
+        /// Share of elements with the same hash in both fingerprints (Jaccard index), 0 for different parameters
+        /// </summary>
+        public double Similarity(ProblemFingerprint other)
+        {
+            if (other == null || other.ParametersHash != ParametersHash || other.SemesterId != SemesterId)
+                return 0;
+            if (other.Hash == Hash)
+                return 1;
+
+            int shared = Elements.Count(kv => other.Elements.TryGetValue(kv.Key, out long hash) && hash == kv.Value);
+            int union = Elements.Count + other.Elements.Count - shared;
+
+            return union == 0 ? 1 : (double)shared / union;
+        }
+
+        /// <summary>
+        /// Change set that turns a solution of the previous input into a solution of this one.
+        /// Removed resources, availability changes, capacity violations and new sections are detected by the
+        /// rescheduler from the problem itself; the change set adds the sections whose own data, qualified
+        /// teachers, resource requirements or assigned resources changed
+        /// </summary>
+        /// <param name="previous">Fingerprint of the input the solution was generated for</param>
+        /// <param name="previousSolution">Solution of the previous input</param>
+        public ScheduleChangeSet GetChangesSince(ProblemFingerprint previous, SchedulingSolution previousSolution)
+        {
+            if (previous == null)
+                throw new ArgumentNullException(nameof(previous));
+            if (previousSolution == null)
+                throw new ArgumentNullException(nameof(previousSolution));
+
+            var changedKeys = Elements
+                .Where(kv => !previous.Elements.TryGetValue(kv.Key, out long hash) || hash != kv.Value)
+                .Select(kv => kv.Key)
+                .Concat(previous.Elements.Keys.Where(key => !Elements.ContainsKey(key)))
+                .ToList();
+
+            var courseOfSection = (previousSolution.Problem?.CourseSections ?? new List<CourseSectionInfo>())
+                .ToDictionary(s => s.Id, s => s.CourseId);
+            var sectionIds = new HashSet<int>();
+
+            foreach (string key in changedKeys)
+            {
+                var ids = ParseIds(key);
+                if (ids.Length == 0)
+                    continue;
+
+                IEnumerable<SchedulingAssignment> affected = Enumerable.Empty<SchedulingAssignment>();
+                if (key.StartsWith(SectionPrefix, StringComparison.Ordinal) || key.StartsWith(RequirementPrefix, StringComparison.Ordinal))
+                {
+                    sectionIds.Add(ids[0]);
+                }
+                else if (key.StartsWith(TeacherPrefix, StringComparison.Ordinal))
+                {
+                    affected = previousSolution.Assignments.Where(a => a.TeacherId == ids[0]);
+                }
+                else if (key.StartsWith(ClassroomPrefix, StringComparison.Ordinal) || key.StartsWith(ResourcePrefix, StringComparison.Ordinal))
+                {
+                    affected = previousSolution.Assignments.Where(a => a.ClassroomId == ids[0]);
+                }
+                else if (key.StartsWith(TimeSlotPrefix, StringComparison.Ordinal))
+                {
+                    affected = previousSolution.Assignments.Where(a => a.TimeSlotId == ids[0]);
+                }
+                else if (key.StartsWith(PreferencePrefix, StringComparison.Ordinal) && ids.Length == 2)
+                {
+                    affected = previousSolution.Assignments.Where(a =>
+                        a.TeacherId == ids[0] && courseOfSection.TryGetValue(a.SectionId, out int courseId) && courseId == ids[1]);
+                }
+                else if (key.StartsWith(PrerequisitePrefix, StringComparison.Ordinal))
+                {
+                    affected = previousSolution.Assignments.Where(a =>
+                        courseOfSection.TryGetValue(a.SectionId, out int courseId) && ids.Contains(courseId));
+                }
+
+                sectionIds.UnionWith(affected.Select(a => a.SectionId));
+            }
+
+            return new ScheduleChangeSet { SectionIds = sectionIds.OrderBy(id => id).ToList() };
+        }
+
+        private static void Add(Dictionary<string, List<string>> contents, string key, string content)
+        {
+            if (!contents.TryGetValue(key, out var list))
+            {
+                list = new List<string>();
+                contents[key] = list;
+            }
+            list.Add(content);
+        }
+
+        private static string Join(params object[] values) =>
+            string.Join("|", values.Select(v => Convert.ToString(v, CultureInfo.InvariantCulture) ?? string.Empty));
+
+        private static string JoinList<T>(IEnumerable<T> values) =>
+            values == null ? string.Empty : string.Join(",", values.Select(v => Convert.ToString(v, CultureInfo.InvariantCulture)).OrderBy(v => v, StringComparer.Ordinal));
+
+        private static int[] ParseIds(string key)
+        {
+            int separator = key.IndexOf(':');
+            if (separator < 0)
+                return Array.Empty<int>();
+
+            var parts = key.Substring(separator + 1).Split(':');
+            var ids = new int[parts.Length];
+            for (int i = 0; i < parts.Length; i++)
+            {
+                if (!int.TryParse(parts[i], NumberStyles.Integer, CultureInfo.InvariantCulture, out ids[i]))
+                    return Array.Empty<int>();
+            }
+            return ids;
+        }
+
+        private static string HashToHex(string value) =>
+            Convert.ToHexString(SHA256.HashData(Encoding.UTF8.GetBytes(value)));
+
+        private static long HashToInt64(string value) =>
+            BitConverter.ToInt64(SHA256.HashData(Encoding.UTF8.GetBytes(value)), 0);
+    }
+}
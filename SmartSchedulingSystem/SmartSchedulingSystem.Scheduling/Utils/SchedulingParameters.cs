@@ -13,6 +13,21 @@ namespace SmartSchedulingSystem.Scheduling.Utils
         /// </summary>
         public int CpTimeLimit { get; set; } = 60;
 
+        /// <summary>
+        /// 增量重排（基于上一版课表的修复求解）的总时间限制（秒）
+        /// </summary>
+        public int RescheduleTimeLimit { get; set; } = 5;
+
+        /// <summary>
+        /// 课程数达到该值时将问题分解为弱耦合的子问题并行求解，0表示不分解。分解求解只生成一个拼接后的初始解
+        /// </summary>
+        public int DecompositionThreshold { get; set; } = 1000;
+
+        /// <summary>
+        /// 分解后每个子问题的最大课程数
+        /// </summary>
+        public int DecompositionMaxComponentSize { get; set; } = 400;
+
         /// <summary>
         /// 初始解数量
         /// </summary>
@@ -48,6 +63,21 @@ namespace SmartSchedulingSystem.Scheduling.Utils
         /// </summary>
         public int MaxParallelism { get; set; } = 0;
 
+        /// <summary>
+        /// 局部搜索全局时间限制（秒），所有并行搜索在截止时间后停止，0表示不限制（默认），此时由MaxLsIterations决定搜索长度
+        /// </summary>
+        public int LocalSearchTimeLimit { get; set; } = 0;
+
+        /// <summary>
+        /// 并行组合搜索中每个初始解的模拟退火变体数量（不同随机种子和初始温度），0表示按并行度自动计算
+        /// </summary>
+        public int PortfolioVariantsPerSolution { get; set; } = 0;
+
+        /// <summary>
+        /// 并行组合搜索中同一初始解的各变体共享最优解的间隔（迭代次数）
+        /// </summary>
+        public int PortfolioSyncInterval { get; set; } = 50;
+
         /// <summary>
         /// 最大迭代次数
         /// </summary>
@@ -83,6 +113,21 @@ namespace SmartSchedulingSystem.Scheduling.Utils
         /// </summary>
         public double MinTemperature { get; set; } = 0.01;
 
+        /// <summary>
+        /// 局部搜索禁忌期限（迭代次数）：被接受的移动离开的位置在此期间内不能被重新选择，除非能得到更优解；0表示禁用禁忌表
+        /// </summary>
+        public int TabuTenure { get; set; } = 10;
+
+        /// <summary>
+        /// 是否启用约束性能分析（记录每个约束和引擎阶段的调用次数、耗时和内存分配），默认关闭
+        /// </summary>
+        public bool EnableConstraintProfiling { get; set; } = false;
+
+        /// <summary>
+        /// 排课总时限（秒）：大于0时根据历史运行时间预测分配CP时间限制、局部搜索迭代次数和引擎权重，并在时限到达时停止；0表示不限时
+        /// </summary>
+        public int DeadlineSeconds { get; set; } = 0;
+
         /// <summary>
         /// 解的多样性阈值（0-1之间），值越大要求解之间越不同
         /// </summary>
@@ -117,6 +162,9 @@ namespace SmartSchedulingSystem.Scheduling.Utils
             return new SchedulingParameters
             {
                 CpTimeLimit = this.CpTimeLimit,
+                RescheduleTimeLimit = this.RescheduleTimeLimit,
+                DecompositionThreshold = this.DecompositionThreshold,
+                DecompositionMaxComponentSize = this.DecompositionMaxComponentSize,
                 InitialSolutionCount = this.InitialSolutionCount,
                 EnableParallelOptimization = this.EnableParallelOptimization,
                 UseBasicConstraints = this.UseBasicConstraints,
@@ -124,6 +172,9 @@ namespace SmartSchedulingSystem.Scheduling.Utils
                 UseEnhancedConstraints = this.UseEnhancedConstraints,
                 ResourceConstraintLevel = this.ResourceConstraintLevel,
                 MaxParallelism = this.MaxParallelism,
+                LocalSearchTimeLimit = this.LocalSearchTimeLimit,
+                PortfolioVariantsPerSolution = this.PortfolioVariantsPerSolution,
+                PortfolioSyncInterval = this.PortfolioSyncInterval,
                 MaxIterations = this.MaxIterations,
                 MaxNoImprovementIterations = this.MaxNoImprovementIterations,
                 MaxLsIterations = this.MaxLsIterations,
@@ -131,6 +182,9 @@ namespace SmartSchedulingSystem.Scheduling.Utils
                 InitialTemperature = this.InitialTemperature,
                 CoolingRate = this.CoolingRate,
                 MinTemperature = this.MinTemperature,
+                TabuTenure = this.TabuTenure,
+                EnableConstraintProfiling = this.EnableConstraintProfiling,
+                DeadlineSeconds = this.DeadlineSeconds,
                 DiversityThreshold = this.DiversityThreshold,
                 HardConstraintWeight = this.HardConstraintWeight,
                 SoftConstraintWeight = this.SoftConstraintWeight,
@@ -11,7 +11,21 @@ namespace SmartSchedulingSystem.Scheduling.Utils
     /// </summary>
     public class TestDataGenerator
     {
-        private readonly Random _random = new Random();
+        private readonly Random _random;
+
+        public TestDataGenerator()
+        {
+            _random = new Random();
+        }
+
+        /// <summary>
+        /// Create a generator that produces the same problems for the same seed
+        /// </summary>
+        /// <param name="seed">Random seed</param>
+        public TestDataGenerator(int seed)
+        {
+            _random = new Random(seed);
+        }
 
         /// <summary>
         /// Generate test scheduling problem
@@ -0,0 +1,119 @@
+using System.Collections.Generic;
+using System.Linq;
+using SmartSchedulingSystem.Scheduling.Algorithms.LS.Moves;
+using SmartSchedulingSystem.Scheduling.Models;
+using SmartSchedulingSystem.Test.TestData;
+using Xunit;
+
+namespace SmartSchedulingSystem.Test.Scheduling
+{
+    public class CompactSolutionTests
+    {
+        [Fact]
+        public void CompactSolution_AnswersConflictsLikeSolution()
+        {
+            var (problem, solution) = SeededTestDataProvider.CreateTestData();
+
+            AssertEquivalent(problem, solution, solution.ToCompact());
+        }
+
+        [Fact]
+        public void Apply_MatchesMovesAppliedToSolution()
+        {
+            var (problem, solution) = SeededTestDataProvider.CreateTestData();
+            var first = solution.Assignments[0];
+            var second = solution.Assignments.First(a => a.TimeSlotId != first.TimeSlotId);
+
+            var moves = new List<IMove>
+            {
+                new TimeSlotMove(first.Id, problem.TimeSlots.First(t => t.Id != first.TimeSlotId).Id),
+                new RoomMove(first.Id, problem.Classrooms.First(c => c.Id != first.ClassroomId).Id),
+                new TeacherMove(first.Id, problem.Teachers.First(t => t.Id != first.TeacherId).Id),
+                new SwapMove(first.Id, second.Id, true, true, true)
+            };
+
+            foreach (var move in moves)
+            {
+                var expected = move.Apply(solution);
+                var compact = solution.ToCompact();
+                compact.Apply(move.GetChanges(compact));
+
+                // 增量更新后的紧凑解与移动后的解等价
+                AssertEquivalent(problem, expected, compact);
+
+                // 物化后的解与移动后的解安排相同，名称随ID更新
+                var materialized = compact.ToSolution(solution);
+                foreach (var assignment in expected.Assignments)
+                {
+                    var actual = materialized.Assignments.Single(a => a.Id == assignment.Id);
+                    Assert.Equal(assignment.TeacherId, actual.TeacherId);
+                    Assert.Equal(assignment.ClassroomId, actual.ClassroomId);
+                    Assert.Equal(assignment.TimeSlotId, actual.TimeSlotId);
+                    Assert.Equal(problem.Teachers.Single(t => t.Id == actual.TeacherId).Name, actual.TeacherName);
+                    Assert.Equal(problem.Classrooms.Single(c => c.Id == actual.ClassroomId).Name, actual.ClassroomName);
+                }
+
+                // 原地应用变化与移动后的解相同，时间信息随时间段更新
+                var inPlace = solution.Clone();
+                inPlace.ApplyChanges(move.GetChanges(compact), solution.ToCompact());
+                AssertEquivalent(problem, inPlace, compact);
+                Assert.All(inPlace.Assignments, a =>
+                    Assert.Equal(problem.TimeSlots.Single(t => t.Id == a.TimeSlotId).StartTime, a.StartTime));
+            }
+        }
+
+        [Fact]
+        public void Clone_IsIndependentOfSource()
+        {
+            var (problem, solution) = SeededTestDataProvider.CreateTestData();
+            var source = solution.ToCompact();
+            var clone = source.Clone();
+
+            var assignment = solution.Assignments[0];
+            int timeSlotId = problem.TimeSlots.First(t => t.Id != assignment.TimeSlotId).Id;
+            var move = new TimeSlotMove(assignment.Id, timeSlotId);
+            clone.Apply(move.GetChanges(source));
+
+            // 修改副本不影响原解，反之亦然
+            AssertEquivalent(problem, solution, source);
+            AssertEquivalent(problem, move.Apply(solution), clone);
+
+            source.SetTimeSlot(source.IndexOf(assignment.Id), timeSlotId);
+            AssertEquivalent(problem, move.Apply(solution), source);
+            AssertEquivalent(problem, move.Apply(solution), clone);
+        }
+
+        private static void AssertEquivalent(SchedulingProblem problem, SchedulingSolution solution, CompactSolution compact)
+        {
+            Assert.Equal(solution.Assignments.Count, compact.Count);
+            foreach (var assignment in solution.Assignments)
+            {
+                var placement = compact.GetPlacement(compact.IndexOf(assignment.Id));
+                Assert.Equal(assignment.SectionId, placement.SectionId);
+                Assert.Equal(assignment.TeacherId, placement.TeacherId);
+                Assert.Equal(assignment.ClassroomId, placement.ClassroomId);
+                Assert.Equal(assignment.TimeSlotId, placement.TimeSlotId);
+            }
+
+            var ignoredSections = new int?[] { null }.Concat(problem.CourseSections.Select(s => (int?)s.Id)).ToList();
+            foreach (var timeSlot in problem.TimeSlots)
+            {
+                foreach (var ignoredSection in ignoredSections)
+                {
+                    foreach (var teacher in problem.Teachers)
+                    {
+                        Assert.Equal(
+                            solution.HasTeacherConflict(teacher.Id, timeSlot.Id, ignoredSection),
+                            compact.HasTeacherConflict(teacher.Id, timeSlot.Id, ignoredSection));
+                    }
+                    foreach (var classroom in problem.Classrooms)
+                    {
+                        Assert.Equal(
+                            solution.HasClassroomConflict(classroom.Id, timeSlot.Id, ignoredSection),
+                            compact.HasClassroomConflict(classroom.Id, timeSlot.Id, ignoredSection));
+                    }
+                }
+            }
+        }
+    }
+}
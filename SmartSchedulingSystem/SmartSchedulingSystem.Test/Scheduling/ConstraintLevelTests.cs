@@ -0,0 +1,150 @@
+using System.Collections.Generic;
+using System.Linq;
+using Google.OrTools.Sat;
+using Microsoft.Extensions.DependencyInjection;
+using SmartSchedulingSystem.Scheduling.Algorithms.CP;
+using SmartSchedulingSystem.Scheduling.Engine;
+using SmartSchedulingSystem.Scheduling.Models;
+using SmartSchedulingSystem.Scheduling.Utils;
+using SmartSchedulingSystem.Test.TestData;
+using Xunit;
+
+namespace SmartSchedulingSystem.Test.Scheduling
+{
+    public class ConstraintLevelTests
+    {
+        private const int LabRoomId = 1;
+        private const int RegularRoomId = 2;
+        private const int SmallRoomId = 3;
+        private const int AvailableSlotId = 1;
+        private const int UnavailableSlotId = 2;
+
+        [Fact]
+        public void EligibilityIndex_AppliesRoomTypeOnlyFromEnhanced()
+        {
+            var eligibility = EligibilityIndex.Build(CreateLabProblem());
+
+            // 容量在所有级别生效，教室类型只在Enhanced及以上生效
+            Assert.Equal(new[] { LabRoomId, RegularRoomId }, RoomIds(eligibility, ConstraintApplicationLevel.Basic));
+            Assert.Equal(new[] { LabRoomId, RegularRoomId }, RoomIds(eligibility, ConstraintApplicationLevel.Standard));
+            Assert.Equal(new[] { LabRoomId }, RoomIds(eligibility, ConstraintApplicationLevel.Enhanced));
+            Assert.Equal(new[] { LabRoomId }, RoomIds(eligibility, ConstraintApplicationLevel.Complete));
+
+            Assert.True(eligibility.IsPreferredRoom(1, LabRoomId));
+            Assert.False(eligibility.IsPreferredRoom(1, RegularRoomId));
+        }
+
+        [Theory]
+        [InlineData(ConstraintApplicationLevel.Basic, AvailableSlotId, LabRoomId, true)]
+        [InlineData(ConstraintApplicationLevel.Basic, AvailableSlotId, RegularRoomId, true)]
+        [InlineData(ConstraintApplicationLevel.Basic, UnavailableSlotId, LabRoomId, true)]
+        [InlineData(ConstraintApplicationLevel.Standard, AvailableSlotId, LabRoomId, true)]
+        [InlineData(ConstraintApplicationLevel.Standard, AvailableSlotId, RegularRoomId, true)]
+        [InlineData(ConstraintApplicationLevel.Standard, UnavailableSlotId, LabRoomId, false)]
+        [InlineData(ConstraintApplicationLevel.Enhanced, AvailableSlotId, LabRoomId, true)]
+        [InlineData(ConstraintApplicationLevel.Enhanced, AvailableSlotId, RegularRoomId, false)]
+        [InlineData(ConstraintApplicationLevel.Enhanced, UnavailableSlotId, LabRoomId, false)]
+        public void LayeredModel_EnablesConstraintsOfSelectedLevel(
+            ConstraintApplicationLevel level, int timeSlotId, int classroomId, bool expectedFeasible)
+        {
+            using var serviceProvider = SeededTestDataProvider.BuildServiceProvider(new SchedulingParameters());
+            var modelBuilder = serviceProvider.GetRequiredService<CPModelBuilder>();
+            var problem = CreateLabProblem();
+
+            // 只保留待检查的安排，其余安排全部禁止
+            var model = modelBuilder.BuildLayeredModel(problem, EligibilityIndex.Build(problem));
+            modelBuilder.ForbidPlacements(model, (sectionId, slotId, roomId, teacherId) => slotId != timeSlotId || roomId != classroomId);
+            modelBuilder.SelectConstraintLevel(model, level);
+
+            var status = new CpSolver().Solve(model);
+
+            Assert.Equal(expectedFeasible, status == CpSolverStatus.Optimal || status == CpSolverStatus.Feasible);
+        }
+
+        [Fact]
+        public void LayeredModel_HasNoVariablesForRoomsWithoutCapacity()
+        {
+            using var serviceProvider = SeededTestDataProvider.BuildServiceProvider(new SchedulingParameters());
+            var modelBuilder = serviceProvider.GetRequiredService<CPModelBuilder>();
+            var problem = CreateLabProblem();
+
+            modelBuilder.BuildLayeredModel(problem, EligibilityIndex.Build(problem));
+
+            // 容量不足的教室在任何级别都不创建变量
+            Assert.Null(modelBuilder.GetAssignmentVariable(new SchedulingAssignment
+            {
+                SectionId = 1, TimeSlotId = AvailableSlotId, ClassroomId = SmallRoomId, TeacherId = 1
+            }));
+        }
+
+        [Fact]
+        public void Cascade_SolvesAtEnhancedWhenFeasible()
+        {
+            var result = GenerateWithCascade(CreateLabProblem());
+
+            // Enhanced级别可行时只使用实验室
+            var solution = Assert.Single(result.Solutions);
+            Assert.Equal(ConstraintApplicationLevel.Enhanced, solution.ConstraintLevel);
+            Assert.Equal(LabRoomId, solution.Assignments.Single().ClassroomId);
+            Assert.Equal(AvailableSlotId, solution.Assignments.Single().TimeSlotId);
+            Assert.Equal(new[] { ConstraintApplicationLevel.Enhanced }, result.Levels);
+        }
+
+        [Fact]
+        public void Cascade_FallsBackToBasic()
+        {
+            // 教师在所有时间段都不可用，Enhanced和Standard级别都不可行
+            var problem = CreateLabProblem();
+            foreach (var availability in problem.TeacherAvailabilities)
+            {
+                availability.IsAvailable = false;
+            }
+
+            var result = GenerateWithCascade(problem);
+
+            var solution = Assert.Single(result.Solutions);
+            Assert.Equal(ConstraintApplicationLevel.Basic, solution.ConstraintLevel);
+            Assert.Equal(
+                new[] { ConstraintApplicationLevel.Basic, ConstraintApplicationLevel.Standard, ConstraintApplicationLevel.Enhanced },
+                result.Levels);
+        }
+
+        private static (List<SchedulingSolution> Solutions, ConstraintApplicationLevel[] Levels) GenerateWithCascade(SchedulingProblem problem)
+        {
+            var parameters = new SchedulingParameters { UseEnhancedConstraints = true, CpTimeLimit = 10 };
+            using var serviceProvider = SeededTestDataProvider.BuildServiceProvider(parameters);
+            var cpScheduler = serviceProvider.GetRequiredService<CPScheduler>();
+
+            var solutions = cpScheduler.GenerateInitialSolutions(problem, 1);
+            return (solutions, cpScheduler.LevelTimeMs.Keys.OrderBy(l => l).ToArray());
+        }
+
+        private static int[] RoomIds(EligibilityIndex eligibility, ConstraintApplicationLevel level)
+        {
+            return eligibility.GetEligibleRooms(1, level).Select(r => r.Id).OrderBy(id => id).ToArray();
+        }
+
+        /// <summary>
+        /// 一个需要实验室的教学班：实验室、容量足够的普通教室和容量不足的普通教室，教师在第二个时间段不可用
+        /// </summary>
+        private static SchedulingProblem CreateLabProblem()
+        {
+            var problem = SuperSimpleTestDataProvider.CreateSuperSimpleTestProblem();
+
+            var section = problem.CourseSections.Single();
+            section.RequiredRoomType = "Lab";
+            section.RequiredEquipment = null;
+
+            problem.Classrooms = new List<ClassroomInfo>
+            {
+                new ClassroomInfo { Id = LabRoomId, Name = "L101", Building = "A", CampusId = 1, Capacity = 40, Type = "Lab" },
+                new ClassroomInfo { Id = RegularRoomId, Name = "A102", Building = "A", CampusId = 1, Capacity = 50, Type = "Regular" },
+                new ClassroomInfo { Id = SmallRoomId, Name = "A103", Building = "A", CampusId = 1, Capacity = 10, Type = "Regular" }
+            };
+            problem.ClassroomAvailabilities = new List<ClassroomAvailability>();
+            problem.TeacherAvailabilities.Single(a => a.TimeSlotId == UnavailableSlotId).IsAvailable = false;
+
+            return problem;
+        }
+    }
+}
@@ -0,0 +1,65 @@
+using System.Linq;
+using Microsoft.Extensions.DependencyInjection;
+using SmartSchedulingSystem.Scheduling.Engine;
+using SmartSchedulingSystem.Scheduling.Models;
+using SmartSchedulingSystem.Test.TestData;
+using Xunit;
+
+namespace SmartSchedulingSystem.Test.Scheduling
+{
+    public class ConstraintProfilerTests
+    {
+        [Fact]
+        public void DisabledProfiler_RecordsNothing()
+        {
+            using var serviceProvider = SeededTestDataProvider.BuildServiceProvider();
+            var evaluator = serviceProvider.GetRequiredService<SolutionEvaluator>();
+            var profiler = serviceProvider.GetRequiredService<ConstraintProfiler>();
+
+            evaluator.Evaluate(SeededTestDataProvider.CreateTestSolution());
+
+            // 默认关闭，不记录任何数据，也不创建运行档案
+            var profile = profiler.GetProfile();
+            Assert.False(profile.Enabled);
+            Assert.Empty(profile.Constraints);
+            Assert.Empty(profile.Phases);
+            Assert.False(profiler.BeginRun());
+            Assert.Null(profiler.EndRun());
+        }
+
+        [Fact]
+        public void EnabledProfiler_RecordsCallsPerConstraint()
+        {
+            using var serviceProvider = SeededTestDataProvider.BuildServiceProvider();
+            var evaluator = serviceProvider.GetRequiredService<SolutionEvaluator>();
+            var profiler = serviceProvider.GetRequiredService<ConstraintProfiler>();
+            var constraints = serviceProvider.GetRequiredService<ConstraintManager>().GetAllConstraints();
+            var solution = SeededTestDataProvider.CreateTestSolution();
+
+            profiler.IsEnabled = true;
+            Assert.True(profiler.BeginRun());
+            foreach (var constraint in constraints)
+            {
+                evaluator.EvaluateConstraint(constraint, solution);
+                evaluator.EvaluateConstraint(constraint, solution);
+            }
+            var run = profiler.EndRun();
+
+            // 每个约束的完整评估都被记录两次
+            var evaluations = run.Constraints.Where(e => e.Operation == ConstraintOperation.Evaluate).ToList();
+            Assert.Equal(constraints.Count, evaluations.Count);
+            Assert.All(evaluations, e =>
+            {
+                Assert.Equal(2, e.Calls);
+                Assert.True(e.P50Microseconds <= e.P99Microseconds);
+                Assert.True(e.P99Microseconds <= e.MaxMicroseconds);
+            });
+
+            // 全局档案包含运行档案的数据，重置后清空
+            Assert.Equal(evaluations.Count,
+                profiler.GetProfile().Constraints.Count(e => e.Operation == ConstraintOperation.Evaluate));
+            profiler.Reset();
+            Assert.Empty(profiler.GetProfile().Constraints);
+        }
+    }
+}
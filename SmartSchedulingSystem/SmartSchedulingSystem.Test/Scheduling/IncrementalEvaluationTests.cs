@@ -0,0 +1,135 @@
+using System;
+using System.Collections.Generic;
+using System.Linq;
+using Microsoft.Extensions.DependencyInjection;
+using SmartSchedulingSystem.Scheduling.Algorithms.LS.Moves;
+using SmartSchedulingSystem.Scheduling.Constraints;
+using SmartSchedulingSystem.Scheduling.Engine;
+using SmartSchedulingSystem.Scheduling.Models;
+using SmartSchedulingSystem.Test.TestData;
+using Xunit;
+using Xunit.Abstractions;
+
+namespace SmartSchedulingSystem.Test.Scheduling
+{
+    public class IncrementalEvaluationTests
+    {
+        private const int MoveCount = 200;
+        private readonly ITestOutputHelper _output;
+
+        public IncrementalEvaluationTests(ITestOutputHelper output)
+        {
+            _output = output;
+        }
+
+        [Fact]
+        public void IncrementalStates_MatchFullEvaluation_AfterRandomMoves()
+        {
+            var serviceProvider = SeededTestDataProvider.BuildServiceProvider();
+            var constraints = serviceProvider.GetServices<IConstraint>().ToList();
+            var (problem, solution) = CreateTestData();
+            var random = new Random(42);
+
+            // 为每个支持增量评估的约束创建状态
+            var states = new List<(IConstraint Constraint, IncrementalConstraintState State)>();
+            foreach (var constraint in constraints.OfType<IIncrementalConstraint>())
+            {
+                var state = constraint.CreateState(solution);
+                if (state != null)
+                    states.Add((constraint, state));
+            }
+
+            _output.WriteLine($"增量约束数: {states.Count}/{constraints.Count}");
+            Assert.NotEmpty(states);
+
+            for (int i = 0; i < MoveCount; i++)
+            {
+                var move = CreateRandomMove(problem, solution, random);
+                var changes = move.GetChanges(solution.ToCompact());
+                solution = move.Apply(solution);
+
+                foreach (var (constraint, state) in states)
+                {
+                    state.Apply(changes);
+                    var (expected, _) = constraint.Evaluate(solution);
+                    Assert.True(Math.Abs(expected - state.Score) < 1e-9,
+                        $"约束 '{constraint.Name}' 在移动 {move.GetDescription()} 后评分不一致: 完整={expected}, 增量={state.Score}");
+                }
+            }
+        }
+
+        [Fact]
+        public void EvaluateChanges_MatchesEvaluateOnMovedSolution()
+        {
+            var serviceProvider = SeededTestDataProvider.BuildServiceProvider();
+            var evaluator = serviceProvider.GetRequiredService<SolutionEvaluator>();
+            var (problem, solution) = CreateTestData();
+            var random = new Random(7);
+
+            var incrementalEvaluation = evaluator.CreateIncrementalEvaluation(solution);
+            AssertScoreEqual(evaluator.Evaluate(solution).Score, incrementalEvaluation.Score);
+
+            for (int i = 0; i < MoveCount; i++)
+            {
+                var move = CreateRandomMove(problem, incrementalEvaluation.Solution, random);
+                var changes = move.GetChanges(incrementalEvaluation.Solution.ToCompact());
+                var newSolution = move.Apply(incrementalEvaluation.Solution);
+
+                double incrementalScore = evaluator.EvaluateChanges(incrementalEvaluation, changes);
+                AssertScoreEqual(evaluator.Evaluate(newSolution).Score, incrementalScore);
+
+                // 提交一半的移动，验证提交后的状态仍然正确
+                if (random.Next(2) == 0)
+                {
+                    evaluator.CommitChanges(incrementalEvaluation, changes, newSolution);
+                    AssertScoreEqual(incrementalScore, incrementalEvaluation.Score);
+                }
+            }
+
+            _output.WriteLine($"评估移动数: {incrementalEvaluation.EvaluatedMoves}, " +
+                             $"完整评估回退次数: {incrementalEvaluation.FullEvaluationFallbacks}");
+        }
+
+        private static (SchedulingProblem Problem, SchedulingSolution Solution) CreateTestData()
+        {
+            var (problem, solution) = SeededTestDataProvider.CreateTestData(
+                courseSectionCount: 20,
+                teacherCount: 6,
+                classroomCount: 8,
+                timeSlotCount: 15);
+
+            // Id为0时SolutionEvaluator不使用按解决方案ID的缓存，保证每次都是完整评估
+            solution.Id = 0;
+            return (problem, solution);
+        }
+
+        private static IMove CreateRandomMove(SchedulingProblem problem, SchedulingSolution solution, Random random)
+        {
+            var assignment = solution.Assignments[random.Next(solution.Assignments.Count)];
+
+            switch (random.Next(4))
+            {
+                case 0:
+                    return new TimeSlotMove(assignment.Id, problem.TimeSlots[random.Next(problem.TimeSlots.Count)].Id);
+                case 1:
+                    return new RoomMove(assignment.Id, problem.Classrooms[random.Next(problem.Classrooms.Count)].Id);
+                case 2:
+                    return new TeacherMove(assignment.Id, problem.Teachers[random.Next(problem.Teachers.Count)].Id);
+                default:
+                    var other = solution.Assignments[random.Next(solution.Assignments.Count)];
+                    return new SwapMove(assignment.Id, other.Id, random.Next(2) == 0, random.Next(2) == 0, random.Next(2) == 0);
+            }
+        }
+
+        private static void AssertScoreEqual(double expected, double actual)
+        {
+            if (double.IsNegativeInfinity(expected))
+            {
+                Assert.True(double.IsNegativeInfinity(actual), $"期望不可行解, 实际评分={actual}");
+                return;
+            }
+
+            Assert.True(Math.Abs(expected - actual) < 1e-9, $"评分不一致: 完整={expected}, 增量={actual}");
+        }
+    }
+}
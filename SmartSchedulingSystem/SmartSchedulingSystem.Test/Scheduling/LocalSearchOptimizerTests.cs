@@ -0,0 +1,117 @@
+using System.Collections.Generic;
+using System.Linq;
+using Microsoft.Extensions.DependencyInjection;
+using SmartSchedulingSystem.Scheduling.Algorithms.LS;
+using SmartSchedulingSystem.Scheduling.Engine;
+using SmartSchedulingSystem.Scheduling.Models;
+using SmartSchedulingSystem.Scheduling.Utils;
+using SmartSchedulingSystem.Test.TestData;
+using Xunit;
+
+namespace SmartSchedulingSystem.Test.Scheduling
+{
+    public class LocalSearchOptimizerTests
+    {
+        [Theory]
+        [InlineData(50)]
+        [InlineData(1200)]
+        public void OptimizeSolution_StopsAtPlannedIterations(int maxIterations)
+        {
+            using var serviceProvider = SeededTestDataProvider.BuildServiceProvider();
+            var optimizer = serviceProvider.GetRequiredService<LocalSearchOptimizer>();
+
+            // 降温足够慢，温度下限不会提前结束搜索；上限高于退火控制器默认的1000次迭代时同样生效
+            optimizer.OptimizeSolution(SeededTestDataProvider.CreateTestSolution(), maxIterations, initialTemperature: 1.0, coolingRate: 0.9995);
+
+            Assert.Equal(maxIterations, optimizer.LastStatistics.Iterations);
+        }
+
+        [Fact]
+        public void OptimizeSolution_AppliesMovesToCopyAndReturnsEvaluatedBest()
+        {
+            using var serviceProvider = SeededTestDataProvider.BuildServiceProvider();
+            var optimizer = serviceProvider.GetRequiredService<LocalSearchOptimizer>();
+            var evaluator = serviceProvider.GetRequiredService<SolutionEvaluator>();
+            var initialSolution = SeededTestDataProvider.CreateTestSolution();
+            var initialPlacements = Placements(initialSolution);
+
+            var optimized = optimizer.OptimizeSolution(initialSolution, 300, initialTemperature: 1.0, coolingRate: 0.995);
+
+            // 接受的移动原地应用在副本上，初始解保持不变
+            Assert.True(optimizer.LastStatistics.AcceptedMoves > 0);
+            Assert.Equal(initialPlacements, Placements(initialSolution));
+
+            // 返回的最优解由紧凑形式物化，分数不低于初始解
+            Assert.NotSame(initialSolution, optimized);
+            Assert.Equal(initialSolution.Assignments.Count, optimized.Assignments.Count);
+            Assert.True(evaluator.CreateIncrementalEvaluation(optimized).Score >= evaluator.CreateIncrementalEvaluation(initialSolution).Score);
+        }
+
+        [Fact]
+        public void OptimizePortfolio_RunsInParallelWithSharedServices()
+        {
+            var parameters = new SchedulingParameters
+            {
+                EnableParallelOptimization = true,
+                MaxParallelism = 4,
+                PortfolioVariantsPerSolution = 2,
+                MaxLsIterations = 300
+            };
+            using var serviceProvider = SeededTestDataProvider.BuildServiceProvider(parameters);
+            var optimizer = serviceProvider.GetRequiredService<LocalSearchOptimizer>();
+            var evaluator = serviceProvider.GetRequiredService<SolutionEvaluator>();
+
+            var (_, initialSolutions) = SeededTestDataProvider.CreateTestSolutions(2);
+
+            var result = optimizer.OptimizePortfolio(initialSolutions);
+
+            // 每个初始解两个变体，四个运行共享评估器、移动生成器和约束实例
+            Assert.Equal(4, result.RunCount);
+            Assert.Equal(initialSolutions.Count, result.Solutions.Count);
+            Assert.False(result.DeadlineReached);
+
+            // 运行报告的分数与重新完整评估的结果一致，并行运行没有破坏共享状态
+            for (int i = 0; i < result.Solutions.Count; i++)
+            {
+                Assert.Equal(problem.CourseSections.Count, result.Solutions[i].Assignments.Count);
+                Assert.Equal(evaluator.CreateIncrementalEvaluation(result.Solutions[i]).Score, result.Scores[i], 6);
+            }
+        }
+
+        [Fact]
+        public void OptimizePortfolio_KeepsResultsOfDifferentStartsDistinct()
+        {
+            var parameters = new SchedulingParameters
+            {
+                EnableParallelOptimization = true,
+                MaxParallelism = 2,
+                PortfolioVariantsPerSolution = 1,
+                PortfolioSyncInterval = 1,
+                MaxLsIterations = 50
+            };
+            using var serviceProvider = SeededTestDataProvider.BuildServiceProvider(parameters);
+            var optimizer = serviceProvider.GetRequiredService<LocalSearchOptimizer>();
+            var evaluator = serviceProvider.GetRequiredService<SolutionEvaluator>();
+
+            // 第二个初始解是第一个初始解优化后的结果，分数更高
+            var worse = SeededTestDataProvider.CreateTestSolution();
+            var better = optimizer.OptimizeSolution(worse.Clone(), 300, initialTemperature: 1.0, coolingRate: 0.995);
+            better.Id = 2;
+            Assert.True(evaluator.CreateIncrementalEvaluation(better).Score > evaluator.CreateIncrementalEvaluation(worse).Score);
+
+            var result = optimizer.OptimizePortfolio(new List<SchedulingSolution> { worse, better });
+
+            // 每次迭代都同步，但不同初始解的运行不会接手对方的最优解
+            Assert.Equal(new[] { 1, 2 }, result.Solutions.Select(s => s.Id));
+            Assert.NotEqual(Placements(result.Solutions[0]), Placements(result.Solutions[1]));
+        }
+
+        private static List<(int, int, int, int)> Placements(SchedulingSolution solution)
+        {
+            return solution.Assignments
+                .OrderBy(a => a.SectionId)
+                .Select(a => (a.SectionId, a.TeacherId, a.ClassroomId, a.TimeSlotId))
+                .ToList();
+        }
+    }
+}
@@ -0,0 +1,197 @@
+using System;
+using System.Collections.Generic;
+using System.Linq;
+using Microsoft.Extensions.DependencyInjection;
+using SmartSchedulingSystem.Scheduling.Algorithms.CP;
+using SmartSchedulingSystem.Scheduling.Engine;
+using SmartSchedulingSystem.Scheduling.Models;
+using SmartSchedulingSystem.Scheduling.Utils;
+using SmartSchedulingSystem.Test.TestData;
+using Xunit;
+
+namespace SmartSchedulingSystem.Test.Scheduling
+{
+    public class ProblemDecompositionTests
+    {
+        private const int LabRoomId = 1;
+        private const int ComputerRoomId = 2;
+
+        [Fact]
+        public void Decompose_SeparatesSectionsWithoutSharedResources()
+        {
+            using var serviceProvider = SeededTestDataProvider.BuildServiceProvider(new SchedulingParameters());
+            var decomposer = serviceProvider.GetRequiredService<ProblemDecomposer>();
+            var problem = CreateIndependentProblem();
+
+            var components = decomposer.Decompose(problem, EligibilityIndex.Build(problem), maxComponentSize: 2);
+
+            // 实验课和上机课的教师、教室互不相交，形成两个独立的子问题
+            Assert.Equal(2, components.Count);
+            Assert.All(components, c => Assert.False(c.SharesResources));
+            Assert.Equal(
+                problem.CourseSections.Select(s => s.Id).OrderBy(id => id),
+                components.SelectMany(c => c.Problem.CourseSections).Select(s => s.Id).OrderBy(id => id));
+
+            foreach (var component in components)
+            {
+                var roomType = component.Problem.CourseSections.Select(s => s.RequiredRoomType).Distinct().Single();
+                var teacherId = component.Problem.CourseSections.Select(s => s.CourseId).Distinct().Single();
+                Assert.Equal(roomType, component.Problem.Classrooms.Single().Type);
+                Assert.Equal(teacherId, component.Problem.Teachers.Single().Id);
+            }
+        }
+
+        [Fact]
+        public void GenerateInitialSolutions_StitchesIndependentComponents()
+        {
+            var problem = CreateIndependentProblem();
+
+            var solution = Assert.Single(GenerateDecomposed(problem, maxComponentSize: 2, solutionCount: 3).Solutions);
+
+            // 请求多个解时分解求解仍只返回一个拼接解
+            Assert.Equal("CP_Decomposed", solution.Algorithm);
+            AssertCompleteWithoutConflicts(problem, solution);
+            Assert.All(solution.Assignments, a =>
+                Assert.Equal(a.SectionId <= 2 ? LabRoomId : ComputerRoomId, a.ClassroomId));
+        }
+
+        [Fact]
+        public void GenerateInitialSolutions_RepairsComponentsSharingResources()
+        {
+            var problem = CreateCoupledProblem();
+            using (var serviceProvider = SeededTestDataProvider.BuildServiceProvider(new SchedulingParameters()))
+            {
+                var components = serviceProvider.GetRequiredService<ProblemDecomposer>()
+                    .Decompose(problem, EligibilityIndex.Build(problem), maxComponentSize: 2);
+
+                // 同一教师和教室的课程按院系拆分，子问题之间共享资源
+                Assert.Equal(2, components.Count);
+                Assert.All(components, c => Assert.True(c.SharesResources));
+            }
+
+            var (solutions, cpScheduler) = GenerateDecomposed(problem, maxComponentSize: 2, solutionCount: 1);
+            var solution = Assert.Single(solutions);
+
+            // 拼接解中的共享资源冲突在修复阶段消除
+            Assert.Equal("CP_Decomposed", solution.Algorithm);
+            AssertCompleteWithoutConflicts(problem, solution);
+
+            // 修复时间单独记录，不计入Standard级别
+            Assert.DoesNotContain(ConstraintApplicationLevel.Standard, cpScheduler.LevelTimeMs.Keys);
+        }
+
+        [Fact]
+        public void GenerateInitialSolutions_FallsBackToFullModelForSingleComponent()
+        {
+            var problem = CreateCoupledProblem();
+
+            // 所有课程都在一个子问题内时直接求解完整模型
+            var solutions = GenerateDecomposed(problem, maxComponentSize: 10, solutionCount: 1).Solutions;
+
+            var solution = Assert.Single(solutions);
+            Assert.NotEqual("CP_Decomposed", solution.Algorithm);
+            AssertCompleteWithoutConflicts(problem, solution);
+        }
+
+        private static (List<SchedulingSolution> Solutions, CPScheduler Scheduler) GenerateDecomposed(SchedulingProblem problem, int maxComponentSize, int solutionCount)
+        {
+            var parameters = new SchedulingParameters
+            {
+                DecompositionThreshold = 2,
+                DecompositionMaxComponentSize = maxComponentSize,
+                CpTimeLimit = 10
+            };
+            using var serviceProvider = SeededTestDataProvider.BuildServiceProvider(parameters);
+            var cpScheduler = serviceProvider.GetRequiredService<CPScheduler>();
+
+            return (cpScheduler.GenerateInitialSolutions(problem, solutionCount), cpScheduler);
+        }
+
+        private static void AssertCompleteWithoutConflicts(SchedulingProblem problem, SchedulingSolution solution)
+        {
+            Assert.Equal(
+                problem.CourseSections.Select(s => s.Id).OrderBy(id => id),
+                solution.Assignments.Select(a => a.SectionId).OrderBy(id => id));
+            Assert.Equal(solution.Assignments.Count, solution.Assignments.Select(a => (a.TeacherId, a.TimeSlotId)).Distinct().Count());
+            Assert.Equal(solution.Assignments.Count, solution.Assignments.Select(a => (a.ClassroomId, a.TimeSlotId)).Distinct().Count());
+        }
+
+        /// <summary>
+        /// 两门实验课和两门上机课，每类课程有自己的教师和教室
+        /// </summary>
+        private static SchedulingProblem CreateIndependentProblem()
+        {
+            return CreateProblem(new[]
+            {
+                (CourseId: 1, DepartmentId: 1, RoomType: "Lab"),
+                (CourseId: 1, DepartmentId: 1, RoomType: "Lab"),
+                (CourseId: 2, DepartmentId: 2, RoomType: "Computer"),
+                (CourseId: 2, DepartmentId: 2, RoomType: "Computer")
+            });
+        }
+
+        /// <summary>
+        /// 两个院系的四门实验课，共用同一教师和同一实验室
+        /// </summary>
+        private static SchedulingProblem CreateCoupledProblem()
+        {
+            return CreateProblem(new[]
+            {
+                (CourseId: 1, DepartmentId: 1, RoomType: "Lab"),
+                (CourseId: 1, DepartmentId: 1, RoomType: "Lab"),
+                (CourseId: 1, DepartmentId: 2, RoomType: "Lab"),
+                (CourseId: 1, DepartmentId: 2, RoomType: "Lab")
+            });
+        }
+
+        private static SchedulingProblem CreateProblem((int CourseId, int DepartmentId, string RoomType)[] sections)
+        {
+            var problem = new SchedulingProblem { Id = 1, Name = "Decomposition Test Problem", SemesterId = 1 };
+
+            problem.TimeSlots = Enumerable.Range(1, 4)
+                .Select(i => new TimeSlotInfo
+                {
+                    Id = i,
+                    DayOfWeek = 1,
+                    DayName = "Monday",
+                    StartTime = new TimeSpan(7 + 2 * i, 0, 0),
+                    EndTime = new TimeSpan(8 + 2 * i, 0, 0),
+                    Type = "Regular"
+                })
+                .ToList();
+
+            problem.Classrooms = new List<ClassroomInfo>
+            {
+                new ClassroomInfo { Id = LabRoomId, Name = "L101", Building = "A", CampusId = 1, Capacity = 40, Type = "Lab" },
+                new ClassroomInfo { Id = ComputerRoomId, Name = "C101", Building = "A", CampusId = 1, Capacity = 40, Type = "Computer" }
+            };
+
+            // 教师ID与其教授的课程ID相同
+            var courseIds = sections.Select(s => s.CourseId).Distinct().ToList();
+            problem.Teachers = courseIds
+                .Select(id => new TeacherInfo { Id = id, Name = $"Teacher {id}", DepartmentId = id, MaxWeeklyHours = 20, MaxDailyHours = 8 })
+                .ToList();
+            problem.TeacherCoursePreferences = courseIds
+                .Select(id => new TeacherCoursePreference { TeacherId = id, CourseId = id, ProficiencyLevel = 5, PreferenceLevel = 5 })
+                .ToList();
+
+            problem.CourseSections = sections
+                .Select((s, i) => new CourseSectionInfo
+                {
+                    Id = i + 1,
+                    CourseId = s.CourseId,
+                    CourseName = $"Course {s.CourseId}",
+                    CourseCode = $"C{s.CourseId}",
+                    SectionCode = $"C{s.CourseId}-{i + 1}",
+                    Credits = 2,
+                    Hours = 1,
+                    Enrollment = 30,
+                    DepartmentId = s.DepartmentId,
+                    RequiredRoomType = s.RoomType
+                })
+                .ToList();
+
+            return problem;
+        }
+    }
+}
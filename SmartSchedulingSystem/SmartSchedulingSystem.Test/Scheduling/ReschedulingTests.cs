@@ -0,0 +1,77 @@
+using System.Collections.Generic;
+using System.Linq;
+using Microsoft.Extensions.DependencyInjection;
+using SmartSchedulingSystem.Scheduling;
+using SmartSchedulingSystem.Scheduling.Algorithms.CP;
+using SmartSchedulingSystem.Scheduling.Models;
+using SmartSchedulingSystem.Scheduling.Utils;
+using Xunit;
+using Xunit.Abstractions;
+
+namespace SmartSchedulingSystem.Test.Scheduling
+{
+    public class ReschedulingTests
+    {
+        private readonly ITestOutputHelper _output;
+
+        public ReschedulingTests(ITestOutputHelper output)
+        {
+            _output = output;
+        }
+
+        [Fact]
+        public void Reschedule_TeacherUnavailable_MovesOnlyNeighbourhood()
+        {
+            var services = new ServiceCollection();
+            services.AddLogging();
+            services.AddSchedulingServices();
+            var serviceProvider = services.BuildServiceProvider();
+            var cpScheduler = serviceProvider.GetRequiredService<CPScheduler>();
+
+            var testDataGenerator = new TestDataGenerator();
+            var problem = testDataGenerator.GenerateTestProblem(
+                courseSectionCount: 10,
+                teacherCount: 5,
+                classroomCount: 8,
+                timeSlotCount: 15);
+
+            // 先把随机测试解修复为无冲突的基准课表
+            var baseline = cpScheduler.Reschedule(problem, testDataGenerator.CreateTestSolution(problem), new ScheduleChangeSet());
+            Assert.True(baseline.IsSuccessful, baseline.Message);
+            var previousSolution = baseline.Solution;
+
+            // 第一门课的教师在该时间段不再可用
+            var blocked = previousSolution.Assignments.First();
+            var changes = new ScheduleChangeSet
+            {
+                TeacherUnavailabilities = new List<TeacherAvailability>
+                {
+                    new TeacherAvailability { TeacherId = blocked.TeacherId, TimeSlotId = blocked.TimeSlotId }
+                }
+            };
+            changes.ApplyTo(problem);
+
+            var result = cpScheduler.Reschedule(problem, previousSolution, changes);
+
+            _output.WriteLine($"尝试次数: {result.Attempts}, 邻域半径: {result.NeighbourhoodRadius}, " +
+                             $"变动课程数: {result.ChangedSectionCount}, 耗时: {result.ExecutionTimeMs}ms");
+
+            Assert.True(result.IsSuccessful, result.Message);
+            Assert.Equal(1, result.AffectedAssignmentCount);
+            Assert.Equal(problem.CourseSections.Count, result.Solution.Assignments.Select(a => a.SectionId).Distinct().Count());
+
+            // 不可用的教师时间段不能再被使用
+            Assert.DoesNotContain(result.Solution.Assignments,
+                a => a.TeacherId == blocked.TeacherId && a.TimeSlotId == blocked.TimeSlotId);
+
+            // 受影响的课程必须移动，其余课程尽量保持不变
+            Assert.True(result.ChangedSectionCount >= 1);
+            Assert.True(result.ChangedSectionCount <= result.FreedSectionCount,
+                $"变动课程数 {result.ChangedSectionCount} 超过了释放的课程数 {result.FreedSectionCount}");
+
+            // 未变动的课程保留原来的分配ID
+            var previousIds = previousSolution.Assignments.ToDictionary(a => a.SectionId, a => a.Id);
+            Assert.All(result.Solution.Assignments, a => Assert.Equal(previousIds[a.SectionId], a.Id));
+        }
+    }
+}
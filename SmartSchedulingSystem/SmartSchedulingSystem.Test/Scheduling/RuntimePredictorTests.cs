@@ -0,0 +1,97 @@
+using System;
+using SmartSchedulingSystem.Scheduling.Algorithms.Hybrid;
+using SmartSchedulingSystem.Scheduling.Models;
+using Xunit;
+using ProblemFeatures = SmartSchedulingSystem.Scheduling.Utils.ProblemFeatures;
+
+namespace SmartSchedulingSystem.Test.Scheduling
+{
+    public class RuntimePredictorTests
+    {
+        private const int SolutionCount = 3;
+
+        [Fact]
+        public void Predictor_LearnsRuntimesFromHistory()
+        {
+            var history = new SchedulingRunHistory();
+            var predictor = new RuntimePredictor(history);
+
+            // 历史数据不足时不做预测
+            Assert.Null(predictor.PredictConstructionMs(CreateFeatures(100), SolutionCount));
+            Assert.Null(predictor.PredictLocalSearchMsPerIteration(CreateFeatures(100)));
+
+            AddHistory(history);
+
+            foreach (int sections in new[] { 30, 300, 3000 })
+            {
+                var features = CreateFeatures(sections);
+                AssertClose(ConstructionMs(sections), predictor.PredictConstructionMs(features, SolutionCount));
+                AssertClose(MsPerIteration(sections), predictor.PredictLocalSearchMsPerIteration(features));
+            }
+        }
+
+        [Fact]
+        public void PlanForDeadline_FitsConstructionAndLocalSearchIntoDeadline()
+        {
+            var history = new SchedulingRunHistory();
+            AddHistory(history);
+            var selector = new EngineSelector(new RuntimePredictor(history));
+            const int deadlineSeconds = 30;
+
+            // 小规模问题不再占用固定的CP时间
+            var small = selector.PlanForDeadline(new SchedulingProblem(), CreateFeatures(20), deadlineSeconds, SolutionCount, 1000);
+            Assert.True(small.CpTimeLimit <= 2, $"CP time limit {small.CpTimeLimit}s");
+
+            // 大规模问题的CP时间和局部搜索迭代次数都在时限之内
+            var large = selector.PlanForDeadline(new SchedulingProblem(), CreateFeatures(2000), deadlineSeconds, SolutionCount, 1000);
+            Assert.True(large.CpTimeLimit < deadlineSeconds);
+            Assert.True(large.CpTimeLimit * 1000.0 + large.MaxLsIterations * SolutionCount * MsPerIteration(2000) <= deadlineSeconds * 1000.0);
+            Assert.Equal(1.0, large.CPWeight + large.LSWeight, 6);
+        }
+
+        private static void AddHistory(SchedulingRunHistory history)
+        {
+            foreach (int sections in new[] { 20, 50, 100, 200, 500, 1000, 2000, 4000 })
+            {
+                foreach (int iterations in new[] { 100, 400, 1600, 6400 })
+                {
+                    history.Record(new SchedulingRunRecord
+                    {
+                        CourseSectionCount = sections,
+                        TeacherCount = sections / 10,
+                        ClassroomCount = sections / 20,
+                        TimeSlotCount = 40,
+                        HardConstraintRatio = 0.5,
+                        SolutionCount = SolutionCount,
+                        CpTimeLimit = 600,
+                        MaxLsIterations = iterations,
+                        ConstructionMs = (long)ConstructionMs(sections),
+                        LocalSearchIterations = iterations * SolutionCount,
+                        LocalSearchMs = (long)(iterations * SolutionCount * MsPerIteration(sections)),
+                        Score = 0.5 + 0.05 * Math.Log(1 + iterations)
+                    });
+                }
+            }
+        }
+
+        // 构造时间和每次迭代时间随问题规模按幂律增长
+        private static double ConstructionMs(int sections) => 2 * Math.Pow(1 + sections, 1.3);
+
+        private static double MsPerIteration(int sections) => 0.01 * (1 + sections);
+
+        private static ProblemFeatures CreateFeatures(int sections) => new ProblemFeatures
+        {
+            CourseSectionCount = sections,
+            TeacherCount = sections / 10,
+            ClassroomCount = sections / 20,
+            TimeSlotCount = 40,
+            HardConstraintRatio = 0.5
+        };
+
+        private static void AssertClose(double expected, double? actual)
+        {
+            Assert.NotNull(actual);
+            Assert.True(Math.Abs(actual.Value - expected) <= expected * 0.25, $"expected {expected:F3}, predicted {actual:F3}");
+        }
+    }
+}
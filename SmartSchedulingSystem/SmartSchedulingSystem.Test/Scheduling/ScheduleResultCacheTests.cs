@@ -0,0 +1,135 @@
+using System.Collections.Generic;
+using System.Linq;
+using Microsoft.Extensions.DependencyInjection;
+using Microsoft.Extensions.Logging.Abstractions;
+using Microsoft.Extensions.Options;
+using SmartSchedulingSystem.API.Services;
+using SmartSchedulingSystem.Scheduling.Models;
+using SmartSchedulingSystem.Scheduling.Utils;
+using SmartSchedulingSystem.Test.TestData;
+using Xunit;
+
+namespace SmartSchedulingSystem.Test.Scheduling
+{
+    public class ScheduleResultCacheTests
+    {
+        [Fact]
+        public void Fingerprint_IgnoresListOrderAndIncludesRequestedSolutions()
+        {
+            var parameters = new SchedulingParameters();
+            var problem = SeededTestDataProvider.CreateTestProblem();
+            var reordered = SeededTestDataProvider.CreateTestProblem();
+            reordered.CourseSections.Reverse();
+            reordered.Teachers.Reverse();
+            reordered.Classrooms.Reverse();
+            reordered.TimeSlots.Reverse();
+            reordered.TeacherAvailabilities.Reverse();
+
+            // 元素顺序不影响指纹
+            Assert.Equal(ProblemFingerprint.Compute(problem, parameters).Hash, ProblemFingerprint.Compute(reordered, parameters).Hash);
+
+            // 请求的方案数量不同则结果不可复用
+            var moreSolutions = SeededTestDataProvider.CreateTestProblem();
+            moreSolutions.SolutionCount = problem.SolutionCount + 1;
+            var single = SeededTestDataProvider.CreateTestProblem();
+            single.GenerateMultipleSolutions = !problem.GenerateMultipleSolutions;
+
+            var fingerprint = ProblemFingerprint.Compute(problem, parameters);
+            Assert.NotEqual(fingerprint.ParametersHash, ProblemFingerprint.Compute(moreSolutions, parameters).ParametersHash);
+            Assert.NotEqual(fingerprint.ParametersHash, ProblemFingerprint.Compute(single, parameters).ParametersHash);
+        }
+
+        [Fact]
+        public void Lookup_ReturnsStoredResultOnHit()
+        {
+            var cache = CreateCache(capacity: 4);
+            var problem = SeededTestDataProvider.CreateTestProblem();
+            var fingerprint = ProblemFingerprint.Compute(problem, new SchedulingParameters());
+            var result = CreateResult(problem);
+
+            Assert.Null(cache.Lookup(problem, fingerprint).Result);
+            cache.Store(fingerprint, result, solveTimeMs: 1500);
+
+            var lookup = cache.Lookup(problem, fingerprint);
+            Assert.Same(result, lookup.Result);
+
+            var statistics = cache.GetStatistics();
+            Assert.Equal(2, statistics.Lookups);
+            Assert.Equal(1, statistics.Hits);
+            Assert.Equal(1.5, statistics.SavedSolverSeconds, 3);
+        }
+
+        [Fact]
+        public void Lookup_ReturnsWarmStartForSimilarInput()
+        {
+            var cache = CreateCache(capacity: 4);
+            var parameters = new SchedulingParameters();
+            var problem = SeededTestDataProvider.CreateTestProblem();
+            var fingerprint = ProblemFingerprint.Compute(problem, parameters);
+            cache.Store(fingerprint, CreateResult(problem), solveTimeMs: 1000);
+
+            // 只修改一个教学班
+            var changed = SeededTestDataProvider.CreateTestProblem();
+            var changedSection = changed.CourseSections[0];
+            changedSection.Enrollment += 5;
+            var changedFingerprint = ProblemFingerprint.Compute(changed, parameters);
+
+            var lookup = cache.Lookup(changed, changedFingerprint);
+            Assert.Null(lookup.Result);
+            Assert.NotNull(lookup.WarmStartSolution);
+            Assert.Same(fingerprint, lookup.WarmStartFingerprint);
+            Assert.InRange(lookup.Similarity, 0.8, 0.999);
+
+            // 需要重新安排的只有被修改的教学班
+            var changes = changedFingerprint.GetChangesSince(lookup.WarmStartFingerprint!, lookup.WarmStartSolution!);
+            Assert.Equal(new List<int> { changedSection.Id }, changes.SectionIds);
+
+            // 参数不同的输入不能热启动
+            var otherParameters = new SchedulingParameters { MaxLsIterations = parameters.MaxLsIterations + 1 };
+            Assert.Null(cache.Lookup(changed, ProblemFingerprint.Compute(changed, otherParameters)).WarmStartSolution);
+        }
+
+        [Fact]
+        public void Store_EvictsLeastRecentlyUsedEntry()
+        {
+            var cache = CreateCache(capacity: 2);
+            var problem = SeededTestDataProvider.CreateTestProblem();
+            var parameters = new SchedulingParameters();
+
+            // 不同变体的指纹互不相似，只能精确命中
+            var first = ProblemFingerprint.Compute(problem, parameters, "first");
+            var second = ProblemFingerprint.Compute(problem, parameters, "second");
+            var third = ProblemFingerprint.Compute(problem, parameters, "third");
+
+            cache.Store(first, CreateResult(problem), 100);
+            cache.Store(second, CreateResult(problem), 100);
+            Assert.NotNull(cache.Lookup(problem, first).Result);
+            cache.Store(third, CreateResult(problem), 100);
+
+            Assert.Equal(2, cache.GetStatistics().MemoryEntries);
+            Assert.NotNull(cache.Lookup(problem, first).Result);
+            Assert.Null(cache.Lookup(problem, second).Result);
+            Assert.NotNull(cache.Lookup(problem, third).Result);
+        }
+
+        private static ScheduleResultCache CreateCache(int capacity)
+        {
+            var scopeFactory = new ServiceCollection().BuildServiceProvider().GetRequiredService<IServiceScopeFactory>();
+            var options = Options.Create(new ScheduleCacheOptions { Capacity = capacity, UseDatabase = false });
+            return new ScheduleResultCache(scopeFactory, options, NullLogger<ScheduleResultCache>.Instance);
+        }
+
+        private static SchedulingResult CreateResult(SchedulingProblem problem)
+        {
+            var solution = new TestDataGenerator(42).CreateTestSolution(problem);
+            solution.Evaluation = new SchedulingEvaluation { Score = 0.9, IsFeasible = true, HardConstraintsSatisfied = true };
+
+            return new SchedulingResult
+            {
+                Status = SchedulingStatus.Success,
+                Problem = problem,
+                Solutions = new List<SchedulingSolution> { solution }
+            };
+        }
+    }
+}
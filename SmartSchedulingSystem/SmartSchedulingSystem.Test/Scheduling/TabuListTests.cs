@@ -0,0 +1,64 @@
+using System.Linq;
+using SmartSchedulingSystem.Scheduling.Algorithms.LS;
+using SmartSchedulingSystem.Scheduling.Algorithms.LS.Moves;
+using SmartSchedulingSystem.Test.TestData;
+using Xunit;
+
+namespace SmartSchedulingSystem.Test.Scheduling
+{
+    public class TabuListTests
+    {
+        [Fact]
+        public void MoveSignature_IsEqualForMovesWithSamePlacements()
+        {
+            var (problem, solution) = SeededTestDataProvider.CreateTestData();
+            var first = solution.Assignments[0];
+            var second = solution.Assignments.First(a => a.TimeSlotId != first.TimeSlotId);
+            var timeSlotId = problem.TimeSlots.First(t => t.Id != first.TimeSlotId).Id;
+            var compact = solution.ToCompact();
+
+            // 不同类型但结果相同的移动签名相同
+            Assert.Equal(
+                MoveSignature.Of(new TimeMove(first.Id, timeSlotId).GetChanges(compact)),
+                MoveSignature.Of(new TimeSlotMove(first.Id, timeSlotId).GetChanges(compact)));
+
+            // 交换顺序不影响签名
+            Assert.Equal(
+                MoveSignature.Of(new SwapMove(first.Id, second.Id, true, false, false).GetChanges(compact)),
+                MoveSignature.Of(new SwapMove(second.Id, first.Id, true, false, false).GetChanges(compact)));
+
+            // 不改变解的移动没有签名
+            Assert.Equal(MoveSignature.None,
+                MoveSignature.Of(new TimeSlotMove(first.Id, first.TimeSlotId).GetChanges(compact)));
+        }
+
+        [Fact]
+        public void TabuList_RejectsUndoingMoveUntilTenureExpires()
+        {
+            var (problem, solution) = SeededTestDataProvider.CreateTestData();
+            var assignment = solution.Assignments[0];
+            int originalTimeSlotId = assignment.TimeSlotId;
+            int newTimeSlotId = problem.TimeSlots.First(t => t.Id != originalTimeSlotId).Id;
+            var tabuList = new TabuList(tenure: 5);
+
+            var move = new TimeSlotMove(assignment.Id, newTimeSlotId);
+            var changes = move.GetChanges(solution.ToCompact());
+            solution = move.Apply(solution);
+            tabuList.Add(changes, iteration: 1);
+
+            // 撤销刚接受的移动在禁忌期内被禁止，其他移动不受影响
+            var undo = new TimeSlotMove(assignment.Id, originalTimeSlotId).GetChanges(solution.ToCompact());
+            Assert.True(tabuList.IsTabu(undo, iteration: 2));
+            Assert.True(tabuList.IsTabu(undo, iteration: 6));
+            Assert.False(tabuList.IsTabu(undo, iteration: 7));
+
+            var other = problem.TimeSlots.First(t => t.Id != originalTimeSlotId && t.Id != newTimeSlotId).Id;
+            Assert.False(tabuList.IsTabu(new TimeSlotMove(assignment.Id, other).GetChanges(solution.ToCompact()), iteration: 2));
+
+            // 禁忌期为0时禁用禁忌表
+            var disabled = new TabuList(tenure: 0);
+            disabled.Add(changes, iteration: 1);
+            Assert.False(disabled.IsTabu(undo, iteration: 2));
+        }
+    }
+}
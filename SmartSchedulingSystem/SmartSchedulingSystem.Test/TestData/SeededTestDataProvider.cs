@@ -0,0 +1,75 @@
+using System.Collections.Generic;
+using System.Linq;
+using Microsoft.Extensions.DependencyInjection;
+using SmartSchedulingSystem.Scheduling;
+using SmartSchedulingSystem.Scheduling.Models;
+using SmartSchedulingSystem.Scheduling.Utils;
+
+namespace SmartSchedulingSystem.Test.TestData
+{
+    /// <summary>
+    /// 调度算法单元测试共用的服务容器和固定种子生成的测试数据，失败时可以复现同一个问题
+    /// </summary>
+    public static class SeededTestDataProvider
+    {
+        public const int Seed = 42;
+
+        public static ServiceProvider BuildServiceProvider(SchedulingParameters? parameters = null)
+        {
+            var services = new ServiceCollection();
+            services.AddLogging();
+            services.AddSchedulingServices(parameters);
+            return services.BuildServiceProvider();
+        }
+
+        public static SchedulingProblem CreateTestProblem(
+            int courseSectionCount = 10,
+            int teacherCount = 4,
+            int classroomCount = 4,
+            int timeSlotCount = 10)
+        {
+            return CreateTestProblem(new TestDataGenerator(Seed), courseSectionCount, teacherCount, classroomCount, timeSlotCount);
+        }
+
+        /// <summary>
+        /// 测试问题和一个随机安排的解
+        /// </summary>
+        public static (SchedulingProblem Problem, SchedulingSolution Solution) CreateTestData(
+            int courseSectionCount = 10,
+            int teacherCount = 4,
+            int classroomCount = 4,
+            int timeSlotCount = 10)
+        {
+            var testDataGenerator = new TestDataGenerator(Seed);
+            var problem = CreateTestProblem(testDataGenerator, courseSectionCount, teacherCount, classroomCount, timeSlotCount);
+            return (problem, testDataGenerator.CreateTestSolution(problem));
+        }
+
+        /// <summary>
+        /// 测试问题和多个互不相同的随机安排的解
+        /// </summary>
+        public static (SchedulingProblem Problem, List<SchedulingSolution> Solutions) CreateTestSolutions(int solutionCount)
+        {
+            var testDataGenerator = new TestDataGenerator(Seed);
+            var problem = CreateTestProblem(testDataGenerator, 10, 4, 4, 10);
+            var solutions = Enumerable.Range(0, solutionCount)
+                .Select(_ => testDataGenerator.CreateTestSolution(problem))
+                .ToList();
+            return (problem, solutions);
+        }
+
+        private static SchedulingProblem CreateTestProblem(
+            TestDataGenerator testDataGenerator,
+            int courseSectionCount,
+            int teacherCount,
+            int classroomCount,
+            int timeSlotCount)
+        {
+            return testDataGenerator.GenerateTestProblem(
+                courseSectionCount: courseSectionCount,
+                teacherCount: teacherCount,
+                classroomCount: classroomCount,
+                timeSlotCount: timeSlotCount);
+        }
+    }
+}
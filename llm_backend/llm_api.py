@@ -2,18 +2,33 @@ from fastapi import FastAPI, HTTPException, Body
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 from typing import List, Dict, Any, Optional
-import openai
 import os
 import json
 import re
-from dotenv import load_dotenv
 import sys
+import threading
 
-# Load environment variables
-load_dotenv()
+# The OpenAI provider (and .env loading) is imported on first use rather than at
+# module import, so the service can start accepting requests without paying for it.
+_openai = None
+_openai_lock = threading.Lock()
 
-# Configure OpenAI API
-openai.api_key = os.getenv("OPENAI_API_KEY")
+def get_openai():
+    """Import and configure the OpenAI provider on first use."""
+    global _openai
+    if _openai is None:
+        with _openai_lock:
+            if _openai is None:
+                from dotenv import load_dotenv
+                import openai
+
+                # Load environment variables
+                load_dotenv()
+
+                # Configure OpenAI API
+                openai.api_key = os.getenv("OPENAI_API_KEY")
+                _openai = openai
+    return _openai
 
 app = FastAPI()
 
@@ -51,10 +66,10 @@ class ParameterOptimizationRequest(BaseModel):
 # Import prompt templates from the templates directory
 from templates.llm_prompts import (
     CHAT_PROMPT,
-    CONSTRAINT_ANALYSIS_PROMPT,
-    CONFLICT_RESOLUTION_PROMPT,
-    SCHEDULE_EXPLANATION_PROMPT,
-    PARAMETER_OPTIMIZATION_PROMPT
+    COMPILED_CONSTRAINT_ANALYSIS_PROMPT,
+    COMPILED_CONFLICT_RESOLUTION_PROMPT,
+    COMPILED_SCHEDULE_EXPLANATION_PROMPT,
+    COMPILED_PARAMETER_OPTIMIZATION_PROMPT
 )
 
 # Helper function to parse JSON from AI responses
@@ -211,6 +226,11 @@ def parse_json_response(response_text):
             return {"error": "Unable to parse response", "rawResponse": response_text}
 
 # API routes
+@app.get("/api/llm/health")
+async def health():
+    """Lightweight readiness probe that does not touch the LLM provider"""
+    return {"status": "ok", "providerLoaded": _openai is not None}
+
 @app.post("/api/llm/chat")
 async def chat_endpoint(request: ChatRequest):
     # Use the imported CHAT_PROMPT template
@@ -224,7 +244,7 @@ async def chat_endpoint(request: ChatRequest):
     messages.append({"role": "user", "content": request.message})
     
     try:
-        response = openai.chat.completions.create(
+        response = get_openai().chat.completions.create(
             model="gpt-3.5-turbo",
             messages=messages,
             temperature=0.7,
@@ -305,12 +325,12 @@ async def analyze_constraints(request: ConstraintAnalysisRequest):
     
     try:
         # Build prompt using the imported template
-        prompt = CONSTRAINT_ANALYSIS_PROMPT.format(input=request.input)
+        prompt = COMPILED_CONSTRAINT_ANALYSIS_PROMPT.format(input=request.input)
         
         print("Calling OpenAI API...")
         
         # Call OpenAI API
-        response = openai.chat.completions.create(
+        response = get_openai().chat.completions.create(
             model="gpt-3.5-turbo",
             messages=[
                 {"role": "system", "content": "You are a scheduling system analysis expert. Your responses should be valid JSON objects only."},
@@ -434,12 +454,12 @@ async def analyze_conflicts(request: ConflictAnalysisRequest):
         conflict_json = json.dumps(request.conflict, ensure_ascii=False, indent=2)
         
         # Build prompt using the imported template
-        prompt = CONFLICT_RESOLUTION_PROMPT.format(conflict_json=conflict_json)
+        prompt = COMPILED_CONFLICT_RESOLUTION_PROMPT.format(conflict_json=conflict_json)
         
         print("Calling OpenAI API...")
         
         # Call OpenAI API
-        response = openai.chat.completions.create(
+        response = get_openai().chat.completions.create(
             model="gpt-3.5-turbo",
             messages=[
                 {"role": "system", "content": "You are a scheduling conflict resolution expert. Your responses should be valid JSON objects only."},
@@ -545,12 +565,12 @@ async def explain_schedule(request: ScheduleExplanationRequest):
         schedule_json = json.dumps(request.scheduleItem, ensure_ascii=False, indent=2)
         
         # Build prompt using the imported template
-        prompt = SCHEDULE_EXPLANATION_PROMPT.format(schedule_json=schedule_json)
+        prompt = COMPILED_SCHEDULE_EXPLANATION_PROMPT.format(schedule_json=schedule_json)
         
         print("Calling OpenAI API...")
         
         # Call OpenAI API
-        response = openai.chat.completions.create(
+        response = get_openai().chat.completions.create(
             model="gpt-3.5-turbo",
             messages=[
                 {"role": "system", "content": "You are a scheduling decision explanation expert. Your responses should be valid JSON objects only."},
@@ -668,7 +688,7 @@ async def optimize_parameters(request: ParameterOptimizationRequest):
         historical_data = json.dumps(request.historicalData, ensure_ascii=False, indent=2) if request.historicalData else "No historical data available"
         
         # Build prompt using the imported template
-        prompt = PARAMETER_OPTIMIZATION_PROMPT.format(
+        prompt = COMPILED_PARAMETER_OPTIMIZATION_PROMPT.format(
             current_parameters=current_parameters,
             historical_data=historical_data
         )
@@ -676,7 +696,7 @@ async def optimize_parameters(request: ParameterOptimizationRequest):
         print("Calling OpenAI API...")
         
         # Call OpenAI API
-        response = openai.chat.completions.create(
+        response = get_openai().chat.completions.create(
             model="gpt-3.5-turbo",
             messages=[
                 {"role": "system", "content": "You are a scheduling parameter optimization expert. Your responses should be valid JSON objects only."},
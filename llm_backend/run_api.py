@@ -4,60 +4,27 @@ Simple script to start the LLM API service.
 This allows easy startup with just 'python run_api.py'
 """
 
-import os
 import sys
-import subprocess
-import platform
-import signal
+import socket
 
-def check_port(port):
-    """Check if the port is in use and try to free it if possible."""
-    import socket
-    
+def check_port(host, port):
+    """Check whether the port can be bound, without shelling out to netstat/lsof."""
+    bind_host = '0.0.0.0' if host in ('', '0.0.0.0') else host
     s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
     try:
-        s.bind(('0.0.0.0', port))
-        s.close()
+        s.bind((bind_host, port))
         return True  # Port is available
-    except socket.error:
-        print(f"Port {port} is already in use. Attempting to free it...")
-        
-        # Try to find and terminate the process using the port
-        if platform.system() == "Windows":
-            try:
-                # For Windows
-                output = subprocess.check_output(f"netstat -ano | findstr :{port}", shell=True).decode()
-                if output:
-                    # Extract PID
-                    lines = output.strip().split("\n")
-                    for line in lines:
-                        if "LISTENING" in line:
-                            pid = line.strip().split()[-1]
-                            try:
-                                print(f"Terminating process with PID {pid}...")
-                                subprocess.call(f"taskkill /PID {pid} /F", shell=True)
-                                return True
-                            except Exception as e:
-                                print(f"Failed to terminate process: {e}")
-            except Exception as e:
-                print(f"Could not check port on Windows: {e}")
-        else:
-            try:
-                # For Linux/Mac
-                output = subprocess.check_output(f"lsof -i :{port} | grep LISTEN", shell=True).decode()
-                if output:
-                    # Extract PID
-                    pid = output.strip().split()[1]
-                    try:
-                        print(f"Terminating process with PID {pid}...")
-                        os.kill(int(pid), signal.SIGTERM)
-                        return True
-                    except Exception as e:
-                        print(f"Failed to terminate process: {e}")
-            except Exception as e:
-                print(f"Could not check port on Linux/Mac: {e}")
-    
-    return False
+    except OSError:
+        return False
+    finally:
+        s.close()
+
+def find_free_port(host, start_port, attempts=20):
+    """Return the first bindable port at or after start_port, or None."""
+    for port in range(start_port, start_port + attempts):
+        if check_port(host, port):
+            return port
+    return None
 
 def parse_arguments():
     """Parse command line arguments."""
@@ -65,7 +32,9 @@ def parse_arguments():
     parser = argparse.ArgumentParser(description='Start the LLM API service')
     parser.add_argument('--port', type=int, default=8080, help='Port to run the service on')
     parser.add_argument('--host', type=str, default='0.0.0.0', help='Host to bind the service to')
-    parser.add_argument('--no-reload', action='store_true', help='Disable hot reloading')
+    parser.add_argument('--reload', action='store_true', help='Enable hot reloading (development only)')
+    parser.add_argument('--no-reload', action='store_true', help='Disable hot reloading (default, kept for compatibility)')
+    parser.add_argument('--auto-port', action='store_true', help='Use the next free port if the requested one is in use')
     return parser.parse_args()
 
 def main():
@@ -73,10 +42,19 @@ def main():
     args = parse_arguments()
     port = args.port
     host = args.host
-    reload = not args.no_reload
+    reload = args.reload and not args.no_reload
     
-    # Check if port is available, attempt to free it if not
-    check_port(port)
+    # Check if port is available; never terminate whatever process holds it
+    if not check_port(host, port):
+        if not args.auto_port:
+            print(f"Port {port} is already in use. Stop the other process or rerun with --auto-port.")
+            return 1
+        free_port = find_free_port(host, port + 1)
+        if free_port is None:
+            print(f"Port {port} is already in use and no free port was found nearby.")
+            return 1
+        print(f"Port {port} is already in use, using port {free_port} instead.")
+        port = free_port
     
     print(f"Starting LLM API service on http://{host}:{port}")
     print("Press CTRL+C to quit")
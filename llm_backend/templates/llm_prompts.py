@@ -3,6 +3,8 @@ LLM Prompts for Smart Scheduling System
 This file contains all prompt templates used for LLM API calls.
 """
 
+from string import Formatter
+
 # Chat prompt template
 CHAT_PROMPT = """
 You are an intelligent scheduling assistant that can answer user questions about course scheduling, 
@@ -120,4 +122,38 @@ Each new parameter suggestion should include:
 - expectedEffect: expected effect
 
 Please ensure you return valid JSON format without any additional text, explanations, or Markdown markup.
-""" 
\ No newline at end of file
+""" 
+
+
+class CompiledPrompt:
+    """Prompt template parsed once into literal text and placeholder fields.
+
+    Rendering joins the pre-split segments instead of re-parsing the template
+    string on every request.
+    """
+
+    _CONVERTERS = {"r": repr, "s": str, "a": ascii}
+
+    def __init__(self, template):
+        self.template = template
+        self.segments = tuple(Formatter().parse(template))
+        self.fields = tuple(name for _, name, _, _ in self.segments if name is not None)
+
+    def format(self, **values):
+        parts = []
+        for literal, name, spec, conversion in self.segments:
+            parts.append(literal)
+            if name is None:
+                continue
+            value = values[name]
+            if conversion:
+                value = self._CONVERTERS[conversion](value)
+            parts.append(format(value, spec) if spec else str(value))
+        return "".join(parts)
+
+
+# Compiled forms of the templates above, built once at import time
+COMPILED_CONSTRAINT_ANALYSIS_PROMPT = CompiledPrompt(CONSTRAINT_ANALYSIS_PROMPT)
+COMPILED_CONFLICT_RESOLUTION_PROMPT = CompiledPrompt(CONFLICT_RESOLUTION_PROMPT)
+COMPILED_SCHEDULE_EXPLANATION_PROMPT = CompiledPrompt(SCHEDULE_EXPLANATION_PROMPT)
+COMPILED_PARAMETER_OPTIMIZATION_PROMPT = CompiledPrompt(PARAMETER_OPTIMIZATION_PROMPT)
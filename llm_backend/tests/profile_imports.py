@@ -0,0 +1,62 @@
+"""
+Import-time profiler for the LLM API service.
+Runs 'import llm_api' in a fresh interpreter with -X importtime and reports the slowest imports.
+
+Usage: python tests/profile_imports.py [--top 20] [--module llm_api] [--sort self|cumulative]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def parse_importtime(stderr_text):
+    """Parse '-X importtime' output into (self_us, cumulative_us, module) tuples."""
+    entries = []
+    for line in stderr_text.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3:
+            continue
+        try:
+            self_us = int(parts[0].strip())
+            cumulative_us = int(parts[1].strip())
+        except ValueError:
+            continue  # Header line
+        entries.append((self_us, cumulative_us, parts[2].strip()))
+    return entries
+
+def main():
+    parser = argparse.ArgumentParser(description="Report the slowest imports of the LLM API service")
+    parser.add_argument("--module", default="llm_api", help="Module to import")
+    parser.add_argument("--top", type=int, default=20, help="Number of imports to report")
+    parser.add_argument("--sort", choices=["self", "cumulative"], default="cumulative", help="Sort key")
+    args = parser.parse_args()
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {args.module}"],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        print(f"Importing {args.module} failed:")
+        print(result.stderr.splitlines()[-1] if result.stderr else "no output")
+        return 1
+
+    entries = parse_importtime(result.stderr)
+    key = 0 if args.sort == "self" else 1
+    entries.sort(key=lambda e: e[key], reverse=True)
+
+    total_us = max((e[1] for e in entries), default=0)
+    print(f"Importing {args.module} took {total_us / 1000:.1f} ms ({len(entries)} modules)")
+    print(f"{'self ms':>10} {'cumul ms':>10}  module")
+    for self_us, cumulative_us, name in entries[:args.top]:
+        print(f"{self_us / 1000:>10.1f} {cumulative_us / 1000:>10.1f}  {name}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,81 @@
+"""
+Cold-start benchmark for the LLM API service.
+Starts uvicorn in a fresh process, measures time until the first successful request
+to /api/llm/health, and fails if it exceeds the configured budget.
+
+Usage: python tests/startup_benchmark.py [--budget 3.0] [--runs 3]
+The budget can also be set with the LLM_STARTUP_BUDGET_SECONDS environment variable.
+"""
+
+import argparse
+import os
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_BUDGET_SECONDS = float(os.getenv("LLM_STARTUP_BUDGET_SECONDS", "3.0"))
+
+def get_free_port():
+    """Let the OS pick an unused local port."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+def measure_startup(timeout):
+    """Return seconds from process spawn to the first successful health response."""
+    port = get_free_port()
+    url = f"http://127.0.0.1:{port}/api/llm/health"
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "llm_api:app", "--host", "127.0.0.1",
+         "--port", str(port), "--log-level", "warning"],
+        cwd=BACKEND_DIR,
+    )
+    try:
+        while time.perf_counter() - start < timeout:
+            if process.poll() is not None:
+                raise RuntimeError(f"Server exited with code {process.returncode} before serving a request")
+            try:
+                with urllib.request.urlopen(url, timeout=0.5) as response:
+                    if response.status == 200:
+                        return time.perf_counter() - start
+            except OSError:
+                time.sleep(0.02)
+        raise RuntimeError(f"Server did not answer within {timeout:.0f}s")
+    finally:
+        process.terminate()
+        try:
+            process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure LLM API time-to-first-request")
+    parser.add_argument("--budget", type=float, default=DEFAULT_BUDGET_SECONDS, help="Maximum allowed seconds")
+    parser.add_argument("--runs", type=int, default=3, help="Number of cold starts to measure")
+    parser.add_argument("--timeout", type=float, default=60.0, help="Give up on a single run after this many seconds")
+    args = parser.parse_args()
+
+    timings = []
+    for run in range(1, args.runs + 1):
+        try:
+            elapsed = measure_startup(args.timeout)
+        except RuntimeError as e:
+            print(f"Run {run}: {e}")
+            return 1
+        timings.append(elapsed)
+        print(f"Run {run}: time to first request {elapsed:.3f}s")
+
+    worst = max(timings)
+    print(f"Best {min(timings):.3f}s, worst {worst:.3f}s, budget {args.budget:.3f}s")
+    if worst > args.budget:
+        print("FAILED: startup exceeded budget")
+        return 1
+    print("PASSED")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())